@@ -20,7 +20,7 @@ if typing.TYPE_CHECKING:
     import pandas
     import pyarrow.lib
     from builtins import list as lst
-    from collections.abc import Callable, Iterable, Sequence, Mapping
+    from collections.abc import Awaitable, Callable, Iterable, Sequence, Mapping
     from ._typing import (
         ParquetFieldsOptions,
         IntoExpr,
@@ -43,7 +43,8 @@ if typing.TYPE_CHECKING:
         ArrowUDF,
     )
     from ._enums import ExplainTypeLiteral, RenderModeLiteral
-    from duckdb import sqltypes, func
+    from duckdb import sqltypes, func, udf
+    from duckdb.shared_memory import SharedResult
 
 __all__: lst[str] = [
     "BinderException",
@@ -84,8 +85,10 @@ __all__: lst[str] = [
     "OutOfRangeException",
     "ParserException",
     "PermissionException",
+    "PreparedStatement",
     "ProgrammingError",
     "PythonExceptionHandling",
+    "QueryFuture",
     "RenderMode",
     "SQLExpression",
     "SequenceException",
@@ -104,11 +107,14 @@ __all__: lst[str] = [
     "array_type",
     "arrow",
     "begin",
+    "binding_stats",
     "checkpoint",
     "close",
     "commit",
     "connect",
+    "create_aggregate_function",
     "create_function",
+    "create_table_function",
     "cursor",
     "decimal_type",
     "default_connection",
@@ -121,6 +127,7 @@ __all__: lst[str] = [
     "enable_profiling",
     "enum_type",
     "execute",
+    "execute_batch",
     "executemany",
     "extract_statements",
     "to_arrow_reader",
@@ -135,6 +142,7 @@ __all__: lst[str] = [
     "fetchnumpy",
     "fetchone",
     "filesystem_is_registered",
+    "filesystem_stats",
     "filter",
     "from_arrow",
     "from_csv_auto",
@@ -145,6 +153,7 @@ __all__: lst[str] = [
     "get_table_names",
     "install_extension",
     "interrupt",
+    "invalidate_filesystem_cache",
     "limit",
     "list_filesystems",
     "list_type",
@@ -153,12 +162,15 @@ __all__: lst[str] = [
     "order",
     "paramstyle",
     "pl",
+    "prepare",
     "project",
     "query",
     "query_df",
     "query_progress",
+    "read_arrow_ipc",
     "read_csv",
     "read_json",
+    "read_numpy",
     "read_parquet",
     "register",
     "register_filesystem",
@@ -169,8 +181,10 @@ __all__: lst[str] = [
     "set_default_connection",
     "sql",
     "sqltype",
+    "statement_cache_stats",
     "string_type",
     "struct_type",
+    "submit",
     "table",
     "table_function",
     "tf",
@@ -208,14 +222,28 @@ class DuckDBPyConnection:
     def to_arrow_reader(self, batch_size: typing.SupportsInt = 1000000) -> pyarrow.lib.RecordBatchReader: ...
     def to_arrow_table(self, batch_size: typing.SupportsInt = 1000000) -> pyarrow.lib.Table: ...
     def begin(self) -> DuckDBPyConnection: ...
+    def binding_stats(self, *, aggregate: bool = False) -> dict[str, typing.Any]: ...
     def checkpoint(self) -> DuckDBPyConnection: ...
     def close(self) -> None: ...
     def commit(self) -> DuckDBPyConnection: ...
+    def create_aggregate_function(
+        self,
+        name: str,
+        init: Callable[[], typing.Any],
+        update: Callable[..., typing.Any],
+        combine: Callable[[typing.Any, typing.Any], typing.Any],
+        finalize: Callable[[typing.Any], PythonLiteral],
+        parameters: lst[IntoPyType],
+        return_type: IntoPyType,
+        *,
+        format: typing.Literal["arrow", "numpy"] = "arrow",
+        null_handling: func.FunctionNullHandling = ...,
+    ) -> DuckDBPyConnection: ...
     @typing.overload
     def create_function(
         self,
         name: str,
-        function: Callable[..., PythonLiteral],
+        function: Callable[..., PythonLiteral] | Callable[..., Awaitable[PythonLiteral]],
         parameters: lst[IntoPyType] | None = None,
         return_type: IntoPyType | None = None,
         *,
@@ -223,6 +251,9 @@ class DuckDBPyConnection:
         null_handling: func.FunctionNullHandling = ...,
         exception_handling: PythonExceptionHandling = ...,
         side_effects: bool = False,
+        concurrency: typing.SupportsInt | None = None,
+        timeout: float | None = None,
+        cache: bool | typing.SupportsInt | udf.FunctionCache | None = None,
     ) -> DuckDBPyConnection: ...
     @typing.overload
     def create_function(
@@ -237,6 +268,16 @@ class DuckDBPyConnection:
         exception_handling: PythonExceptionHandling = ...,
         side_effects: bool = False,
     ) -> DuckDBPyConnection: ...
+    def create_table_function(
+        self,
+        name: str,
+        function: Callable[..., typing.Any],
+        schema: dict[str, IntoPyType],
+        parameters: lst[IntoPyType] | None = None,
+        *,
+        cardinality: typing.SupportsInt | Callable[..., typing.SupportsInt | None] | None = None,
+        projection_pushdown: bool = False,
+    ) -> DuckDBPyConnection: ...
     def cursor(self) -> DuckDBPyConnection: ...
     def decimal_type(self, width: typing.SupportsInt, scale: typing.SupportsInt) -> sqltypes.DuckDBPyType: ...
     def df(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
@@ -244,6 +285,13 @@ class DuckDBPyConnection:
     def duplicate(self) -> DuckDBPyConnection: ...
     def enum_type(self, name: str, type: sqltypes.DuckDBPyType, values: lst[typing.Any]) -> sqltypes.DuckDBPyType: ...
     def execute(self, query: Statement | str, parameters: object = None) -> DuckDBPyConnection: ...
+    def execute_batch(
+        self,
+        queries: Iterable[Statement | str | tuple[Statement | str, object]],
+        *,
+        return_results: bool = True,
+        transaction: bool = False,
+    ) -> lst[DuckDBPyRelation] | None: ...
     def executemany(self, query: Statement | str, parameters: object = None) -> DuckDBPyConnection: ...
     def extract_statements(self, query: str) -> lst[Statement]: ...
     def fetch_arrow_table(self, rows_per_batch: typing.SupportsInt = 1000000) -> pyarrow.lib.Table:
@@ -262,6 +310,7 @@ class DuckDBPyConnection:
     def fetchnumpy(self) -> dict[str, np.typing.NDArray[typing.Any] | pandas.Categorical]: ...
     def fetchone(self) -> tuple[typing.Any, ...] | None: ...
     def filesystem_is_registered(self, name: str) -> bool: ...
+    def filesystem_stats(self, name: str) -> dict[str, int]: ...
     def from_arrow(self, arrow_object: object) -> DuckDBPyRelation: ...
     def from_csv_auto(
         self,
@@ -341,6 +390,7 @@ class DuckDBPyConnection:
     def enable_profiling(self) -> None: ...
     def disable_profiling(self) -> None: ...
     def interrupt(self) -> None: ...
+    def invalidate_filesystem_cache(self, name: str, path: str | None = None) -> None: ...
     def list_filesystems(self) -> lst[str]: ...
     def list_type(self, type: IntoPyType) -> sqltypes.DuckDBPyType: ...
     def load_extension(self, extension: str) -> None: ...
@@ -355,8 +405,19 @@ class DuckDBPyConnection:
     def pl(
         self, rows_per_batch: typing.SupportsInt = 1000000, *, lazy: bool = False
     ) -> polars.DataFrame | polars.LazyFrame: ...
+    def prepare(self, query: Statement | str) -> PreparedStatement: ...
     def query(self, query: str, *, alias: str = "", params: object = None) -> DuckDBPyRelation: ...
     def query_progress(self) -> float: ...
+    def read_arrow_ipc(
+        self,
+        path_or_buffer: str
+        | bytes
+        | os.PathLike[str]
+        | os.PathLike[bytes]
+        | typing.IO[bytes]
+        | typing.IO[str]
+        | Sequence[str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str]],
+    ) -> DuckDBPyRelation: ...
     def read_csv(
         self,
         path_or_buffer: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str],
@@ -426,6 +487,16 @@ class DuckDBPyConnection:
         hive_types: HiveTypes | None = None,
         hive_types_autocast: bool | None = None,
     ) -> DuckDBPyRelation: ...
+    def read_numpy(
+        self,
+        path_or_buffer: str
+        | bytes
+        | os.PathLike[str]
+        | os.PathLike[bytes]
+        | typing.IO[bytes]
+        | typing.IO[str]
+        | Sequence[str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str]],
+    ) -> DuckDBPyRelation: ...
     def read_parquet(
         self,
         path_or_buffer: str
@@ -444,14 +515,27 @@ class DuckDBPyConnection:
         compression: ParquetCompression | None = None,
     ) -> DuckDBPyRelation: ...
     def register(self, view_name: str, python_object: object) -> DuckDBPyConnection: ...
-    def register_filesystem(self, filesystem: fsspec.AbstractFileSystem) -> None: ...
+    def register_filesystem(
+        self,
+        filesystem: fsspec.AbstractFileSystem,
+        *,
+        cache_size: typing.SupportsInt = 0,
+        block_size: typing.SupportsInt = 1048576,
+        read_ahead: typing.SupportsInt = 0,
+        metadata_ttl: float = 0,
+        write_buffer_size: typing.SupportsInt = 1048576,
+        upload_block_size: typing.SupportsInt | None = None,
+        read_timeout: float = 30,
+    ) -> None: ...
     def remove_function(self, name: str) -> DuckDBPyConnection: ...
     def rollback(self) -> DuckDBPyConnection: ...
     def row_type(self, fields: IntoFields) -> sqltypes.DuckDBPyType: ...
     def sql(self, query: Statement | str, *, alias: str = "", params: object = None) -> DuckDBPyRelation: ...
     def sqltype(self, type_str: str) -> sqltypes.DuckDBPyType: ...
+    def statement_cache_stats(self) -> dict[str, int]: ...
     def string_type(self, collation: str = "") -> sqltypes.DuckDBPyType: ...
     def struct_type(self, fields: IntoFields) -> sqltypes.DuckDBPyType: ...
+    def submit(self, query: Statement | str, parameters: object = None) -> QueryFuture: ...
     def table(self, table_name: str) -> DuckDBPyRelation: ...
     def table_function(self, name: str, parameters: object = None) -> DuckDBPyRelation: ...
     def tf(self) -> dict[str, typing.Any]: ...
@@ -599,7 +683,13 @@ class DuckDBPyRelation:
         self, expression: str, groups: str = "", window_spec: str = "", projected_columns: str = ""
     ) -> DuckDBPyRelation: ...
     def map(
-        self, map_function: Callable[..., typing.Any], *, schema: dict[str, sqltypes.DuckDBPyType] | None = None
+        self,
+        map_function: Callable[..., typing.Any],
+        *,
+        schema: dict[str, sqltypes.DuckDBPyType] | None = None,
+        format: typing.Literal["pandas", "arrow", "polars"] = "pandas",
+        batch_rows: typing.SupportsInt | None = None,
+        parallel: bool = True,
     ) -> DuckDBPyRelation: ...
     def max(
         self, expression: str, groups: str = "", window_spec: str = "", projected_columns: str = ""
@@ -707,7 +797,7 @@ class DuckDBPyRelation:
     def tf(self) -> dict[str, typing.Any]: ...
     def to_csv(
         self,
-        file_name: str,
+        file_name: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str],
         *,
         sep: str | None = None,
         na_rep: str | None = None,
@@ -728,7 +818,7 @@ class DuckDBPyRelation:
     def to_df(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
     def to_parquet(
         self,
-        file_name: str,
+        file_name: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes],
         *,
         compression: ParquetCompression | None = None,
         field_ids: ParquetFieldsOptions | None = None,
@@ -743,6 +833,7 @@ class DuckDBPyRelation:
         filename_pattern: str | None = None,
         file_size_bytes: str | int | None = None,
     ) -> None: ...
+    def to_shared_memory(self, name: str, *, batch_size: typing.SupportsInt = 1000000) -> SharedResult: ...
     def to_table(self, table_name: str) -> None: ...
     def to_view(self, view_name: str, replace: bool = True) -> DuckDBPyRelation: ...
     def torch(self) -> dict[str, typing.Any]: ...
@@ -764,7 +855,7 @@ class DuckDBPyRelation:
     ) -> DuckDBPyRelation: ...
     def write_csv(
         self,
-        file_name: str,
+        file_name: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str],
         *,
         sep: str | None = None,
         na_rep: str | None = None,
@@ -784,7 +875,7 @@ class DuckDBPyRelation:
     ) -> None: ...
     def write_parquet(
         self,
-        file_name: str,
+        file_name: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes],
         *,
         compression: ParquetCompression | None = None,
         field_ids: ParquetFieldsOptions | None = None,
@@ -837,7 +928,55 @@ class OutOfMemoryException(OperationalError): ...
 class OutOfRangeException(DataError): ...
 class ParserException(ProgrammingError): ...
 class PermissionException(DatabaseError): ...
+
+class PreparedStatement:
+    def close(self) -> None: ...
+    def df(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
+    def execute(self, parameters: object = None) -> PreparedStatement: ...
+    def executemany(self, parameters: object) -> PreparedStatement: ...
+    def fetch_df(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
+    def fetch_df_chunk(
+        self, vectors_per_chunk: typing.SupportsInt = 1, *, date_as_object: bool = False
+    ) -> pandas.DataFrame: ...
+    def fetchall(self) -> lst[tuple[typing.Any, ...]]: ...
+    def fetchdf(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
+    def fetchmany(self, size: typing.SupportsInt = 1) -> lst[tuple[typing.Any, ...]]: ...
+    def fetchnumpy(self) -> dict[str, np.typing.NDArray[typing.Any] | pandas.Categorical]: ...
+    def fetchone(self) -> tuple[typing.Any, ...] | None: ...
+    @typing.overload
+    def pl(
+        self, rows_per_batch: typing.SupportsInt = 1000000, *, lazy: typing.Literal[False] = ...
+    ) -> polars.DataFrame: ...
+    @typing.overload
+    def pl(self, rows_per_batch: typing.SupportsInt = 1000000, *, lazy: typing.Literal[True]) -> polars.LazyFrame: ...
+    @typing.overload
+    def pl(
+        self, rows_per_batch: typing.SupportsInt = 1000000, *, lazy: bool = False
+    ) -> polars.DataFrame | polars.LazyFrame: ...
+    def to_arrow_reader(self, batch_size: typing.SupportsInt = 1000000) -> pyarrow.lib.RecordBatchReader: ...
+    def to_arrow_table(self, batch_size: typing.SupportsInt = 1000000) -> pyarrow.lib.Table: ...
+    @property
+    def columns(self) -> lst[str]: ...
+    @property
+    def description(self) -> lst[tuple[str, sqltypes.DuckDBPyType, None, None, None, None, None]] | None: ...
+    @property
+    def parameter_types(self) -> dict[str, sqltypes.DuckDBPyType | None]: ...
+    @property
+    def query(self) -> str: ...
+    @property
+    def type(self) -> StatementType: ...
+    @property
+    def types(self) -> lst[sqltypes.DuckDBPyType]: ...
+
 class ProgrammingError(DatabaseError): ...
+
+class QueryFuture:
+    def cancel(self) -> bool: ...
+    def cancelled(self) -> bool: ...
+    def done(self) -> bool: ...
+    def progress(self) -> float: ...
+    def result(self, timeout: float | None = None) -> DuckDBPyRelation: ...
+
 class SequenceException(DatabaseError): ...
 class SerializationException(OperationalError): ...
 
@@ -895,6 +1034,9 @@ def to_arrow_table(
     batch_size: typing.SupportsInt = 1000000, *, connection: DuckDBPyConnection | None = None
 ) -> pyarrow.lib.Table: ...
 def begin(*, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
+def binding_stats(
+    *, aggregate: bool = False, connection: DuckDBPyConnection | None = None
+) -> dict[str, typing.Any]: ...
 def checkpoint(*, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
 def close(*, connection: DuckDBPyConnection | None = None) -> None: ...
 def commit(*, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
@@ -903,10 +1045,23 @@ def connect(
     read_only: bool = False,
     config: dict[str, str | bool | int | float | lst[str]] | None = None,
 ) -> DuckDBPyConnection: ...
+def create_aggregate_function(
+    name: str,
+    init: Callable[[], typing.Any],
+    update: Callable[..., typing.Any],
+    combine: Callable[[typing.Any, typing.Any], typing.Any],
+    finalize: Callable[[typing.Any], PythonLiteral],
+    parameters: lst[IntoPyType],
+    return_type: IntoPyType,
+    *,
+    format: typing.Literal["arrow", "numpy"] = "arrow",
+    null_handling: func.FunctionNullHandling = ...,
+    connection: DuckDBPyConnection | None = None,
+) -> DuckDBPyConnection: ...
 @typing.overload
 def create_function(
     name: str,
-    function: Callable[..., PythonLiteral],
+    function: Callable[..., PythonLiteral] | Callable[..., Awaitable[PythonLiteral]],
     parameters: lst[IntoPyType] | None = None,
     return_type: IntoPyType | None = None,
     *,
@@ -914,6 +1069,9 @@ def create_function(
     null_handling: func.FunctionNullHandling = ...,
     exception_handling: PythonExceptionHandling = ...,
     side_effects: bool = False,
+    concurrency: typing.SupportsInt | None = None,
+    timeout: float | None = None,
+    cache: bool | typing.SupportsInt | udf.FunctionCache | None = None,
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyConnection: ...
 @typing.overload
@@ -929,6 +1087,16 @@ def create_function(
     side_effects: bool = False,
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyConnection: ...
+def create_table_function(
+    name: str,
+    function: Callable[..., typing.Any],
+    schema: dict[str, IntoPyType],
+    parameters: lst[IntoPyType] | None = None,
+    *,
+    cardinality: typing.SupportsInt | Callable[..., typing.SupportsInt | None] | None = None,
+    projection_pushdown: bool = False,
+    connection: DuckDBPyConnection | None = None,
+) -> DuckDBPyConnection: ...
 def cursor(*, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
 def decimal_type(
     width: typing.SupportsInt, scale: typing.SupportsInt, *, connection: DuckDBPyConnection | None = None
@@ -957,6 +1125,13 @@ def execute(
     *,
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyConnection: ...
+def execute_batch(
+    queries: Iterable[Statement | str | tuple[Statement | str, object]],
+    *,
+    return_results: bool = True,
+    transaction: bool = False,
+    connection: DuckDBPyConnection | None = None,
+) -> lst[DuckDBPyRelation] | None: ...
 def executemany(
     query: Statement | str,
     parameters: object = None,
@@ -993,6 +1168,7 @@ def fetchnumpy(
 ) -> dict[str, np.typing.NDArray[typing.Any] | pandas.Categorical]: ...
 def fetchone(*, connection: DuckDBPyConnection | None = None) -> tuple[typing.Any, ...] | None: ...
 def filesystem_is_registered(name: str, *, connection: DuckDBPyConnection | None = None) -> bool: ...
+def filesystem_stats(name: str, *, connection: DuckDBPyConnection | None = None) -> dict[str, int]: ...
 def filter(
     df: pandas.DataFrame,
     filter_expr: IntoExprColumn,
@@ -1086,6 +1262,9 @@ def install_extension(
     connection: DuckDBPyConnection | None = None,
 ) -> None: ...
 def interrupt(*, connection: DuckDBPyConnection | None = None) -> None: ...
+def invalidate_filesystem_cache(
+    name: str, path: str | None = None, *, connection: DuckDBPyConnection | None = None
+) -> None: ...
 def limit(
     df: pandas.DataFrame,
     n: typing.SupportsInt,
@@ -1128,6 +1307,7 @@ def pl(
     lazy: bool = False,
     connection: DuckDBPyConnection | None = None,
 ) -> polars.DataFrame | polars.LazyFrame: ...
+def prepare(query: Statement | str, *, connection: DuckDBPyConnection | None = None) -> PreparedStatement: ...
 def project(
     df: pandas.DataFrame, *args: IntoExpr, groups: str = "", connection: DuckDBPyConnection | None = None
 ) -> DuckDBPyRelation: ...
@@ -1146,6 +1326,17 @@ def query_df(
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyRelation: ...
 def query_progress(*, connection: DuckDBPyConnection | None = None) -> float: ...
+def read_arrow_ipc(
+    path_or_buffer: str
+    | bytes
+    | os.PathLike[str]
+    | os.PathLike[bytes]
+    | typing.IO[bytes]
+    | typing.IO[str]
+    | Sequence[str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str]],
+    *,
+    connection: DuckDBPyConnection | None = None,
+) -> DuckDBPyRelation: ...
 def read_csv(
     path_or_buffer: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str],
     header: bool | int | None = None,
@@ -1213,6 +1404,17 @@ def read_json(
     hive_types: HiveTypes | None = None,
     hive_types_autocast: bool | None = None,
 ) -> DuckDBPyRelation: ...
+def read_numpy(
+    path_or_buffer: str
+    | bytes
+    | os.PathLike[str]
+    | os.PathLike[bytes]
+    | typing.IO[bytes]
+    | typing.IO[str]
+    | Sequence[str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str]],
+    *,
+    connection: DuckDBPyConnection | None = None,
+) -> DuckDBPyRelation: ...
 def read_parquet(
     path_or_buffer: str
     | bytes
@@ -1237,7 +1439,16 @@ def register(
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyConnection: ...
 def register_filesystem(
-    filesystem: fsspec.AbstractFileSystem, *, connection: DuckDBPyConnection | None = None
+    filesystem: fsspec.AbstractFileSystem,
+    *,
+    cache_size: typing.SupportsInt = 0,
+    block_size: typing.SupportsInt = 1048576,
+    read_ahead: typing.SupportsInt = 0,
+    metadata_ttl: float = 0,
+    write_buffer_size: typing.SupportsInt = 1048576,
+    upload_block_size: typing.SupportsInt | None = None,
+    read_timeout: float = 30,
+    connection: DuckDBPyConnection | None = None,
 ) -> None: ...
 def remove_function(name: str, *, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
 def rollback(*, connection: DuckDBPyConnection | None = None) -> DuckDBPyConnection: ...
@@ -1252,8 +1463,12 @@ def sql(
     connection: DuckDBPyConnection | None = None,
 ) -> DuckDBPyRelation: ...
 def sqltype(type_str: str, *, connection: DuckDBPyConnection | None = None) -> sqltypes.DuckDBPyType: ...
+def statement_cache_stats(*, connection: DuckDBPyConnection | None = None) -> dict[str, int]: ...
 def string_type(collation: str = "", *, connection: DuckDBPyConnection | None = None) -> sqltypes.DuckDBPyType: ...
 def struct_type(fields: IntoFields, *, connection: DuckDBPyConnection | None = None) -> sqltypes.DuckDBPyType: ...
+def submit(
+    query: Statement | str, parameters: object = None, *, connection: DuckDBPyConnection | None = None
+) -> QueryFuture: ...
 def table(table_name: str, *, connection: DuckDBPyConnection | None = None) -> DuckDBPyRelation: ...
 def table_function(
     name: str,
@@ -1272,7 +1487,7 @@ def values(*args: IntoValues, connection: DuckDBPyConnection | None = None) -> D
 def view(view_name: str, *, connection: DuckDBPyConnection | None = None) -> DuckDBPyRelation: ...
 def write_csv(
     df: pandas.DataFrame,
-    filename: str,
+    filename: str | bytes | os.PathLike[str] | os.PathLike[bytes] | typing.IO[bytes] | typing.IO[str],
     *,
     sep: str | None = None,
     na_rep: str | None = None,
@@ -11,10 +11,14 @@ still captures per-batch Produce GIL calls + UDF dispatch. Never gated either wa
 
 GOTCHA: a SINGLE-BATCH arrow table does NOT parallelize (one batch = one serial scan unit). The arrow scan bench
 MUST use a MULTI-BATCH table AND a CPU-heavy aggregate (a cheap sum is bandwidth-bound and won't parallelize).
+
+The client benches scale the other way round: many Python threads, one cursor each. They show what the GIL costs
+concurrent fetch / ingest, and what a free-threaded interpreter gives back.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import pytest
@@ -23,6 +27,8 @@ import duckdb
 from duckdb.sqltypes import BIGINT
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_codspeed import BenchmarkFixture
 
 pa = pytest.importorskip("pyarrow")
@@ -109,3 +115,57 @@ def test_udf_arrow_parallel(benchmark: BenchmarkFixture, threads: int) -> None:
         benchmark(lambda: con.execute("SELECT sum(af(a)) FROM t").fetchall())
     finally:
         con.close()
+
+
+# Concurrent CLIENTS: N Python threads, one cursor each, fetching / ingesting at the same time. With the GIL the
+# per-row conversion of fetchall and the per-value conversion of executemany serialize, so the walltime grows with
+# the thread count; on a free-threaded build (3.13t/3.14t) they run in parallel and it should stay ~flat.
+N_CLIENT_FETCH = 200_000
+N_CLIENT_INGEST = 20_000
+PYTHON_THREADS = [1, 2, 4, 8]
+
+
+def _run_clients(
+    con: duckdb.DuckDBPyConnection, threads: int, work: Callable[[duckdb.DuckDBPyConnection, int], None]
+) -> None:
+    cursors = [con.cursor() for _ in range(threads)]
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for future in [pool.submit(work, cursor, client) for client, cursor in enumerate(cursors)]:
+                future.result()
+    finally:
+        for cursor in cursors:
+            cursor.close()
+
+
+@pytest.mark.parametrize("threads", PYTHON_THREADS)
+def test_clients_fetchall(benchmark: BenchmarkFixture, threads: int) -> None:
+    con = duckdb.connect()
+    try:
+        con.execute(f"CREATE TABLE t AS SELECT i AS a, i::VARCHAR AS b FROM range({N_CLIENT_FETCH}) s(i)")
+
+        def work(cursor: duckdb.DuckDBPyConnection, client: int) -> None:
+            cursor.execute("SELECT a, b FROM t").fetchall()
+
+        _run_clients(con, threads, work)  # warm
+        benchmark(lambda: _run_clients(con, threads, work))
+    finally:
+        con.close()
+
+
+@pytest.mark.parametrize("threads", PYTHON_THREADS)
+def test_clients_ingest(benchmark: BenchmarkFixture, threads: int) -> None:
+    con = duckdb.connect()
+    try:
+        rows = [(i, str(i)) for i in range(N_CLIENT_INGEST)]
+        for client in range(threads):
+            con.execute(f"CREATE TABLE t{client} (a BIGINT, b VARCHAR)")
+
+        def work(cursor: duckdb.DuckDBPyConnection, client: int) -> None:
+            # every client appends to its own table, so the clients don't conflict on commit
+            cursor.executemany(f"INSERT INTO t{client} VALUES (?, ?)", rows)
+
+        _run_clients(con, threads, work)  # warm
+        benchmark(lambda: _run_clients(con, threads, work))
+    finally:
+        con.close()
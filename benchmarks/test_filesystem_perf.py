@@ -0,0 +1,90 @@
+"""Parquet scans through a registered fsspec filesystem with injected latency. Walltime-only, never gated.
+
+`LatencyFileSystem` is an async fsspec stand-in for an object store: every request (a file-handle read or a
+`_cat_file` range) sleeps LATENCY before it returns. Without the block cache every DuckDB read is a sequential
+seek+read round trip through the file handle; with it the missing blocks of a read go out as one `cat_ranges`
+call whose ranges the async filesystem awaits concurrently. fsspec is not in the frozen bench pins, so the module
+skips unless it is installed locally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+import duckdb
+
+if TYPE_CHECKING:
+    from pytest_codspeed import BenchmarkFixture
+
+fsspec = pytest.importorskip("fsspec")
+from fsspec.asyn import AsyncFileSystem  # noqa: E402  (after importorskip, matching the suite convention)
+
+pytestmark = pytest.mark.informational
+
+LATENCY = 0.005  # seconds per request, a fast object store
+N_ROWS = 1_000_000
+QUERY = "SELECT sum(a), sum(length(b)) FROM read_parquet('latency://data.parquet')"
+
+
+class LatencyFile(io.BytesIO):
+    def read(self, size: int | None = -1) -> bytes:
+        time.sleep(LATENCY)
+        return super().read(size)
+
+
+class LatencyFileSystem(AsyncFileSystem):
+    protocol = "latency"
+
+    def __init__(self, files: dict[str, bytes], **kwargs: object) -> None:
+        super().__init__(**kwargs)
+        self.files = files
+
+    async def _info(self, path: str, **kwargs: object) -> dict[str, object]:
+        path = self._strip_protocol(path)
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return {"name": path, "size": len(self.files[path]), "type": "file"}
+
+    async def _cat_file(self, path: str, start: int | None = None, end: int | None = None, **kwargs: object) -> bytes:
+        await asyncio.sleep(LATENCY)
+        return self.files[self._strip_protocol(path)][start:end]
+
+    def _open(self, path: str, mode: str = "rb", **kwargs: object) -> LatencyFile:
+        return LatencyFile(self.files[self._strip_protocol(path)])
+
+
+@pytest.fixture(scope="module")
+def parquet_file() -> dict[str, bytes]:
+    buffer = fsspec.filesystem("memory", skip_instance_cache=True)
+    buffer.store = {}
+    with duckdb.connect() as con:
+        con.register_filesystem(buffer)
+        con.execute(
+            f"COPY (SELECT i AS a, 'value_' || i AS b FROM range({N_ROWS}) t(i)) TO 'memory://data.parquet' "
+            "(FORMAT PARQUET, ROW_GROUP_SIZE 100000)"
+        )
+    return {"data.parquet": buffer.cat("data.parquet")}
+
+
+def _bench(benchmark: BenchmarkFixture, files: dict[str, bytes], **options: int) -> None:
+    def run() -> None:
+        # a fresh connection per round, so the block cache starts cold every time
+        with duckdb.connect(config={"threads": 4}) as con:
+            con.register_filesystem(LatencyFileSystem(files, skip_instance_cache=True), **options)
+            con.execute(QUERY).fetchall()
+
+    run()
+    benchmark(run)
+
+
+def test_parquet_scan_handle_reads(benchmark: BenchmarkFixture, parquet_file: dict[str, bytes]) -> None:
+    _bench(benchmark, parquet_file)
+
+
+def test_parquet_scan_range_reads(benchmark: BenchmarkFixture, parquet_file: dict[str, bytes]) -> None:
+    _bench(benchmark, parquet_file, cache_size=1 << 28, block_size=1 << 18, read_ahead=4)
@@ -48,8 +48,10 @@ from _duckdb import (
     OutOfRangeException,
     ParserException,
     PermissionException,
+    PreparedStatement,
     ProgrammingError,
     PythonExceptionHandling,
+    QueryFuture,
     RenderMode,
     SequenceException,
     SerializationException,
@@ -74,11 +76,14 @@ from _duckdb import (
     array_type,
     arrow,
     begin,
+    binding_stats,
     checkpoint,
     close,
     commit,
     connect,
+    create_aggregate_function,
     create_function,
+    create_table_function,
     cursor,
     decimal_type,
     default_connection,
@@ -91,6 +96,7 @@ from _duckdb import (
     enable_profiling,
     enum_type,
     execute,
+    execute_batch,
     executemany,
     extract_statements,
     fetch_arrow_table,
@@ -103,6 +109,7 @@ from _duckdb import (
     fetchnumpy,
     fetchone,
     filesystem_is_registered,
+    filesystem_stats,
     filter,
     from_arrow,
     from_csv_auto,
@@ -113,6 +120,7 @@ from _duckdb import (
     get_table_names,
     install_extension,
     interrupt,
+    invalidate_filesystem_cache,
     limit,
     list_filesystems,
     list_type,
@@ -121,12 +129,15 @@ from _duckdb import (
     order,
     paramstyle,
     pl,
+    prepare,
     project,
     query,
     query_df,
     query_progress,
+    read_arrow_ipc,
     read_csv,
     read_json,
+    read_numpy,
     read_parquet,
     register,
     register_filesystem,
@@ -137,8 +148,10 @@ from _duckdb import (
     set_default_connection,
     sql,
     sqltype,
+    statement_cache_stats,
     string_type,
     struct_type,
+    submit,
     table,
     table_function,
     tf,
@@ -170,6 +183,15 @@ from duckdb._version import (
     __version__,
     version,
 )
+from duckdb.pool import ConnectionPool
+from duckdb.remote import (
+    connect_remote,
+    serve,
+)
+from duckdb.shared_memory import (
+    SharedResult,
+    attach_shared_result,
+)
 from duckdb.value.constant import (
     BinaryValue,
     BitValue,
@@ -218,6 +240,7 @@ __all__: list[str] = [
     "CoalesceOperator",
     "ColumnExpression",
     "ConnectionException",
+    "ConnectionPool",
     "ConstantExpression",
     "ConstraintException",
     "ConversionException",
@@ -260,12 +283,15 @@ __all__: list[str] = [
     "OutOfRangeException",
     "ParserException",
     "PermissionException",
+    "PreparedStatement",
     "ProgrammingError",
     "PythonExceptionHandling",
+    "QueryFuture",
     "RenderMode",
     "SQLExpression",
     "SequenceException",
     "SerializationException",
+    "SharedResult",
     "ShortValue",
     "StarExpression",
     "Statement",
@@ -304,12 +330,17 @@ __all__: list[str] = [
     "append",
     "array_type",
     "arrow",
+    "attach_shared_result",
     "begin",
+    "binding_stats",
     "checkpoint",
     "close",
     "commit",
     "connect",
+    "connect_remote",
+    "create_aggregate_function",
     "create_function",
+    "create_table_function",
     "cursor",
     "decimal_type",
     "default_connection",
@@ -322,6 +353,7 @@ __all__: list[str] = [
     "enable_profiling",
     "enum_type",
     "execute",
+    "execute_batch",
     "executemany",
     "extract_statements",
     "fetch_arrow_table",
@@ -334,6 +366,7 @@ __all__: list[str] = [
     "fetchnumpy",
     "fetchone",
     "filesystem_is_registered",
+    "filesystem_stats",
     "filter",
     "from_arrow",
     "from_csv_auto",
@@ -344,6 +377,7 @@ __all__: list[str] = [
     "get_table_names",
     "install_extension",
     "interrupt",
+    "invalidate_filesystem_cache",
     "limit",
     "list_filesystems",
     "list_type",
@@ -353,12 +387,15 @@ __all__: list[str] = [
     "paramstyle",
     "paramstyle",
     "pl",
+    "prepare",
     "project",
     "query",
     "query_df",
     "query_progress",
+    "read_arrow_ipc",
     "read_csv",
     "read_json",
+    "read_numpy",
     "read_parquet",
     "register",
     "register_filesystem",
@@ -366,11 +403,14 @@ __all__: list[str] = [
     "rollback",
     "row_type",
     "rowcount",
+    "serve",
     "set_default_connection",
     "sql",
     "sqltype",
+    "statement_cache_stats",
     "string_type",
     "struct_type",
+    "submit",
     "table",
     "table_function",
     "tf",
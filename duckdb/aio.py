@@ -0,0 +1,186 @@
+"""Use DuckDB from asyncio without blocking the event loop.
+
+``await duckdb.aio.connect()`` returns an ``AsyncConnection``, whose queries and fetches are awaitables. Every
+connection runs its calls one at a time on its own worker thread, which waits for the query with the GIL released,
+so the event loop keeps running other tasks. Cancelling the task awaiting a call interrupts the query it runs.
+Results can be consumed as async iterators of rows (``async for row in connection``) or of Arrow record batches
+(``fetch_record_batch()``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import os
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+    import pyarrow
+    from _duckdb import DuckDBPyConnection, Statement
+
+    import numpy as np
+    import pandas
+
+__all__ = ["AsyncConnection", "AsyncRecordBatchReader", "connect"]
+
+_T = typing.TypeVar("_T")
+
+
+class AsyncRecordBatchReader:
+    """An async iterator of the Arrow record batches of a result, created by ``AsyncConnection.fetch_record_batch()``.
+
+    Every batch is read on the worker thread of the connection.
+    """
+
+    def __init__(  # noqa: D107
+        self, connection: AsyncConnection, reader: pyarrow.RecordBatchReader
+    ) -> None:
+        self._connection = connection
+        self._reader = reader
+
+    @property
+    def schema(self) -> pyarrow.Schema:
+        """The schema of the batches."""
+        return self._reader.schema
+
+    async def read_next_batch(self) -> pyarrow.RecordBatch | None:
+        """Read the next batch, or return None at the end of the result."""
+        return await self._connection._run(_read_next_batch, self._reader)
+
+    def __aiter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    async def __anext__(self) -> pyarrow.RecordBatch:  # noqa: D105
+        batch = await self.read_next_batch()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+
+def _read_next_batch(reader: pyarrow.RecordBatchReader) -> pyarrow.RecordBatch | None:
+    try:
+        return reader.read_next_batch()
+    except StopIteration:
+        return None
+
+
+class AsyncConnection:
+    """A connection whose calls are awaitables, created by ``connect()`` or ``AsyncConnection.cursor()``.
+
+    Like the connection it wraps, it holds one result at a time: ``execute()`` replaces the result of the previous
+    query. Use ``cursor()`` for concurrent queries.
+    """
+
+    def __init__(self, connection: DuckDBPyConnection) -> None:
+        """Wrap ``connection``, which should not be used by other threads while it is wrapped."""
+        self._connection = connection
+        # runs the calls of this connection and its readers one at a time, in submission order
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="duckdb-aio")
+
+    @property
+    def connection(self) -> DuckDBPyConnection:
+        """The wrapped connection."""
+        return self._connection
+
+    async def _run(self, function: Callable[..., _T], *args: object) -> _T:
+        future = self._executor.submit(function, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # cancelling the awaiting task cancels the call if it did not start yet, a running query is interrupted;
+            # wait until it stopped, the next call would otherwise queue behind it
+            if not future.cancelled():
+                self._connection.interrupt()
+                with contextlib.suppress(Exception):
+                    await asyncio.wrap_future(future)
+            raise
+
+    async def execute(self, query: Statement | str, parameters: object = None) -> typing.Self:
+        """Execute a query with the given parameters, the result is fetched with the fetch methods."""
+        await self._run(self._connection.execute, query, parameters)
+        return self
+
+    async def executemany(self, query: Statement | str, parameters: object = None) -> typing.Self:
+        """Execute a query once for every set of parameters."""
+        await self._run(self._connection.executemany, query, parameters)
+        return self
+
+    async def fetchone(self) -> tuple[typing.Any, ...] | None:
+        """Fetch the next row of the result."""
+        return await self._run(self._connection.fetchone)
+
+    async def fetchmany(self, size: int = 1) -> list[tuple[typing.Any, ...]]:
+        """Fetch the next ``size`` rows of the result."""
+        return await self._run(self._connection.fetchmany, size)
+
+    async def fetchall(self) -> list[tuple[typing.Any, ...]]:
+        """Fetch the remaining rows of the result."""
+        return await self._run(self._connection.fetchall)
+
+    async def fetchnumpy(self) -> dict[str, np.ndarray]:
+        """Fetch the result as a dict of NumPy arrays."""
+        return await self._run(self._connection.fetchnumpy)
+
+    async def df(self, *, date_as_object: bool = False) -> pandas.DataFrame:
+        """Fetch the result as a pandas DataFrame."""
+        return await self._run(functools.partial(self._connection.df, date_as_object=date_as_object))
+
+    fetchdf = df
+
+    async def fetch_arrow_table(self, batch_size: int = 1000000) -> pyarrow.Table:
+        """Fetch the result as an Arrow table."""
+        return await self._run(self._connection.to_arrow_table, batch_size)
+
+    async def fetch_record_batch(self, rows_per_batch: int = 1000000) -> AsyncRecordBatchReader:
+        """Fetch the result as an async iterator of Arrow record batches of ``rows_per_batch`` rows."""
+        reader = await self._run(self._connection.to_arrow_reader, rows_per_batch)
+        return AsyncRecordBatchReader(self, reader)
+
+    async def rows(self, batch_size: int = 10000) -> AsyncIterator[tuple[typing.Any, ...]]:
+        """Iterate over the rows of the result, fetching ``batch_size`` rows at a time on the worker thread."""
+        while rows := await self.fetchmany(batch_size):
+            for row in rows:
+                yield row
+
+    def __aiter__(self) -> AsyncIterator[tuple[typing.Any, ...]]:  # noqa: D105
+        return self.rows()
+
+    def interrupt(self) -> None:
+        """Interrupt the running query, like cancelling the task awaiting it."""
+        self._connection.interrupt()
+
+    def cursor(self) -> AsyncConnection:
+        """Create a connection to the same database, with its own worker thread."""
+        return AsyncConnection(self._connection.cursor())
+
+    async def close(self) -> None:
+        """Close the connection and stop its worker thread."""
+        try:
+            await self._run(self._connection.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    async def __aexit__(self, *args: object) -> None:  # noqa: D105
+        await self.close()
+
+
+async def connect(
+    database: str | os.PathLike[str] = ":memory:",
+    read_only: bool = False,  # noqa: FBT001
+    config: dict[str, typing.Any] | None = None,
+) -> AsyncConnection:
+    """Open a connection like ``duckdb.connect()``, on a worker thread since opening a database file can block."""
+    import duckdb
+
+    loop = asyncio.get_running_loop()
+    connection = await loop.run_in_executor(
+        None, functools.partial(duckdb.connect, os.fspath(database), read_only=read_only, config=config or {})
+    )
+    return AsyncConnection(connection)
@@ -5,14 +5,179 @@ Warning: Not for external use. May change at any moment. Likely to be made inter
 
 from __future__ import annotations
 
+import codecs
 import io
+import tempfile
+import threading
 import typing
+from datetime import datetime, timezone
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.memory import MemoryFile, MemoryFileSystem
 
 from .bytes_io_wrapper import BytesIOWrapper
 
+# Bytes of a non-seekable stream that are kept in memory for re-reads before spilling to a temporary file
+SPOOL_MEMORY = 16 * 1024 * 1024
+
+
+def _is_seekable(obj: object) -> bool:
+    try:
+        return bool(obj.seekable())  # type: ignore[attr-defined]
+    except Exception:
+        return False
+
+
+class FileObject:
+    """A file-like object registered in the filesystem, read in place instead of being copied into memory.
+
+    Seekable objects are read on demand at the requested offsets. Other objects are exposed as pipes that DuckDB
+    reads front to back, the bytes consumed so far are spooled so the stream can be read again.
+
+    Nothing is copied up front, so a seekable object is read again on every execution of the relation: closing it
+    makes later executions fail, and changes made to it show up in their results. Its position is left where it was
+    after every read.
+    """
+
+    def __init__(self, obj: io.IOBase | BytesIOWrapper, path: str) -> None:  # noqa: D107
+        self.obj = obj
+        self.path = path
+        self.created = self.modified = datetime.now(tz=timezone.utc)
+        self.lock = threading.Lock()
+        self.seekable = not isinstance(obj, BytesIOWrapper) and _is_seekable(obj)
+        if self.seekable:
+            # Like read(), start at the current position of the object
+            self.start = obj.tell()
+            self.size = obj.seek(0, io.SEEK_END) - self.start
+            obj.seek(self.start)
+        else:
+            self.size = 0
+            self.spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MEMORY)  # noqa: SIM115
+            self.spooled = 0
+
+    def open(self) -> FileObjectReader:
+        """Return a reader with its own position."""
+        return FileObjectReader(self)
+
+    def readinto(self, position: int, buffer: memoryview) -> int:
+        """Read into `buffer` at `position`, returning the number of bytes read."""
+        with self.lock:
+            if self.seekable:
+                if getattr(self.obj, "closed", False):
+                    msg = "The file-like object was closed before the relation reading it was executed"
+                    raise ValueError(msg)
+                # the caller may still be using the object, leave its position as it was
+                original_position = self.obj.tell()
+                try:
+                    self.obj.seek(self.start + position)
+                    return self._read_source(buffer)
+                finally:
+                    self.obj.seek(original_position)
+            if position < self.spooled:
+                self.spool.seek(position)
+                return self.spool.readinto(buffer)
+            count = self._read_source(buffer)
+            self.spool.seek(self.spooled)
+            self.spool.write(buffer[:count])
+            self.spooled += count
+            return count
+
+    def _read_source(self, buffer: memoryview) -> int:
+        if hasattr(self.obj, "readinto"):
+            return self.obj.readinto(buffer) or 0
+        data = self.obj.read(len(buffer))[: len(buffer)]
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """Release the spooled bytes, the file-like object itself is owned by the caller."""
+        if not self.seekable:
+            self.spool.close()
+
+
+class FileObjectReader(io.RawIOBase):
+    """A reader of a FileObject, keeping its own position so readers don't interfere with each other."""
+
+    def __init__(self, file: FileObject) -> None:  # noqa: D107
+        super().__init__()
+        self.file = file
+        self.position = 0
+
+    def readable(self) -> bool:  # noqa: D102
+        return True
+
+    def seekable(self) -> bool:  # noqa: D102
+        return self.file.seekable
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:  # noqa: D102
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += self.file.size
+        if not self.file.seekable and offset > self.file.spooled:
+            msg = "Can not seek past the data read so far from a non-seekable file-like object"
+            raise io.UnsupportedOperation(msg)
+        self.position = offset
+        return offset
+
+    def tell(self) -> int:  # noqa: D102
+        return self.position
+
+    def readinto(self, buffer: typing.Any) -> int:  # noqa: D102, ANN401
+        count = self.file.readinto(self.position, memoryview(buffer).cast("B"))
+        self.position += count
+        return count
+
+
+class FileObjectWriter(io.RawIOBase):
+    """A writable file-like object registered in the filesystem, DuckDB's writes are passed on as they come.
+
+    The object itself is left open when DuckDB closes the file. Text objects are written decoded as UTF-8.
+    """
+
+    def __init__(self, obj: io.IOBase | typing.Any, path: str) -> None:  # noqa: D107, ANN401
+        super().__init__()
+        self.obj = obj
+        self.path = path
+        self.created = self.modified = datetime.now(tz=timezone.utc)
+        # a multi-byte character can be split across writes
+        self.decoder = codecs.getincrementaldecoder("utf-8")() if isinstance(obj, io.TextIOBase) else None
+        self.size = 0
+
+    def writable(self) -> bool:  # noqa: D102
+        return True
+
+    def seekable(self) -> bool:  # noqa: D102
+        return False
+
+    def tell(self) -> int:  # noqa: D102
+        return self.size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:  # noqa: D102
+        if whence == io.SEEK_CUR:
+            offset += self.size
+        if whence == io.SEEK_END or offset != self.size:
+            msg = "Can not seek in a file-like object that is written to"
+            raise io.UnsupportedOperation(msg)
+        return offset
+
+    def write(self, data: typing.Any) -> int:  # noqa: D102, ANN401
+        data = bytes(data)
+        self.obj.write(self.decoder.decode(data) if self.decoder else data)
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:  # noqa: D102
+        if hasattr(self.obj, "flush"):
+            self.obj.flush()
+
+    def close(self) -> None:  # noqa: D102
+        if not self.closed:
+            if self.decoder:
+                self.obj.write(self.decoder.decode(b"", final=True))
+            self.flush()
+        super().close()
+
 
 class ModifiedMemoryFileSystem(MemoryFileSystem):
     """In-memory filesystem implementation that uses its own protocol."""
@@ -21,13 +186,50 @@ class ModifiedMemoryFileSystem(MemoryFileSystem):
     # defer to the original implementation that doesn't hardcode the protocol
     _strip_protocol: typing.Callable[[str], str] = classmethod(AbstractFileSystem._strip_protocol.__func__)  # type: ignore[assignment]
 
-    def add_file(self, obj: io.IOBase | BytesIOWrapper | object, path: str) -> None:
-        """Add a file to the filesystem."""
+    def add_file(self, obj: io.IOBase | BytesIOWrapper | object, path: str, *, allow_pipe: bool = False) -> None:
+        """Add a file to the filesystem.
+
+        Binary file-like objects that are seekable are read in place. With `allow_pipe`, other objects that report
+        they are not seekable are streamed as pipes. Remaining objects, including seekable ones whose position can't
+        be read or changed after all, are copied into memory.
+        """
         if not (hasattr(obj, "read") and hasattr(obj, "seek")):
             msg = "Can not read from a non file-like object"
             raise TypeError(msg)
+        streamable = hasattr(obj, "seekable")
         if isinstance(obj, io.TextIOBase):
             # Wrap this so that we can return a bytes object from 'read'
             obj = BytesIOWrapper(obj)
         path = self._strip_protocol(path)
-        self.store[path] = MemoryFile(self, path, obj.read())
+        if streamable and not isinstance(obj, BytesIOWrapper) and _is_seekable(obj):
+            try:
+                self.store[path] = FileObject(obj, path)
+            except OSError:
+                # tell() or seek() is not supported after all
+                self.store[path] = MemoryFile(self, path, obj.read())
+        elif streamable and allow_pipe:
+            self.store[path] = FileObject(obj, path)
+        else:
+            self.store[path] = MemoryFile(self, path, obj.read())
+
+    def add_writer(self, obj: io.IOBase | typing.Any, path: str) -> None:  # noqa: ANN401
+        """Add a file that is written to the file-like object `obj`."""
+        if not hasattr(obj, "write"):
+            msg = "Can not write to a non file-like object"
+            raise TypeError(msg)
+        path = self._strip_protocol(path)
+        self.store[path] = FileObjectWriter(obj, path)
+
+    def _open(self, path: str, mode: str = "rb", **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
+        entry = self.store.get(self._strip_protocol(path))
+        if isinstance(entry, FileObject) and mode == "rb":
+            return entry.open()
+        if isinstance(entry, FileObjectWriter) and mode in ("wb", "xb"):
+            return entry
+        return super()._open(path, mode, **kwargs)
+
+    def _rm(self, path: str) -> None:
+        entry = self.store.get(self._strip_protocol(path))
+        super()._rm(path)
+        if isinstance(entry, FileObject):
+            entry.close()
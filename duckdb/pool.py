@@ -0,0 +1,185 @@
+"""A thread-safe pool of connections to one database.
+
+``ConnectionPool`` keeps between ``min_size`` and ``max_size`` cursors of a single database connection and hands them
+out to threads, instead of creating a new cursor for every unit of work. A connection is reset when it is returned:
+its open transaction is rolled back and its result is cleared, so the next thread starts from a clean state. Settings
+changed with ``SET`` and objects registered on the connection are kept.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
+    from _duckdb import DuckDBPyConnection
+
+__all__ = ["ConnectionPool"]
+
+
+class ConnectionPool:
+    """A bounded pool of cursors of one database connection.
+
+    ``acquire()`` checks a connection out and ``release()`` returns it, ``connection()`` does both as a context
+    manager. When all ``max_size`` connections are checked out, ``acquire()`` waits until one is returned.
+    """
+
+    def __init__(
+        self,
+        database: str | os.PathLike[str] = ":memory:",
+        min_size: int = 1,
+        max_size: int = 8,
+        *,
+        read_only: bool = False,
+        config: dict[str, typing.Any] | None = None,
+    ) -> None:
+        """Connect to ``database`` and open ``min_size`` connections, see ``duckdb.connect()`` for the arguments."""
+        import duckdb
+
+        if max_size < 1:
+            msg = "max_size must be at least 1"
+            raise ValueError(msg)
+        if not 0 <= min_size <= max_size:
+            msg = "min_size must be between 0 and max_size"
+            raise ValueError(msg)
+        self._max_size = max_size
+        # every pooled connection is a cursor of this one, which also keeps an in-memory database alive
+        self._connection = duckdb.connect(database, read_only=read_only, config=config or {})
+        self._condition = threading.Condition()
+        self._idle: list[DuckDBPyConnection] = [self._connection.cursor() for _ in range(min_size)]
+        self._in_use: dict[int, DuckDBPyConnection] = {}
+        self._size = min_size
+        self._closed = False
+        self._acquisitions = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of connections of the pool."""
+        return self._max_size
+
+    def acquire(self, timeout: float | None = None) -> DuckDBPyConnection:
+        """Check out a connection, waiting at most ``timeout`` seconds for one to be returned.
+
+        Raises ``TimeoutError`` when no connection became available in time.
+        """
+        import duckdb
+
+        start = time.perf_counter()
+        deadline = None if timeout is None else start + timeout
+        waited = False
+        with self._condition:
+            while True:
+                if self._closed:
+                    msg = "The connection pool is closed"
+                    raise duckdb.ConnectionException(msg)
+                if self._idle:
+                    # the most recently returned connection, its caches are the warmest
+                    connection = self._idle.pop()
+                    break
+                if self._size < self._max_size:
+                    connection = None
+                    self._size += 1
+                    break
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    self._timeouts += 1
+                    msg = f"No connection became available within {timeout} seconds"
+                    raise TimeoutError(msg)
+                waited = True
+                self._condition.wait(remaining)
+            self._acquisitions += 1
+            if waited:
+                wait_time = time.perf_counter() - start
+                self._waits += 1
+                self._wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+        if connection is None:
+            try:
+                connection = self._connection.cursor()
+            except BaseException:
+                self._discard()
+                raise
+        with self._condition:
+            self._in_use[id(connection)] = connection
+        return connection
+
+    def _discard(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def release(self, connection: DuckDBPyConnection) -> None:
+        """Return a connection checked out with ``acquire()``, rolling back its open transaction."""
+        import duckdb
+
+        with self._condition:
+            if self._in_use.pop(id(connection), None) is None:
+                msg = "The connection was not acquired from this pool"
+                raise duckdb.InvalidInputException(msg)
+        try:
+            # clears the result before it fails when no transaction is open
+            connection.rollback()
+        except duckdb.TransactionException:
+            pass
+        except duckdb.Error:
+            # e.g. closed by the caller, the next acquire() opens a new connection instead
+            with contextlib.suppress(duckdb.Error):
+                connection.close()
+            self._discard()
+            return
+        with self._condition:
+            if self._closed:
+                self._size -= 1
+                return
+            self._idle.append(connection)
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[DuckDBPyConnection]:
+        """Check out a connection for the duration of a ``with`` block."""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def stats(self) -> dict[str, int | float]:
+        """Return the size of the pool and how long ``acquire()`` waited for a connection, in seconds."""
+        with self._condition:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "acquisitions": self._acquisitions,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "wait_time": self._wait_time,
+                "max_wait_time": self._max_wait_time,
+            }
+
+    def close(self) -> None:
+        """Close all connections, including the checked out ones, and wake up the waiting threads."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._size -= len(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        # closing a connection closes its cursors
+        self._connection.close()
+
+    def __enter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: D105
+        self.close()
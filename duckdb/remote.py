@@ -0,0 +1,400 @@
+"""Share one database between local processes through a query server on a Unix domain socket.
+
+``serve(connection, socket_path)`` answers queries from other processes on a cursor of ``connection``, and
+``connect_remote(socket_path)`` connects to it. Results are sent as Arrow IPC streams, batch by batch: the server only
+fetches the next batch of a query once the previous one was written to the socket, so a slow reader throttles the
+query instead of buffering its result.
+
+The protocol is a sequence of frames, a 4-byte big-endian length followed by a JSON object. A client opens a session
+(one cursor on the server) with ``{"op": "open"}`` and then sends ``{"op": "execute", ...}`` requests. Each request is
+answered with a status frame; when the query produced a result it is followed by an Arrow IPC stream and a trailing
+status frame, which reports errors raised while the result was streamed. ``{"op": "interrupt", "session": id}`` on a
+separate socket interrupts the query running in a session.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import os
+import struct
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    import socket
+    from collections.abc import Iterator
+
+    import pyarrow
+    from _duckdb import DuckDBPyConnection
+
+    import pandas
+
+__all__ = ["QueryServer", "RemoteConnection", "connect_remote", "serve"]
+
+_FRAME_LENGTH = struct.Struct(">I")
+
+
+def _send_frame(file: typing.BinaryIO, message: dict[str, typing.Any]) -> None:
+    payload = json.dumps(message).encode()
+    file.write(_FRAME_LENGTH.pack(len(payload)) + payload)
+    file.flush()
+
+
+def _receive_frame(file: typing.BinaryIO) -> dict[str, typing.Any] | None:
+    """Read the next frame, or return None when the other side closed the socket."""
+    header = file.read(_FRAME_LENGTH.size)
+    if len(header) < _FRAME_LENGTH.size:
+        return None
+    (length,) = _FRAME_LENGTH.unpack(header)
+    payload = file.read(length)
+    if len(payload) < length:
+        return None
+    return json.loads(payload)
+
+
+def _error_frame(error: Exception) -> dict[str, typing.Any]:
+    return {"status": "error", "type": type(error).__name__, "message": str(error)}
+
+
+def _invalid_request(message: str) -> dict[str, typing.Any]:
+    return {"status": "error", "type": "InvalidInputException", "message": message}
+
+
+def _raise_error(frame: dict[str, typing.Any]) -> typing.NoReturn:
+    import duckdb
+
+    # raise the same DuckDB exception type as a local query would
+    error_type = getattr(duckdb, frame.get("type", ""), None)
+    if not isinstance(error_type, type) or not issubclass(error_type, duckdb.Error):
+        error_type = duckdb.Error
+    raise error_type(frame.get("message", "The query server closed the connection"))
+
+
+class QueryServer:
+    """Answers queries on a Unix domain socket, every client session gets its own cursor of the connection.
+
+    Created by ``serve()``; the server accepts clients on a background thread until ``close()`` is called.
+    """
+
+    def __init__(
+        self, connection: DuckDBPyConnection, socket_path: str | os.PathLike[str], *, backlog: int = 64
+    ) -> None:
+        """Listen on ``socket_path``, see ``serve()``."""
+        import socket
+
+        self._connection = connection
+        self._path = os.fspath(socket_path)
+        self._lock = threading.Lock()
+        self._sessions: dict[int, tuple[DuckDBPyConnection, socket.socket]] = {}
+        self._session_ids = itertools.count(1)
+        self._closed = False
+
+        if os.path.exists(self._path):  # noqa: PTH110
+            self._remove_stale_socket()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.bind(self._path)
+            # only the owner may connect, the socket refuses connections until listen() so there is no window
+            os.chmod(self._path, 0o600)  # noqa: PTH101
+            self._socket.listen(backlog)
+        except BaseException:
+            self._socket.close()
+            raise
+        self._thread = threading.Thread(target=self._accept_clients, name="duckdb-query-server", daemon=True)
+        self._thread.start()
+
+    @property
+    def socket_path(self) -> str:
+        """The path of the Unix domain socket the server listens on."""
+        return self._path
+
+    def _remove_stale_socket(self) -> None:
+        import socket
+
+        # a socket left behind by a server that did not shut down cleanly refuses connections
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(self._path)
+            except ConnectionRefusedError:
+                os.unlink(self._path)  # noqa: PTH108
+                return
+        msg = f"Another query server is listening on '{self._path}'"
+        raise FileExistsError(msg)
+
+    def _accept_clients(self) -> None:
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            if self._closed:
+                client.close()
+                return
+            threading.Thread(
+                target=self._serve_client, args=(client,), name="duckdb-query-session", daemon=True
+            ).start()
+
+    def _serve_client(self, client: socket.socket) -> None:
+        session_id = None
+        cursor = None
+        try:
+            with client, client.makefile("rb") as reader, client.makefile("wb") as writer:
+                try:
+                    request = _receive_frame(reader)
+                    if request is None:
+                        return
+                    if request.get("op") == "interrupt":
+                        self._interrupt(request.get("session"))
+                        _send_frame(writer, {"status": "ok"})
+                        return
+                    if request.get("op") != "open":
+                        _send_frame(writer, _invalid_request("Expected a session to be opened"))
+                        return
+                    cursor = self._connection.cursor()
+                except OSError:
+                    raise
+                except Exception as error:
+                    _send_frame(writer, _error_frame(error))
+                    return
+                with self._lock:
+                    session_id = next(self._session_ids)
+                    self._sessions[session_id] = (cursor, client)
+                _send_frame(writer, {"status": "ok", "session": session_id})
+                while self._handle_request(cursor, reader, writer):
+                    pass
+        except OSError:
+            # the client went away while a result was being sent
+            pass
+        finally:
+            if session_id is not None:
+                with self._lock:
+                    self._sessions.pop(session_id, None)
+            if cursor is not None:
+                cursor.close()
+
+    def _handle_request(self, cursor: DuckDBPyConnection, reader: typing.BinaryIO, writer: typing.BinaryIO) -> bool:
+        """Answer the next request of a session, returns False once the session is closed."""
+        try:
+            request = _receive_frame(reader)
+            if request is None or request.get("op") == "close":
+                return False
+            if request.get("op") == "execute":
+                self._execute(cursor, request, writer)
+            else:
+                _send_frame(writer, _invalid_request(f"Unknown request '{request.get('op')}'"))
+        except OSError:
+            raise
+        except Exception as error:
+            # a malformed request is answered with an error, it doesn't end the session
+            _send_frame(writer, _error_frame(error))
+        return True
+
+    def _execute(self, cursor: DuckDBPyConnection, request: dict[str, typing.Any], writer: typing.BinaryIO) -> None:
+        import pyarrow.ipc
+
+        try:
+            relation = cursor.sql(request["query"], params=request.get("parameters"))
+            result = None if relation is None else relation.to_arrow_reader(request.get("batch_size", 1000000))
+        except Exception as error:
+            _send_frame(writer, _error_frame(error))
+            return
+        if result is None:
+            _send_frame(writer, {"status": "ok", "result": False})
+            return
+        _send_frame(writer, {"status": "ok", "result": True})
+        trailer: dict[str, typing.Any] = {"status": "ok"}
+        with pyarrow.ipc.new_stream(writer, result.schema) as stream:
+            try:
+                for batch in result:
+                    stream.write_batch(batch)
+                    writer.flush()
+            except OSError:
+                # the client went away
+                raise
+            except Exception as error:
+                # errors of the query surface through the Arrow stream, e.g. as pyarrow.ArrowInvalid
+                trailer = _error_frame(error)
+        _send_frame(writer, trailer)
+
+    def _interrupt(self, session_id: int | None) -> None:
+        with self._lock:
+            session = self._sessions.get(session_id) if session_id is not None else None
+        if session is not None:
+            session[0].interrupt()
+
+    def close(self) -> None:
+        """Stop accepting clients, interrupt the running queries and remove the socket."""
+        import socket
+
+        if self._closed:
+            return
+        self._closed = True
+        # wake up the accepting thread
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wakeup, contextlib.suppress(OSError):
+            wakeup.connect(self._path)
+        self._thread.join()
+        self._socket.close()
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for cursor, client in sessions:
+            cursor.interrupt()
+            with contextlib.suppress(OSError):
+                client.shutdown(socket.SHUT_RDWR)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)  # noqa: PTH108
+
+    def __enter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: D105
+        self.close()
+
+
+class RemoteConnection:
+    """A session on a ``QueryServer``, created by ``connect_remote()``.
+
+    Like a cursor, a session runs one query at a time: executing a new query interrupts and discards the result of
+    the previous one if it was not read completely. Use ``cursor()`` for concurrent queries.
+    """
+
+    def __init__(self, socket_path: str | os.PathLike[str]) -> None:  # noqa: D107
+        import socket
+
+        self._path = os.fspath(socket_path)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.connect(self._path)
+            self._reader = self._socket.makefile("rb")
+            self._writer = self._socket.makefile("wb")
+            _send_frame(self._writer, {"op": "open"})
+            response = self._receive()
+        except BaseException:
+            self._socket.close()
+            raise
+        self._session: int = response["session"]
+        self._stream: Iterator[pyarrow.RecordBatch] | None = None
+        self._schema: pyarrow.Schema | None = None
+        self._closed = False
+
+    def _receive(self) -> dict[str, typing.Any]:
+        frame = _receive_frame(self._reader)
+        if frame is None:
+            msg = "The query server closed the connection"
+            raise ConnectionError(msg)
+        if frame.get("status") != "ok":
+            _raise_error(frame)
+        return frame
+
+    def _batches(self, stream: pyarrow.ipc.RecordBatchStreamReader) -> Iterator[pyarrow.RecordBatch]:
+        yield from stream
+        self._stream = None
+        # errors raised by the query after the first batch arrive after the stream
+        self._receive()
+
+    def _discard_result(self) -> None:
+        if self._stream is None:
+            return
+        self.interrupt()
+        stream = self._stream
+        # the interrupted query reports an InterruptException
+        with contextlib.suppress(Exception):
+            for _ in stream:
+                pass
+        self._stream = None
+
+    def execute(self, query: str, parameters: object = None, *, batch_size: int = 1000000) -> typing.Self:
+        """Run ``query`` on the server, the parameters have to be JSON-serializable."""
+        import pyarrow.ipc
+
+        if self._closed:
+            msg = "The remote connection is closed"
+            raise ConnectionError(msg)
+        self._discard_result()
+        self._schema = None
+        request = {"op": "execute", "query": query, "parameters": parameters, "batch_size": batch_size}
+        _send_frame(self._writer, request)
+        response = self._receive()
+        if response.get("result"):
+            stream = pyarrow.ipc.open_stream(self._reader)
+            self._schema = stream.schema
+            self._stream = self._batches(stream)
+        return self
+
+    def _take_stream(self) -> tuple[pyarrow.Schema, Iterator[pyarrow.RecordBatch]]:
+        if self._stream is None or self._schema is None:
+            msg = "No open result set"
+            raise ValueError(msg)
+        return self._schema, self._stream
+
+    def to_arrow_reader(self) -> pyarrow.RecordBatchReader:
+        """Stream the result of the last query as an Arrow RecordBatchReader."""
+        import pyarrow as pa
+
+        schema, batches = self._take_stream()
+        return pa.RecordBatchReader.from_batches(schema, batches)
+
+    def to_arrow_table(self) -> pyarrow.Table:
+        """Fetch the result of the last query as an Arrow Table."""
+        import pyarrow as pa
+
+        schema, batches = self._take_stream()
+        return pa.Table.from_batches(list(batches), schema=schema)
+
+    def fetchall(self) -> list[tuple[typing.Any, ...]]:
+        """Fetch the result of the last query as a list of tuples."""
+        table = self.to_arrow_table()
+        return list(zip(*(column.to_pylist() for column in table.columns), strict=True))
+
+    def df(self) -> pandas.DataFrame:
+        """Fetch the result of the last query as a pandas DataFrame."""
+        return self.to_arrow_table().to_pandas()
+
+    def interrupt(self) -> None:
+        """Interrupt the query running in this session."""
+        import socket
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as control:
+            control.connect(self._path)
+            with control.makefile("rb") as reader, control.makefile("wb") as writer:
+                _send_frame(writer, {"op": "interrupt", "session": self._session})
+                _receive_frame(reader)
+
+    def cursor(self) -> RemoteConnection:
+        """Open another session on the same server, which runs its queries concurrently with this one."""
+        return RemoteConnection(self._path)
+
+    def close(self) -> None:
+        """Close the session, the server closes its cursor."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._discard_result()
+            _send_frame(self._writer, {"op": "close"})
+        except OSError:
+            pass
+        finally:
+            self._reader.close()
+            self._writer.close()
+            self._socket.close()
+
+    def __enter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: D105
+        self.close()
+
+
+def serve(connection: DuckDBPyConnection, socket_path: str | os.PathLike[str]) -> QueryServer:
+    """Answer queries of other local processes on ``connection`` through the Unix domain socket ``socket_path``.
+
+    Returns the running server, which stops when ``close()`` is called. Every client session runs on its own cursor.
+    """
+    return QueryServer(connection, socket_path)
+
+
+def connect_remote(socket_path: str | os.PathLike[str]) -> RemoteConnection:
+    """Connect to a query server started with ``serve()`` in another process."""
+    return RemoteConnection(socket_path)
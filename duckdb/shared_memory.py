@@ -0,0 +1,221 @@
+"""Share query results between local processes through shared memory.
+
+A result is written once as an Arrow IPC file into a named shared memory segment with
+``DuckDBPyRelation.to_shared_memory(name)``. Other processes open it with ``attach_shared_result(name)`` and read it
+as a pyarrow Table or a relation without copying: the Arrow buffers point into the mapped segment.
+
+Every open handle holds a reference that is counted in the header of the segment, the segment is removed when the
+last handle is closed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import struct
+import sys
+import tempfile
+import typing
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows, where the segment is removed once no process has it open
+    fcntl = None  # type: ignore[assignment]
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+    from multiprocessing.shared_memory import SharedMemory
+
+    import pyarrow
+    from _duckdb import DuckDBPyConnection, DuckDBPyRelation
+
+__all__ = ["SharedResult", "attach_shared_result"]
+
+_MAGIC = b"DUCKSHM1"
+# magic, reference count and length of the IPC file; the IPC file starts at a 64-byte aligned offset
+_HEADER = struct.Struct("<8sqq")
+_HEADER_SIZE = 64
+
+
+def _check_name(name: str) -> None:
+    # the name ends up in the path of the lock file, it must not point outside of the temporary directory
+    stripped = name.lstrip("/")
+    if not stripped or "/" in stripped or "\\" in stripped or stripped in (".", ".."):
+        msg = f"Invalid shared memory segment name '{name}'"
+        raise ValueError(msg)
+
+
+def _lock_path(name: str) -> str:
+    _check_name(name)
+    return os.path.join(tempfile.gettempdir(), f"duckdb-shared-{name.lstrip('/')}.lock")  # noqa: PTH118
+
+
+@contextlib.contextmanager
+def _locked(name: str) -> Iterator[None]:
+    """Serialize updates of the reference count of a segment across processes."""
+    if fcntl is None:
+        yield
+        return
+    with open(_lock_path(name), "a") as lock_file:  # noqa: PTH123
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _remove_lock_file(name: str) -> None:
+    if fcntl is not None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(_lock_path(name))  # noqa: PTH107
+
+
+def _open_segment(name: str, size: int = 0) -> SharedMemory:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+
+    create = size > 0
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, create=create, size=size, track=False)
+    segment = SharedMemory(name, create=create, size=size)
+    if os.name == "posix":
+        # the resource tracker would remove the segment when this process exits, the reference count decides instead
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    return segment
+
+
+def _unlink_segment(segment: SharedMemory) -> None:
+    from multiprocessing import resource_tracker
+
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # unlink() unregisters the segment from the resource tracker, which _open_segment already did
+        resource_tracker.register(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    segment.unlink()
+
+
+def _release(name: str, segment: SharedMemory) -> None:
+    """Drop a reference to the segment, removing it when it was the last one."""
+    with _locked(name):
+        magic, references, length = _HEADER.unpack_from(segment.buf)
+        references -= 1
+        _HEADER.pack_into(segment.buf, 0, magic, references, length)
+        if references <= 0:
+            with contextlib.suppress(FileNotFoundError):
+                _unlink_segment(segment)
+            _remove_lock_file(name)
+
+
+class SharedResult:
+    """A query result in a named shared memory segment, see ``attach_shared_result``.
+
+    The handle holds a reference to the segment until ``close()`` is called or the handle is garbage collected.
+    Tables read from it stay valid after ``close()``, the mapping is released when the last of them is gone.
+    """
+
+    def __init__(self, name: str, segment: SharedMemory) -> None:  # noqa: D107
+        self._name = name
+        self._segment: SharedMemory | None = segment
+        _, _, self._length = _HEADER.unpack_from(segment.buf)
+        self._finalizer = weakref.finalize(self, _release, name, segment)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory segment."""
+        return self._name
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the Arrow IPC file holding the result."""
+        return self._length
+
+    @property
+    def closed(self) -> bool:
+        """Whether the handle was closed."""
+        return self._segment is None
+
+    def to_arrow_table(self) -> pyarrow.Table:
+        """Read the result as a pyarrow Table whose buffers point into the shared memory segment."""
+        import ctypes
+
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        if self._segment is None:
+            msg = f"The shared result '{self._name}' is closed"
+            raise ValueError(msg)
+        # the buffer keeps the segment mapped for as long as the table uses it, without exporting its memoryview
+        address = ctypes.addressof(ctypes.c_char.from_buffer(self._segment.buf))
+        buffer = pa.foreign_buffer(address + _HEADER_SIZE, self._length, base=self._segment)
+        return pyarrow.ipc.open_file(buffer).read_all()
+
+    def to_relation(self, *, connection: DuckDBPyConnection | None = None) -> DuckDBPyRelation:
+        """Scan the result from DuckDB, on the default connection unless ``connection`` is given."""
+        import duckdb
+
+        if connection is None:
+            connection = duckdb.default_connection()
+        return connection.from_arrow(self.to_arrow_table())
+
+    def close(self) -> None:
+        """Drop the reference of this handle, the segment is removed when no handle is left."""
+        self._segment = None
+        self._finalizer()
+
+    def __enter__(self) -> typing.Self:  # noqa: D105
+        return self
+
+    def __exit__(self, *args: object) -> None:  # noqa: D105
+        self.close()
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"<SharedResult name={self._name!r} nbytes={self._length}{' closed' if self.closed else ''}>"
+
+
+def attach_shared_result(name: str) -> SharedResult:
+    """Open a result that another process wrote with ``DuckDBPyRelation.to_shared_memory(name)``."""
+    _check_name(name)
+    segment = _open_segment(name)
+    with _locked(name):
+        magic, references, length = _HEADER.unpack_from(segment.buf)
+        if magic != _MAGIC:
+            segment.close()
+            msg = f"The shared memory segment '{name}' does not hold a DuckDB result"
+            raise ValueError(msg)
+        if references <= 0:
+            # the last handle is being closed
+            segment.close()
+            msg = f"The shared result '{name}' was already released"
+            raise FileNotFoundError(msg)
+        _HEADER.pack_into(segment.buf, 0, magic, references + 1, length)
+    return SharedResult(name, segment)
+
+
+def _export_shared_result(reader: pyarrow.RecordBatchReader, name: str) -> SharedResult:
+    """Write the batches of ``reader`` as an Arrow IPC file into a new segment, called by ``to_shared_memory``."""
+    import pyarrow as pa
+    import pyarrow.ipc
+
+    _check_name(name)
+    # a segment can't grow once it is created, so the batches are serialized once and copied in when the size is known
+    sink = pa.BufferOutputStream()
+    with pyarrow.ipc.new_file(sink, reader.schema) as writer:
+        for batch in reader:
+            writer.write_batch(batch)
+    data = sink.getvalue()
+    del sink
+    length = data.size
+
+    segment = _open_segment(name, _HEADER_SIZE + length)
+    try:
+        segment.buf[_HEADER_SIZE : _HEADER_SIZE + length] = memoryview(data)
+        del data
+        # the creating handle holds the first reference, attach_shared_result checks the magic under the same lock
+        with _locked(name):
+            _HEADER.pack_into(segment.buf, 0, _MAGIC, 1, length)
+    except BaseException:
+        segment.close()
+        _unlink_segment(segment)
+        _remove_lock_file(name)
+        raise
+    return SharedResult(name, segment)
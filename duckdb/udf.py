@@ -1,6 +1,16 @@
 # ruff: noqa: D100
+import asyncio
+import collections
+import collections.abc
+import sys
+import threading
 import typing
 
+if typing.TYPE_CHECKING:
+    import pyarrow
+
+_event_loops = threading.local()
+
 
 def vectorized(func: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
     """Decorate a function with annotated function parameters.
@@ -22,3 +32,335 @@ def vectorized(func: typing.Callable[..., typing.Any]) -> typing.Callable[..., t
 
     new_func.__annotations__ = new_annotations
     return new_func
+
+
+def _thread_event_loop() -> asyncio.AbstractEventLoop:
+    # DuckDB runs a UDF on whichever worker thread executes the chunk; every thread keeps its own loop so clients
+    # bound to a loop (aiohttp sessions, grpc.aio channels) can be reused across chunks.
+    loop = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _event_loops.loop = loop
+    return loop
+
+
+_helper_loop: asyncio.AbstractEventLoop | None = None
+_helper_loop_lock = threading.Lock()
+
+
+def _helper_event_loop() -> asyncio.AbstractEventLoop:
+    # A thread that already runs a loop can't run a second one; its chunks are awaited on a single loop running on a
+    # daemon thread, started on first use and shared by every such call.
+    global _helper_loop
+    with _helper_loop_lock:
+        if _helper_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="duckdb-udf-event-loop", daemon=True).start()
+            _helper_loop = loop
+        return _helper_loop
+
+
+def _gather_async(
+    function: typing.Callable[..., typing.Awaitable[typing.Any]],
+    arguments: list[tuple[typing.Any, ...]],
+    max_concurrency: int | None,
+    timeout: float | None,
+    *,
+    return_exceptions: bool,
+) -> list[typing.Any]:
+    """Await ``function(*args)`` for every tuple in ``arguments`` concurrently, returning the results in order.
+
+    Called by the binding once per chunk for ``async def`` UDFs.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def call(args: tuple[typing.Any, ...]) -> typing.Any:  # noqa: ANN401
+        if semaphore is None:
+            return await asyncio.wait_for(function(*args), timeout)
+        async with semaphore:
+            return await asyncio.wait_for(function(*args), timeout)
+
+    async def gather() -> list[typing.Any]:
+        tasks = [asyncio.ensure_future(call(args)) for args in arguments]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # the first exception fails the chunk, the calls still running are not needed anymore
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _thread_event_loop().run_until_complete(gather())
+    # The query was issued from a coroutine running on this thread
+    return asyncio.run_coroutine_threadsafe(gather(), _helper_event_loop()).result()
+
+
+_MISSING = object()
+
+
+class CacheInfo(typing.NamedTuple):
+    """The statistics of a :class:`FunctionCache`, mirroring ``functools.lru_cache``'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    max_bytes: int | None
+    currbytes: int
+
+
+class FunctionCache:
+    """A bounded LRU cache for the results of a deterministic UDF.
+
+    Passed to ``create_function(cache=...)``; ``cache=True`` or ``cache=<maxsize>`` create one implicitly. Once more
+    than ``maxsize`` results are cached, or their combined ``sys.getsizeof`` exceeds ``max_bytes``, the least recently
+    used results are evicted. Calls with unhashable arguments (lists, structs) and calls that raised are not cached.
+    A cache belongs to a single function: the arguments are the only key.
+    """
+
+    def __init__(self, maxsize: int | None = 4096, max_bytes: int | None = None) -> None:
+        """Create an empty cache, ``None`` leaves the corresponding limit unbounded."""
+        if maxsize is not None and maxsize <= 0:
+            msg = "'maxsize' has to be a positive integer or None"
+            raise ValueError(msg)
+        if max_bytes is not None and max_bytes <= 0:
+            msg = "'max_bytes' has to be a positive integer or None"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: collections.OrderedDict[tuple[typing.Any, ...], typing.Any] = collections.OrderedDict()
+        self._sizes: dict[tuple[typing.Any, ...], int] = {}
+        self._currbytes = 0
+        # DuckDB calls the function from several threads; hold this while touching the entries or the counters
+        self._lock = threading.Lock()
+
+    def cache_info(self) -> CacheInfo:
+        """Report the hit and miss counters and the current size of the cache."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries), self.max_bytes, self._currbytes)
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def _lookup(self, key: tuple[typing.Any, ...]) -> typing.Any:  # noqa: ANN401
+        value = self._entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: tuple[typing.Any, ...], value: typing.Any) -> None:  # noqa: ANN401
+        if key in self._entries:
+            return
+        self._entries[key] = value
+        if self.max_bytes is not None:
+            size = sys.getsizeof(value)
+            self._sizes[key] = size
+            self._currbytes += size
+        while self._entries and (
+            (self.maxsize is not None and len(self._entries) > self.maxsize)
+            or (self.max_bytes is not None and self._currbytes > self.max_bytes)
+        ):
+            evicted, _ = self._entries.popitem(last=False)
+            self._currbytes -= self._sizes.pop(evicted, 0)
+
+
+def _call_each(
+    function: typing.Callable[..., typing.Any],
+    arguments: list[tuple[typing.Any, ...]],
+    *,
+    return_exceptions: bool,
+) -> list[typing.Any]:
+    results = []
+    for args in arguments:
+        try:
+            results.append(function(*args))
+        except Exception as e:  # noqa: PERF203
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def _call_cached(
+    cache: FunctionCache,
+    function: typing.Callable[..., typing.Any],
+    arguments: list[tuple[typing.Any, ...]],
+    max_concurrency: int | None,
+    timeout: float | None,
+    *,
+    is_async: bool,
+    return_exceptions: bool,
+    deduplicated: int,
+) -> list[typing.Any]:
+    """Resolve ``function(*args)`` for every tuple in ``arguments`` through ``cache``, returning the results in order.
+
+    Called by the binding once per chunk for UDFs created with ``cache=``. The binding already collapsed
+    ``deduplicated`` rows of CONSTANT and DICTIONARY vectors into the calls in ``arguments``; they count as hits.
+    """
+    results: list[typing.Any] = [None] * len(arguments)
+    # The distinct missing argument tuples, and the positions in 'arguments' waiting for them
+    pending: dict[tuple[typing.Any, ...], list[int]] = {}
+    uncacheable: list[int] = []
+    with cache._lock:
+        cache.hits += deduplicated
+        for i, args in enumerate(arguments):
+            try:
+                value = cache._lookup(args)
+            except TypeError:
+                uncacheable.append(i)
+                continue
+            if value is not _MISSING:
+                cache.hits += 1
+                results[i] = value
+            elif args in pending:
+                cache.hits += 1
+                pending[args].append(i)
+            else:
+                pending[args] = [i]
+        cache.misses += len(pending) + len(uncacheable)
+
+    calls = [*pending, *(arguments[i] for i in uncacheable)]
+    if not calls:
+        return results
+    if is_async:
+        computed = _gather_async(function, calls, max_concurrency, timeout, return_exceptions=return_exceptions)
+    else:
+        computed = _call_each(function, calls, return_exceptions=return_exceptions)
+
+    with cache._lock:
+        for (args, positions), value in zip(pending.items(), computed, strict=False):
+            if not isinstance(value, BaseException):
+                cache._store(args, value)
+            for i in positions:
+                results[i] = value
+    for i, value in zip(uncacheable, computed[len(pending) :], strict=False):
+        results[i] = value
+    return results
+
+
+def _update_aggregate(
+    init: typing.Callable[[], typing.Any],
+    update: typing.Callable[..., typing.Any],
+    states: list[typing.Any],
+    table: "pyarrow.Table",
+    offsets: list[int],
+    *,
+    as_numpy: bool,
+) -> list[typing.Any]:
+    """Feed every group its slice of ``table`` and return the new states.
+
+    Called by the binding once per chunk for aggregates created with ``create_aggregate_function``. The rows of group
+    ``i`` are ``offsets[i]:offsets[i + 1]``, its state is ``None`` until the first update. ``update`` may return
+    ``None`` after modifying the state in place.
+    """
+    columns = [column.combine_chunks() for column in table.columns]
+    if as_numpy:
+        columns = [column.to_numpy(zero_copy_only=False) for column in columns]
+    new_states = []
+    for i, state in enumerate(states):
+        start, end = offsets[i], offsets[i + 1]
+        current = init() if state is None else state
+        result = update(current, *(column[start:end] for column in columns))
+        new_states.append(current if result is None else result)
+    return new_states
+
+
+def _combine_aggregate(
+    init: typing.Callable[[], typing.Any],
+    combine: typing.Callable[[typing.Any, typing.Any], typing.Any],
+    targets: list[typing.Any],
+    sources: list[typing.Any],
+) -> list[typing.Any]:
+    """Merge every state in ``sources`` into the matching state in ``targets``, returning the new targets."""
+    new_targets = []
+    for target, source in zip(targets, sources, strict=False):
+        current = init() if target is None else target
+        result = combine(current, source)
+        new_targets.append(current if result is None else result)
+    return new_targets
+
+
+def _finalize_aggregate(
+    init: typing.Callable[[], typing.Any],
+    finalize: typing.Callable[[typing.Any], typing.Any],
+    states: list[typing.Any],
+) -> list[typing.Any]:
+    """Turn every state into its result, groups without any input rows get ``finalize(init())``."""
+    return [finalize(init() if state is None else state) for state in states]
+
+
+def _to_arrow_table(item: typing.Any) -> "pyarrow.Table":  # noqa: ANN401
+    import pyarrow as pa
+
+    if isinstance(item, pa.Table):
+        return item
+    if isinstance(item, pa.RecordBatch):
+        return pa.Table.from_batches([item])
+    polars = sys.modules.get("polars")
+    if polars is not None and isinstance(item, polars.DataFrame):
+        return item.to_arrow()
+    # Dicts of NumPy arrays or lists, pandas DataFrames and anything exporting __arrow_c_stream__
+    return pa.table(item)
+
+
+def _table_function_reader(
+    function: typing.Callable[..., typing.Any],
+    arguments: list[typing.Any],
+    schema: "pyarrow.Schema",
+    columns: list[str] | None,
+    *,
+    projection_pushdown: bool,
+) -> "pyarrow.RecordBatchReader":
+    """Call a table function and stream what it yields as a reader of ``schema``.
+
+    Called by the binding every time a function created with ``create_table_function`` is scanned. ``columns`` are
+    the columns the query needs, they're passed on as the ``columns`` keyword when ``projection_pushdown`` is set.
+    Every yielded item is restricted to those columns and cast to the declared types, so the function may produce
+    more columns than needed or types that only roughly match.
+    """
+    import pyarrow as pa
+
+    if columns:
+        schema = pa.schema([schema.field(name) for name in columns])
+    kwargs = {"columns": schema.names} if projection_pushdown else {}
+    result = function(*arguments, **kwargs)
+    # Returning a single table is fine as well, only iterators, lists and tuples are treated as a sequence of batches
+    items = result if isinstance(result, (collections.abc.Iterator, list, tuple)) else (result,)
+
+    def batches() -> typing.Iterator["pyarrow.RecordBatch"]:
+        for item in items:
+            table = _to_arrow_table(item).select(schema.names).cast(schema)
+            yield from table.to_batches()
+
+    return pa.RecordBatchReader.from_batches(schema, batches())
+
+
+def _map_batch(
+    function: typing.Callable[[typing.Any], typing.Any], table: "pyarrow.Table", *, format: str
+) -> "pyarrow.Table":
+    """Call the function of ``DuckDBPyRelation.map`` on a batch of rows and return its result as a pyarrow Table.
+
+    The batch is passed as a pyarrow Table, or as a Polars DataFrame for ``format="polars"``, both sharing the buffers
+    DuckDB produced. The function may return either of those, a RecordBatch or a pandas DataFrame.
+    """
+    if format == "polars":
+        import polars as pl
+
+        table = pl.from_arrow(table)
+    result = function(table)
+    if result is None:
+        msg = "No return value from Python function"
+        raise ValueError(msg)
+    return _to_arrow_table(result)
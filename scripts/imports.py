@@ -148,3 +148,18 @@ collections.abc.Mapping
 import duckdb.polars_io
 
 duckdb.polars_io.duckdb_source
+
+import duckdb.udf
+
+duckdb.udf._gather_async
+duckdb.udf._call_cached
+duckdb.udf.FunctionCache
+duckdb.udf._update_aggregate
+duckdb.udf._combine_aggregate
+duckdb.udf._finalize_aggregate
+duckdb.udf._table_function_reader
+duckdb.udf._map_batch
+
+import duckdb.shared_memory
+
+duckdb.shared_memory._export_shared_result
@@ -0,0 +1,831 @@
+#include "duckdb_python/arrow/arrow_ipc_scan.hpp"
+#include "duckdb_python/mapped_file.hpp"
+
+#include "duckdb/common/arrow/arrow_wrapper.hpp"
+#include "duckdb/common/helper.hpp"
+#include "duckdb/common/operator/multiply.hpp"
+#include "duckdb/common/string_util.hpp"
+#include "duckdb/function/table/arrow.hpp"
+#include "duckdb/main/client_context.hpp"
+
+namespace duckdb {
+
+namespace {
+
+//! Bounds-checked access to a table of the flatbuffers that hold the metadata of an Arrow IPC file
+class FlatbufferTable {
+public:
+	FlatbufferTable(const MappedFile &file, idx_t position) : file(file), position(position) {
+		vtable = idx_t(int64_t(position) - Read<int32_t>(position));
+		vtable_size = Read<uint16_t>(vtable);
+	}
+
+	//! The table a buffer starts with
+	static FlatbufferTable Root(const MappedFile &file, idx_t position) {
+		return FlatbufferTable(file, position + Load<uint32_t>(file.GetData(position, sizeof(uint32_t))));
+	}
+
+	bool Has(idx_t field) const {
+		return FieldPosition(field) != 0;
+	}
+	template <class T>
+	T Get(idx_t field, T default_value) const {
+		auto field_position = FieldPosition(field);
+		return field_position ? Read<T>(field_position) : default_value;
+	}
+	FlatbufferTable GetTable(idx_t field) const {
+		return FlatbufferTable(file, Offset(field));
+	}
+	string GetString(idx_t field) const {
+		if (!Has(field)) {
+			return string();
+		}
+		auto string_position = Offset(field);
+		auto length = Read<uint32_t>(string_position);
+		return string(const_char_ptr_cast(file.GetData(string_position + sizeof(uint32_t), length)), length);
+	}
+	idx_t GetVectorLength(idx_t field) const {
+		return Has(field) ? Read<uint32_t>(Offset(field)) : 0;
+	}
+	FlatbufferTable GetTableElement(idx_t field, idx_t index) const {
+		auto element = Offset(field) + sizeof(uint32_t) + index * sizeof(uint32_t);
+		return FlatbufferTable(file, element + Read<uint32_t>(element));
+	}
+	//! The position of an element of a vector of structs
+	idx_t GetStructElement(idx_t field, idx_t index, idx_t struct_size) const {
+		return Offset(field) + sizeof(uint32_t) + index * struct_size;
+	}
+	template <class T>
+	T Read(idx_t read_position) const {
+		return Load<T>(file.GetData(read_position, sizeof(T)));
+	}
+
+private:
+	idx_t FieldPosition(idx_t field) const {
+		auto entry = 2 * sizeof(uint16_t) + field * sizeof(uint16_t);
+		if (entry + sizeof(uint16_t) > vtable_size) {
+			return 0;
+		}
+		auto field_offset = Read<uint16_t>(vtable + entry);
+		return field_offset ? position + field_offset : 0;
+	}
+	idx_t Offset(idx_t field) const {
+		auto field_position = FieldPosition(field);
+		if (!field_position) {
+			throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+		}
+		return field_position + Read<uint32_t>(field_position);
+	}
+
+private:
+	const MappedFile &file;
+	idx_t position;
+	idx_t vtable;
+	uint16_t vtable_size;
+};
+
+// Ids of the Arrow IPC (Schema.fbs and Message.fbs) unions
+enum class ArrowIPCType : uint8_t {
+	NULL_TYPE = 1,
+	INT = 2,
+	FLOATING_POINT = 3,
+	BINARY = 4,
+	UTF8 = 5,
+	BOOL = 6,
+	DECIMAL = 7,
+	DATE = 8,
+	TIME = 9,
+	TIMESTAMP = 10,
+	INTERVAL = 11,
+	LIST = 12,
+	STRUCT = 13,
+	FIXED_SIZE_BINARY = 15,
+	FIXED_SIZE_LIST = 16,
+	MAP = 17,
+	DURATION = 18,
+	LARGE_BINARY = 19,
+	LARGE_UTF8 = 20,
+	LARGE_LIST = 21
+};
+static constexpr uint8_t ARROW_IPC_SCHEMA_MESSAGE = 1;
+static constexpr uint8_t ARROW_IPC_RECORD_BATCH_MESSAGE = 3;
+// FieldNode, Buffer and Block structs
+static constexpr idx_t ARROW_IPC_FIELD_NODE_SIZE = 16;
+static constexpr idx_t ARROW_IPC_BUFFER_SIZE = 16;
+static constexpr idx_t ARROW_IPC_BLOCK_SIZE = 24;
+static constexpr const char ARROW_IPC_MAGIC[] = "ARROW1";
+//! Columns nested deeper than this are rejected, a malformed schema could otherwise recurse until the stack overflows
+static constexpr idx_t ARROW_IPC_MAX_NESTING_DEPTH = 64;
+static constexpr idx_t ARROW_IPC_MAGIC_SIZE = 6;
+
+//! A field of the schema of an Arrow IPC file, with the C data interface format of its type
+struct ArrowIPCField {
+	string name;
+	bool nullable = true;
+	string format;
+	//! The number of buffers of the field itself, in a record batch and in the C data interface
+	idx_t buffer_count = 0;
+	//! The width of the values in bits for types with a fixed-width values buffer, 0 otherwise
+	idx_t value_bits = 0;
+	//! The size of the offsets of variable-size binary and list types, 0 otherwise
+	idx_t offset_size = 0;
+	//! The number of child values of every value of a fixed-size list
+	idx_t list_size = 0;
+	vector<ArrowIPCField> children;
+	//! The field nodes and buffers of the field and its children in a record batch
+	idx_t total_nodes = 1;
+	idx_t total_buffers = 0;
+
+	bool Equals(const ArrowIPCField &other) const {
+		if (name != other.name || format != other.format || nullable != other.nullable ||
+		    children.size() != other.children.size()) {
+			return false;
+		}
+		for (idx_t i = 0; i < children.size(); i++) {
+			if (!children[i].Equals(other.children[i])) {
+				return false;
+			}
+		}
+		return true;
+	}
+};
+
+static string ArrowIPCTimeUnit(int16_t unit) {
+	static constexpr const char UNITS[] = "smun";
+	return string(1, UNITS[MinValue<idx_t>(idx_t(unit), 3)]);
+}
+
+static ArrowIPCField ParseArrowIPCField(const MappedFile &file, const FlatbufferTable &table, idx_t depth) {
+	if (depth > ARROW_IPC_MAX_NESTING_DEPTH) {
+		throw InvalidInputException("read_arrow_ipc: the columns of \"%s\" are nested more than %d levels deep",
+		                            file.path, ARROW_IPC_MAX_NESTING_DEPTH);
+	}
+	ArrowIPCField result;
+	result.name = table.GetString(0);
+	result.nullable = table.Get<uint8_t>(1, 0) != 0;
+	auto type_id = ArrowIPCType(table.Get<uint8_t>(2, 0));
+	if (table.Has(4)) {
+		throw NotImplementedException("read_arrow_ipc: the dictionary-encoded column '%s' of \"%s\" is not supported",
+		                              result.name, file.path);
+	}
+	for (idx_t i = 0; i < table.GetVectorLength(5); i++) {
+		result.children.push_back(ParseArrowIPCField(file, table.GetTableElement(5, i), depth + 1));
+	}
+	if (!table.Has(3) && type_id != ArrowIPCType::NULL_TYPE) {
+		throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+	}
+	result.buffer_count = 2;
+	switch (type_id) {
+	case ArrowIPCType::NULL_TYPE:
+		result.format = "n";
+		result.buffer_count = 0;
+		break;
+	case ArrowIPCType::INT: {
+		auto type = table.GetTable(3);
+		auto is_signed = type.Get<uint8_t>(1, 0) != 0;
+		auto bit_width = type.Get<int32_t>(0, 0);
+		switch (bit_width) {
+		case 8:
+			result.format = is_signed ? "c" : "C";
+			break;
+		case 16:
+			result.format = is_signed ? "s" : "S";
+			break;
+		case 32:
+			result.format = is_signed ? "i" : "I";
+			break;
+		case 64:
+			result.format = is_signed ? "l" : "L";
+			break;
+		default:
+			throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+		}
+		result.value_bits = idx_t(bit_width);
+		break;
+	}
+	case ArrowIPCType::FLOATING_POINT: {
+		static constexpr const char *FORMATS[] = {"e", "f", "g"};
+		auto precision = MinValue<idx_t>(idx_t(table.GetTable(3).Get<int16_t>(0, 0)), 2);
+		result.format = FORMATS[precision];
+		result.value_bits = 16ULL << precision;
+		break;
+	}
+	case ArrowIPCType::BINARY:
+		result.format = "z";
+		result.buffer_count = 3;
+		result.offset_size = sizeof(int32_t);
+		break;
+	case ArrowIPCType::UTF8:
+		result.format = "u";
+		result.buffer_count = 3;
+		result.offset_size = sizeof(int32_t);
+		break;
+	case ArrowIPCType::LARGE_BINARY:
+		result.format = "Z";
+		result.buffer_count = 3;
+		result.offset_size = sizeof(int64_t);
+		break;
+	case ArrowIPCType::LARGE_UTF8:
+		result.format = "U";
+		result.buffer_count = 3;
+		result.offset_size = sizeof(int64_t);
+		break;
+	case ArrowIPCType::BOOL:
+		result.format = "b";
+		result.value_bits = 1;
+		break;
+	case ArrowIPCType::DECIMAL: {
+		auto type = table.GetTable(3);
+		auto bit_width = type.Get<int32_t>(2, 128);
+		if (bit_width != 32 && bit_width != 64 && bit_width != 128 && bit_width != 256) {
+			throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+		}
+		result.value_bits = idx_t(bit_width);
+		result.format = StringUtil::Format("d:%d,%d", type.Get<int32_t>(0, 0), type.Get<int32_t>(1, 0));
+		if (bit_width != 128) {
+			result.format += "," + std::to_string(bit_width);
+		}
+		break;
+	}
+	case ArrowIPCType::DATE: {
+		auto days = table.GetTable(3).Get<int16_t>(0, 1) == 0;
+		result.format = days ? "tdD" : "tdm";
+		result.value_bits = days ? 32 : 64;
+		break;
+	}
+	case ArrowIPCType::TIME: {
+		result.format = "tt" + ArrowIPCTimeUnit(table.GetTable(3).Get<int16_t>(0, 1));
+		// seconds and milliseconds are 32-bit, microseconds and nanoseconds 64-bit
+		result.value_bits = result.format == "tts" || result.format == "ttm" ? 32 : 64;
+		break;
+	}
+	case ArrowIPCType::TIMESTAMP: {
+		auto type = table.GetTable(3);
+		result.format = "ts" + ArrowIPCTimeUnit(type.Get<int16_t>(0, 0)) + ":" + type.GetString(1);
+		result.value_bits = 64;
+		break;
+	}
+	case ArrowIPCType::DURATION:
+		result.format = "tD" + ArrowIPCTimeUnit(table.GetTable(3).Get<int16_t>(0, 1));
+		result.value_bits = 64;
+		break;
+	case ArrowIPCType::INTERVAL: {
+		static constexpr const char *FORMATS[] = {"tiM", "tiD", "tin"};
+		auto unit = MinValue<idx_t>(idx_t(table.GetTable(3).Get<int16_t>(0, 0)), 2);
+		result.format = FORMATS[unit];
+		result.value_bits = 32ULL << unit;
+		break;
+	}
+	case ArrowIPCType::FIXED_SIZE_BINARY: {
+		auto byte_width = table.GetTable(3).Get<int32_t>(0, 0);
+		if (byte_width <= 0) {
+			throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+		}
+		result.format = "w:" + std::to_string(byte_width);
+		result.value_bits = idx_t(byte_width) * 8;
+		break;
+	}
+	case ArrowIPCType::LIST:
+		result.format = "+l";
+		result.offset_size = sizeof(int32_t);
+		break;
+	case ArrowIPCType::LARGE_LIST:
+		result.format = "+L";
+		result.offset_size = sizeof(int64_t);
+		break;
+	case ArrowIPCType::MAP:
+		result.format = "+m";
+		result.offset_size = sizeof(int32_t);
+		break;
+	case ArrowIPCType::FIXED_SIZE_LIST: {
+		auto list_size = table.GetTable(3).Get<int32_t>(0, 0);
+		if (list_size < 0) {
+			throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+		}
+		result.format = "+w:" + std::to_string(list_size);
+		result.list_size = idx_t(list_size);
+		result.buffer_count = 1;
+		break;
+	}
+	case ArrowIPCType::STRUCT:
+		result.format = "+s";
+		result.buffer_count = 1;
+		break;
+	default:
+		throw NotImplementedException("read_arrow_ipc: the type of column '%s' in \"%s\" is not supported", result.name,
+		                              file.path);
+	}
+	// nested types need their children, e.g. a list without a child type would be read without its values
+	auto nested = result.format[0] == '+';
+	auto expected_children = result.format == "+s" ? result.children.size() : idx_t(nested ? 1 : 0);
+	if (result.children.size() != expected_children) {
+		throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file.path);
+	}
+	result.total_buffers = result.buffer_count;
+	for (auto &child : result.children) {
+		result.total_nodes += child.total_nodes;
+		result.total_buffers += child.total_buffers;
+	}
+	return result;
+}
+
+//! Owns the strings and children of an exported ArrowSchema
+struct ArrowIPCSchemaData {
+	string format;
+	string name;
+	vector<unique_ptr<ArrowSchema>> children;
+	vector<ArrowSchema *> child_pointers;
+};
+
+static void ReleaseArrowIPCSchema(ArrowSchema *schema) {
+	if (!schema || !schema->release) {
+		return;
+	}
+	auto data = reinterpret_cast<ArrowIPCSchemaData *>(schema->private_data);
+	for (auto &child : data->children) {
+		if (child->release) {
+			child->release(child.get());
+		}
+	}
+	delete data;
+	schema->release = nullptr;
+}
+
+static void ExportArrowIPCSchema(const string &name, const string &format, int64_t flags,
+                                 const vector<ArrowIPCField> &children, ArrowSchema &out) {
+	auto data = new ArrowIPCSchemaData();
+	data->name = name;
+	data->format = format;
+	for (auto &child : children) {
+		data->children.push_back(make_uniq<ArrowSchema>());
+		ExportArrowIPCSchema(child.name, child.format, child.nullable ? ARROW_FLAG_NULLABLE : 0, child.children,
+		                     *data->children.back());
+		data->child_pointers.push_back(data->children.back().get());
+	}
+	out.format = data->format.c_str();
+	out.name = data->name.c_str();
+	out.metadata = nullptr;
+	out.flags = flags;
+	out.n_children = NumericCast<int64_t>(data->child_pointers.size());
+	out.children = data->child_pointers.data();
+	out.dictionary = nullptr;
+	out.release = ReleaseArrowIPCSchema;
+	out.private_data = data;
+}
+
+//! Owns the buffer pointers and children of an imported ArrowArray, the buffers themselves stay in the mapped file
+struct ArrowIPCArrayData {
+	~ArrowIPCArrayData() {
+		// also releases the children imported before an invalid one was found
+		for (auto &child : children) {
+			if (child->release) {
+				child->release(child.get());
+			}
+		}
+	}
+
+	shared_ptr<MappedFile> file;
+	vector<const void *> buffers;
+	vector<unique_ptr<ArrowArray>> children;
+	vector<ArrowArray *> child_pointers;
+};
+
+static void ReleaseArrowIPCArray(ArrowArray *array) {
+	if (!array || !array->release) {
+		return;
+	}
+	delete reinterpret_cast<ArrowIPCArrayData *>(array->private_data);
+	array->release = nullptr;
+}
+
+static void InitializeArrowIPCArray(ArrowIPCArrayData *data, int64_t length, int64_t null_count, ArrowArray &out) {
+	out.length = length;
+	out.null_count = null_count;
+	out.offset = 0;
+	out.n_buffers = NumericCast<int64_t>(data->buffers.size());
+	out.n_children = NumericCast<int64_t>(data->child_pointers.size());
+	out.buffers = data->buffers.data();
+	out.children = data->child_pointers.data();
+	out.dictionary = nullptr;
+	out.release = ReleaseArrowIPCArray;
+	out.private_data = data;
+}
+
+//! Checks that count + 1 offsets start at 0 or later and never decrease, and returns the last one in end_offset
+template <class T>
+static bool ArrowIPCOffsetsAreValid(const_data_ptr_t offsets, idx_t count, idx_t &end_offset) {
+	auto previous = Load<T>(offsets);
+	if (previous < 0) {
+		return false;
+	}
+	for (idx_t i = 1; i <= count; i++) {
+		auto current = Load<T>(offsets + i * sizeof(T));
+		if (current < previous) {
+			return false;
+		}
+		previous = current;
+	}
+	end_offset = idx_t(previous);
+	return true;
+}
+
+//! Where the metadata and the body of a record batch message are in the file
+struct ArrowIPCBlock {
+	idx_t metadata_position;
+	idx_t body_position;
+	idx_t body_length;
+	idx_t row_count;
+};
+
+//! The record batch that is being imported: positions of its field nodes and buffers, and the next one to import
+struct ArrowIPCRecordBatch {
+	const ArrowIPCBlock &block;
+	idx_t nodes_position;
+	idx_t buffers_position;
+	idx_t node_index;
+	idx_t buffer_index;
+};
+
+//! An Arrow IPC file (or stream), mapped into memory with its schema and the positions of its record batches
+struct ArrowIPCFile {
+	shared_ptr<MappedFile> file;
+	vector<ArrowIPCField> fields;
+	vector<ArrowIPCBlock> record_batches;
+	idx_t row_count = 0;
+
+	static shared_ptr<ArrowIPCFile> Open(ClientContext &context, const string &path) {
+		auto result = make_shared_ptr<ArrowIPCFile>();
+		result->file = MappedFile::Open(context, path);
+		auto &file = *result->file;
+		auto size = file.Size();
+		if (size >= 2 * ARROW_IPC_MAGIC_SIZE + sizeof(int32_t) &&
+		    memcmp(file.GetData(0, ARROW_IPC_MAGIC_SIZE), ARROW_IPC_MAGIC, ARROW_IPC_MAGIC_SIZE) == 0) {
+			result->ReadFooter();
+		} else {
+			result->ReadStream();
+		}
+		return result;
+	}
+
+	//! Reads the record batches listed in the footer of the file format
+	void ReadFooter() {
+		auto &mapped = *file;
+		auto size = mapped.Size();
+		if (memcmp(mapped.GetData(size - ARROW_IPC_MAGIC_SIZE, ARROW_IPC_MAGIC_SIZE), ARROW_IPC_MAGIC,
+		           ARROW_IPC_MAGIC_SIZE) != 0) {
+			ThrowInvalid();
+		}
+		auto footer_length_position = size - ARROW_IPC_MAGIC_SIZE - sizeof(int32_t);
+		auto footer_length = Load<int32_t>(mapped.GetData(footer_length_position, sizeof(int32_t)));
+		if (footer_length <= 0 || idx_t(footer_length) > footer_length_position) {
+			ThrowInvalid();
+		}
+		auto footer = FlatbufferTable::Root(mapped, footer_length_position - idx_t(footer_length));
+		ReadSchema(footer.GetTable(1));
+		for (idx_t i = 0; i < footer.GetVectorLength(3); i++) {
+			auto block = footer.GetStructElement(3, i, ARROW_IPC_BLOCK_SIZE);
+			auto offset = footer.Read<int64_t>(block);
+			auto metadata_length = footer.Read<int32_t>(block + 8);
+			auto body_length = footer.Read<int64_t>(block + 16);
+			if (offset < 0 || metadata_length < 0 || body_length < 0) {
+				ThrowInvalid();
+			}
+			idx_t prefix_length;
+			auto metadata_position = MessageMetadata(idx_t(offset), prefix_length);
+			AddRecordBatch(metadata_position, idx_t(offset) + idx_t(metadata_length), idx_t(body_length));
+		}
+	}
+
+	//! Walks the messages of the streaming format, up to the end-of-stream marker or the end of the file
+	void ReadStream() {
+		auto &mapped = *file;
+		idx_t position = 0;
+		bool has_schema = false;
+		while (position + sizeof(int32_t) <= mapped.Size()) {
+			idx_t metadata_length;
+			auto metadata_position = MessageMetadata(position, metadata_length);
+			if (metadata_length == 0) {
+				break;
+			}
+			auto message = FlatbufferTable::Root(mapped, metadata_position);
+			auto body_position = metadata_position + metadata_length;
+			auto body_length = message.Get<int64_t>(3, 0);
+			if (body_length < 0) {
+				ThrowInvalid();
+			}
+			auto header_type = message.Get<uint8_t>(1, 0);
+			if (!has_schema) {
+				if (header_type != ARROW_IPC_SCHEMA_MESSAGE) {
+					ThrowInvalid();
+				}
+				ReadSchema(message.GetTable(2));
+				has_schema = true;
+			} else if (header_type == ARROW_IPC_RECORD_BATCH_MESSAGE) {
+				AddRecordBatch(metadata_position, body_position, idx_t(body_length));
+			} else {
+				throw NotImplementedException(
+				    "read_arrow_ipc: \"%s\" holds dictionary batches, which are not supported", mapped.path);
+			}
+			position = body_position + idx_t(body_length);
+		}
+		if (!has_schema) {
+			ThrowInvalid();
+		}
+	}
+
+	//! Returns the position of the flatbuffer of the message at `position` and sets its length
+	idx_t MessageMetadata(idx_t position, idx_t &metadata_length) const {
+		auto &mapped = *file;
+		auto length = Load<int32_t>(mapped.GetData(position, sizeof(int32_t)));
+		idx_t metadata_position = position + sizeof(int32_t);
+		if (length == -1) {
+			// the continuation marker of format version 0.15 and later
+			length = Load<int32_t>(mapped.GetData(metadata_position, sizeof(int32_t)));
+			metadata_position += sizeof(int32_t);
+		}
+		if (length < 0) {
+			ThrowInvalid();
+		}
+		metadata_length = idx_t(length);
+		return metadata_position;
+	}
+
+	void ReadSchema(const FlatbufferTable &schema) {
+		if (schema.Get<int16_t>(0, 0) != 0) {
+			throw NotImplementedException("read_arrow_ipc: \"%s\" is big-endian, which is not supported", file->path);
+		}
+		for (idx_t i = 0; i < schema.GetVectorLength(1); i++) {
+			fields.push_back(ParseArrowIPCField(*file, schema.GetTableElement(1, i), 1));
+		}
+		if (fields.empty()) {
+			throw InvalidInputException("read_arrow_ipc: \"%s\" does not have any columns", file->path);
+		}
+	}
+
+	void AddRecordBatch(idx_t metadata_position, idx_t body_position, idx_t body_length) {
+		auto message = FlatbufferTable::Root(*file, metadata_position);
+		if (message.Get<uint8_t>(1, 0) != ARROW_IPC_RECORD_BATCH_MESSAGE) {
+			ThrowInvalid();
+		}
+		auto batch = message.GetTable(2);
+		auto length = batch.Get<int64_t>(0, 0);
+		if (length < 0) {
+			ThrowInvalid();
+		}
+		if (batch.Has(3)) {
+			throw NotImplementedException("read_arrow_ipc: \"%s\" holds compressed record batches, which are not "
+			                              "supported",
+			                              file->path);
+		}
+		// the body has to be in the file
+		file->GetData(body_position, body_length);
+		record_batches.push_back({metadata_position, body_position, body_length, idx_t(length)});
+		row_count += idx_t(length);
+	}
+
+	//! Imports a record batch as a struct array of the given columns, referencing the buffers in the mapped file
+	void ImportRecordBatch(idx_t index, const vector<idx_t> &column_ids, ArrowArray &out) const {
+		auto &block = record_batches[index];
+		auto message = FlatbufferTable::Root(*file, block.metadata_position);
+		auto batch = message.GetTable(2);
+		idx_t total_nodes = 0;
+		idx_t total_buffers = 0;
+		for (auto &field : fields) {
+			total_nodes += field.total_nodes;
+			total_buffers += field.total_buffers;
+		}
+		if (batch.GetVectorLength(1) < total_nodes || batch.GetVectorLength(2) < total_buffers) {
+			ThrowInvalid();
+		}
+		ArrowIPCRecordBatch record_batch {block, batch.GetStructElement(1, 0, ARROW_IPC_FIELD_NODE_SIZE),
+		                                  batch.GetStructElement(2, 0, ARROW_IPC_BUFFER_SIZE), 0, 0};
+
+		// the nodes and buffers of the columns follow each other, find where every column starts
+		vector<pair<idx_t, idx_t>> column_starts;
+		for (auto &field : fields) {
+			column_starts.emplace_back(record_batch.node_index, record_batch.buffer_index);
+			record_batch.node_index += field.total_nodes;
+			record_batch.buffer_index += field.total_buffers;
+		}
+
+		auto data = make_uniq<ArrowIPCArrayData>();
+		data->file = file;
+		data->buffers.push_back(nullptr);
+		for (auto column_id : column_ids) {
+			record_batch.node_index = column_starts[column_id].first;
+			record_batch.buffer_index = column_starts[column_id].second;
+			data->children.push_back(make_uniq<ArrowArray>());
+			ImportArray(fields[column_id], record_batch, block.row_count, true, *data->children.back());
+			data->child_pointers.push_back(data->children.back().get());
+		}
+		InitializeArrowIPCArray(data.release(), NumericCast<int64_t>(block.row_count), 0, out);
+	}
+
+	//! Imports the next field node as an array of field, its length has to be required_length or (when not exact)
+	//! at least required_length
+	void ImportArray(const ArrowIPCField &field, ArrowIPCRecordBatch &record_batch, idx_t required_length, bool exact,
+	                 ArrowArray &out) const {
+		auto &mapped = *file;
+		auto node = record_batch.nodes_position + record_batch.node_index++ * ARROW_IPC_FIELD_NODE_SIZE;
+		auto length = Load<int64_t>(mapped.GetData(node, sizeof(int64_t)));
+		auto null_count = Load<int64_t>(mapped.GetData(node + 8, sizeof(int64_t)));
+		if (length < 0 || null_count < 0 || null_count > length) {
+			ThrowInvalid();
+		}
+		auto count = idx_t(length);
+		if (exact ? count != required_length : count < required_length) {
+			ThrowInvalid();
+		}
+
+		auto data = make_uniq<ArrowIPCArrayData>();
+		data->file = file;
+		vector<idx_t> buffer_lengths;
+		for (idx_t i = 0; i < field.buffer_count; i++) {
+			auto buffer = record_batch.buffers_position + record_batch.buffer_index++ * ARROW_IPC_BUFFER_SIZE;
+			auto offset = Load<int64_t>(mapped.GetData(buffer, sizeof(int64_t)));
+			auto buffer_length = Load<int64_t>(mapped.GetData(buffer + 8, sizeof(int64_t)));
+			if (offset < 0 || buffer_length < 0 || idx_t(offset) > record_batch.block.body_length ||
+			    idx_t(buffer_length) > record_batch.block.body_length - idx_t(offset)) {
+				ThrowInvalid();
+			}
+			buffer_lengths.push_back(idx_t(buffer_length));
+			bool is_validity = i == 0 && field.format != "n";
+			if (is_validity && null_count == 0) {
+				// all values are valid
+				data->buffers.push_back(nullptr);
+				continue;
+			}
+			if (is_validity && idx_t(buffer_length) < (count + 7) / 8) {
+				ThrowInvalid();
+			}
+			data->buffers.push_back(
+			    mapped.GetData(record_batch.block.body_position + idx_t(offset), idx_t(buffer_length)));
+		}
+
+		// the length every child has to have at least
+		idx_t child_length = count;
+		if (field.value_bits == 1) {
+			if (buffer_lengths[1] < (count + 7) / 8) {
+				ThrowInvalid();
+			}
+		} else if (field.value_bits > 0) {
+			if (count > buffer_lengths[1] / (field.value_bits / 8)) {
+				ThrowInvalid();
+			}
+		} else if (field.offset_size > 0) {
+			// the offsets of an empty array may be left out, otherwise there is one more offset than values
+			idx_t end_offset = 0;
+			if (count > 0) {
+				if (count + 1 > buffer_lengths[1] / field.offset_size) {
+					ThrowInvalid();
+				}
+				auto offsets = const_data_ptr_cast(data->buffers[1]);
+				auto valid = field.offset_size == sizeof(int32_t)
+				                 ? ArrowIPCOffsetsAreValid<int32_t>(offsets, count, end_offset)
+				                 : ArrowIPCOffsetsAreValid<int64_t>(offsets, count, end_offset);
+				if (!valid) {
+					ThrowInvalid();
+				}
+			}
+			if (field.buffer_count == 3 && end_offset > buffer_lengths[2]) {
+				ThrowInvalid();
+			}
+			child_length = end_offset;
+		} else if (!field.children.empty() && field.format != "+s") {
+			// a fixed-size list
+			if (!TryMultiplyOperator::Operation(count, field.list_size, child_length)) {
+				ThrowInvalid();
+			}
+		}
+
+		for (auto &child : field.children) {
+			data->children.push_back(make_uniq<ArrowArray>());
+			ImportArray(child, record_batch, child_length, false, *data->children.back());
+			data->child_pointers.push_back(data->children.back().get());
+		}
+		InitializeArrowIPCArray(data.release(), length, null_count, out);
+	}
+
+	[[noreturn]] void ThrowInvalid() const {
+		throw InvalidInputException("read_arrow_ipc: \"%s\" is not a valid Arrow IPC file", file->path);
+	}
+};
+
+//! Produces the record batches of all files of a read_arrow_ipc scan, the files after the first are opened lazily
+struct ArrowIPCStreamFactory {
+	ArrowIPCStreamFactory(ClientContext &context, vector<string> files, shared_ptr<ArrowIPCFile> first_file)
+	    : context(context), files(std::move(files)), first_file(std::move(first_file)) {
+	}
+
+	static unique_ptr<ArrowArrayStreamWrapper> Produce(uintptr_t factory_ptr, ArrowStreamParameters &parameters);
+
+	ClientContext &context;
+	vector<string> files;
+	shared_ptr<ArrowIPCFile> first_file;
+};
+
+//! Hands out the record batches one by one, the Arrow scan converts them on its threads
+class ArrowIPCStream : public ArrowArrayStreamWrapper {
+public:
+	ArrowIPCStream(ArrowIPCStreamFactory &factory, vector<idx_t> column_ids)
+	    : factory(factory), column_ids(std::move(column_ids)) {
+	}
+
+	shared_ptr<ArrowArrayWrapper> GetNextChunk() override {
+		auto result = make_shared_ptr<ArrowArrayWrapper>();
+		while (!file || batch_index >= file->record_batches.size()) {
+			if (file_index >= factory.files.size()) {
+				// a released array marks the end of the stream
+				return result;
+			}
+			auto &path = factory.files[file_index++];
+			file = file_index == 1 ? factory.first_file : ArrowIPCFile::Open(factory.context, path);
+			auto &expected = factory.first_file->fields;
+			bool same_schema = file->fields.size() == expected.size();
+			for (idx_t i = 0; same_schema && i < expected.size(); i++) {
+				same_schema = file->fields[i].Equals(expected[i]);
+			}
+			if (!same_schema) {
+				throw InvalidInputException("read_arrow_ipc: \"%s\" does not have the same schema as \"%s\"", path,
+				                            factory.files[0]);
+			}
+			batch_index = 0;
+		}
+		file->ImportRecordBatch(batch_index++, column_ids, result->arrow_array);
+		return result;
+	}
+
+private:
+	ArrowIPCStreamFactory &factory;
+	vector<idx_t> column_ids;
+	shared_ptr<ArrowIPCFile> file;
+	idx_t file_index = 0;
+	idx_t batch_index = 0;
+};
+
+unique_ptr<ArrowArrayStreamWrapper> ArrowIPCStreamFactory::Produce(uintptr_t factory_ptr,
+                                                                   ArrowStreamParameters &parameters) {
+	auto factory = reinterpret_cast<ArrowIPCStreamFactory *>(factory_ptr); // NOLINT
+	// only the projected columns are imported, in the order of the projection
+	vector<pair<idx_t, idx_t>> projection(parameters.projected_columns.filter_to_col.begin(),
+	                                      parameters.projected_columns.filter_to_col.end());
+	std::sort(projection.begin(), projection.end());
+	vector<idx_t> column_ids;
+	for (auto &entry : projection) {
+		column_ids.push_back(entry.second);
+	}
+	return make_uniq<ArrowIPCStream>(*factory, std::move(column_ids));
+}
+
+//! Exposes the batch indexes of the Arrow scan, so that read_arrow_ipc keeps the order of the record batches
+struct ArrowIPCTableFunction : public ArrowTableFunction {
+	using ArrowTableFunction::ArrowGetPartitionData;
+};
+
+struct ArrowIPCScanData : public ArrowScanFunctionData {
+	explicit ArrowIPCScanData(unique_ptr<ArrowIPCStreamFactory> factory_p)
+	    : ArrowScanFunctionData(ArrowIPCStreamFactory::Produce, reinterpret_cast<uintptr_t>(factory_p.get())),
+	      factory(std::move(factory_p)) {
+	}
+
+	unique_ptr<ArrowIPCStreamFactory> factory;
+};
+
+} // namespace
+
+ArrowIPCScanFunction::ArrowIPCScanFunction(const LogicalType &argument)
+    : TableFunction("read_arrow_ipc", {argument}, ArrowTableFunction::ArrowScanFunction, ArrowIPCScanBind,
+                    ArrowTableFunction::ArrowScanInitGlobal, ArrowTableFunction::ArrowScanInitLocal) {
+	get_partition_data = ArrowIPCTableFunction::ArrowGetPartitionData;
+	cardinality = ArrowIPCScanCardinality;
+	projection_pushdown = true;
+}
+
+unique_ptr<FunctionData> ArrowIPCScanFunction::ArrowIPCScanBind(ClientContext &context, TableFunctionBindInput &input,
+                                                                vector<LogicalType> &return_types,
+                                                                vector<string> &names) {
+	auto files = MappedFile::GlobFiles(context, input.inputs[0], "read_arrow_ipc");
+	auto first_file = ArrowIPCFile::Open(context, files[0]);
+	auto factory = make_uniq<ArrowIPCStreamFactory>(context, std::move(files), first_file);
+	auto res = make_uniq<ArrowIPCScanData>(std::move(factory));
+
+	ExportArrowIPCSchema(string(), "+s", 0, first_file->fields, res->schema_root.arrow_schema);
+	ArrowTableFunction::PopulateArrowTableSchema(context, res->arrow_table, res->schema_root.arrow_schema);
+	names = res->arrow_table.GetNames();
+	return_types = res->arrow_table.GetTypes();
+	res->all_types = return_types;
+	return std::move(res);
+}
+
+unique_ptr<NodeStatistics> ArrowIPCScanFunction::ArrowIPCScanCardinality(ClientContext &context,
+                                                                         const FunctionData *bind_data) {
+	auto &data = bind_data->Cast<ArrowIPCScanData>();
+	auto row_count = data.factory->first_file->row_count;
+	if (data.factory->files.size() == 1) {
+		return make_uniq<NodeStatistics>(row_count, row_count);
+	}
+	// the other files are only opened when they are scanned
+	return make_uniq<NodeStatistics>(row_count * data.factory->files.size());
+}
+
+} // namespace duckdb
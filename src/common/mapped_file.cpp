@@ -0,0 +1,73 @@
+#include "duckdb_python/mapped_file.hpp"
+
+#include "duckdb/common/exception.hpp"
+#include "duckdb/common/file_system.hpp"
+#include "duckdb/common/open_file_info.hpp"
+#include "duckdb/common/types/value.hpp"
+#include "duckdb/main/client_context.hpp"
+
+namespace duckdb {
+
+MappedFile::MappedFile(string path_p, unique_ptr<MemoryMappedFile> mapping_p)
+    : path(std::move(path_p)), mapping(std::move(mapping_p)), data(nullptr), size(mapping->Size()) {
+	if (size > 0) {
+		data = mapping->GetData(0, size);
+	}
+}
+
+MappedFile::MappedFile(string path_p, AllocatedData buffer_p, idx_t size)
+    : path(std::move(path_p)), buffer(std::move(buffer_p)), data(buffer.get()), size(size) {
+}
+
+shared_ptr<MappedFile> MappedFile::Open(ClientContext &context, const string &path) {
+	auto &fs = FileSystem::GetFileSystem(context);
+	try {
+		return make_shared_ptr<MappedFile>(
+		    path, fs.MemoryMapFile(OpenFileInfo(path), FileFlags::FILE_FLAGS_READ, MMapOptions()));
+	} catch (NotImplementedException &) {
+		// the filesystem of this path can't map files, read it as a whole instead
+	}
+	auto handle = fs.OpenFile(path, FileFlags::FILE_FLAGS_READ);
+	auto file_size = handle->GetFileSize();
+	auto file_buffer = Allocator::DefaultAllocator().Allocate(file_size);
+	handle->Read(file_buffer.get(), file_size, 0);
+	return make_shared_ptr<MappedFile>(path, std::move(file_buffer), file_size);
+}
+
+vector<string> MappedFile::GlobFiles(ClientContext &context, const Value &input, const string &function_name) {
+	vector<string> patterns;
+	if (input.IsNull()) {
+		throw InvalidInputException("%s does not accept NULL as a file name", function_name);
+	}
+	if (input.type().id() == LogicalTypeId::LIST) {
+		for (auto &child : ListValue::GetChildren(input)) {
+			if (child.IsNull()) {
+				throw InvalidInputException("%s does not accept NULL as a file name", function_name);
+			}
+			patterns.push_back(StringValue::Get(child));
+		}
+	} else {
+		patterns.push_back(StringValue::Get(input));
+	}
+	if (patterns.empty()) {
+		throw InvalidInputException("%s needs at least one file to read", function_name);
+	}
+	auto &fs = FileSystem::GetFileSystem(context);
+	vector<string> files;
+	for (auto &pattern : patterns) {
+		for (auto &file : fs.GlobFiles(pattern, FileGlobOptions::DISALLOW_EMPTY)) {
+			files.push_back(file.path);
+		}
+	}
+	return files;
+}
+
+const_data_ptr_t MappedFile::GetData(idx_t location, idx_t nr_bytes) const {
+	if (location > size || nr_bytes > size - location) {
+		throw IOException("Could not read %d bytes at offset %d of \"%s\", the file is only %d bytes", nr_bytes,
+		                  location, path, size);
+	}
+	return data + location;
+}
+
+} // namespace duckdb
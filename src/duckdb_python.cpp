@@ -7,6 +7,8 @@
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pystatement.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pyquery_future.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/expression/pyexpression.hpp"
 #include "duckdb_python/exceptions.hpp"
@@ -82,14 +84,19 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 	    "Create a duplicate of the current connection", nb::kw_only(), nb::arg("connection").none() = nb::none());
 	m.def(
 	    "register_filesystem",
-	    [](AbstractFileSystem filesystem, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	    [](AbstractFileSystem filesystem, idx_t cache_size, idx_t block_size, idx_t read_ahead, double metadata_ttl,
+	       idx_t write_buffer_size, const nb::object &upload_block_size, double read_timeout,
+	       std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
-		    conn->RegisterFilesystem(filesystem);
+		    conn->RegisterFilesystem(filesystem, cache_size, block_size, read_ahead, metadata_ttl, write_buffer_size,
+		                             upload_block_size, read_timeout);
 	    },
-	    "Register a fsspec compliant filesystem", nb::arg("filesystem"), nb::kw_only(),
-	    nb::arg("connection").none() = nb::none());
+	    "Register a fsspec compliant filesystem", nb::arg("filesystem"), nb::kw_only(), nb::arg("cache_size") = 0,
+	    nb::arg("block_size") = 1048576, nb::arg("read_ahead") = 0, nb::arg("metadata_ttl") = 0,
+	    nb::arg("write_buffer_size") = 1048576, nb::arg("upload_block_size").none() = nb::none(),
+	    nb::arg("read_timeout") = 30, nb::arg("connection").none() = nb::none());
 	m.def(
 	    "unregister_filesystem",
 	    [](const nb::str &name, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -119,6 +126,47 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 	    },
 	    "Check if a filesystem with the provided name is currently registered", nb::arg("name"), nb::kw_only(),
 	    nb::arg("connection").none() = nb::none());
+	m.def(
+	    "filesystem_stats",
+	    [](const string &name, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->FilesystemStats(name);
+	    },
+	    "Get the block cache statistics of a registered Python filesystem", nb::arg("name"), nb::kw_only(),
+	    nb::arg("connection").none() = nb::none());
+	m.def(
+	    "invalidate_filesystem_cache",
+	    [](const string &name, const nb::object &path, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    conn->InvalidateFilesystemCache(name, path);
+	    },
+	    "Drop the cached blocks and metadata of a registered Python filesystem, or of one path of it", nb::arg("name"),
+	    nb::arg("path").none() = nb::none(), nb::kw_only(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "statement_cache_stats",
+	    [](std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->StatementCacheStats();
+	    },
+	    "Get the statistics of the cache of statements prepared by execute()", nb::kw_only(),
+	    nb::arg("connection").none() = nb::none());
+	m.def(
+	    "binding_stats",
+	    [](bool aggregate, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->BindingStats(aggregate);
+	    },
+	    "Get the time spent waiting for the GIL and the connection lock, looking up Python objects and converting "
+	    "results, counted while python_binding_stats is set. With aggregate, of all connections",
+	    nb::kw_only(), nb::arg("aggregate") = false, nb::arg("connection").none() = nb::none());
 	m.def(
 	    "get_profiling_information",
 	    [](const std::string &format, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -153,18 +201,53 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 	       const nb::object &return_type = nb::none(), PythonUDFType type = PythonUDFType::NATIVE,
 	       FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	       PythonExceptionHandling exception_handling = PythonExceptionHandling::FORWARD_ERROR,
-	       bool side_effects = false, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	       bool side_effects = false, const nb::object &concurrency = nb::none(),
+	       const nb::object &timeout = nb::none(), const nb::object &cache = nb::none(),
+	       std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
 		    return conn->RegisterScalarUDF(name, udf, arguments, return_type, type, null_handling, exception_handling,
-		                                   side_effects);
+		                                   side_effects, concurrency, timeout, cache);
 	    },
 	    "Create a DuckDB function out of the passing in Python function so it can be used in queries", nb::arg("name"),
 	    nb::arg("function"), nb::arg("parameters") = nb::none(), nb::arg("return_type").none() = nb::none(),
 	    nb::kw_only(), nb::arg("type") = PythonUDFType::NATIVE,
 	    nb::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	    nb::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, nb::arg("side_effects") = false,
+	    nb::arg("concurrency").none() = nb::none(), nb::arg("timeout").none() = nb::none(),
+	    nb::arg("cache").none() = nb::none(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "create_aggregate_function",
+	    [](const string &name, const nb::callable &init, const nb::callable &update, const nb::callable &combine,
+	       const nb::callable &finalize, const nb::object &parameters, const nb::object &return_type,
+	       const string &format = "arrow",
+	       FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING,
+	       std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->RegisterAggregateUDF(name, init, update, combine, finalize, parameters, return_type, format,
+		                                      null_handling);
+	    },
+	    "Create a DuckDB aggregate function out of the passed in Python functions so it can be used in queries",
+	    nb::arg("name"), nb::arg("init"), nb::arg("update"), nb::arg("combine"), nb::arg("finalize"),
+	    nb::arg("parameters"), nb::arg("return_type"), nb::kw_only(), nb::arg("format") = "arrow",
+	    nb::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING,
+	    nb::arg("connection").none() = nb::none());
+	m.def(
+	    "create_table_function",
+	    [](const string &name, const nb::callable &function, const nb::object &schema,
+	       const nb::object &parameters = nb::none(), const nb::object &cardinality = nb::none(),
+	       bool projection_pushdown = false, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->RegisterTableUDF(name, function, schema, parameters, cardinality, projection_pushdown);
+	    },
+	    "Create a DuckDB table function out of the passed in Python function so it can be used in queries",
+	    nb::arg("name"), nb::arg("function"), nb::arg("schema"), nb::arg("parameters").none() = nb::none(),
+	    nb::kw_only(), nb::arg("cardinality").none() = nb::none(), nb::arg("projection_pushdown") = false,
 	    nb::arg("connection").none() = nb::none());
 	m.def(
 	    "remove_function",
@@ -329,6 +412,40 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 	    },
 	    "Execute the given prepared statement multiple times using the list of parameter sets in parameters",
 	    nb::arg("query"), nb::arg("parameters") = nb::none(), nb::kw_only(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "prepare",
+	    [](const nb::object &query, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->Prepare(query);
+	    },
+	    "Prepare the given SQL query once, to execute it repeatedly without parsing and planning it again",
+	    nb::arg("query"), nb::kw_only(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "submit",
+	    [](const nb::object &query, nb::object params, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->Submit(query, params);
+	    },
+	    "Execute the given SQL query on a background thread, returns a QueryFuture of its result. The query is bound "
+	    "before submit returns, binding errors are raised by submit",
+	    nb::arg("query"), nb::arg("parameters") = nb::none(), nb::kw_only(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "execute_batch",
+	    [](const nb::object &queries, bool return_results, bool transaction,
+	       std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->ExecuteBatch(queries, return_results, transaction);
+	    },
+	    "Execute a list of queries, each a query or a (query, parameters) tuple, under a single lock. Returns a "
+	    "relation over the result of every query, or None when return_results is False",
+	    nb::arg("queries"), nb::kw_only(), nb::arg("return_results") = true, nb::arg("transaction") = false,
+	    nb::arg("connection").none() = nb::none());
 	m.def(
 	    "close",
 	    [](std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -649,16 +766,18 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 		                          maximum_sample_files, filename, hive_partitioning, union_by_name, hive_types,
 		                          hive_types_autocast);
 	    },
-	    "Create a relation object from the JSON file in 'name'", nb::arg("path_or_buffer"), nb::kw_only(),
-	    nb::arg("columns") = nb::none(), nb::arg("sample_size") = nb::none(), nb::arg("maximum_depth") = nb::none(),
-	    nb::arg("records") = nb::none(), nb::arg("format") = nb::none(), nb::arg("date_format") = nb::none(),
-	    nb::arg("timestamp_format") = nb::none(), nb::arg("compression") = nb::none(),
-	    nb::arg("maximum_object_size") = nb::none(), nb::arg("ignore_errors") = nb::none(),
-	    nb::arg("convert_strings_to_integers") = nb::none(), nb::arg("field_appearance_threshold") = nb::none(),
-	    nb::arg("map_inference_threshold") = nb::none(), nb::arg("maximum_sample_files") = nb::none(),
-	    nb::arg("filename") = nb::none(), nb::arg("hive_partitioning") = nb::none(),
-	    nb::arg("union_by_name") = nb::none(), nb::arg("hive_types") = nb::none(),
-	    nb::arg("hive_types_autocast") = nb::none(), nb::arg("connection").none() = nb::none());
+	    "Create a relation object from the JSON file in 'name'. A seekable file-like object is read when the relation "
+	    "is executed, so it has to stay open and unchanged until then",
+	    nb::arg("path_or_buffer"), nb::kw_only(), nb::arg("columns") = nb::none(), nb::arg("sample_size") = nb::none(),
+	    nb::arg("maximum_depth") = nb::none(), nb::arg("records") = nb::none(), nb::arg("format") = nb::none(),
+	    nb::arg("date_format") = nb::none(), nb::arg("timestamp_format") = nb::none(),
+	    nb::arg("compression") = nb::none(), nb::arg("maximum_object_size") = nb::none(),
+	    nb::arg("ignore_errors") = nb::none(), nb::arg("convert_strings_to_integers") = nb::none(),
+	    nb::arg("field_appearance_threshold") = nb::none(), nb::arg("map_inference_threshold") = nb::none(),
+	    nb::arg("maximum_sample_files") = nb::none(), nb::arg("filename") = nb::none(),
+	    nb::arg("hive_partitioning") = nb::none(), nb::arg("union_by_name") = nb::none(),
+	    nb::arg("hive_types") = nb::none(), nb::arg("hive_types_autocast") = nb::none(),
+	    nb::arg("connection").none() = nb::none());
 	m.def(
 	    "extract_statements",
 	    [](const string &query, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -736,8 +855,12 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 		}
 		return conn->ReadCSV(name, kwargs);
 	};
-	m.def("read_csv", module_read_csv, "Create a relation object from the CSV file in 'name'");
-	m.def("from_csv_auto", module_read_csv, "Create a relation object from the CSV file in 'name'");
+	m.def("read_csv", module_read_csv,
+	      "Create a relation object from the CSV file in 'name'. A seekable file-like object is read when the relation "
+	      "is executed, so it has to stay open and unchanged until then");
+	m.def("from_csv_auto", module_read_csv,
+	      "Create a relation object from the CSV file in 'name'. A seekable file-like object is read when the relation "
+	      "is executed, so it has to stay open and unchanged until then");
 	m.def(
 	    "from_df",
 	    [](const PandasDataFrame &value, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -769,7 +892,8 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 		    return conn->FromParquet(path_or_buffer, binary_as_string, file_row_number, filename, hive_partitioning,
 		                             union_by_name, compression);
 	    },
-	    "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'",
+	    "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'. A seekable "
+	    "file-like object is read when the relation is executed, so it has to stay open and unchanged until then",
 	    nb::arg("path_or_buffer"), nb::arg("binary_as_string") = false, nb::kw_only(),
 	    nb::arg("file_row_number") = false, nb::arg("filename") = false, nb::arg("hive_partitioning") = false,
 	    nb::arg("union_by_name") = false, nb::arg("compression") = nb::none(),
@@ -785,11 +909,32 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 		    return conn->FromParquet(path_or_buffer, binary_as_string, file_row_number, filename, hive_partitioning,
 		                             union_by_name, compression);
 	    },
-	    "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'",
+	    "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'. A seekable "
+	    "file-like object is read when the relation is executed, so it has to stay open and unchanged until then",
 	    nb::arg("path_or_buffer"), nb::arg("binary_as_string") = false, nb::kw_only(),
 	    nb::arg("file_row_number") = false, nb::arg("filename") = false, nb::arg("hive_partitioning") = false,
 	    nb::arg("union_by_name") = false, nb::arg("compression") = nb::none(),
 	    nb::arg("connection").none() = nb::none());
+	m.def(
+	    "read_numpy",
+	    [](const nb::object &path_or_buffer, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->ReadNumpy(path_or_buffer);
+	    },
+	    "Create a relation object from the .npy path(s) or file-like object(s) in 'path_or_buffer'",
+	    nb::arg("path_or_buffer"), nb::kw_only(), nb::arg("connection").none() = nb::none());
+	m.def(
+	    "read_arrow_ipc",
+	    [](const nb::object &path_or_buffer, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->ReadArrowIPC(path_or_buffer);
+	    },
+	    "Create a relation object from the Arrow IPC path(s) or file-like object(s) in 'path_or_buffer'",
+	    nb::arg("path_or_buffer"), nb::kw_only(), nb::arg("connection").none() = nb::none());
 	m.def(
 	    "get_table_names",
 	    [](const string &query, bool qualified, std::shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -866,7 +1011,7 @@ static void InitializeConnectionMethods(nb::module_ &m) {
 	    nb::arg("connection").none() = nb::none());
 	m.def(
 	    "write_csv",
-	    [](const PandasDataFrame &df, const string &filename, const nb::object &sep = nb::none(),
+	    [](const PandasDataFrame &df, const nb::object &filename, const nb::object &sep = nb::none(),
 	       const nb::object &na_rep = nb::none(), const nb::object &header = nb::none(),
 	       const nb::object &quotechar = nb::none(), const nb::object &escapechar = nb::none(),
 	       const nb::object &date_format = nb::none(), const nb::object &timestamp_format = nb::none(),
@@ -1107,6 +1252,8 @@ NB_MODULE(DUCKDB_PYTHON_LIB_NAME, m) { // NOLINT
 	DuckDBPyFunctional::Initialize(m);
 	DuckDBPyExpression::Initialize(m);
 	DuckDBPyStatement::Initialize(m);
+	DuckDBPyPreparedStatement::Initialize(m);
+	DuckDBPyQueryFuture::Initialize(m);
 	DuckDBPyRelation::Initialize(m);
 	DuckDBPyConnection::Initialize(m);
 	PythonObject::Initialize();
@@ -0,0 +1,27 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/arrow/arrow_ipc_scan.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/parser/parsed_data/create_table_function_info.hpp"
+
+namespace duckdb {
+
+//! read_arrow_ipc: scans Arrow IPC files in place, their record batches are passed to the Arrow scan without copies
+struct ArrowIPCScanFunction : public TableFunction {
+public:
+	explicit ArrowIPCScanFunction(const LogicalType &argument);
+
+	static unique_ptr<FunctionData> ArrowIPCScanBind(ClientContext &context, TableFunctionBindInput &input,
+	                                                 vector<LogicalType> &return_types, vector<string> &names);
+
+	static unique_ptr<NodeStatistics> ArrowIPCScanCardinality(ClientContext &context, const FunctionData *bind_data);
+};
+
+} // namespace duckdb
@@ -59,13 +59,64 @@ protected:
 	}
 };
 
+struct DuckdbUdfCacheItem : public PythonImportCacheItem {
+
+public:
+	static constexpr const char *Name = "duckdb.udf";
+
+public:
+	DuckdbUdfCacheItem()
+	    : PythonImportCacheItem("duckdb.udf"), _gather_async("_gather_async", this), _call_cached("_call_cached", this),
+	      FunctionCache("FunctionCache", this), _update_aggregate("_update_aggregate", this),
+	      _combine_aggregate("_combine_aggregate", this), _finalize_aggregate("_finalize_aggregate", this),
+	      _table_function_reader("_table_function_reader", this), _map_batch("_map_batch", this) {
+	}
+	~DuckdbUdfCacheItem() override {
+	}
+
+	PythonImportCacheItem _gather_async;
+	PythonImportCacheItem _call_cached;
+	PythonImportCacheItem FunctionCache;
+	PythonImportCacheItem _update_aggregate;
+	PythonImportCacheItem _combine_aggregate;
+	PythonImportCacheItem _finalize_aggregate;
+	PythonImportCacheItem _table_function_reader;
+	PythonImportCacheItem _map_batch;
+
+protected:
+	bool IsRequired() const override final {
+		return false;
+	}
+};
+
+struct DuckdbSharedmemoryCacheItem : public PythonImportCacheItem {
+
+public:
+	static constexpr const char *Name = "duckdb.shared_memory";
+
+public:
+	DuckdbSharedmemoryCacheItem()
+	    : PythonImportCacheItem("duckdb.shared_memory"), _export_shared_result("_export_shared_result", this) {
+	}
+	~DuckdbSharedmemoryCacheItem() override {
+	}
+
+	PythonImportCacheItem _export_shared_result;
+
+protected:
+	bool IsRequired() const override final {
+		return false;
+	}
+};
+
 struct DuckdbCacheItem : public PythonImportCacheItem {
 
 public:
 	static constexpr const char *Name = "duckdb";
 
 public:
-	DuckdbCacheItem() : PythonImportCacheItem("duckdb"), filesystem(), Value("Value", this), polars_io() {
+	DuckdbCacheItem()
+	    : PythonImportCacheItem("duckdb"), filesystem(), Value("Value", this), polars_io(), udf(), shared_memory() {
 	}
 	~DuckdbCacheItem() override {
 	}
@@ -73,6 +124,8 @@ public:
 	DuckdbFilesystemCacheItem filesystem;
 	PythonImportCacheItem Value;
 	DuckdbPolarsioCacheItem polars_io;
+	DuckdbUdfCacheItem udf;
+	DuckdbSharedmemoryCacheItem shared_memory;
 };
 
 } // namespace duckdb
@@ -11,6 +11,7 @@
 
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb.hpp"
+#include "duckdb/common/mutex.hpp"
 #include "duckdb/common/vector.hpp"
 #include "duckdb_python/import_cache/python_import_cache_modules.hpp"
 
@@ -40,9 +41,11 @@ public:
 	CollectionsCacheItem collections;
 
 public:
-	nb::handle AddCache(nb::object item);
+	//! Store item in slot unless another thread did first, returns the stored object
+	nb::handle AddCache(atomic<PyObject *> &slot, nb::object item);
 
 private:
+	mutex lock;
 	vector<nb::object> owned_objects;
 };
 
@@ -10,6 +10,7 @@
 
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb.hpp"
+#include "duckdb/common/atomic.hpp"
 #include "duckdb/common/vector.hpp"
 
 namespace duckdb {
@@ -40,7 +41,7 @@ protected:
 	}
 
 private:
-	nb::handle AddCache(PythonImportCache &cache, nb::object object);
+	nb::handle AddCache(PythonImportCache &cache, nb::object loaded);
 	void LoadAttribute(PythonImportCache &cache, nb::handle source);
 	void LoadModule(PythonImportCache &cache);
 
@@ -50,11 +51,12 @@ private:
 	//! Whether the item is a module
 	bool is_module;
 	//! Whether or not we attempted to load the item
-	bool load_succeeded;
+	atomic<bool> load_succeeded;
 	//! The parent of this item (either a module or an attribute)
 	optional_ptr<PythonImportCacheItem> parent;
-	//! The stored item
-	nb::handle object;
+	//! The stored item, set once. Threads can load an item concurrently on free-threaded builds, the first one to
+	//! finish publishes it
+	atomic<PyObject *> object;
 };
 
 } // namespace duckdb
@@ -23,8 +23,18 @@ public:
 	static unique_ptr<FunctionData> MapFunctionBind(ClientContext &context, TableFunctionBindInput &input,
 	                                                vector<LogicalType> &return_types, vector<string> &names);
 
+	static unique_ptr<GlobalTableFunctionState> MapFunctionInitGlobal(ClientContext &context,
+	                                                                  TableFunctionInitInput &input);
+
+	static unique_ptr<LocalTableFunctionState> MapFunctionInitLocal(ExecutionContext &context,
+	                                                                TableFunctionInitInput &input,
+	                                                                GlobalTableFunctionState *global_state);
+
 	static OperatorResultType MapFunctionExec(ExecutionContext &context, TableFunctionInput &data, DataChunk &input,
 	                                          DataChunk &output);
+
+	static OperatorFinalizeResultType MapFunctionFinal(ExecutionContext &context, TableFunctionInput &data,
+	                                                   DataChunk &output);
 };
 
 } // namespace duckdb
@@ -0,0 +1,47 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/mapped_file.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/allocator.hpp"
+#include "duckdb/common/memory_mapped_file.hpp"
+#include "duckdb/common/types/value.hpp"
+
+namespace duckdb {
+
+class ClientContext;
+
+//! A file that is scanned in place: local files are memory-mapped, files of filesystems that can't be mapped
+//! (object stores, registered Python filesystems) are read into memory once
+class MappedFile {
+public:
+	MappedFile(string path, unique_ptr<MemoryMappedFile> mapping);
+	MappedFile(string path, AllocatedData buffer, idx_t size);
+
+	static shared_ptr<MappedFile> Open(ClientContext &context, const string &path);
+	//! Expands the VARCHAR or LIST(VARCHAR) argument of a file scan into the files it matches
+	static vector<string> GlobFiles(ClientContext &context, const Value &input, const string &function_name);
+
+	//! Bounds-checked pointer to [location, location + nr_bytes) within the file
+	const_data_ptr_t GetData(idx_t location, idx_t nr_bytes) const;
+	idx_t Size() const {
+		return size;
+	}
+
+public:
+	string path;
+
+private:
+	unique_ptr<MemoryMappedFile> mapping;
+	AllocatedData buffer;
+	const_data_ptr_t data;
+	idx_t size;
+};
+
+} // namespace duckdb
@@ -0,0 +1,47 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/numpy/numpy_file_scan.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/parser/parsed_data/create_table_function_info.hpp"
+
+namespace duckdb {
+
+//! read_numpy: scans .npy files in place, without loading them through NumPy
+struct NumpyFileScanFunction : public TableFunction {
+public:
+	static constexpr idx_t NUMPY_FILE_PARTITION_COUNT = 50 * STANDARD_VECTOR_SIZE;
+
+public:
+	explicit NumpyFileScanFunction(const LogicalType &argument);
+
+	static unique_ptr<FunctionData> NumpyFileScanBind(ClientContext &context, TableFunctionBindInput &input,
+	                                                  vector<LogicalType> &return_types, vector<string> &names);
+
+	static unique_ptr<GlobalTableFunctionState> NumpyFileScanInitGlobal(ClientContext &context,
+	                                                                    TableFunctionInitInput &input);
+	static unique_ptr<LocalTableFunctionState>
+	NumpyFileScanInitLocal(ExecutionContext &context, TableFunctionInitInput &input, GlobalTableFunctionState *gstate);
+
+	static bool NumpyFileScanParallelStateNext(ClientContext &context, const FunctionData *bind_data_p,
+	                                           LocalTableFunctionState *lstate, GlobalTableFunctionState *gstate);
+
+	//! Can be called in parallel, values of contiguous columns are not copied but referenced in the mapped file
+	static void NumpyFileScanFunc(ClientContext &context, TableFunctionInput &data_p, DataChunk &output);
+
+	static unique_ptr<NodeStatistics> NumpyFileScanCardinality(ClientContext &context, const FunctionData *bind_data);
+
+	static double NumpyFileScanProgress(ClientContext &context, const FunctionData *bind_data_p,
+	                                    const GlobalTableFunctionState *gstate);
+
+	static OperatorPartitionData NumpyFileScanGetPartitionData(ClientContext &context,
+	                                                           TableFunctionGetPartitionInput &input);
+};
+
+} // namespace duckdb
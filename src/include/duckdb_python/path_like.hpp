@@ -10,7 +10,8 @@ namespace duckdb {
 struct DuckDBPyConnection;
 
 struct PathLike {
-	static PathLike Create(const nb::object &object, DuckDBPyConnection &connection);
+	//! With allow_pipe, non-seekable file-like objects are read as pipes (front to back) instead of being copied
+	static PathLike Create(const nb::object &object, DuckDBPyConnection &connection, bool allow_pipe = false);
 	// The file(s) extracted from object
 	vector<string> files;
 	shared_ptr<ExternalDependency> dependency;
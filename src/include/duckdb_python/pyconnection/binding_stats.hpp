@@ -0,0 +1,127 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyconnection/binding_stats.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/main/client_context_state.hpp"
+#include "duckdb_python/nb/casters.hpp"
+
+#include <chrono>
+
+namespace duckdb {
+
+//! What the binding spends time on besides executing queries
+enum class PythonBindingMetric : uint8_t {
+	//! Waiting for the GIL, when taking it back after a query or from an engine thread
+	GIL_WAIT,
+	//! Waiting for py_connection_lock, held by another thread using the connection
+	CONNECTION_LOCK_WAIT,
+	//! Looking up Python objects by the names of the tables of a query
+	REPLACEMENT_SCAN,
+	//! Converting results into Python objects, one metric per fetch API
+	FETCHONE,
+	FETCHMANY,
+	FETCHALL,
+	FETCHNUMPY,
+	DF,
+	TORCH,
+	TF,
+	ARROW,
+	//! Only creating the stream, its batches are converted when they are read
+	ARROW_STREAM
+};
+
+static constexpr idx_t PYTHON_BINDING_METRIC_COUNT = static_cast<idx_t>(PythonBindingMetric::ARROW_STREAM) + 1;
+
+//! How often something happened and how long it took in total
+struct PythonBindingTiming {
+	atomic<idx_t> count {0};
+	atomic<idx_t> nanoseconds {0};
+
+	void Record(std::chrono::steady_clock::duration elapsed);
+};
+
+struct PythonBindingCounters {
+	PythonBindingTiming timings[PYTHON_BINDING_METRIC_COUNT];
+
+	PythonBindingTiming &Get(PythonBindingMetric metric) {
+		return timings[static_cast<idx_t>(metric)];
+	}
+	nb::dict ToDict() const;
+	string ToJSON() const;
+};
+
+//! The counters of a connection, registered in its ClientContext. Only counts while the python_binding_stats setting
+//! is enabled, which is checked when a query begins
+class PythonBindingStats : public ClientContextState {
+public:
+	static constexpr const char *NAME = "python_binding_stats";
+
+public:
+	//! The stats of the connection of the context while they are enabled, nullptr otherwise
+	static shared_ptr<PythonBindingStats> Get(ClientContext &context);
+	//! The counters of all connections of the process
+	static PythonBindingCounters &Totals();
+
+	bool Enabled() const {
+		return enabled;
+	}
+	//! Read the python_binding_stats setting
+	void Refresh(ClientContext &context);
+	//! Record in the counters of the connection and in the totals
+	void Record(PythonBindingMetric metric, std::chrono::steady_clock::duration elapsed);
+
+	void QueryBegin(ClientContext &context) override;
+	void WriteProfilingInformation(std::ostream &ss) override;
+
+public:
+	PythonBindingCounters counters;
+
+private:
+	atomic<bool> enabled {false};
+};
+
+//! Records the time from construction to destruction when stats are given
+class PythonBindingStatsScope {
+public:
+	PythonBindingStatsScope(optional_ptr<PythonBindingStats> stats, PythonBindingMetric metric);
+	~PythonBindingStatsScope();
+
+private:
+	optional_ptr<PythonBindingStats> stats;
+	PythonBindingMetric metric;
+	std::chrono::steady_clock::time_point start;
+};
+
+//! nb::gil_scoped_acquire, recording the time it waited for the GIL when stats are given
+class InstrumentedGILAcquire {
+public:
+	explicit InstrumentedGILAcquire(optional_ptr<PythonBindingStats> stats);
+
+private:
+	std::chrono::steady_clock::time_point start;
+	nb::gil_scoped_acquire gil;
+};
+
+//! nb::gil_scoped_release, recording the time it waits to take the GIL back when stats are given
+class InstrumentedGILRelease {
+public:
+	explicit InstrumentedGILRelease(optional_ptr<PythonBindingStats> stats);
+	~InstrumentedGILRelease();
+
+	InstrumentedGILRelease(const InstrumentedGILRelease &) = delete;
+	InstrumentedGILRelease &operator=(const InstrumentedGILRelease &) = delete;
+
+private:
+	optional_ptr<PythonBindingStats> stats;
+	PyThreadState *thread_state;
+};
+
+} // namespace duckdb
@@ -0,0 +1,56 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyconnection/parameter_binder.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/common/identifier.hpp"
+#include "duckdb/planner/expression/bound_parameter_data.hpp"
+#include "duckdb_python/nb/casters.hpp"
+
+namespace duckdb {
+
+enum class PythonParameterConversion : uint8_t { GENERIC, NONE, BOOLEAN, INTEGER, DOUBLE, VARCHAR, TIMESTAMP, DATE };
+
+//! Transforms the parameters of repeated executions of one prepared statement.
+//! Every parameter remembers the Python type of its last value, values of the same builtin type are converted
+//! directly instead of going through TransformPythonValue. Other types, and type changes, take the generic path.
+//! Produces the same values as TransformPythonValue, except that integers are passed as BIGINT when the statement
+//! expects a BIGINT, which spares DuckDB from binding the statement again.
+class PythonParameterBinder {
+public:
+	identifier_map_t<BoundParameterData> BindList(ClientContext &context, PreparedStatement &prep,
+	                                              const nb::handle &params);
+	identifier_map_t<BoundParameterData> BindDict(ClientContext &context, PreparedStatement &prep,
+	                                              const nb::dict &params);
+
+public:
+	//! The number of parameter values that were converted directly and through TransformPythonValue
+	idx_t direct_conversions = 0;
+	idx_t generic_conversions = 0;
+
+private:
+	struct ParameterSlot {
+		PyTypeObject *type = nullptr;
+		PythonParameterConversion conversion = PythonParameterConversion::GENERIC;
+		//! The statement was bound with a BIGINT parameter, an INTEGER value would make DuckDB bind it again
+		bool expects_bigint = false;
+	};
+
+	static ParameterSlot CreateSlot(PreparedStatement &prep, const Identifier &identifier);
+	static PythonParameterConversion GetConversion(nb::handle value);
+	//! Converts values of the builtin types of the slot, returns false for the values that take the generic path
+	static bool TryTransformDirect(ParameterSlot &slot, nb::handle value, Value &result);
+	Value Transform(ClientContext &context, ParameterSlot &slot, nb::handle value);
+
+private:
+	vector<ParameterSlot> positional;
+	identifier_map_t<ParameterSlot> named;
+};
+
+} // namespace duckdb
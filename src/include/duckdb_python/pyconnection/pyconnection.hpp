@@ -17,9 +17,15 @@
 #include "duckdb_python/path_like.hpp"
 #include "duckdb/execution/operator/csv_scanner/csv_reader_options.hpp"
 #include "duckdb_python/pyfilesystem.hpp"
+#include "duckdb_python/pyconnection/binding_stats.hpp"
+#include "duckdb_python/pyconnection/statement_cache.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pyquery_future.hpp"
 #include "duckdb_python/registered_py_object.hpp"
 #include "duckdb_python/python_dependency.hpp"
 #include "duckdb/function/scalar_function.hpp"
+#include "duckdb/function/aggregate_function.hpp"
+#include "duckdb/function/table_function.hpp"
 #include "duckdb_python/nb/conversions/exception_handling_enum.hpp"
 #include "duckdb_python/nb/conversions/python_udf_type_enum.hpp"
 #include "duckdb/common/shared_ptr.hpp"
@@ -156,8 +162,12 @@ private:
 		void ClearCursors();
 
 	private:
+		static constexpr idx_t MINIMUM_COMPACTION_THRESHOLD = 16;
+
 		mutex lock;
 		vector<std::weak_ptr<DuckDBPyConnection>> cursors;
+		//! The number of cursors at which the closed ones are removed from the list
+		idx_t compaction_threshold = MINIMUM_COMPACTION_THRESHOLD;
 	};
 
 public:
@@ -172,7 +182,9 @@ public:
 	public:
 		explicit ConnectionLockGuard(DuckDBPyConnection &conn) : lock_(conn.py_connection_lock, std::defer_lock) {
 			D_ASSERT(duckdb::PyUtil::GilCheck());
-			nb::gil_scoped_release release;
+			auto stats = conn.GetBindingStats();
+			InstrumentedGILRelease release(stats);
+			PythonBindingStatsScope wait(stats, PythonBindingMetric::CONNECTION_LOCK_WAIT);
 			lock_.lock();
 		}
 
@@ -193,7 +205,13 @@ public:
 	//! MemoryFileSystem used to temporarily store file-like objects for reading
 	std::shared_ptr<ModifiedMemoryFileSystem> internal_object_filesystem;
 	case_insensitive_map_t<unique_ptr<ExternalDependency>> registered_functions;
+	//! The catalog type of every entry in registered_functions, needed to drop it again
+	case_insensitive_map_t<CatalogType> registered_function_types;
 	case_insensitive_set_t registered_objects;
+	//! Statements prepared by execute(), created once python_statement_cache_size is set
+	unique_ptr<PreparedStatementCache> statement_cache;
+	//! Registered in the ClientContext when the connection is created
+	shared_ptr<PythonBindingStats> binding_stats;
 
 public:
 	explicit DuckDBPyConnection() {
@@ -252,15 +270,41 @@ public:
 	                  const nb::object &return_type = nb::none(), PythonUDFType type = PythonUDFType::NATIVE,
 	                  FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING,
 	                  PythonExceptionHandling exception_handling = PythonExceptionHandling::FORWARD_ERROR,
-	                  bool side_effects = false);
+	                  bool side_effects = false, const nb::object &concurrency = nb::none(),
+	                  const nb::object &timeout = nb::none(), const nb::object &cache = nb::none());
+
+	std::shared_ptr<DuckDBPyConnection>
+	RegisterAggregateUDF(const string &name, const nb::callable &init, const nb::callable &update,
+	                     const nb::callable &combine, const nb::callable &finalize, const nb::object &parameters,
+	                     const nb::object &return_type, const string &format = "arrow",
+	                     FunctionNullHandling null_handling = FunctionNullHandling::DEFAULT_NULL_HANDLING);
+
+	std::shared_ptr<DuckDBPyConnection> RegisterTableUDF(const string &name, const nb::callable &function,
+	                                                     const nb::object &schema,
+	                                                     const nb::object &parameters = nb::none(),
+	                                                     const nb::object &cardinality = nb::none(),
+	                                                     bool projection_pushdown = false);
 
 	std::shared_ptr<DuckDBPyConnection> UnregisterUDF(const string &name);
 
 	std::shared_ptr<DuckDBPyConnection> ExecuteMany(const nb::object &query, nb::object params = nb::list());
+	std::unique_ptr<DuckDBPyPreparedStatement> Prepare(const nb::object &query);
+	//! Execute the last statement of the query on a background thread, the ones before it are executed right away
+	std::unique_ptr<DuckDBPyQueryFuture> Submit(const nb::object &query, nb::object params = nb::list());
+	//! Execute every query of the list, each a query or a (query, parameters) tuple, under one lock and one GIL
+	//! release. Returns a relation over the result of every query when return_results is set, None otherwise
+	nb::object ExecuteBatch(const nb::object &queries, bool return_results = true, bool transaction = false);
+	//! Execute a statement prepared by Prepare, keeping the result in the connection
+	void ExecutePrepared(PreparedStatement &prep, nb::object params,
+	                     optional_ptr<PythonParameterBinder> binder = nullptr);
+	//! Executes once per parameter set, with a binder for the loop when none is given
+	void ExecutePreparedMany(PreparedStatement &prep, nb::object params,
+	                         optional_ptr<PythonParameterBinder> binder = nullptr);
 
 	void ExecuteImmediately(vector<unique_ptr<SQLStatement>> statements);
 	unique_ptr<PreparedStatement> PrepareQuery(unique_ptr<SQLStatement> statement);
-	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep, nb::object params = nb::list());
+	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep, nb::object params = nb::list(),
+	                                        optional_ptr<PythonParameterBinder> binder = nullptr);
 	unique_ptr<QueryResult> PrepareAndExecuteInternal(unique_ptr<SQLStatement> statement,
 	                                                  nb::object params = nb::list());
 
@@ -296,6 +340,10 @@ public:
 
 	std::unique_ptr<DuckDBPyRelation> FromArrow(nb::object &arrow_object);
 
+	std::unique_ptr<DuckDBPyRelation> ReadNumpy(const nb::object &path_or_buffer);
+
+	std::unique_ptr<DuckDBPyRelation> ReadArrowIPC(const nb::object &path_or_buffer);
+
 	unordered_set<string> GetTableNames(const string &query, bool qualified);
 
 	std::shared_ptr<DuckDBPyConnection> UnregisterPythonObject(const string &name);
@@ -352,10 +400,22 @@ public:
 
 	// Takes nb::object (not AbstractFileSystem) so the binding can accept None: nanobind's .none() does not bypass a
 	// nb::object-subclass wrapper's check_(). The body imports fsspec and validates the instance explicitly.
-	void RegisterFilesystem(nb::object filesystem);
+	void RegisterFilesystem(nb::object filesystem, idx_t cache_size = 0, idx_t block_size = 1048576,
+	                        idx_t read_ahead = 0, double metadata_ttl = 0, idx_t write_buffer_size = 1048576,
+	                        const nb::object &upload_block_size = nb::none(), double read_timeout = 30);
 	void UnregisterFilesystem(const nb::str &name);
 	nb::list ListFilesystems();
 	bool FileSystemIsRegistered(const string &name);
+	nb::dict FilesystemStats(const string &name);
+	void InvalidateFilesystemCache(const string &name, const nb::object &path = nb::none());
+
+	nb::dict StatementCacheStats();
+	//! The counters of this connection, or of all connections of the process when aggregate is set
+	nb::dict BindingStats(bool aggregate = false);
+	//! The binding stats while they are enabled, nullptr otherwise
+	shared_ptr<PythonBindingStats> GetBindingStats();
+	//! Create the stats of the connection, they are kept as long as its ClientContext
+	void RegisterBindingStats();
 
 	// Profiling info
 	nb::str GetProfilingInformation(const string &format = "json");
@@ -367,15 +427,33 @@ public:
 	static bool IsAcceptedArrowObject(const nb::object &object);
 	static NumpyObjectType IsAcceptedNumpyObject(const nb::object &object);
 
-	static unique_ptr<QueryResult> CompletePendingQuery(PendingQueryResult &pending_query);
+	static unique_ptr<QueryResult> CompletePendingQuery(PendingQueryResult &pending_query,
+	                                                    optional_ptr<PythonBindingStats> stats = nullptr);
 
 private:
 	std::unique_ptr<DuckDBPyRelation> CreateRelation(shared_ptr<Relation> rel);
 	std::unique_ptr<DuckDBPyRelation> CreateRelation(std::shared_ptr<DuckDBPyResult> result);
-	PathLike GetPathLike(const nb::object &object);
+	PathLike GetPathLike(const nb::object &object, bool allow_pipe = false);
+	//! Prepare a statement to be executed more than once
+	unique_ptr<PreparedStatement> PrepareReusableQuery(unique_ptr<SQLStatement> statement);
+	optional_ptr<PreparedStatementCache> GetStatementCache();
+	//! Execute a cached statement, or prepare and cache it. Returns nullptr, with the parsed statements, when the query
+	//! can't be cached
+	unique_ptr<QueryResult> ExecuteCachedQuery(PreparedStatementCache &cache, const string &query, nb::object params,
+	                                           vector<unique_ptr<SQLStatement>> &statements);
+	std::unique_ptr<DuckDBPyRelation> ReadFiles(const string &function_name, const nb::object &path_or_buffer);
 	ScalarFunction CreateScalarUDF(const string &name, const nb::callable &udf, const nb::object &parameters,
 	                               const nb::object &return_type, bool vectorized, FunctionNullHandling null_handling,
-	                               PythonExceptionHandling exception_handling, bool side_effects);
+	                               PythonExceptionHandling exception_handling, bool side_effects,
+	                               const nb::object &concurrency, const nb::object &timeout, const nb::object &cache,
+	                               ExternalDependency &dependency);
+	AggregateFunction CreateAggregateUDF(const string &name, const nb::callable &init, const nb::callable &update,
+	                                     const nb::callable &combine, const nb::callable &finalize,
+	                                     const nb::object &parameters, const nb::object &return_type,
+	                                     const string &format, FunctionNullHandling null_handling);
+	duckdb::TableFunction CreateTableUDF(const string &name, const nb::callable &function, const nb::object &schema,
+	                                     const nb::object &parameters, const nb::object &cardinality,
+	                                     bool projection_pushdown);
 	vector<unique_ptr<SQLStatement>> GetStatements(const nb::object &query);
 
 	static void DetectEnvironment();
@@ -0,0 +1,80 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyconnection/statement_cache.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/common/lru_cache.hpp"
+#include "duckdb/main/client_context_state.hpp"
+#include "duckdb_python/nb/casters.hpp"
+#include "duckdb_python/pyconnection/parameter_binder.hpp"
+
+namespace duckdb {
+
+//! Registered in the ClientContext of a connection that caches statements, observes what the cache can't see
+class PythonStatementCacheState : public ClientContextState {
+public:
+	static constexpr const char *NAME = "python_statement_cache";
+
+public:
+	RebindQueryInfo OnExecutePrepared(ClientContext &context, PreparedStatementCallbackInfo &info,
+	                                  RebindQueryInfo current_rebind) override;
+
+public:
+	//! Executions of prepared statements that were bound again first, because the catalog or the parameter types
+	//! changed since they were prepared
+	atomic<idx_t> rebinds {0};
+	//! Python objects that were found by name while binding
+	atomic<idx_t> replacement_scans {0};
+};
+
+//! A statement in the cache, with the binder of the parameters of its executions
+struct CachedStatement {
+	explicit CachedStatement(unique_ptr<PreparedStatement> prepared_p) : prepared(std::move(prepared_p)) {
+	}
+
+	unique_ptr<PreparedStatement> prepared;
+	PythonParameterBinder binder;
+};
+
+//! An LRU cache of the statements prepared by execute(), keyed by the query text, the parameter style and the catalog
+//! search path.
+//! Enabled by the python_statement_cache_size setting. Not thread-safe, the connection lock serialises all access.
+class PreparedStatementCache {
+public:
+	explicit PreparedStatementCache(ClientContext &context);
+
+public:
+	//! Only queries and DML are cached, other statements are rarely executed repeatedly
+	static bool CanCache(const SQLStatement &statement);
+	static string GetKey(ClientContext &context, const string &query, const nb::object &params);
+
+	shared_ptr<CachedStatement> Get(const string &key);
+	void Put(const string &key, shared_ptr<CachedStatement> statement);
+	void Delete(const string &key);
+	//! Change the maximum number of cached statements, dropping the cached ones if it changes
+	void Resize(idx_t capacity);
+
+	idx_t Capacity() const;
+	nb::dict GetStats() const;
+
+public:
+	shared_ptr<PythonStatementCacheState> state;
+	idx_t hits = 0;
+	idx_t misses = 0;
+	idx_t rebinds = 0;
+	//! The parameter values of cached statements that were converted directly and through TransformPythonValue
+	idx_t direct_parameters = 0;
+	idx_t generic_parameters = 0;
+
+private:
+	unique_ptr<SharedLruCache<string, CachedStatement>> statements;
+};
+
+} // namespace duckdb
@@ -5,6 +5,12 @@
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb/common/vector.hpp"
 #include "duckdb/common/types/timestamp.hpp"
+#include "duckdb/common/lru_cache.hpp"
+#include "duckdb/common/mutex.hpp"
+#include "duckdb/storage/object_cache.hpp"
+
+#include <chrono>
+#include <condition_variable>
 
 namespace duckdb {
 
@@ -45,28 +51,234 @@ public:
 	}
 };
 
+//! The options of a PythonFilesystem, set through register_filesystem
+struct PythonFilesystemOptions {
+	//! The maximum amount of bytes kept in the block cache, 0 disables the cache
+	idx_t cache_size = 0;
+	//! The size of the blocks that are fetched from Python and cached
+	idx_t block_size = 1048576;
+	//! The amount of blocks that are fetched ahead of a sequential read
+	idx_t read_ahead = 0;
+	//! The amount of seconds that file metadata and glob results are cached for, 0 disables the metadata cache
+	double metadata_ttl = 0;
+	//! Writes are combined into blocks of this size before they are handed to Python, 0 writes through
+	idx_t write_buffer_size = 1048576;
+	//! The block_size files are opened with for writing, object stores use it as the part size of multipart uploads
+	optional_idx upload_block_size;
+	//! The amount of seconds a read waits for a non-blocking stream that keeps reporting no data is available
+	double read_timeout = 30;
+};
+
+//! The metadata of a path, as reported by info(), glob(detail=True) or ls(detail=True)
+struct PythonFileMetadata {
+	bool exists = false;
+	bool is_directory = false;
+	optional_idx size;
+	bool has_last_modified = false;
+	timestamp_t last_modified;
+	std::chrono::steady_clock::time_point fetched_at;
+};
+
+//! A cached glob result or directory listing
+struct PythonFileListing {
+	vector<string> files;
+	vector<bool> is_directory;
+	std::chrono::steady_clock::time_point fetched_at;
+};
+
+struct PythonFileBlockPayload {
+	explicit PythonFileBlockPayload(idx_t size) : size(size) {
+	}
+	idx_t GetWeight() const {
+		return size;
+	}
+	idx_t size;
+};
+
+//! A block that is being fetched from Python, reads of the same block wait for it instead of fetching it again
+struct PythonPendingBlock {
+	mutex lock;
+	std::condition_variable fetched;
+	bool done = false;
+	shared_ptr<string> block;
+	string error;
+};
+
+//! A byte range of a file requested through cat_ranges, dispatched together with the ranges other reads request
+struct PythonRangeRequest {
+	PythonRangeRequest(string path_p, idx_t start_p, idx_t end_p)
+	    : path(std::move(path_p)), start(start_p), end(end_p) {
+	}
+	string path;
+	idx_t start;
+	idx_t end;
+	bool done = false;
+	string data;
+	string error;
+};
+
+//! The state shared by all handles of a PythonFilesystem, kept in the ObjectCache of the database
+class PythonFilesystemState : public ObjectCacheEntry {
+public:
+	explicit PythonFilesystemState(PythonFilesystemOptions options);
+
+	static string ObjectType() {
+		return "python_filesystem";
+	}
+	string GetObjectType() override {
+		return ObjectType();
+	}
+	optional_idx GetEstimatedCacheMemory() const override {
+		// never evicted, the state lives as long as the filesystem is registered
+		return optional_idx();
+	}
+
+	bool CacheEnabled() const {
+		return options.cache_size > 0;
+	}
+	bool MetadataEnabled() const {
+		return options.metadata_ttl > 0;
+	}
+	shared_ptr<string> GetBlock(const string &key);
+	//! Claims the fetch of a block. Returns nullptr if the caller has to fetch it, or the pending block to wait for
+	shared_ptr<PythonPendingBlock> BeginFetch(const string &key, shared_ptr<PythonPendingBlock> &claimed);
+	//! Caches a fetched block (or the error that occurred fetching it) and wakes up the reads waiting for it
+	void FinishFetch(const string &key, PythonPendingBlock &pending, shared_ptr<string> block, const string &error);
+	static shared_ptr<string> WaitForFetch(PythonPendingBlock &pending);
+	//! Queues a range and waits for its bytes. The first waiting read dispatches every queued range in a single call,
+	//! ranges queued while a dispatch runs go out together with the next one
+	string FetchRange(const shared_ptr<PythonRangeRequest> &request,
+	                  const std::function<void(const vector<shared_ptr<PythonRangeRequest>> &)> &dispatch);
+	//! Returns the generation of a path, which changes whenever the path or a directory above it is written to through
+	//! DuckDB
+	idx_t GetGeneration(const string &path);
+	//! Returns whether metadata of the path that is not older than the TTL is cached
+	bool GetMetadata(const string &path, PythonFileMetadata &result);
+	//! Caches (part of) the metadata of a path, merging it with metadata cached before
+	void PutMetadata(const string &path, const PythonFileMetadata &metadata);
+	//! Returns whether the result of the glob or listing is cached and not older than the TTL
+	bool GetListing(const string &key, PythonFileListing &result);
+	void PutListing(const string &key, PythonFileListing listing);
+	//! Drops the cached blocks and metadata of a path (and the paths below it) and all glob results and listings
+	void Invalidate(const string &path);
+	void InvalidateAll();
+	nb::dict GetStats();
+
+public:
+	const PythonFilesystemOptions options;
+	//! Whether blocks are fetched through cat_ranges, which async fsspec implementations execute concurrently
+	bool fetch_ranges = false;
+	atomic<idx_t> cache_hits;
+	atomic<idx_t> cache_misses;
+	//! Reads of a block another read was fetching already, they wait for it instead of fetching it again
+	atomic<idx_t> pending_waits;
+	atomic<idx_t> bytes_fetched;
+	atomic<idx_t> fetches;
+	atomic<idx_t> metadata_hits;
+	atomic<idx_t> metadata_misses;
+	atomic<idx_t> writes;
+	atomic<idx_t> bytes_written;
+
+private:
+	//! Paths are cached without their protocol and leading slashes, e.g. memory://a and memory:///a are the same file
+	static string NormalizePath(const string &path);
+	bool IsFresh(std::chrono::steady_clock::time_point fetched_at) const;
+
+private:
+	mutex lock;
+	SharedLruCache<string, string, PythonFileBlockPayload> blocks;
+	unordered_map<string, shared_ptr<PythonPendingBlock>> pending_blocks;
+	unordered_map<string, idx_t> generations;
+	//! The generation of paths that were not written to since the last InvalidateAll
+	idx_t base_generation = 0;
+	idx_t next_generation = 0;
+	unordered_map<string, PythonFileMetadata> metadata;
+	unordered_map<string, PythonFileListing> listings;
+
+	mutex range_lock;
+	std::condition_variable ranges_dispatched;
+	vector<shared_ptr<PythonRangeRequest>> queued_ranges;
+	bool dispatching_ranges = false;
+};
+
 class PythonFileHandle : public FileHandle {
 public:
-	PythonFileHandle(FileSystem &file_system, const string &path, const nb::object &handle, FileOpenFlags flags);
+	PythonFileHandle(FileSystem &file_system, const string &path, const nb::object &handle, FileOpenFlags flags,
+	                 shared_ptr<PythonFilesystemState> state);
 	~PythonFileHandle() override;
 	void Close() override;
 
 	static const nb::object &GetHandle(const FileHandle &handle);
+	//! Reads up to nr_bytes into buffer with a single call to the Python file object, requires the GIL
+	idx_t ReadInto(data_ptr_t buffer, idx_t nr_bytes);
+	//! Adds a write to the write buffer, returns false if the buffer has to be flushed first
+	bool BufferWrite(const_data_ptr_t buffer, idx_t nr_bytes, optional_idx location);
+	bool HasBufferedWrites() const {
+		return !write_buffer.empty();
+	}
+	//! Hands the buffered writes to the Python file object, requires the GIL
+	void FlushWrites();
+	//! Writes buffer with as many calls to write() as the Python file object needs, requires the GIL
+	void WriteAll(const_data_ptr_t buffer, idx_t nr_bytes);
+
+public:
+	//! Whether the Python file object supports readinto(), which fills DuckDB's buffer without an extra copy
+	bool supports_readinto = false;
+	//! Whether the Python file object reports it is not seekable, it is then read front to back as a pipe
+	bool is_pipe = false;
+	//! Whether reads of this handle are served from the block cache
+	bool cached = false;
+	//! The prefix of the cache keys of this file, identifying the version of the file that was opened
+	string cache_key;
+	//! The size of the file when it was opened, known if cached or has_file_size is set
+	idx_t file_size = 0;
+	//! Whether file_size was fetched, only for handles that are not opened for writing
+	bool has_file_size = false;
+	//! The last modification time of the file, fetched once for handles that are not opened for writing
+	bool has_last_modified = false;
+	timestamp_t last_modified;
+	//! The position of the handle, maintained in C++ when reads are served from the cache
+	idx_t position = 0;
+	//! The block following the last block that was read, used to detect sequential reads
+	idx_t next_block = 0;
+	//! The size of the write buffer, 0 if writes are handed to Python as they come
+	idx_t write_buffer_size = 0;
+	//! The client the file was opened for, a read waiting for data stops when its query is interrupted
+	weak_ptr<ClientContext> context;
 
 private:
 	nb::object handle;
+	shared_ptr<PythonFilesystemState> state;
+	//! The writes that were not handed to Python yet
+	string write_buffer;
+	//! The offset the buffered writes start at, if they are positional writes
+	optional_idx write_offset;
 };
 
 class PythonFilesystem : public FileSystem {
 private:
 	const vector<string> protocols;
 	AbstractFileSystem filesystem;
+	shared_ptr<PythonFilesystemState> state;
 	std::string DecodeFlags(FileOpenFlags flags);
-	bool Exists(const string &filename, const char *func_name) const;
+	bool Exists(const string &filename, const char *func_name);
+	void InitializeCache(PythonFileHandle &handle);
+	//! The metadata getters below require the GIL
+	idx_t GetSize(PythonFileHandle &handle);
+	timestamp_t GetModified(PythonFileHandle &handle);
+	PythonFileMetadata GetMetadata(const string &path);
+	static PythonFileMetadata ParseInfo(const nb::handle &info);
+	void ReadCached(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location);
+	void ReadExactly(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location);
+	shared_ptr<string> GetBlock(PythonFileHandle &handle, idx_t block_idx, idx_t last_block);
+	vector<shared_ptr<string>> FetchBlocks(PythonFileHandle &handle, idx_t block_idx, idx_t block_count);
+	//! Fetches the ranges with one call to cat_ranges, merging adjacent and overlapping ranges of the same file
+	void DispatchRanges(const vector<shared_ptr<PythonRangeRequest>> &requests);
 
 public:
-	explicit PythonFilesystem(vector<string> protocols, AbstractFileSystem filesystem)
-	    : protocols(std::move(protocols)), filesystem(std::move(filesystem)) {
+	explicit PythonFilesystem(vector<string> protocols, AbstractFileSystem filesystem,
+	                          shared_ptr<PythonFilesystemState> state)
+	    : protocols(std::move(protocols)), filesystem(std::move(filesystem)), state(std::move(state)) {
 	}
 	~PythonFilesystem() override;
 
@@ -79,7 +291,7 @@ public:
 	unique_ptr<FileHandle> OpenFile(const string &path, FileOpenFlags flags, optional_ptr<FileOpener> opener) override;
 	void Seek(duckdb::FileHandle &handle, uint64_t location) override;
 	FileType GetFileType(FileHandle &handle) override {
-		return FileType::FILE_TYPE_REGULAR;
+		return handle.Cast<PythonFileHandle>().is_pipe ? FileType::FILE_TYPE_FIFO : FileType::FILE_TYPE_REGULAR;
 	}
 	int64_t Read(FileHandle &handle, void *buffer, int64_t nr_bytes) override;
 	void Read(duckdb::FileHandle &handle, void *buffer, int64_t nr_bytes, uint64_t location) override;
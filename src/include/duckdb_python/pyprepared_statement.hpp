@@ -0,0 +1,49 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyprepared_statement.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb_python/nb/casters.hpp"
+#include "duckdb_python/pyconnection/parameter_binder.hpp"
+#include "duckdb.hpp"
+
+namespace duckdb {
+
+struct DuckDBPyConnection;
+
+//! A statement prepared by DuckDBPyConnection::prepare, executions skip parsing and planning.
+//! Its results are held by the connection, like the results of execute()
+struct DuckDBPyPreparedStatement {
+public:
+	DuckDBPyPreparedStatement(std::shared_ptr<DuckDBPyConnection> connection, unique_ptr<PreparedStatement> prepared);
+
+public:
+	static void Initialize(nb::handle &m);
+
+	DuckDBPyPreparedStatement &Execute(nb::object params);
+	DuckDBPyPreparedStatement &ExecuteMany(nb::object params);
+	void Close();
+
+	string Query() const;
+	StatementType Type() const;
+	nb::dict ParameterTypes() const;
+	nb::list Columns() const;
+	nb::list ColumnTypes() const;
+
+	DuckDBPyConnection &GetConnection() const;
+
+private:
+	PreparedStatement &GetPrepared() const;
+
+private:
+	std::shared_ptr<DuckDBPyConnection> connection;
+	unique_ptr<PreparedStatement> prepared;
+	PythonParameterBinder binder;
+};
+
+} // namespace duckdb
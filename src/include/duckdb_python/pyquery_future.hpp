@@ -0,0 +1,79 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyquery_future.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb_python/nb/casters.hpp"
+#include "duckdb.hpp"
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/common/error_data.hpp"
+#include "duckdb/common/mutex.hpp"
+#include "duckdb/main/pending_query_result.hpp"
+#include "duckdb/planner/expression/bound_parameter_data.hpp"
+
+#include <condition_variable>
+#include <thread>
+
+namespace duckdb {
+
+struct DuckDBPyConnection;
+
+//! A query submitted by DuckDBPyConnection::submit, executed on a background thread without the GIL.
+//! The thread takes the connection lock before the query is bound and holds it until the query finished, other calls
+//! on the connection wait for it. The query is bound by submit on the calling thread, so replacement scans find the
+//! Python objects of its frames, only its execution runs on the background thread
+struct DuckDBPyQueryFuture {
+public:
+	explicit DuckDBPyQueryFuture(std::shared_ptr<DuckDBPyConnection> connection);
+	~DuckDBPyQueryFuture();
+
+public:
+	static void Initialize(nb::handle &m);
+
+	//! Wait until the thread holds the connection lock, the query may be bound once this returns. Requires the GIL
+	void WaitForConnection();
+	//! Hand the bound query to the thread, which executes it
+	void Start(unique_ptr<PendingQueryResult> pending_query);
+	//! Let the thread release the connection lock without executing a query, when binding the query failed
+	void Abort();
+
+	//! Wait for the query and return its result as a relation, raising its error if it failed
+	nb::object Result(const nb::object &timeout);
+	bool Done();
+	//! Interrupt the query, returns false if it already finished
+	bool Cancel();
+	bool Cancelled();
+	double Progress();
+
+private:
+	void Run();
+	bool Wait(const nb::object &timeout);
+
+private:
+	std::shared_ptr<DuckDBPyConnection> connection;
+	std::thread thread;
+	atomic<bool> cancelled {false};
+	//! Set once the query was handed to the thread, before that it can't be interrupted
+	atomic<bool> started {false};
+
+	mutex lock;
+	//! Signals connection_locked to submit and handed_over to the thread
+	std::condition_variable handoff_condition;
+	bool connection_locked = false;
+	bool handed_over = false;
+	unique_ptr<PendingQueryResult> pending_query;
+
+	std::condition_variable finished_condition;
+	bool finished = false;
+	unique_ptr<QueryResult> result;
+	ErrorData error;
+	//! The relation returned by Result, created on the first call
+	nb::object relation;
+};
+
+} // namespace duckdb
@@ -200,18 +200,22 @@ public:
 
 	duckdb::pyarrow::RecordBatchReader ToRecordBatch(idx_t batch_size);
 
+	nb::object ToSharedMemory(const string &name, idx_t batch_size);
+
 	std::unique_ptr<DuckDBPyRelation> Union(DuckDBPyRelation *other);
 
 	std::unique_ptr<DuckDBPyRelation> Except(DuckDBPyRelation *other);
 
 	std::unique_ptr<DuckDBPyRelation> Intersect(DuckDBPyRelation *other);
 
-	std::unique_ptr<DuckDBPyRelation> Map(nb::callable fun, Optional<nb::object> schema);
+	std::unique_ptr<DuckDBPyRelation> Map(nb::callable fun, Optional<nb::object> schema,
+	                                      const string &format = "pandas", const nb::object &batch_rows = nb::none(),
+	                                      bool parallel = true);
 
 	std::unique_ptr<DuckDBPyRelation> Join(DuckDBPyRelation *other, const nb::object &condition, const string &type);
 	std::unique_ptr<DuckDBPyRelation> Cross(DuckDBPyRelation *other);
 
-	void ToParquet(const string &filename, const nb::object &compression = nb::none(),
+	void ToParquet(const nb::object &filename, const nb::object &compression = nb::none(),
 	               const nb::object &field_ids = nb::none(), const nb::object &row_group_size_bytes = nb::none(),
 	               const nb::object &row_group_size = nb::none(), const nb::object &overwrite = nb::none(),
 	               const nb::object &per_thread_output = nb::none(), const nb::object &use_tmp_file = nb::none(),
@@ -219,7 +223,7 @@ public:
 	               const nb::object &append = nb::none(), const nb::object &filename_pattern = nb::none(),
 	               const nb::object &file_size_bytes = nb::none());
 
-	void ToCSV(const string &filename, const nb::object &sep = nb::none(), const nb::object &na_rep = nb::none(),
+	void ToCSV(const nb::object &filename, const nb::object &sep = nb::none(), const nb::object &na_rep = nb::none(),
 	           const nb::object &header = nb::none(), const nb::object &quotechar = nb::none(),
 	           const nb::object &escapechar = nb::none(), const nb::object &date_format = nb::none(),
 	           const nb::object &timestamp_format = nb::none(), const nb::object &quoting = nb::none(),
@@ -289,6 +293,19 @@ private:
 	void ExecuteOrThrow(bool stream_result = false);
 	unique_ptr<QueryResult> ExecuteInternal(bool stream_result = false);
 
+	//! Acquire py_relation_lock, releasing the GIL while waiting so the thread holding it can take the GIL
+	class RelationLockGuard {
+	public:
+		explicit RelationLockGuard(DuckDBPyRelation &relation) : lock_(relation.py_relation_lock, std::defer_lock) {
+			D_ASSERT(duckdb::PyUtil::GilCheck());
+			nb::gil_scoped_release release;
+			lock_.lock();
+		}
+
+	private:
+		std::unique_lock<std::recursive_mutex> lock_;
+	};
+
 private:
 	//! Prevents GC of the parent DuckDBPyConnection.
 	//! Declared first so it is destroyed last (reverse declaration order).
@@ -300,6 +317,9 @@ private:
 	vector<string> names;
 	std::shared_ptr<DuckDBPyResult> result;
 	std::string rendered_result;
+	//! Serialises the methods that execute the relation or fetch from its result. Without the GIL (free-threaded
+	//! builds) two threads could otherwise fetch from, or reset, the same result at once
+	std::recursive_mutex py_relation_lock;
 };
 
 } // namespace duckdb
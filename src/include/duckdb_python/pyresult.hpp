@@ -14,12 +14,14 @@
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/dataframe.hpp"
+#include "duckdb_python/pyconnection/binding_stats.hpp"
 
 namespace duckdb {
 
 struct DuckDBPyResult {
 public:
-	explicit DuckDBPyResult(unique_ptr<QueryResult> result);
+	//! Fetches are timed in binding_stats while they are enabled
+	explicit DuckDBPyResult(unique_ptr<QueryResult> result, shared_ptr<PythonBindingStats> binding_stats = nullptr);
 	~DuckDBPyResult();
 
 public:
@@ -59,6 +61,18 @@ public:
 
 	ClientProperties GetClientProperties();
 
+private:
+	//! Records the time of a fetch in the binding stats, a fetch called by another one is part of the outer one
+	class FetchTimer {
+	public:
+		FetchTimer(DuckDBPyResult &result, PythonBindingMetric metric);
+		~FetchTimer();
+
+	private:
+		DuckDBPyResult &result;
+		unique_ptr<PythonBindingStatsScope> scope;
+	};
+
 private:
 	void FillNumpy(nb::dict &res, idx_t col_idx, NumpyResultConversion &conversion, const char *name);
 
@@ -92,6 +106,9 @@ private:
 	// Holds the categorical type of Categorical/ENUM types
 	unordered_map<idx_t, nb::object> categories_type;
 	bool result_closed = false;
+	shared_ptr<PythonBindingStats> binding_stats;
+	//! Whether a FetchTimer is running
+	bool timing_fetch = false;
 };
 
 } // namespace duckdb
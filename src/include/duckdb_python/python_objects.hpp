@@ -35,8 +35,8 @@ public:
 	idx_t len;
 
 public:
-	nb::handle operator[](const nb::object &obj) const {
-		return PyDict_GetItem(dict.ptr(), obj.ptr());
+	nb::object operator[](const nb::object &obj) const {
+		return duckdb::PyUtil::DictGetItem(dict, obj);
 	}
 
 public:
@@ -92,6 +92,12 @@ struct PyUtil {
 	static bool GilCheck();
 	static void GilAssert();
 
+	// Lookups returning a new reference: a borrowed one into a dict or list that another thread can change is not
+	// safe on free-threaded builds. DictGetItem returns a null object for a missing key, ListGetItem raises IndexError
+	// when the list got shorter.
+	static nb::object DictGetItem(nb::handle dict, nb::handle key);
+	static nb::object ListGetItem(nb::handle list, idx_t index);
+
 	// Collection predicates consulting the connection's ImportCache (collections.abc Iterable/Mapping).
 	static bool IsListLike(nb::handle obj);
 	static bool IsDictLike(nb::handle obj);
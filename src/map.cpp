@@ -9,21 +9,79 @@
 #include "duckdb_python/pytype.hpp"
 #include "duckdb_python/dataframe.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/registered_py_object.hpp"
+#include "duckdb_python/arrow/arrow_array_stream.hpp"
+#include "duckdb_python/arrow/arrow_export_utils.hpp"
+#include "duckdb/common/arrow/arrow_appender.hpp"
+#include "duckdb/common/arrow/arrow_converter.hpp"
+#include "duckdb/common/types/arrow_aux_data.hpp"
+#include "duckdb/function/table/arrow.hpp"
+#include "duckdb/parser/tableref/table_function_ref.hpp"
 
 namespace duckdb {
 
 MapFunction::MapFunction()
-    : TableFunction("python_map_function", {LogicalType::TABLE, LogicalType::POINTER, LogicalType::POINTER}, nullptr,
-                    MapFunctionBind) {
+    : TableFunction("python_map_function",
+                    {LogicalType::TABLE, LogicalType::POINTER, LogicalType::POINTER, LogicalType::VARCHAR,
+                     LogicalType::UBIGINT, LogicalType::BOOLEAN},
+                    nullptr, MapFunctionBind, MapFunctionInitGlobal, MapFunctionInitLocal) {
 	in_out_function = MapFunctionExec;
+	in_out_function_final = MapFunctionFinal;
 }
 
+enum class MapFunctionFormat : uint8_t { PANDAS, ARROW, POLARS };
+
 struct MapFunctionData : public TableFunctionData {
 	MapFunctionData() : function(nullptr) {
 	}
 	PyObject *function;
 	vector<LogicalType> in_types, out_types;
 	vector<Identifier> in_names, out_names;
+	MapFunctionFormat format = MapFunctionFormat::PANDAS;
+	//! The amount of rows collected before calling the function, 0 calls it for every input chunk
+	idx_t batch_rows = 0;
+	//! Whether the function may be called from several threads at once
+	bool parallel = true;
+};
+
+struct MapFunctionGlobalState : public GlobalTableFunctionState {
+	//! Held while calling the function if it may not be called from several threads at once. The input pipeline of
+	//! an in-out function runs on as many threads as its source, so this is what keeps the calls serial.
+	mutex function_lock;
+};
+
+//! Serializes the calls of a function that may not run in parallel, always taken before acquiring the GIL
+static unique_lock<mutex> LockFunction(const MapFunctionData &data, GlobalTableFunctionState &global_state) {
+	if (data.parallel) {
+		return unique_lock<mutex>();
+	}
+	return unique_lock<mutex>(global_state.Cast<MapFunctionGlobalState>().function_lock);
+}
+
+//! Scans the pyarrow Table returned by a call through the arrow scan, casting it to the bound output types
+struct MapArrowResult {
+	MapArrowResult(ClientContext &context, const MapFunctionData &data, nb::object table_p);
+
+	//! Writes the next rows of the result to 'output', returns false once the result is exhausted
+	bool Scan(ClientContext &context, DataChunk &output);
+
+	//! Declared first so the scan state referencing it is destroyed before it
+	unique_ptr<RegisteredObject> table;
+	unique_ptr<PythonTableArrowArrayStreamFactory> factory;
+	unique_ptr<FunctionData> bind_data;
+	unique_ptr<GlobalTableFunctionState> global_state;
+	unique_ptr<LocalTableFunctionState> local_state;
+	DataChunk chunk;
+};
+
+struct MapFunctionLocalState : public LocalTableFunctionState {
+	//! The input rows collected for the next call ('arrow' and 'polars' formats)
+	unique_ptr<ArrowAppender> appender;
+	idx_t buffered_rows = 0;
+	//! The input chunk is passed again for as long as we return HAVE_MORE_OUTPUT, it should only be collected once
+	bool input_collected = false;
+	//! The result of the last call, if it still has rows left
+	unique_ptr<MapArrowResult> result;
 };
 
 static nb::object FunctionCall(NumpyResultConversion &conversion, const vector<Identifier> &names, PyObject *function) {
@@ -107,6 +165,30 @@ static void OverrideNullType(vector<LogicalType> &return_types, const vector<Ide
 	}
 }
 
+static nb::object ToPyArrowSchema(const MapFunctionData &data, ClientProperties options) {
+	vector<string> names;
+	for (auto &name : data.in_names) {
+		names.push_back(name.GetIdentifierName());
+	}
+	ArrowSchema schema;
+	ArrowConverter::ToArrowSchema(&schema, data.in_types, names, options);
+	return pyarrow::ToPyArrowSchema(schema);
+}
+
+static nb::object ArrowFunctionCall(const MapFunctionData &data, const nb::object &table) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	try {
+		return import_cache.duckdb.udf._map_batch()(nb::handle(data.function), table,
+		                                            nb::arg("format") =
+		                                                data.format == MapFunctionFormat::POLARS ? "polars" : "arrow");
+	} catch (nb::python_error &e) {
+		auto type_name = nb::cast<std::string>(nb::str(nb::object(e.type().attr("__name__"))));
+		auto message = nb::cast<std::string>(nb::str(e.value()));
+		throw InvalidInputException("Python exception occurred while executing the map function: %s: %s", type_name,
+		                            message);
+	}
+}
+
 unique_ptr<FunctionData> BindExplicitSchema(unique_ptr<MapFunctionData> function_data, PyObject *schema_p,
                                             vector<LogicalType> &types, vector<string> &names) {
 	D_ASSERT(schema_p != Py_None);
@@ -155,12 +237,39 @@ unique_ptr<FunctionData> MapFunction::MapFunctionBind(ClientContext &context, Ta
 	data.function = reinterpret_cast<PyObject *>(input.inputs[1].GetPointer());
 	auto explicit_schema = reinterpret_cast<PyObject *>(input.inputs[2].GetPointer());
 
+	auto format = input.inputs[3].GetValue<string>();
+	data.format = format == "arrow"    ? MapFunctionFormat::ARROW
+	              : format == "polars" ? MapFunctionFormat::POLARS
+	                                   : MapFunctionFormat::PANDAS;
+	data.batch_rows = input.inputs[4].GetValue<uint64_t>();
+	data.parallel = input.inputs[5].GetValue<bool>();
+
 	data.in_names = input.input_table_names;
 	data.in_types = input.input_table_types;
 
 	if (explicit_schema != Py_None) {
 		return BindExplicitSchema(std::move(data_uptr), explicit_schema, return_types, names);
 	}
+	if (data.format != MapFunctionFormat::PANDAS) {
+		// Infer the output columns from a call with an empty table
+		auto table =
+		    ArrowFunctionCall(data, ToPyArrowSchema(data, context.GetClientProperties()).attr("empty_table")());
+		ArrowSchemaWrapper schema;
+		PythonTableArrowArrayStreamFactory::GetSchemaInternal(table, schema);
+		ArrowTableSchema arrow_table;
+		ArrowTableFunction::PopulateArrowTableSchema(context, arrow_table, schema.arrow_schema);
+		return_types = arrow_table.GetTypes();
+		names = arrow_table.GetNames();
+		if (return_types.empty()) {
+			throw InvalidInputException("The map function has to return at least one column");
+		}
+		for (auto &name : names) {
+			data.out_names.push_back(Identifier(name));
+		}
+		OverrideNullType(return_types, data.out_names, data.in_types, data.in_names);
+		data.out_types = return_types;
+		return std::move(data_uptr);
+	}
 	NumpyResultConversion conversion(data.in_types, 0, context.GetClientProperties());
 	auto df = FunctionCall(conversion, data.in_names, data.function);
 	vector<PandasColumnBindData> pandas_bind_data; // unused
@@ -183,16 +292,157 @@ static string TypeVectorToString(const vector<LogicalType> &types) {
 	return StringUtil::Join(types, types.size(), ", ", [](const LogicalType &argument) { return argument.ToString(); });
 }
 
+MapArrowResult::MapArrowResult(ClientContext &context, const MapFunctionData &data, nb::object table_p)
+    : table(make_uniq<RegisteredObject>(std::move(table_p))) {
+	factory = make_uniq<PythonTableArrowArrayStreamFactory>(table->obj.ptr(), context.GetClientProperties(),
+	                                                        PyArrowObjectType::Table);
+	vector<Value> children;
+	children.push_back(Value::POINTER(CastPointerToValue(factory.get())));
+	children.push_back(Value::POINTER(CastPointerToValue(PythonTableArrowArrayStreamFactory::Produce)));
+	children.push_back(Value::POINTER(CastPointerToValue(PythonTableArrowArrayStreamFactory::GetSchema)));
+	named_parameter_map_t named_params;
+	vector<LogicalType> input_types;
+	vector<Identifier> input_names;
+	TableFunctionRef empty;
+	TableFunction dummy_table_function;
+	dummy_table_function.name = "python_map_function";
+	TableFunctionBindInput bind_input(children, named_params, input_types, input_names, nullptr, nullptr,
+	                                  dummy_table_function, empty);
+	vector<LogicalType> types;
+	vector<string> names;
+	bind_data = ArrowTableFunction::ArrowScanBind(context, bind_input, types, names);
+
+	if (types.size() != data.out_types.size()) {
+		throw InvalidInputException("Expected %llu columns from UDF, got %llu", data.out_types.size(), types.size());
+	}
+	for (idx_t col_idx = 0; col_idx < names.size(); col_idx++) {
+		if (Identifier(names[col_idx]) != data.out_names[col_idx]) {
+			throw InvalidInputException("UDF column name mismatch, expected [%s], got [%s]",
+			                            StringUtil::Join(data.out_names, ", "), StringUtil::Join(names, ", "));
+		}
+	}
+
+	vector<column_t> column_ids;
+	for (idx_t col_idx = 0; col_idx < types.size(); col_idx++) {
+		column_ids.push_back(col_idx);
+	}
+	TableFunctionInitInput input(bind_data.get(), column_ids, vector<idx_t>(), nullptr);
+	global_state = ArrowTableFunction::ArrowScanInitGlobal(context, input);
+	local_state = ArrowTableFunction::ArrowScanInitLocalInternal(context, input, global_state.get());
+	chunk.Initialize(context, types, STANDARD_VECTOR_SIZE);
+}
+
+bool MapArrowResult::Scan(ClientContext &context, DataChunk &output) {
+	chunk.Reset();
+	TableFunctionInput function_input(bind_data.get(), local_state.get(), global_state.get());
+	ArrowTableFunction::ArrowScanFunction(context, function_input, chunk);
+	if (chunk.size() == 0) {
+		return false;
+	}
+	for (idx_t col_idx = 0; col_idx < output.ColumnCount(); col_idx++) {
+		if (chunk.data[col_idx].GetType() == output.data[col_idx].GetType()) {
+			output.data[col_idx].Reference(chunk.data[col_idx]);
+		} else {
+			VectorOperations::Cast(context, chunk.data[col_idx], output.data[col_idx], chunk.size());
+		}
+	}
+	output.SetChildCardinality(chunk.size());
+	return true;
+}
+
+unique_ptr<GlobalTableFunctionState> MapFunction::MapFunctionInitGlobal(ClientContext &context,
+                                                                        TableFunctionInitInput &input) {
+	return make_uniq<MapFunctionGlobalState>();
+}
+
+unique_ptr<LocalTableFunctionState> MapFunction::MapFunctionInitLocal(ExecutionContext &context,
+                                                                      TableFunctionInitInput &input,
+                                                                      GlobalTableFunctionState *global_state) {
+	return make_uniq<MapFunctionLocalState>();
+}
+
+//! Calls the function on the collected rows, the result is scanned by subsequent calls to MapArrowResult::Scan
+static void CallArrowFunction(ClientContext &context, const MapFunctionData &data,
+                              GlobalTableFunctionState &global_state, MapFunctionLocalState &state) {
+	auto options = context.GetClientProperties();
+	auto array = state.appender->Finalize();
+	state.appender.reset();
+	state.buffered_rows = 0;
+
+	nb::object result;
+	{
+		auto function_lock = LockFunction(data, global_state);
+		nb::gil_scoped_acquire acquire;
+		auto pyarrow_schema = ToPyArrowSchema(data, options);
+		nb::list batches;
+		TransformDuckToArrowChunk(pyarrow_schema, array, batches);
+		result = ArrowFunctionCall(data, pyarrow::ToArrowTable(batches, pyarrow_schema));
+	}
+	state.result = make_uniq<MapArrowResult>(context, data, std::move(result));
+}
+
+//! The 'arrow' and 'polars' formats: the GIL is only held to call the function, collecting the input and scanning
+//! the result happens without it, so functions that release the GIL themselves can run on several threads at once
+static OperatorResultType MapArrowExec(ExecutionContext &context, const MapFunctionData &data,
+                                       GlobalTableFunctionState &global_state, MapFunctionLocalState &state,
+                                       DataChunk &input, DataChunk &output) {
+	if (!state.input_collected) {
+		state.input_collected = true;
+		if (input.size() > 0) {
+			if (!state.appender) {
+				auto batch_capacity = MaxValue<idx_t>(data.batch_rows, STANDARD_VECTOR_SIZE);
+				state.appender =
+				    make_uniq<ArrowAppender>(data.in_types, batch_capacity, context.client.GetClientProperties(),
+				                             ArrowTypeExtensionData::GetExtensionTypes(context.client, data.in_types));
+			}
+			state.appender->Append(input, 0, input.size(), input.size());
+			state.buffered_rows += input.size();
+		}
+		if (state.buffered_rows > 0 && state.buffered_rows >= data.batch_rows) {
+			CallArrowFunction(context.client, data, global_state, state);
+		}
+	}
+	if (state.result && state.result->Scan(context.client, output)) {
+		return OperatorResultType::HAVE_MORE_OUTPUT;
+	}
+	state.result.reset();
+	state.input_collected = false;
+	return OperatorResultType::NEED_MORE_INPUT;
+}
+
+OperatorFinalizeResultType MapFunction::MapFunctionFinal(ExecutionContext &context, TableFunctionInput &data_p,
+                                                         DataChunk &output) {
+	auto &data = data_p.bind_data->Cast<MapFunctionData>();
+	auto &state = data_p.local_state->Cast<MapFunctionLocalState>();
+	if (data.format == MapFunctionFormat::PANDAS) {
+		return OperatorFinalizeResultType::FINISHED;
+	}
+	// Call the function on the rows that didn't fill up a whole batch
+	if (!state.result && state.buffered_rows > 0) {
+		CallArrowFunction(context.client, data, *data_p.global_state, state);
+	}
+	if (state.result && state.result->Scan(context.client, output)) {
+		return OperatorFinalizeResultType::HAVE_MORE_OUTPUT;
+	}
+	state.result.reset();
+	return OperatorFinalizeResultType::FINISHED;
+}
+
 OperatorResultType MapFunction::MapFunctionExec(ExecutionContext &context, TableFunctionInput &data_p, DataChunk &input,
                                                 DataChunk &output) {
+	auto &data = data_p.bind_data->Cast<MapFunctionData>();
+	if (data.format != MapFunctionFormat::PANDAS) {
+		return MapArrowExec(context, data, *data_p.global_state, data_p.local_state->Cast<MapFunctionLocalState>(),
+		                    input, output);
+	}
+
+	auto function_lock = LockFunction(data, *data_p.global_state);
 	nb::gil_scoped_acquire acquire;
 
 	if (input.size() == 0) {
 		return OperatorResultType::NEED_MORE_INPUT;
 	}
 
-	auto &data = data_p.bind_data->Cast<MapFunctionData>();
-
 	D_ASSERT(input.GetTypes() == data.in_types);
 	NumpyResultConversion conversion(data.in_types, input.size(), context.client.GetClientProperties());
 	conversion.Append(input);
@@ -815,6 +815,15 @@ struct PythonVectorConversion {
 		}
 	}
 
+	// another thread can change a list while it is converted, a tuple can't
+	template <bool IS_LIST>
+	static nb::object GetListChild(nb::handle ele, idx_t index) {
+		if (IS_LIST) {
+			return duckdb::PyUtil::ListGetItem(ele, index);
+		}
+		return nb::borrow(PyTuple_GET_ITEM(ele.ptr(), static_cast<Py_ssize_t>(index)));
+	}
+
 	template <bool IS_LIST>
 	static void HandleListFast(optional_ptr<ClientContext> context, Vector &result, const idx_t &result_offset,
 	                           nb::handle ele, idx_t list_size) {
@@ -829,7 +838,7 @@ struct PythonVectorConversion {
 			auto &child_array = ArrayVector::GetChildMutable(result);
 			idx_t start_offset = result_offset * array_size;
 			for (idx_t i = 0; i < list_size; i++) {
-				auto child_ele = IS_LIST ? PyList_GetItem(ele.ptr(), i) : PyTuple_GetItem(ele.ptr(), i);
+				auto child_ele = GetListChild<IS_LIST>(ele, i);
 				TransformPythonObject(context, child_ele, child_array, start_offset + i);
 			}
 			return;
@@ -847,7 +856,7 @@ struct PythonVectorConversion {
 			// convert the child elements
 			auto &child_vector = ListVector::GetChildMutable(result);
 			for (idx_t i = 0; i < list_size; i++) {
-				auto child_ele = IS_LIST ? PyList_GetItem(ele.ptr(), i) : PyTuple_GetItem(ele.ptr(), i);
+				auto child_ele = GetListChild<IS_LIST>(ele, i);
 				TransformPythonObject(context, child_ele, child_vector, start_offset + i);
 			}
 			ListVector::SetListSize(result, start_offset + list_size);
@@ -0,0 +1,765 @@
+#include "duckdb_python/numpy/numpy_file_scan.hpp"
+#include "duckdb_python/mapped_file.hpp"
+
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/common/helper.hpp"
+#include "duckdb/common/operator/add.hpp"
+#include "duckdb/common/operator/multiply.hpp"
+#include "duckdb/common/string_util.hpp"
+#include "duckdb/common/types/interval.hpp"
+#include "duckdb/common/vector/string_vector.hpp"
+#include "duckdb/main/client_context.hpp"
+#include "utf8proc_wrapper.hpp"
+
+namespace duckdb {
+
+namespace {
+
+//! Headers with lists, tuples or dicts nested deeper than this are rejected instead of recursing without bound
+static constexpr idx_t NUMPY_HEADER_MAX_DEPTH = 32;
+
+//! A value of the Python literal in the header of a .npy file, e.g. {'descr': '<f8', 'shape': (3,)}
+struct NumpyHeaderValue {
+	enum class Kind : uint8_t { STRING, INTEGER, BOOLEAN, NONE, SEQUENCE, DICT };
+
+	Kind kind = Kind::NONE;
+	string str;
+	int64_t integer = 0;
+	bool boolean = false;
+	//! The items of a list or tuple, or the values of a dict
+	vector<NumpyHeaderValue> items;
+	vector<string> keys;
+
+	optional_ptr<const NumpyHeaderValue> Find(const string &key) const {
+		for (idx_t i = 0; i < keys.size(); i++) {
+			if (keys[i] == key) {
+				return &items[i];
+			}
+		}
+		return nullptr;
+	}
+};
+
+class NumpyHeaderParser {
+public:
+	NumpyHeaderParser(const string &path, const char *data, idx_t size) : path(path), data(data), size(size) {
+	}
+
+	NumpyHeaderValue Parse() {
+		auto result = ParseValue();
+		SkipWhitespace();
+		if (position != size) {
+			ThrowInvalid();
+		}
+		return result;
+	}
+
+private:
+	NumpyHeaderValue ParseValue() {
+		SkipWhitespace();
+		if (position >= size) {
+			ThrowInvalid();
+		}
+		NumpyHeaderValue result;
+		auto c = data[position];
+		if (c == '{') {
+			result.kind = NumpyHeaderValue::Kind::DICT;
+			ParseItems('}', [&]() {
+				auto key = ParseValue();
+				SkipWhitespace();
+				if (key.kind != NumpyHeaderValue::Kind::STRING || !Consume(':')) {
+					ThrowInvalid();
+				}
+				result.keys.push_back(std::move(key.str));
+				result.items.push_back(ParseValue());
+			});
+		} else if (c == '[' || c == '(') {
+			result.kind = NumpyHeaderValue::Kind::SEQUENCE;
+			ParseItems(c == '[' ? ']' : ')', [&]() { result.items.push_back(ParseValue()); });
+		} else if (c == '\'' || c == '"') {
+			result.kind = NumpyHeaderValue::Kind::STRING;
+			position++;
+			while (position < size && data[position] != c) {
+				if (data[position] == '\\') {
+					position++;
+				}
+				if (position < size) {
+					result.str += data[position++];
+				}
+			}
+			if (!Consume(c)) {
+				ThrowInvalid();
+			}
+		} else if (c == '-' || StringUtil::CharacterIsDigit(c)) {
+			result.kind = NumpyHeaderValue::Kind::INTEGER;
+			bool negative = Consume('-');
+			if (position >= size || !StringUtil::CharacterIsDigit(data[position])) {
+				ThrowInvalid();
+			}
+			while (position < size && StringUtil::CharacterIsDigit(data[position])) {
+				int64_t digit = data[position++] - '0';
+				if (!TryMultiplyOperator::Operation<int64_t, int64_t, int64_t>(result.integer, 10, result.integer) ||
+				    !TryAddOperator::Operation<int64_t, int64_t, int64_t>(result.integer, digit, result.integer)) {
+					ThrowInvalid();
+				}
+			}
+			// Python 2 long literals
+			Consume('L');
+			if (negative) {
+				result.integer = -result.integer;
+			}
+		} else if (ConsumeWord("True")) {
+			result.kind = NumpyHeaderValue::Kind::BOOLEAN;
+			result.boolean = true;
+		} else if (ConsumeWord("False")) {
+			result.kind = NumpyHeaderValue::Kind::BOOLEAN;
+		} else if (!ConsumeWord("None")) {
+			ThrowInvalid();
+		}
+		return result;
+	}
+
+	template <class F>
+	void ParseItems(char end, F &&parse_item) {
+		if (++depth > NUMPY_HEADER_MAX_DEPTH) {
+			throw InvalidInputException("read_numpy: the header of \"%s\" is nested more than %d levels deep", path,
+			                            NUMPY_HEADER_MAX_DEPTH);
+		}
+		position++;
+		while (true) {
+			SkipWhitespace();
+			if (Consume(end)) {
+				break;
+			}
+			parse_item();
+			SkipWhitespace();
+			if (!Consume(',')) {
+				SkipWhitespace();
+				if (!Consume(end)) {
+					ThrowInvalid();
+				}
+				break;
+			}
+		}
+		depth--;
+	}
+
+	void SkipWhitespace() {
+		while (position < size && StringUtil::CharacterIsSpace(data[position])) {
+			position++;
+		}
+	}
+
+	bool Consume(char c) {
+		if (position < size && data[position] == c) {
+			position++;
+			return true;
+		}
+		return false;
+	}
+
+	bool ConsumeWord(const string &word) {
+		if (size - position < word.size() || memcmp(data + position, word.c_str(), word.size()) != 0) {
+			return false;
+		}
+		position += word.size();
+		return true;
+	}
+
+	[[noreturn]] void ThrowInvalid() const {
+		throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+	}
+
+private:
+	const string &path;
+	const char *data;
+	idx_t size;
+	idx_t position = 0;
+	//! The number of lists, tuples and dicts the parser is in
+	idx_t depth = 0;
+};
+
+//! A column of a .npy file: the array itself, a row of a 2-D array or a field of a structured array
+struct NumpyFileColumn {
+	string name;
+	LogicalType type;
+	//! The kind character of the NumPy type string ('b', 'i', 'u', 'f', 'M', 'm', 'S' or 'U')
+	char kind = 0;
+	//! The unit of datetime64 and timedelta64 columns
+	string unit;
+	idx_t item_size = 0;
+	//! Position of the first value in the file, and the distance between consecutive values
+	idx_t offset = 0;
+	idx_t stride = 0;
+
+	bool SameLayout(const NumpyFileColumn &other) const {
+		return name == other.name && type == other.type && kind == other.kind && unit == other.unit &&
+		       item_size == other.item_size;
+	}
+	//! Whether the values are used as they are in the file
+	bool ZeroCopy() const {
+		return stride == item_size && (kind == 'b' || kind == 'i' || kind == 'u' || kind == 'f' || kind == 'M');
+	}
+};
+
+//! Keeps the mapped file alive while vectors reference its values
+struct NumpyFileAuxiliaryData : public AuxiliaryDataHolder {
+	explicit NumpyFileAuxiliaryData(shared_ptr<MappedFile> file_p) : file(std::move(file_p)) {
+	}
+
+	shared_ptr<MappedFile> file;
+};
+
+//! Multiplies or adds the sizes of the array in a .npy file, whose header can describe more data than fits in an idx_t
+static idx_t NumpyMultiplySizes(const string &path, idx_t left, idx_t right) {
+	idx_t result;
+	if (!TryMultiplyOperator::Operation<idx_t, idx_t, idx_t>(left, right, result)) {
+		throw InvalidInputException("read_numpy: the array in \"%s\" is too large", path);
+	}
+	return result;
+}
+
+static idx_t NumpyAddSizes(const string &path, idx_t left, idx_t right) {
+	idx_t result;
+	if (!TryAddOperator::Operation<idx_t, idx_t, idx_t>(left, right, result)) {
+		throw InvalidInputException("read_numpy: the array in \"%s\" is too large", path);
+	}
+	return result;
+}
+
+//! Parses a NumPy type string such as '<i8', '|S5' or '<M8[ns]'
+static void ParseNumpyTypeString(const string &path, const string &type_string, NumpyFileColumn &column) {
+	idx_t position = 0;
+	if (!type_string.empty() &&
+	    (type_string[0] == '<' || type_string[0] == '>' || type_string[0] == '|' || type_string[0] == '=')) {
+		position++;
+	}
+	if (position >= type_string.size()) {
+		throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+	}
+	column.kind = type_string[position++];
+	idx_t size = 0;
+	while (position < type_string.size() && StringUtil::CharacterIsDigit(type_string[position])) {
+		size = NumpyAddSizes(path, NumpyMultiplySizes(path, size, 10), idx_t(type_string[position++] - '0'));
+	}
+	if (position < type_string.size() && type_string[position] == '[' && type_string.back() == ']') {
+		column.unit = type_string.substr(position + 1, type_string.size() - position - 2);
+		position = type_string.size();
+	}
+	if (position != type_string.size()) {
+		throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+	}
+	column.item_size = column.kind == 'U' ? NumpyMultiplySizes(path, size, 4) : size;
+	if (type_string[0] == '>' && column.item_size > 1 && column.kind != 'S' && column.kind != 'V') {
+		throw NotImplementedException("read_numpy: \"%s\" stores big-endian values ('%s'), which are not supported",
+		                              path, type_string);
+	}
+}
+
+static LogicalType NumpyFileType(const string &path, const string &type_string, NumpyFileColumn &column) {
+	ParseNumpyTypeString(path, type_string, column);
+	auto size = column.kind == 'U' ? column.item_size / 4 : column.item_size;
+	switch (column.kind) {
+	case 'b':
+		if (size == 1) {
+			return LogicalType::BOOLEAN;
+		}
+		break;
+	case 'i':
+		switch (size) {
+		case 1:
+			return LogicalType::TINYINT;
+		case 2:
+			return LogicalType::SMALLINT;
+		case 4:
+			return LogicalType::INTEGER;
+		case 8:
+			return LogicalType::BIGINT;
+		default:
+			break;
+		}
+		break;
+	case 'u':
+		switch (size) {
+		case 1:
+			return LogicalType::UTINYINT;
+		case 2:
+			return LogicalType::USMALLINT;
+		case 4:
+			return LogicalType::UINTEGER;
+		case 8:
+			return LogicalType::UBIGINT;
+		default:
+			break;
+		}
+		break;
+	case 'f':
+		if (size == 4) {
+			return LogicalType::FLOAT;
+		}
+		if (size == 8) {
+			return LogicalType::DOUBLE;
+		}
+		break;
+	case 'M':
+		if (size != 8) {
+			break;
+		}
+		if (column.unit == "ns") {
+			return LogicalType::TIMESTAMP_NS;
+		}
+		if (column.unit == "us") {
+			return LogicalType::TIMESTAMP;
+		}
+		if (column.unit == "ms") {
+			return LogicalType::TIMESTAMP_MS;
+		}
+		if (column.unit == "s") {
+			return LogicalType::TIMESTAMP_S;
+		}
+		break;
+	case 'm':
+		if (size == 8 && (column.unit == "ns" || column.unit == "us" || column.unit == "ms" || column.unit == "s")) {
+			return LogicalType::INTERVAL;
+		}
+		break;
+	case 'S':
+		return LogicalType::BLOB;
+	case 'U':
+		return LogicalType::VARCHAR;
+	case 'O':
+		throw NotImplementedException(
+		    "read_numpy: \"%s\" stores Python objects, which are pickled and can only be loaded by NumPy", path);
+	default:
+		break;
+	}
+	throw NotImplementedException("read_numpy: the NumPy type '%s' of \"%s\" is not supported", type_string, path);
+}
+
+//! A .npy file, mapped into memory with the layout of its columns
+struct NumpyFile {
+	shared_ptr<MappedFile> file;
+	idx_t row_count = 0;
+	vector<NumpyFileColumn> columns;
+
+	static shared_ptr<NumpyFile> Open(ClientContext &context, const string &path) {
+		auto result = make_shared_ptr<NumpyFile>();
+		result->file = MappedFile::Open(context, path);
+		auto &file = *result->file;
+
+		static constexpr const char NUMPY_MAGIC[] = "\x93NUMPY";
+		if (file.Size() < 10 || memcmp(file.GetData(0, 6), NUMPY_MAGIC, 6) != 0) {
+			throw InvalidInputException("read_numpy: \"%s\" is not a .npy file", path);
+		}
+		auto major_version = *file.GetData(6, 1);
+		idx_t header_start;
+		idx_t header_length;
+		if (major_version == 1) {
+			header_start = 10;
+			header_length = Load<uint16_t>(file.GetData(8, sizeof(uint16_t)));
+		} else if (major_version == 2 || major_version == 3) {
+			header_start = 12;
+			header_length = Load<uint32_t>(file.GetData(8, sizeof(uint32_t)));
+		} else {
+			throw NotImplementedException("read_numpy: version %d of the .npy format of \"%s\" is not supported",
+			                              int(major_version), path);
+		}
+		auto header_data = const_char_ptr_cast(file.GetData(header_start, header_length));
+		auto header = NumpyHeaderParser(path, header_data, header_length).Parse();
+		auto descr = header.Find("descr");
+		auto fortran_order = header.Find("fortran_order");
+		auto shape = header.Find("shape");
+		if (header.kind != NumpyHeaderValue::Kind::DICT || !descr || !shape ||
+		    shape->kind != NumpyHeaderValue::Kind::SEQUENCE) {
+			throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+		}
+		vector<idx_t> dimensions;
+		for (auto &dimension : shape->items) {
+			if (dimension.kind != NumpyHeaderValue::Kind::INTEGER || dimension.integer < 0) {
+				throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+			}
+			dimensions.push_back(idx_t(dimension.integer));
+		}
+		if (dimensions.size() > 2) {
+			throw NotImplementedException("read_numpy: \"%s\" holds a %d-dimensional array, only 1-D and 2-D arrays "
+			                              "are supported",
+			                              path, dimensions.size());
+		}
+		auto data_offset = header_start + header_length;
+
+		idx_t data_size;
+		if (descr->kind == NumpyHeaderValue::Kind::STRING) {
+			NumpyFileColumn column;
+			column.type = NumpyFileType(path, descr->str, column);
+			// like a registered ndarray, a 1-D array is a single column and every row of a 2-D array is a column
+			idx_t column_count = dimensions.size() == 2 ? dimensions[0] : 1;
+			result->row_count = dimensions.empty() ? 1 : dimensions.back();
+			// computed first, the offsets of the columns are within the data and so cannot overflow either
+			data_size =
+			    NumpyMultiplySizes(path, NumpyMultiplySizes(path, column_count, result->row_count), column.item_size);
+			bool is_fortran_order = fortran_order && fortran_order->boolean;
+			for (idx_t i = 0; i < column_count; i++) {
+				column.name = "column" + std::to_string(i);
+				if (is_fortran_order) {
+					column.offset = data_offset + i * column.item_size;
+					column.stride = column_count * column.item_size;
+				} else {
+					column.offset = data_offset + i * result->row_count * column.item_size;
+					column.stride = column.item_size;
+				}
+				result->columns.push_back(column);
+			}
+		} else if (descr->kind == NumpyHeaderValue::Kind::SEQUENCE) {
+			if (dimensions.size() > 1) {
+				throw NotImplementedException("read_numpy: \"%s\" holds a 2-D structured array, only 1-D structured "
+				                              "arrays are supported",
+				                              path);
+			}
+			// a structured array, every field is a column
+			idx_t record_size = 0;
+			for (auto &field : descr->items) {
+				if (field.kind != NumpyHeaderValue::Kind::SEQUENCE || field.items.size() < 2) {
+					throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+				}
+				if (field.items.size() > 2 || field.items[1].kind != NumpyHeaderValue::Kind::STRING) {
+					throw NotImplementedException(
+					    "read_numpy: the nested or sub-array field of \"%s\" is not supported", path);
+				}
+				auto &name = field.items[0];
+				NumpyFileColumn column;
+				ParseNumpyTypeString(path, field.items[1].str, column);
+				if (column.kind == 'V' && name.kind == NumpyHeaderValue::Kind::STRING && name.str.empty()) {
+					// padding between the fields of an aligned dtype
+					record_size = NumpyAddSizes(path, record_size, column.item_size);
+					continue;
+				}
+				if (name.kind == NumpyHeaderValue::Kind::STRING) {
+					column.name = name.str;
+				} else if (name.kind == NumpyHeaderValue::Kind::SEQUENCE && name.items.size() == 2 &&
+				           name.items[1].kind == NumpyHeaderValue::Kind::STRING) {
+					// a (title, name) pair
+					column.name = name.items[1].str;
+				} else {
+					throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+				}
+				column.type = NumpyFileType(path, field.items[1].str, column);
+				column.offset = data_offset + record_size;
+				record_size = NumpyAddSizes(path, record_size, column.item_size);
+				result->columns.push_back(std::move(column));
+			}
+			for (auto &column : result->columns) {
+				column.stride = record_size;
+			}
+			result->row_count = dimensions.empty() ? 1 : dimensions[0];
+			data_size = NumpyMultiplySizes(path, result->row_count, record_size);
+		} else {
+			throw InvalidInputException("read_numpy: \"%s\" does not have a valid .npy header", path);
+		}
+		if (result->columns.empty()) {
+			throw InvalidInputException("read_numpy: \"%s\" does not hold any columns", path);
+		}
+		if (NumpyAddSizes(path, data_offset, data_size) > file.Size()) {
+			throw IOException("read_numpy: \"%s\" is truncated, its header describes %d bytes of data but only %d "
+			                  "follow",
+			                  path, data_size, file.Size() - MinValue<idx_t>(data_offset, file.Size()));
+		}
+		return result;
+	}
+};
+
+struct NumpyFileScanData : public TableFunctionData {
+	NumpyFileScanData(vector<string> files_p, shared_ptr<NumpyFile> first_file_p)
+	    : files(std::move(files_p)), first_file(std::move(first_file_p)) {
+	}
+
+	vector<string> files;
+	//! The first file, opened while binding to get the columns of all files
+	shared_ptr<NumpyFile> first_file;
+};
+
+struct NumpyFileScanLocalState : public LocalTableFunctionState {
+	shared_ptr<NumpyFile> file;
+	idx_t start = 0;
+	idx_t end = 0;
+	idx_t batch_index = 0;
+	vector<column_t> column_ids;
+};
+
+struct NumpyFileScanGlobalState : public GlobalTableFunctionState {
+	explicit NumpyFileScanGlobalState(idx_t max_threads) : max_threads(max_threads) {
+	}
+
+	mutable mutex lock;
+	//! The file that is being partitioned, and the next file to open
+	shared_ptr<NumpyFile> file;
+	idx_t file_index = 0;
+	idx_t position = 0;
+	idx_t batch_index = 0;
+	idx_t files_done = 0;
+	idx_t max_threads;
+
+	idx_t MaxThreads() const override {
+		return max_threads;
+	}
+};
+
+} // namespace
+
+NumpyFileScanFunction::NumpyFileScanFunction(const LogicalType &argument)
+    : TableFunction("read_numpy", {argument}, NumpyFileScanFunc, NumpyFileScanBind, NumpyFileScanInitGlobal,
+                    NumpyFileScanInitLocal) {
+	get_partition_data = NumpyFileScanGetPartitionData;
+	cardinality = NumpyFileScanCardinality;
+	table_scan_progress = NumpyFileScanProgress;
+	projection_pushdown = true;
+}
+
+unique_ptr<FunctionData> NumpyFileScanFunction::NumpyFileScanBind(ClientContext &context, TableFunctionBindInput &input,
+                                                                  vector<LogicalType> &return_types,
+                                                                  vector<string> &names) {
+	auto files = MappedFile::GlobFiles(context, input.inputs[0], "read_numpy");
+	auto first_file = NumpyFile::Open(context, files[0]);
+	for (auto &column : first_file->columns) {
+		names.push_back(column.name);
+		return_types.push_back(column.type);
+	}
+	return make_uniq<NumpyFileScanData>(std::move(files), std::move(first_file));
+}
+
+unique_ptr<GlobalTableFunctionState> NumpyFileScanFunction::NumpyFileScanInitGlobal(ClientContext &context,
+                                                                                    TableFunctionInitInput &input) {
+	auto &bind_data = input.bind_data->Cast<NumpyFileScanData>();
+	auto row_count = bind_data.first_file->row_count * bind_data.files.size();
+	return make_uniq<NumpyFileScanGlobalState>(row_count / NUMPY_FILE_PARTITION_COUNT + 1);
+}
+
+unique_ptr<LocalTableFunctionState> NumpyFileScanFunction::NumpyFileScanInitLocal(ExecutionContext &context,
+                                                                                  TableFunctionInitInput &input,
+                                                                                  GlobalTableFunctionState *gstate) {
+	auto result = make_uniq<NumpyFileScanLocalState>();
+	result->column_ids = input.column_ids;
+	NumpyFileScanParallelStateNext(context.client, input.bind_data.get(), result.get(), gstate);
+	return std::move(result);
+}
+
+bool NumpyFileScanFunction::NumpyFileScanParallelStateNext(ClientContext &context, const FunctionData *bind_data_p,
+                                                           LocalTableFunctionState *lstate,
+                                                           GlobalTableFunctionState *gstate) {
+	auto &bind_data = bind_data_p->Cast<NumpyFileScanData>();
+	auto &parallel_state = gstate->Cast<NumpyFileScanGlobalState>();
+	auto &state = lstate->Cast<NumpyFileScanLocalState>();
+
+	lock_guard<mutex> parallel_lock(parallel_state.lock);
+	while (!parallel_state.file || parallel_state.position >= parallel_state.file->row_count) {
+		if (parallel_state.file) {
+			parallel_state.files_done++;
+		}
+		if (parallel_state.file_index >= bind_data.files.size()) {
+			parallel_state.file = nullptr;
+			return false;
+		}
+		auto &path = bind_data.files[parallel_state.file_index++];
+		auto file = parallel_state.file_index == 1 ? bind_data.first_file : NumpyFile::Open(context, path);
+		auto &expected = bind_data.first_file->columns;
+		bool same_layout = file->columns.size() == expected.size();
+		for (idx_t i = 0; same_layout && i < expected.size(); i++) {
+			same_layout = file->columns[i].SameLayout(expected[i]);
+		}
+		if (!same_layout) {
+			throw InvalidInputException("read_numpy: the array in \"%s\" does not have the same columns and types as "
+			                            "the one in \"%s\"",
+			                            path, bind_data.files[0]);
+		}
+		parallel_state.file = std::move(file);
+		parallel_state.position = 0;
+	}
+	state.file = parallel_state.file;
+	state.start = parallel_state.position;
+	parallel_state.position = MinValue(parallel_state.position + NUMPY_FILE_PARTITION_COUNT, state.file->row_count);
+	state.end = parallel_state.position;
+	state.batch_index = parallel_state.batch_index++;
+	return true;
+}
+
+template <class T>
+static void ScanNumpyFileValues(const_data_ptr_t source, idx_t stride, idx_t count, Vector &out) {
+	auto target = FlatVector::GetDataMutable<T>(out);
+	for (idx_t i = 0; i < count; i++) {
+		target[i] = Load<T>(source + i * stride);
+	}
+}
+
+//! Like in a scanned ndarray, NaN and Not a Time (the minimum of int64) are NULL
+template <class T>
+static void SetNumpyFileNullValues(Vector &out, idx_t count) {
+	auto values = FlatVector::GetData<T>(out);
+	for (idx_t i = 0; i < count; i++) {
+		if (Value::IsNan<T>(values[i])) {
+			FlatVector::ValidityMutable(out).SetInvalid(i);
+		}
+	}
+}
+
+template <>
+void SetNumpyFileNullValues<int64_t>(Vector &out, idx_t count) {
+	auto values = FlatVector::GetData<int64_t>(out);
+	for (idx_t i = 0; i < count; i++) {
+		if (values[i] == NumericLimits<int64_t>::Minimum()) {
+			FlatVector::ValidityMutable(out).SetInvalid(i);
+		}
+	}
+}
+
+static void ScanNumpyFileColumn(const shared_ptr<MappedFile> &file, const NumpyFileColumn &column, idx_t start,
+                                idx_t count, Vector &out) {
+	auto source = file->GetData(column.offset + start * column.stride, (count - 1) * column.stride + column.item_size);
+	if (column.ZeroCopy()) {
+		FlatVector::SetData(out, const_cast<data_ptr_t>(source), count_t(count)); // NOLINT
+		out.AddAuxiliaryData(make_uniq<NumpyFileAuxiliaryData>(file));
+	} else if (column.kind != 'm' && column.kind != 'S' && column.kind != 'U') {
+		switch (column.item_size) {
+		case 1:
+			ScanNumpyFileValues<uint8_t>(source, column.stride, count, out);
+			break;
+		case 2:
+			ScanNumpyFileValues<uint16_t>(source, column.stride, count, out);
+			break;
+		case 4:
+			ScanNumpyFileValues<uint32_t>(source, column.stride, count, out);
+			break;
+		default:
+			ScanNumpyFileValues<uint64_t>(source, column.stride, count, out);
+			break;
+		}
+	}
+
+	switch (column.kind) {
+	case 'f':
+		if (column.item_size == 4) {
+			SetNumpyFileNullValues<float>(out, count);
+		} else {
+			SetNumpyFileNullValues<double>(out, count);
+		}
+		break;
+	case 'M':
+		SetNumpyFileNullValues<int64_t>(out, count);
+		break;
+	case 'm': {
+		auto target = FlatVector::GetDataMutable<interval_t>(out);
+		auto &mask = FlatVector::ValidityMutable(out);
+		for (idx_t i = 0; i < count; i++) {
+			auto value = Load<int64_t>(source + i * column.stride);
+			if (value == NumericLimits<int64_t>::Minimum()) {
+				mask.SetInvalid(i);
+				continue;
+			}
+			int64_t micros;
+			if (column.unit == "ns") {
+				micros = value / 1000;
+			} else if (column.unit == "us") {
+				micros = value;
+			} else if (column.unit == "ms") {
+				micros = value * Interval::MICROS_PER_MSEC;
+			} else {
+				micros = value * Interval::MICROS_PER_SEC;
+			}
+			target[i] = Interval::FromMicro(micros);
+		}
+		break;
+	}
+	case 'S': {
+		auto target = FlatVector::GetDataMutable<string_t>(out);
+		for (idx_t i = 0; i < count; i++) {
+			auto value = const_char_ptr_cast(source + i * column.stride);
+			// NumPy pads shorter values with NUL bytes
+			idx_t length = column.item_size;
+			while (length > 0 && value[length - 1] == '\0') {
+				length--;
+			}
+			target[i] = StringVector::AddStringOrBlob(out, value, length);
+		}
+		break;
+	}
+	case 'U': {
+		auto target = FlatVector::GetDataMutable<string_t>(out);
+		for (idx_t i = 0; i < count; i++) {
+			auto value = source + i * column.stride;
+			idx_t length = column.item_size / 4;
+			while (length > 0 && Load<uint32_t>(value + (length - 1) * 4) == 0) {
+				length--;
+			}
+			string utf8;
+			for (idx_t c = 0; c < length; c++) {
+				char buffer[4];
+				int size;
+				if (!Utf8Proc::CodepointToUtf8(int(Load<uint32_t>(value + c * 4)), size, buffer)) {
+					throw InvalidInputException("read_numpy: \"%s\" holds a string that is not valid UTF-32",
+					                            file->path);
+				}
+				utf8.append(buffer, idx_t(size));
+			}
+			target[i] = StringVector::AddString(out, utf8);
+		}
+		break;
+	}
+	default:
+		break;
+	}
+}
+
+void NumpyFileScanFunction::NumpyFileScanFunc(ClientContext &context, TableFunctionInput &data_p, DataChunk &output) {
+	auto &state = data_p.local_state->Cast<NumpyFileScanLocalState>();
+
+	if (state.start >= state.end) {
+		if (!NumpyFileScanParallelStateNext(context, data_p.bind_data.get(), data_p.local_state.get(),
+		                                    data_p.global_state.get())) {
+			return;
+		}
+	}
+	idx_t this_count = MinValue<idx_t>(STANDARD_VECTOR_SIZE, state.end - state.start);
+	output.SetChildCardinality(this_count);
+	for (idx_t idx = 0; idx < state.column_ids.size(); idx++) {
+		auto col_idx = state.column_ids[idx];
+		if (col_idx == COLUMN_IDENTIFIER_ROW_ID) {
+			output.data[idx].Sequence(NumericCast<int64_t>(state.start), 1, this_count);
+		} else {
+			ScanNumpyFileColumn(state.file->file, state.file->columns[col_idx], state.start, this_count,
+			                    output.data[idx]);
+		}
+	}
+	state.start += this_count;
+}
+
+unique_ptr<NodeStatistics> NumpyFileScanFunction::NumpyFileScanCardinality(ClientContext &context,
+                                                                           const FunctionData *bind_data) {
+	auto &data = bind_data->Cast<NumpyFileScanData>();
+	auto row_count = data.first_file->row_count;
+	if (data.files.size() == 1) {
+		return make_uniq<NodeStatistics>(row_count, row_count);
+	}
+	// the other shards are only opened when they are scanned
+	return make_uniq<NodeStatistics>(row_count * data.files.size());
+}
+
+double NumpyFileScanFunction::NumpyFileScanProgress(ClientContext &context, const FunctionData *bind_data_p,
+                                                    const GlobalTableFunctionState *gstate) {
+	auto &bind_data = bind_data_p->Cast<NumpyFileScanData>();
+	auto &state = gstate->Cast<NumpyFileScanGlobalState>();
+	lock_guard<mutex> parallel_lock(state.lock);
+	double files_done = double(state.files_done);
+	if (state.file && state.file->row_count > 0) {
+		files_done += double(state.position) / double(state.file->row_count);
+	}
+	return MinValue<double>(files_done * 100.0 / double(bind_data.files.size()), 100.0);
+}
+
+OperatorPartitionData NumpyFileScanFunction::NumpyFileScanGetPartitionData(ClientContext &context,
+                                                                           TableFunctionGetPartitionInput &input) {
+	if (input.partition_info.RequiresPartitionColumns()) {
+		throw InternalException("NumpyFileScan::GetPartitionData: partition columns not supported");
+	}
+	auto &state = input.local_state->Cast<NumpyFileScanLocalState>();
+	return OperatorPartitionData(state.batch_index);
+}
+
+} // namespace duckdb
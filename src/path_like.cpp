@@ -10,7 +10,8 @@ namespace duckdb {
 
 struct PathLikeProcessor {
 public:
-	explicit PathLikeProcessor(DuckDBPyConnection &connection) : connection(connection) {
+	PathLikeProcessor(DuckDBPyConnection &connection, bool allow_pipe)
+	    : connection(connection), allow_pipe(allow_pipe) {
 	}
 
 public:
@@ -27,6 +28,8 @@ protected:
 
 public:
 	DuckDBPyConnection &connection;
+	// Whether non-seekable file-like objects can be streamed as pipes instead of being copied into memory
+	bool allow_pipe;
 	optional_ptr<ModifiedMemoryFileSystem> object_store;
 	// The list containing every file
 	vector<string> all_files;
@@ -52,7 +55,7 @@ void PathLikeProcessor::AddFile(const nb::object &object) {
 	fs_files.push_back(generated_name);
 
 	auto &fs = GetFS();
-	fs.attr("add_file")(object, generated_name);
+	fs.attr("add_file")(object, generated_name, nb::arg("allow_pipe") = allow_pipe);
 }
 
 PathLike PathLikeProcessor::Finalize() {
@@ -78,8 +81,8 @@ PathLike PathLikeProcessor::Finalize() {
 	return result;
 }
 
-PathLike PathLike::Create(const nb::object &object, DuckDBPyConnection &connection) {
-	PathLikeProcessor processor(connection);
+PathLike PathLike::Create(const nb::object &object, DuckDBPyConnection &connection, bool allow_pipe) {
+	PathLikeProcessor processor(connection, allow_pipe);
 	if (nb::isinstance<nb::list>(object)) {
 		auto list = nb::list(object);
 		for (auto item : list) { // nanobind list iteration yields temporary handles; bind by value (cheap handle)
@@ -10,6 +10,7 @@
 #include "duckdb/main/db_instance_cache.hpp"
 #include "duckdb/main/extension_helper.hpp"
 #include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
 #include "duckdb/main/relation/read_csv_relation.hpp"
 #include "duckdb/main/relation/read_json_relation.hpp"
 #include "duckdb/main/relation/value_relation.hpp"
@@ -19,6 +20,7 @@
 #include "duckdb/parser/statement/select_statement.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
 #include "duckdb_python/arrow/arrow_array_stream.hpp"
+#include "duckdb_python/arrow/arrow_ipc_scan.hpp"
 #include "duckdb_python/map.hpp"
 #include "duckdb_python/pandas/pandas_scan.hpp"
 #include "duckdb_python/pyrelation.hpp"
@@ -27,9 +29,11 @@
 #include "duckdb_python/python_conversion.hpp"
 #include "duckdb_python/numpy/numpy_type.hpp"
 #include "duckdb_python/numpy/numpy_array.hpp"
+#include "duckdb_python/numpy/numpy_file_scan.hpp"
 #include "duckdb_python/jupyter_progress_bar_display.hpp"
 #include "duckdb_python/pyfilesystem.hpp"
 #include "duckdb/parser/parsed_data/create_scalar_function_info.hpp"
+#include "duckdb/parser/parsed_data/create_aggregate_function_info.hpp"
 #include "duckdb/function/scalar_function.hpp"
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb/function/function.hpp"
@@ -45,6 +49,8 @@
 #include "duckdb_python/expression/pyexpression.hpp"
 #include "duckdb_python/nb/conversions/python_csv_line_terminator_enum.hpp"
 
+#include <chrono>
+
 namespace duckdb {
 
 // All process-global module state lives in one struct, reached only through GetModuleState().
@@ -56,6 +62,8 @@ struct DuckDBPyModuleState {
 	std::shared_ptr<PythonImportCache> import_cache;
 	PythonEnvironmentType environment = PythonEnvironmentType::NORMAL;
 	std::string formatted_python_version;
+	//! Python only runs signal handlers on its main thread
+	unsigned long main_thread_ident = 0; // NOLINT: matches PyThread_get_thread_ident
 };
 
 static DuckDBPyModuleState &GetModuleState() {
@@ -72,6 +80,7 @@ DuckDBPyConnection::~DuckDBPyConnection() {
 		// whose entries transitively own Python references)
 		// run with the GIL reacquired because `gil` is destroyed at the end
 		// of the inner block.
+		statement_cache.reset();
 		{
 			nb::gil_scoped_release gil;
 			con.SetDatabase(nullptr);
@@ -102,6 +111,8 @@ void DuckDBPyConnection::DetectEnvironment() {
 	int major = nb::cast<int>(version_info.attr("major"));
 	int minor = nb::cast<int>(version_info.attr("minor"));
 	GetModuleState().formatted_python_version = std::to_string(major) + "." + std::to_string(minor);
+	GetModuleState().main_thread_ident =
+	    nb::cast<unsigned long>(nb::module_::import_("threading").attr("main_thread")().attr("ident"));
 
 	// If __main__ does not have a __file__ attribute, we are in interactive mode
 	auto main_module = nb::module_::import_("__main__");
@@ -152,19 +163,43 @@ static void InitializeConnectionMethods(nb::class_<DuckDBPyConnection> &m) {
 	// .none() lets None reach RegisterFilesystem's body, which imports fsspec explicitly (surfacing
 	// ModuleNotFoundError when fsspec is absent) before validating the instance.
 	m.def("register_filesystem", &DuckDBPyConnection::RegisterFilesystem, "Register a fsspec compliant filesystem",
-	      nb::arg("filesystem").none());
+	      nb::arg("filesystem").none(), nb::kw_only(), nb::arg("cache_size") = 0, nb::arg("block_size") = 1048576,
+	      nb::arg("read_ahead") = 0, nb::arg("metadata_ttl") = 0, nb::arg("write_buffer_size") = 1048576,
+	      nb::arg("upload_block_size").none() = nb::none(), nb::arg("read_timeout") = 30);
 	m.def("unregister_filesystem", &DuckDBPyConnection::UnregisterFilesystem, "Unregister a filesystem",
 	      nb::arg("name"));
 	m.def("list_filesystems", &DuckDBPyConnection::ListFilesystems,
 	      "List registered filesystems, including builtin ones");
 	m.def("filesystem_is_registered", &DuckDBPyConnection::FileSystemIsRegistered,
 	      "Check if a filesystem with the provided name is currently registered", nb::arg("name"));
+	m.def("filesystem_stats", &DuckDBPyConnection::FilesystemStats,
+	      "Get the block cache statistics of a registered Python filesystem", nb::arg("name"));
+	m.def("invalidate_filesystem_cache", &DuckDBPyConnection::InvalidateFilesystemCache,
+	      "Drop the cached blocks and metadata of a registered Python filesystem, or of one path of it",
+	      nb::arg("name"), nb::arg("path").none() = nb::none());
+	m.def("statement_cache_stats", &DuckDBPyConnection::StatementCacheStats,
+	      "Get the statistics of the cache of statements prepared by execute()");
+	m.def("binding_stats", &DuckDBPyConnection::BindingStats,
+	      "Get the time spent waiting for the GIL and the connection lock, looking up Python objects and converting "
+	      "results, counted while python_binding_stats is set. With aggregate, of all connections",
+	      nb::kw_only(), nb::arg("aggregate") = false);
 	m.def("create_function", &DuckDBPyConnection::RegisterScalarUDF,
 	      "Create a DuckDB function out of the passing in Python function so it can be used in queries",
 	      nb::arg("name"), nb::arg("function"), nb::arg("parameters") = nb::none(),
 	      nb::arg("return_type").none() = nb::none(), nb::kw_only(), nb::arg("type") = PythonUDFType::NATIVE,
 	      nb::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING,
-	      nb::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, nb::arg("side_effects") = false);
+	      nb::arg("exception_handling") = PythonExceptionHandling::FORWARD_ERROR, nb::arg("side_effects") = false,
+	      nb::arg("concurrency").none() = nb::none(), nb::arg("timeout").none() = nb::none(),
+	      nb::arg("cache").none() = nb::none());
+	m.def("create_aggregate_function", &DuckDBPyConnection::RegisterAggregateUDF,
+	      "Create a DuckDB aggregate function out of the passed in Python functions so it can be used in queries",
+	      nb::arg("name"), nb::arg("init"), nb::arg("update"), nb::arg("combine"), nb::arg("finalize"),
+	      nb::arg("parameters"), nb::arg("return_type"), nb::kw_only(), nb::arg("format") = "arrow",
+	      nb::arg("null_handling") = FunctionNullHandling::DEFAULT_NULL_HANDLING);
+	m.def("create_table_function", &DuckDBPyConnection::RegisterTableUDF,
+	      "Create a DuckDB table function out of the passed in Python function so it can be used in queries",
+	      nb::arg("name"), nb::arg("function"), nb::arg("schema"), nb::arg("parameters").none() = nb::none(),
+	      nb::kw_only(), nb::arg("cardinality").none() = nb::none(), nb::arg("projection_pushdown") = false);
 	m.def("remove_function", &DuckDBPyConnection::UnregisterUDF, "Remove a previously created function",
 	      nb::arg("name"));
 	m.def("sqltype", &DuckDBPyConnection::Type, "Create a type object by parsing the 'type_str' string",
@@ -198,6 +233,17 @@ static void InitializeConnectionMethods(nb::class_<DuckDBPyConnection> &m) {
 	m.def("executemany", &DuckDBPyConnection::ExecuteMany,
 	      "Execute the given prepared statement multiple times using the list of parameter sets in parameters",
 	      nb::arg("query"), nb::arg("parameters") = nb::none());
+	m.def("prepare", &DuckDBPyConnection::Prepare,
+	      "Prepare the given SQL query once, to execute it repeatedly without parsing and planning it again",
+	      nb::arg("query"));
+	m.def("submit", &DuckDBPyConnection::Submit,
+	      "Execute the given SQL query on a background thread, returns a QueryFuture of its result. The query is bound "
+	      "before submit returns, binding errors are raised by submit",
+	      nb::arg("query"), nb::arg("parameters") = nb::none());
+	m.def("execute_batch", &DuckDBPyConnection::ExecuteBatch,
+	      "Execute a list of queries, each a query or a (query, parameters) tuple, under a single lock. Returns a "
+	      "relation over the result of every query, or None when return_results is False",
+	      nb::arg("queries"), nb::kw_only(), nb::arg("return_results") = true, nb::arg("transaction") = false);
 	m.def("close", &DuckDBPyConnection::Close, "Close the connection");
 	m.def("interrupt", &DuckDBPyConnection::Interrupt, "Interrupt pending operations");
 	m.def("query_progress", &DuckDBPyConnection::QueryProgress, "Query progress of pending operation");
@@ -259,7 +305,9 @@ static void InitializeConnectionMethods(nb::class_<DuckDBPyConnection> &m) {
 	m.def("table_function", &DuckDBPyConnection::TableFunction,
 	      "Create a relation object from the named table function with given parameters", nb::arg("name"),
 	      nb::arg("parameters") = nb::none());
-	m.def("read_json", &DuckDBPyConnection::ReadJSON, "Create a relation object from the JSON file in 'name'",
+	m.def("read_json", &DuckDBPyConnection::ReadJSON,
+	      "Create a relation object from the JSON file in 'name'. A seekable file-like object is read when the "
+	      "relation is executed, so it has to stay open and unchanged until then",
 	      nb::arg("path_or_buffer"), nb::kw_only(), nb::arg("columns") = nb::none(),
 	      nb::arg("sample_size") = nb::none(), nb::arg("maximum_depth") = nb::none(), nb::arg("records") = nb::none(),
 	      nb::arg("format") = nb::none(), nb::arg("date_format") = nb::none(), nb::arg("timestamp_format") = nb::none(),
@@ -302,21 +350,33 @@ static void InitializeConnectionMethods(nb::class_<DuckDBPyConnection> &m) {
 		}
 		return self.ReadCSV(name, kwargs);
 	};
-	m.def("read_csv", read_csv_fn, "Create a relation object from the CSV file in 'name'");
-	m.def("from_csv_auto", read_csv_fn, "Create a relation object from the CSV file in 'name'");
+	m.def("read_csv", read_csv_fn,
+	      "Create a relation object from the CSV file in 'name'. A seekable file-like object is read when the relation "
+	      "is executed, so it has to stay open and unchanged until then");
+	m.def("from_csv_auto", read_csv_fn,
+	      "Create a relation object from the CSV file in 'name'. A seekable file-like object is read when the relation "
+	      "is executed, so it has to stay open and unchanged until then");
 	m.def("from_df", &DuckDBPyConnection::FromDF, "Create a relation object from the DataFrame in df", nb::arg("df"));
 	m.def("from_arrow", &DuckDBPyConnection::FromArrow, "Create a relation object from an Arrow object",
 	      nb::arg("arrow_object"));
 	m.def("from_parquet", &DuckDBPyConnection::FromParquet,
-	      "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'",
+	      "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'. A seekable "
+	      "file-like object is read when the relation is executed, so it has to stay open and unchanged until then",
 	      nb::arg("path_or_buffer"), nb::arg("binary_as_string") = false, nb::kw_only(),
 	      nb::arg("file_row_number") = false, nb::arg("filename") = false, nb::arg("hive_partitioning") = false,
 	      nb::arg("union_by_name") = false, nb::arg("compression") = nb::none());
 	m.def("read_parquet", &DuckDBPyConnection::FromParquet,
-	      "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'",
+	      "Create a relation object from the Parquet path(s) or file-like object(s) in 'path_or_buffer'. A seekable "
+	      "file-like object is read when the relation is executed, so it has to stay open and unchanged until then",
 	      nb::arg("path_or_buffer"), nb::arg("binary_as_string") = false, nb::kw_only(),
 	      nb::arg("file_row_number") = false, nb::arg("filename") = false, nb::arg("hive_partitioning") = false,
 	      nb::arg("union_by_name") = false, nb::arg("compression") = nb::none());
+	m.def("read_numpy", &DuckDBPyConnection::ReadNumpy,
+	      "Create a relation object from the .npy path(s) or file-like object(s) in 'path_or_buffer'",
+	      nb::arg("path_or_buffer"));
+	m.def("read_arrow_ipc", &DuckDBPyConnection::ReadArrowIPC,
+	      "Create a relation object from the Arrow IPC path(s) or file-like object(s) in 'path_or_buffer'",
+	      nb::arg("path_or_buffer"));
 	m.def("get_table_names", &DuckDBPyConnection::GetTableNames, "Extract the required table names from a query",
 	      nb::arg("query"), nb::kw_only(), nb::arg("qualified") = false);
 	m.def("install_extension", &DuckDBPyConnection::InstallExtension,
@@ -334,10 +394,15 @@ void DuckDBPyConnection::UnregisterFilesystem(const nb::str &name) {
 	auto &database = con.GetDatabase();
 	auto &fs = database.GetFileSystem();
 
-	fs.ExtractSubSystem(nb::cast<std::string>(name));
+	auto name_s = nb::cast<std::string>(name);
+	if (fs.ExtractSubSystem(name_s)) {
+		database.instance->GetObjectCache().DeleteWithTypePrefix<PythonFilesystemState>(name_s);
+	}
 }
 
-void DuckDBPyConnection::RegisterFilesystem(nb::object filesystem) {
+void DuckDBPyConnection::RegisterFilesystem(nb::object filesystem, idx_t cache_size, idx_t block_size, idx_t read_ahead,
+                                            double metadata_ttl, idx_t write_buffer_size,
+                                            const nb::object &upload_block_size, double read_timeout) {
 	nb::gil_scoped_acquire gil;
 
 	auto &database = con.GetDatabase();
@@ -365,7 +430,94 @@ void DuckDBPyConnection::RegisterFilesystem(nb::object filesystem) {
 		}
 	}
 
-	fs.RegisterSubSystem(make_uniq<PythonFilesystem>(std::move(protocols), nb::borrow<AbstractFileSystem>(filesystem)));
+	if (block_size == 0) {
+		throw InvalidInputException("'block_size' has to be a positive integer");
+	}
+	if (read_ahead > 0 && cache_size == 0) {
+		throw InvalidInputException("'read_ahead' requires the block cache, set 'cache_size' to enable it");
+	}
+	if (!(metadata_ttl >= 0)) {
+		throw InvalidInputException("'metadata_ttl' has to be a non-negative number of seconds");
+	}
+	if (!(read_timeout > 0)) {
+		throw InvalidInputException("'read_timeout' has to be a positive number of seconds");
+	}
+	PythonFilesystemOptions options;
+	options.cache_size = cache_size;
+	options.block_size = block_size;
+	options.read_ahead = read_ahead;
+	options.metadata_ttl = metadata_ttl;
+	options.write_buffer_size = write_buffer_size;
+	if (!upload_block_size.is_none()) {
+		auto size = nb::cast<idx_t>(upload_block_size);
+		if (size == 0) {
+			throw InvalidInputException("'upload_block_size' has to be a positive integer");
+		}
+		options.upload_block_size = size;
+	}
+	options.read_timeout = read_timeout;
+	auto state = make_shared_ptr<PythonFilesystemState>(options);
+	// async implementations run the ranges of a cat_ranges call concurrently, others are read through the file handle
+	auto async_filesystem = nb::module_::import_("fsspec.asyn").attr("AsyncFileSystem");
+	state->fetch_ranges = duckdb::PyUtil::IsInstance(filesystem, async_filesystem);
+
+	auto name = protocols[0];
+	fs.RegisterSubSystem(
+	    make_uniq<PythonFilesystem>(std::move(protocols), nb::borrow<AbstractFileSystem>(filesystem), state));
+	database.instance->GetObjectCache().PutWithTypePrefix<PythonFilesystemState>(name, std::move(state));
+}
+
+nb::dict DuckDBPyConnection::FilesystemStats(const string &name) {
+	auto &database = con.GetDatabase();
+	auto state = database.instance->GetObjectCache().GetWithTypePrefix<PythonFilesystemState>(name);
+	if (!state) {
+		throw InvalidInputException("No Python filesystem named '%s' is registered", name);
+	}
+	return state->GetStats();
+}
+
+nb::dict DuckDBPyConnection::StatementCacheStats() {
+	ConnectionLockGuard conn_lock(*this);
+	GetStatementCache();
+	if (!statement_cache) {
+		statement_cache = make_uniq<PreparedStatementCache>(*con.GetConnection().context);
+	}
+	return statement_cache->GetStats();
+}
+
+nb::dict DuckDBPyConnection::BindingStats(bool aggregate) {
+	ConnectionLockGuard conn_lock(*this);
+	auto &context = *con.GetConnection().context;
+	binding_stats->Refresh(context);
+	auto result = aggregate ? PythonBindingStats::Totals().ToDict() : binding_stats->counters.ToDict();
+	result["enabled"] = binding_stats->Enabled();
+	return result;
+}
+
+void DuckDBPyConnection::RegisterBindingStats() {
+	auto &context = *con.GetConnection().context;
+	binding_stats = context.registered_state->GetOrCreate<PythonBindingStats>(PythonBindingStats::NAME);
+	binding_stats->Refresh(context);
+}
+
+shared_ptr<PythonBindingStats> DuckDBPyConnection::GetBindingStats() {
+	if (!binding_stats || !binding_stats->Enabled()) {
+		return nullptr;
+	}
+	return binding_stats;
+}
+
+void DuckDBPyConnection::InvalidateFilesystemCache(const string &name, const nb::object &path) {
+	auto &database = con.GetDatabase();
+	auto state = database.instance->GetObjectCache().GetWithTypePrefix<PythonFilesystemState>(name);
+	if (!state) {
+		throw InvalidInputException("No Python filesystem named '%s' is registered", name);
+	}
+	if (path.is_none()) {
+		state->InvalidateAll();
+	} else {
+		state->Invalidate(nb::cast<std::string>(nb::str(path)));
+	}
 }
 
 nb::list DuckDBPyConnection::ListFilesystems() {
@@ -432,6 +584,7 @@ bool DuckDBPyConnection::FileSystemIsRegistered(const string &name) {
 }
 
 std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterUDF(const string &name) {
+	ConnectionLockGuard conn_lock(*this);
 	auto entry = registered_functions.find(name);
 	if (entry == registered_functions.end()) {
 		// Not registered or already unregistered
@@ -446,7 +599,7 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterUDF(const stri
 		// create function
 		auto &catalog = Catalog::GetCatalog(context, SYSTEM_CATALOG);
 		DropInfo info;
-		info.type = CatalogType::SCALAR_FUNCTION_ENTRY;
+		info.type = registered_function_types[name];
 		info.SetName(Identifier(name));
 		info.allow_drop_internal = true;
 		info.cascade = false;
@@ -454,15 +607,16 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterUDF(const stri
 		catalog.DropEntry(context, info);
 	});
 	registered_functions.erase(entry);
+	registered_function_types.erase(name);
 
 	return shared_from_this();
 }
 
-std::shared_ptr<DuckDBPyConnection>
-DuckDBPyConnection::RegisterScalarUDF(const string &name, const nb::callable &udf, const nb::object &parameters_p,
-                                      const nb::object &return_type_p, PythonUDFType type,
-                                      FunctionNullHandling null_handling, PythonExceptionHandling exception_handling,
-                                      bool side_effects) {
+std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::RegisterScalarUDF(
+    const string &name, const nb::callable &udf, const nb::object &parameters_p, const nb::object &return_type_p,
+    PythonUDFType type, FunctionNullHandling null_handling, PythonExceptionHandling exception_handling,
+    bool side_effects, const nb::object &concurrency, const nb::object &timeout, const nb::object &cache) {
+	ConnectionLockGuard conn_lock(*this);
 	auto &connection = con.GetConnection();
 	auto &context = *connection.context;
 
@@ -474,15 +628,81 @@ DuckDBPyConnection::RegisterScalarUDF(const string &name, const nb::callable &ud
 		                              "functions with the same name is not supported yet, please remove it first",
 		                              name);
 	}
-	auto scalar_function = CreateScalarUDF(name, udf, parameters_p, return_type_p, type == PythonUDFType::ARROW,
-	                                       null_handling, exception_handling, side_effects);
+	auto dependency = make_uniq<ExternalDependency>();
+	dependency->AddDependency("function", PythonDependencyItem::Create(udf));
+	auto scalar_function =
+	    CreateScalarUDF(name, udf, parameters_p, return_type_p, type == PythonUDFType::ARROW, null_handling,
+	                    exception_handling, side_effects, concurrency, timeout, cache, *dependency);
 	CreateScalarFunctionInfo info(scalar_function);
 
 	context.RegisterFunction(info);
 
+	registered_functions[name] = std::move(dependency);
+	registered_function_types[name] = CatalogType::SCALAR_FUNCTION_ENTRY;
+
+	return shared_from_this();
+}
+
+std::shared_ptr<DuckDBPyConnection>
+DuckDBPyConnection::RegisterAggregateUDF(const string &name, const nb::callable &init, const nb::callable &update,
+                                         const nb::callable &combine, const nb::callable &finalize,
+                                         const nb::object &parameters, const nb::object &return_type,
+                                         const string &format, FunctionNullHandling null_handling) {
+	ConnectionLockGuard conn_lock(*this);
+	auto &connection = con.GetConnection();
+	auto &context = *connection.context;
+
+	if (context.transaction.HasActiveTransaction()) {
+		context.CancelTransaction();
+	}
+	if (registered_functions.find(name) != registered_functions.end()) {
+		throw NotImplementedException("A function by the name of '%s' is already created, creating multiple "
+		                              "functions with the same name is not supported yet, please remove it first",
+		                              name);
+	}
+	auto aggregate_function =
+	    CreateAggregateUDF(name, init, update, combine, finalize, parameters, return_type, format, null_handling);
+	CreateAggregateFunctionInfo info(aggregate_function);
+
+	context.RegisterFunction(info);
+
 	auto dependency = make_uniq<ExternalDependency>();
-	dependency->AddDependency("function", PythonDependencyItem::Create(udf));
+	dependency->AddDependency("init", PythonDependencyItem::Create(init));
+	dependency->AddDependency("update", PythonDependencyItem::Create(update));
+	dependency->AddDependency("combine", PythonDependencyItem::Create(combine));
+	dependency->AddDependency("finalize", PythonDependencyItem::Create(finalize));
+	registered_functions[name] = std::move(dependency);
+	registered_function_types[name] = CatalogType::AGGREGATE_FUNCTION_ENTRY;
+
+	return shared_from_this();
+}
+
+std::shared_ptr<DuckDBPyConnection>
+DuckDBPyConnection::RegisterTableUDF(const string &name, const nb::callable &function, const nb::object &schema,
+                                     const nb::object &parameters, const nb::object &cardinality,
+                                     bool projection_pushdown) {
+	ConnectionLockGuard conn_lock(*this);
+	auto &connection = con.GetConnection();
+	auto &context = *connection.context;
+
+	if (context.transaction.HasActiveTransaction()) {
+		context.CancelTransaction();
+	}
+	if (registered_functions.find(name) != registered_functions.end()) {
+		throw NotImplementedException("A function by the name of '%s' is already created, creating multiple "
+		                              "functions with the same name is not supported yet, please remove it first",
+		                              name);
+	}
+	auto table_function = CreateTableUDF(name, function, schema, parameters, cardinality, projection_pushdown);
+	CreateTableFunctionInfo info(table_function);
+
+	context.RegisterFunction(info);
+
+	auto dependency = make_uniq<ExternalDependency>();
+	dependency->AddDependency("function", PythonDependencyItem::Create(function));
+	dependency->AddDependency("cardinality", PythonDependencyItem::Create(cardinality));
 	registered_functions[name] = std::move(dependency);
+	registered_function_types[name] = CatalogType::TABLE_FUNCTION_ENTRY;
 
 	return shared_from_this();
 }
@@ -512,9 +732,6 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const nb::ob
 	nb::gil_scoped_acquire gil;
 	ConnectionLockGuard conn_lock(*this);
 	con.SetResult(nullptr);
-	if (params_p.is_none()) {
-		params_p = nb::list();
-	}
 
 	auto statements = GetStatements(query);
 	if (statements.empty()) {
@@ -529,6 +746,31 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const nb::ob
 	ExecuteImmediately(std::move(statements));
 
 	auto prep = PrepareQuery(std::move(last_statement));
+	ExecutePreparedMany(*prep, std::move(params_p));
+	return shared_from_this();
+}
+
+void DuckDBPyConnection::ExecutePrepared(PreparedStatement &prep, nb::object params,
+                                         optional_ptr<PythonParameterBinder> binder) {
+	nb::gil_scoped_acquire gil;
+	ConnectionLockGuard conn_lock(*this);
+	con.SetResult(nullptr);
+
+	auto res = ExecuteInternal(prep, std::move(params), binder);
+	// Don't use CreateRelation here — the result is stored inside the connection,
+	// so setting connection_owner would create a ref cycle (connection → result → connection).
+	con.SetResult(
+	    std::make_unique<DuckDBPyRelation>(std::make_shared<DuckDBPyResult>(std::move(res), GetBindingStats())));
+}
+
+void DuckDBPyConnection::ExecutePreparedMany(PreparedStatement &prep, nb::object params_p,
+                                             optional_ptr<PythonParameterBinder> binder) {
+	nb::gil_scoped_acquire gil;
+	ConnectionLockGuard conn_lock(*this);
+	con.SetResult(nullptr);
+	if (params_p.is_none()) {
+		params_p = nb::list();
+	}
 
 	if (!duckdb::PyUtil::IsListLike(params_p)) {
 		throw InvalidInputException("executemany requires a list of parameter sets to be provided");
@@ -538,33 +780,43 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const nb::ob
 		throw InvalidInputException("executemany requires a non-empty list of parameter sets to be provided");
 	}
 
+	PythonParameterBinder local_binder;
+	if (!binder) {
+		binder = &local_binder;
+	}
 	unique_ptr<QueryResult> query_result;
 	// Execute once for every set of parameters that are provided
 	for (auto parameters : outer_list) {
 		auto params = nb::borrow<nb::object>(parameters);
-		query_result = ExecuteInternal(*prep, std::move(params));
+		query_result = ExecuteInternal(prep, std::move(params), binder);
 	}
 	// Set the internal 'result' object
 	if (query_result) {
 		// Don't use CreateRelation here — the result is stored inside the connection,
 		// so setting connection_owner would create a ref cycle (connection → result → connection).
-		con.SetResult(std::make_unique<DuckDBPyRelation>(std::make_shared<DuckDBPyResult>(std::move(query_result))));
+		con.SetResult(std::make_unique<DuckDBPyRelation>(
+		    std::make_shared<DuckDBPyResult>(std::move(query_result), GetBindingStats())));
 	}
-
-	return shared_from_this();
 }
 
-unique_ptr<QueryResult> DuckDBPyConnection::CompletePendingQuery(PendingQueryResult &pending_query) {
+unique_ptr<QueryResult> DuckDBPyConnection::CompletePendingQuery(PendingQueryResult &pending_query,
+                                                                 optional_ptr<PythonBindingStats> stats) {
 	PendingExecutionResult execution_result;
 	if (pending_query.HasError()) {
 		pending_query.ThrowError();
 	}
+	// Signals are only handled on the main thread, other threads run the query without taking the GIL back. The main
+	// thread checks for them at most once per interval instead of after every task
+	static constexpr auto SIGNAL_CHECK_INTERVAL = std::chrono::milliseconds(50);
+	const bool check_signals = PyThread_get_thread_ident() == GetModuleState().main_thread_ident;
+	auto next_signal_check = std::chrono::steady_clock::now() + SIGNAL_CHECK_INTERVAL;
 	while (!PendingQueryResult::IsResultReady(execution_result = pending_query.ExecuteTask())) {
-		{
-			nb::gil_scoped_acquire gil;
+		if (check_signals && std::chrono::steady_clock::now() >= next_signal_check) {
+			InstrumentedGILAcquire gil(stats);
 			if (PyErr_CheckSignals() != 0) {
 				throw std::runtime_error("Query interrupted");
 			}
+			next_signal_check = std::chrono::steady_clock::now() + SIGNAL_CHECK_INTERVAL;
 		}
 		if (execution_result == PendingExecutionResult::BLOCKED) {
 			pending_query.WaitForTask();
@@ -614,7 +866,8 @@ nb::list TransformNamedParameters(const case_insensitive_map_t<idx_t> &named_par
 }
 
 identifier_map_t<BoundParameterData> TransformPreparedParameters(ClientContext &context, const nb::object &params,
-                                                                 optional_ptr<PreparedStatement> prep = {}) {
+                                                                 optional_ptr<PreparedStatement> prep = {},
+                                                                 optional_ptr<PythonParameterBinder> binder = {}) {
 	identifier_map_t<BoundParameterData> named_values;
 	if (duckdb::PyUtil::IsListLike(params)) {
 		if (prep && prep->named_param_map.size() != nb::len(params)) {
@@ -625,6 +878,9 @@ identifier_map_t<BoundParameterData> TransformPreparedParameters(ClientContext &
 			throw InvalidInputException("Prepared statement needs %d parameters, %d given",
 			                            prep->named_param_map.size(), nb::len(params));
 		}
+		if (binder) {
+			return binder->BindList(context, *prep, params);
+		}
 		auto unnamed_values = DuckDBPyConnection::TransformPythonParamList(context, params);
 		for (idx_t i = 0; i < unnamed_values.size(); i++) {
 			auto &value = unnamed_values[i];
@@ -633,6 +889,9 @@ identifier_map_t<BoundParameterData> TransformPreparedParameters(ClientContext &
 		}
 	} else if (duckdb::PyUtil::IsDictLike(params)) {
 		auto dict = nb::cast<nb::dict>(params);
+		if (binder) {
+			return binder->BindDict(context, *prep, dict);
+		}
 		named_values = DuckDBPyConnection::TransformPythonParamDict(context, dict);
 	} else {
 		throw InvalidInputException("Prepared parameters can only be passed as a list or a dictionary");
@@ -656,25 +915,27 @@ unique_ptr<PreparedStatement> DuckDBPyConnection::PrepareQuery(unique_ptr<SQLSta
 	return prep;
 }
 
-unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &prep, nb::object params) {
+unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &prep, nb::object params,
+                                                            optional_ptr<PythonParameterBinder> binder) {
 	if (params.is_none()) {
 		params = nb::list();
 	}
 	auto &context = *con.GetConnection().context;
 
 	// Execute the prepared statement with the prepared parameters
-	auto named_values = TransformPreparedParameters(context, params, prep);
+	auto named_values = TransformPreparedParameters(context, params, prep, binder);
 	unique_ptr<QueryResult> res;
 	{
 		D_ASSERT(duckdb::PyUtil::GilCheck());
-		nb::gil_scoped_release release;
+		auto stats = GetBindingStats();
+		InstrumentedGILRelease release(stats);
 		unique_lock<std::recursive_mutex> lock(py_connection_lock);
 
 		auto pending_query = prep.PendingQuery(named_values);
 		if (pending_query->HasError()) {
 			pending_query->ThrowError();
 		}
-		res = CompletePendingQuery(*pending_query);
+		res = CompletePendingQuery(*pending_query, stats);
 
 		if (res->HasError()) {
 			res->ThrowError();
@@ -695,7 +956,8 @@ unique_ptr<QueryResult> DuckDBPyConnection::PrepareAndExecuteInternal(unique_ptr
 	unique_ptr<QueryResult> res;
 	{
 		D_ASSERT(duckdb::PyUtil::GilCheck());
-		nb::gil_scoped_release release;
+		auto stats = GetBindingStats();
+		InstrumentedGILRelease release(stats);
 		unique_lock<std::recursive_mutex> lock(py_connection_lock);
 
 		auto pending_query = con.GetConnection().PendingQuery(std::move(statement), named_values, true);
@@ -704,7 +966,7 @@ unique_ptr<QueryResult> DuckDBPyConnection::PrepareAndExecuteInternal(unique_ptr
 			pending_query->ThrowError();
 		}
 
-		res = CompletePendingQuery(*pending_query);
+		res = CompletePendingQuery(*pending_query, stats);
 
 		if (res->HasError()) {
 			res->ThrowError();
@@ -733,30 +995,255 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteFromString(const
 	return Execute(nb::str(query.c_str(), query.size()));
 }
 
-std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const nb::object &query, nb::object params) {
+unique_ptr<PreparedStatement> DuckDBPyConnection::PrepareReusableQuery(unique_ptr<SQLStatement> statement) {
+	auto &context = *con.GetConnection().context;
+	auto state = context.registered_state->GetOrCreate<PythonStatementCacheState>(PythonStatementCacheState::NAME);
+	auto replacement_scans = state->replacement_scans.load();
+	auto prep = PrepareQuery(std::move(statement));
+	if (state->replacement_scans != replacement_scans) {
+		// the statement scans Python objects found by name, which have to be looked up again on every execution
+		prep->data->properties.always_require_rebind = true;
+	}
+	return prep;
+}
+
+std::unique_ptr<DuckDBPyPreparedStatement> DuckDBPyConnection::Prepare(const nb::object &query) {
+	ConnectionLockGuard conn_lock(*this);
+	auto statements = GetStatements(query);
+	if (statements.size() != 1) {
+		throw InvalidInputException("prepare requires a single statement, %d were provided", statements.size());
+	}
+	auto prep = PrepareReusableQuery(std::move(statements[0]));
+	return std::make_unique<DuckDBPyPreparedStatement>(shared_from_this(), std::move(prep));
+}
+
+std::unique_ptr<DuckDBPyQueryFuture> DuckDBPyConnection::Submit(const nb::object &query, nb::object params) {
+	if (params.is_none()) {
+		params = nb::list();
+	}
+	// the thread of the future takes the connection lock and holds it until the query finished, no other query can
+	// run in between. The query is bound here, with the Python frames of the caller available to replacement scans,
+	// without taking the lock again
+	auto future = std::make_unique<DuckDBPyQueryFuture>(shared_from_this());
+	future->WaitForConnection();
+	try {
+		auto statements = GetStatements(query);
+		if (statements.empty()) {
+			throw InvalidInputException("submit requires a query to execute");
+		}
+		auto statement = std::move(statements.back());
+		statements.pop_back();
+		ExecuteImmediately(std::move(statements));
+		auto &connection = con.GetConnection();
+		auto named_values = TransformPreparedParameters(*connection.context, params);
+		unique_ptr<PendingQueryResult> pending_query;
+		{
+			InstrumentedGILRelease release(GetBindingStats());
+			pending_query = connection.PendingQuery(std::move(statement), named_values, false);
+		}
+		if (pending_query->HasError()) {
+			pending_query->ThrowError();
+		}
+		future->Start(std::move(pending_query));
+	} catch (...) {
+		future->Abort();
+		throw;
+	}
+	return future;
+}
+
+//! A query of execute_batch, parsed and with its parameters bound before the batch runs
+struct BatchQuery {
+	vector<unique_ptr<SQLStatement>> statements;
+	//! The parameters of the last statement
+	identifier_map_t<BoundParameterData> values;
+};
+
+nb::object DuckDBPyConnection::ExecuteBatch(const nb::object &queries, bool return_results, bool transaction) {
 	nb::gil_scoped_acquire gil;
 	ConnectionLockGuard conn_lock(*this);
 	con.SetResult(nullptr);
+	if (nb::isinstance<nb::str>(queries) || nb::isinstance<DuckDBPyStatement>(queries)) {
+		throw InvalidInputException("execute_batch requires a list of queries, use execute to run a single query");
+	}
+	auto &connection = con.GetConnection();
+	auto &context = *connection.context;
 
-	auto statements = GetStatements(query);
-	if (statements.empty()) {
-		// TODO: should we throw?
+	// Parse every query and transform its parameters first, a malformed entry fails before anything was executed
+	vector<BatchQuery> batch;
+	for (auto entry : queries) {
+		nb::object query = nb::borrow<nb::object>(entry);
+		nb::object params = nb::none();
+		if (nb::isinstance<nb::tuple>(entry)) {
+			auto pair = nb::borrow<nb::tuple>(entry);
+			if (pair.size() != 2) {
+				throw InvalidInputException(
+				    "execute_batch expects every entry to be a query or a (query, parameters) tuple, got a tuple of %d",
+				    pair.size());
+			}
+			query = pair[0];
+			params = pair[1];
+		}
+		BatchQuery batch_query;
+		batch_query.statements = GetStatements(query);
+		if (batch_query.statements.empty()) {
+			throw InvalidInputException("execute_batch requires every entry to contain a query");
+		}
+		for (idx_t i = 0; i + 1 < batch_query.statements.size(); i++) {
+			if (!batch_query.statements[i]->named_param_map.empty()) {
+				throw NotImplementedException(
+				    "Prepared parameters are only supported for the last statement, please split your query up into "
+				    "separate entries if you want to use prepared parameters");
+			}
+		}
+		if (!params.is_none()) {
+			batch_query.values = TransformPreparedParameters(context, params);
+		}
+		batch.push_back(std::move(batch_query));
+	}
+
+	vector<unique_ptr<QueryResult>> results;
+	{
+		auto stats = GetBindingStats();
+		InstrumentedGILRelease release(stats);
+		// Inside a transaction begun by the user the batch becomes part of it, which is left open
+		const bool begin_transaction = transaction && connection.IsAutoCommit();
+		if (begin_transaction) {
+			connection.BeginTransaction();
+		}
+		try {
+			for (auto &batch_query : batch) {
+				unique_ptr<QueryResult> res;
+				identifier_map_t<BoundParameterData> no_values;
+				for (idx_t i = 0; i < batch_query.statements.size(); i++) {
+					auto &values = i + 1 == batch_query.statements.size() ? batch_query.values : no_values;
+					auto pending_query = connection.PendingQuery(std::move(batch_query.statements[i]), values, false);
+					res = CompletePendingQuery(*pending_query, stats);
+					if (res->HasError()) {
+						res->ThrowError();
+					}
+				}
+				if (return_results) {
+					results.push_back(std::move(res));
+				}
+			}
+			if (begin_transaction) {
+				connection.Commit();
+			}
+		} catch (...) {
+			if (begin_transaction && connection.HasActiveTransaction()) {
+				connection.Rollback();
+			}
+			throw;
+		}
+	}
+
+	if (!return_results) {
+		return nb::none();
+	}
+	nb::list relations;
+	for (auto &res : results) {
+		auto py_relation = CreateRelation(std::make_shared<DuckDBPyResult>(std::move(res), GetBindingStats()));
+		relations.append(nb::cast(py_relation.release(), nb::rv_policy::take_ownership));
+	}
+	return std::move(relations);
+}
+
+optional_ptr<PreparedStatementCache> DuckDBPyConnection::GetStatementCache() {
+	auto &context = *con.GetConnection().context;
+	Value setting;
+	idx_t capacity = 0;
+	if (context.TryGetCurrentSetting("python_statement_cache_size", setting)) {
+		capacity = setting.GetValue<uint64_t>();
+	}
+	if (!statement_cache) {
+		if (capacity == 0) {
+			return nullptr;
+		}
+		statement_cache = make_uniq<PreparedStatementCache>(context);
+	}
+	statement_cache->Resize(capacity);
+	if (capacity == 0) {
 		return nullptr;
 	}
+	return statement_cache.get();
+}
 
-	auto last_statement = std::move(statements.back());
-	statements.pop_back();
-	// First immediately execute any preceding statements (if any)
-	// FIXME: SQLites implementation says to not accept an 'execute' call with multiple statements
-	ExecuteImmediately(std::move(statements));
+unique_ptr<QueryResult> DuckDBPyConnection::ExecuteCachedQuery(PreparedStatementCache &cache, const string &query,
+                                                               nb::object params,
+                                                               vector<unique_ptr<SQLStatement>> &statements) {
+	auto key = PreparedStatementCache::GetKey(*con.GetConnection().context, query, params);
+	auto cached = cache.Get(key);
+	if (cached) {
+		cache.hits++;
+	} else {
+		statements = con.GetConnection().ExtractStatements(query);
+		if (statements.size() != 1 || !PreparedStatementCache::CanCache(*statements[0])) {
+			return nullptr;
+		}
+		cache.misses++;
+		cached = make_shared_ptr<CachedStatement>(PrepareReusableQuery(std::move(statements[0])));
+		statements.clear();
+		cache.Put(key, cached);
+	}
+
+	auto &prep = cached->prepared;
+	auto rebinds = cache.state->rebinds.load();
+	auto &binder = cached->binder;
+	auto direct = binder.direct_conversions;
+	auto generic = binder.generic_conversions;
+	auto res = ExecuteInternal(*prep, std::move(params), binder);
+	cache.direct_parameters += binder.direct_conversions - direct;
+	cache.generic_parameters += binder.generic_conversions - generic;
+	if (cache.state->rebinds != rebinds) {
+		cache.rebinds++;
+		if (prep->named_param_map.empty() && !prep->data->properties.always_require_rebind) {
+			// without parameters only a catalog change rebinds the statement, prepare it again on the next execution
+			// instead of binding it on every one
+			cache.Delete(key);
+		}
+	}
+	return res;
+}
+
+std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const nb::object &query, nb::object params) {
+	nb::gil_scoped_acquire gil;
+	ConnectionLockGuard conn_lock(*this);
+	con.SetResult(nullptr);
+	if (params.is_none()) {
+		params = nb::list();
+	}
 
-	auto res = PrepareAndExecuteInternal(std::move(last_statement), std::move(params));
+	unique_ptr<QueryResult> res;
+	vector<unique_ptr<SQLStatement>> statements;
+	auto cache = nb::isinstance<nb::str>(query) ? GetStatementCache() : nullptr;
+	if (cache) {
+		// parse-free when the statement is cached, otherwise the parsed statements are executed below
+		res = ExecuteCachedQuery(*cache, nb::cast<std::string>(query), params, statements);
+	} else {
+		statements = GetStatements(query);
+	}
+	if (!res) {
+		if (statements.empty()) {
+			// TODO: should we throw?
+			return nullptr;
+		}
+
+		auto last_statement = std::move(statements.back());
+		statements.pop_back();
+		// First immediately execute any preceding statements (if any)
+		// FIXME: SQLites implementation says to not accept an 'execute' call with multiple statements
+		ExecuteImmediately(std::move(statements));
+
+		res = PrepareAndExecuteInternal(std::move(last_statement), std::move(params));
+	}
 
 	// Set the internal 'result' object
 	if (res) {
 		// Don't use CreateRelation here — the result is stored inside the connection,
 		// so setting connection_owner would create a ref cycle (connection → result → connection).
-		con.SetResult(std::make_unique<DuckDBPyRelation>(std::make_shared<DuckDBPyResult>(std::move(res))));
+		con.SetResult(
+		    std::make_unique<DuckDBPyRelation>(std::make_shared<DuckDBPyResult>(std::move(res), GetBindingStats())));
 	}
 	return shared_from_this();
 }
@@ -788,6 +1275,7 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Append(const string &nam
 
 std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::RegisterPythonObject(const string &name,
                                                                              const nb::object &python_object) {
+	ConnectionLockGuard conn_lock(*this);
 	auto &connection = con.GetConnection();
 	auto &client = *connection.context;
 	auto object = PythonReplacementScan::ReplacementObject(python_object, name, client);
@@ -855,7 +1343,7 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadJSON(
 
 	auto &connection = con.GetConnection();
 	auto &context = *connection.context;
-	auto path_like = GetPathLike(name_p);
+	auto path_like = GetPathLike(name_p, true);
 	auto &name = path_like.files;
 	auto file_like_object_wrapper = std::move(path_like.dependency);
 
@@ -1029,8 +1517,8 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadJSON(
 	return CreateRelation(std::move(read_json_relation));
 }
 
-PathLike DuckDBPyConnection::GetPathLike(const nb::object &object) {
-	return PathLike::Create(object, *this);
+PathLike DuckDBPyConnection::GetPathLike(const nb::object &object, bool allow_pipe) {
+	return PathLike::Create(object, *this, allow_pipe);
 }
 
 static void AcceptableCSVOptions(const string &unkown_parameter) {
@@ -1242,7 +1730,7 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadCSV(const nb::object &
 	auto &connection = con.GetConnection();
 	auto &context = *connection.context;
 	CSVReaderOptions options;
-	auto path_like = GetPathLike(name_p);
+	auto path_like = GetPathLike(name_p, true);
 	auto &name = path_like.files;
 	auto file_like_object_wrapper = std::move(path_like.dependency);
 	named_parameter_map_t bind_parameters;
@@ -1614,7 +2102,8 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadCSV(const nb::object &
 void DuckDBPyConnection::ExecuteImmediately(vector<unique_ptr<SQLStatement>> statements) {
 	auto &connection = con.GetConnection();
 	D_ASSERT(duckdb::PyUtil::GilCheck());
-	nb::gil_scoped_release release;
+	auto stats = GetBindingStats();
+	InstrumentedGILRelease release(stats);
 	if (statements.empty()) {
 		return;
 	}
@@ -1628,7 +2117,7 @@ void DuckDBPyConnection::ExecuteImmediately(vector<unique_ptr<SQLStatement>> sta
 		if (pending_query->HasError()) {
 			pending_query->ThrowError();
 		}
-		auto res = CompletePendingQuery(*pending_query);
+		auto res = CompletePendingQuery(*pending_query, stats);
 
 		if (res->HasError()) {
 			res->ThrowError();
@@ -1853,6 +2342,37 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::FromParquet(const nb::obje
 	return CreateRelation(parquet_relation->Alias(name));
 }
 
+std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadFiles(const string &function_name,
+                                                                const nb::object &path_or_buffer) {
+	auto &connection = con.GetConnection();
+	auto path_like = GetPathLike(path_or_buffer);
+	auto file_like_object_wrapper = std::move(path_like.dependency);
+
+	string name = function_name + "_" + StringUtil::GenerateRandomName();
+	vector<Value> file_values;
+	for (auto &file : path_like.files) {
+		file_values.emplace_back(std::move(file));
+	}
+	vector<Value> params;
+	params.emplace_back(Value::LIST(LogicalType::VARCHAR, std::move(file_values)));
+
+	D_ASSERT(duckdb::PyUtil::GilCheck());
+	nb::gil_scoped_release gil;
+	auto relation = connection.TableFunction(function_name, params);
+	if (file_like_object_wrapper) {
+		relation->AddExternalDependency(std::move(file_like_object_wrapper));
+	}
+	return CreateRelation(relation->Alias(name));
+}
+
+std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadNumpy(const nb::object &path_or_buffer) {
+	return ReadFiles("read_numpy", path_or_buffer);
+}
+
+std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ReadArrowIPC(const nb::object &path_or_buffer) {
+	return ReadFiles("read_arrow_ipc", path_or_buffer);
+}
+
 std::unique_ptr<DuckDBPyRelation> DuckDBPyConnection::FromArrow(nb::object &arrow_object) {
 	auto &connection = con.GetConnection();
 	string name = "arrow_object_" + StringUtil::GenerateRandomName();
@@ -1873,6 +2393,7 @@ unordered_set<string> DuckDBPyConnection::GetTableNames(const string &query, boo
 }
 
 std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::UnregisterPythonObject(const string &name) {
+	ConnectionLockGuard conn_lock(*this);
 	auto &connection = con.GetConnection();
 	if (!registered_objects.count(name)) {
 		return shared_from_this();
@@ -1927,6 +2448,8 @@ void DuckDBPyConnection::Close() {
 	ConnectionLockGuard conn_lock(*this);
 	con.SetResult(nullptr);
 	D_ASSERT(duckdb::PyUtil::GilCheck());
+	// cached plans can hold Python references through the bind data of Python scans
+	statement_cache.reset();
 	// Release the GIL only for the native Connection / DuckDB teardown, which
 	// is pure C++ work and can take noticeable time. Hold the GIL back for
 	// `registered_functions.clear()` because the
@@ -1943,6 +2466,7 @@ void DuckDBPyConnection::Close() {
 	// https://peps.python.org/pep-0249/#Connection.close
 	cursors.ClearCursors();
 	registered_functions.clear();
+	registered_function_types.clear();
 }
 
 void DuckDBPyConnection::Interrupt() {
@@ -2007,7 +2531,13 @@ void DuckDBPyConnection::LoadExtension(const string &extension) {
 }
 
 std::shared_ptr<DuckDBPyConnection> DefaultConnectionHolder::Get() {
-	lock_guard<mutex> guard(l);
+	// creating the connection releases the GIL, a thread waiting here with the GIL held would deadlock against it
+	unique_lock<mutex> guard(l, std::defer_lock);
+	{
+		D_ASSERT(duckdb::PyUtil::GilCheck());
+		nb::gil_scoped_release release;
+		guard.lock();
+	}
 	if (!connection || connection->con.ConnectionIsClosed()) {
 		nb::dict config_dict;
 		connection = DuckDBPyConnection::Connect(nb::str(":memory:"), false, config_dict);
@@ -2023,19 +2553,13 @@ void DefaultConnectionHolder::Set(std::shared_ptr<DuckDBPyConnection> conn) {
 void DuckDBPyConnection::Cursors::AddCursor(std::shared_ptr<DuckDBPyConnection> conn) {
 	lock_guard<mutex> l(lock);
 
-	// Clean up previously created cursors
-	vector<std::weak_ptr<DuckDBPyConnection>> compacted_cursors;
-	bool needs_compaction = false;
-	for (auto &cur_p : cursors) {
-		auto cur = cur_p.lock();
-		if (!cur) {
-			needs_compaction = true;
-			continue;
-		}
-		compacted_cursors.push_back(cur_p);
-	}
-	if (needs_compaction) {
-		cursors = std::move(compacted_cursors);
+	// Clean up the closed cursors once the list doubled since the last clean up, so creating many short-lived cursors
+	// takes amortised constant time per cursor
+	if (cursors.size() >= compaction_threshold) {
+		cursors.erase(std::remove_if(cursors.begin(), cursors.end(),
+		                             [](const std::weak_ptr<DuckDBPyConnection> &cur) { return cur.expired(); }),
+		              cursors.end());
+		compaction_threshold = MaxValue<idx_t>(MINIMUM_COMPACTION_THRESHOLD, cursors.size() * 2);
 	}
 
 	cursors.push_back(conn);
@@ -2065,6 +2589,7 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Cursor() {
 	auto res = std::make_shared<DuckDBPyConnection>();
 	res->con.SetDatabase(con);
 	res->con.SetConnection(make_uniq<Connection>(res->con.GetDatabase()));
+	res->RegisterBindingStats();
 	cursors.AddCursor(res);
 	return res;
 }
@@ -2234,11 +2759,25 @@ void InstantiateNewInstance(DuckDB &db) {
 	CreateTableFunctionInfo scan_info(std::move(scan_set));
 	scan_info.on_conflict = OnCreateConflict::ALTER_ON_CONFLICT;
 
+	TableFunctionSet numpy_file_set("read_numpy");
+	numpy_file_set.AddFunction(NumpyFileScanFunction(LogicalType::VARCHAR));
+	numpy_file_set.AddFunction(NumpyFileScanFunction(LogicalType::LIST(LogicalType::VARCHAR)));
+	CreateTableFunctionInfo numpy_file_info(std::move(numpy_file_set));
+	numpy_file_info.on_conflict = OnCreateConflict::ALTER_ON_CONFLICT;
+
+	TableFunctionSet arrow_ipc_set("read_arrow_ipc");
+	arrow_ipc_set.AddFunction(ArrowIPCScanFunction(LogicalType::VARCHAR));
+	arrow_ipc_set.AddFunction(ArrowIPCScanFunction(LogicalType::LIST(LogicalType::VARCHAR)));
+	CreateTableFunctionInfo arrow_ipc_info(std::move(arrow_ipc_set));
+	arrow_ipc_info.on_conflict = OnCreateConflict::ALTER_ON_CONFLICT;
+
 	auto &system_catalog = Catalog::GetSystemCatalog(db_instance);
 	auto transaction = CatalogTransaction::GetSystemTransaction(db_instance);
 
 	system_catalog.CreateFunction(transaction, map_info);
 	system_catalog.CreateFunction(transaction, scan_info);
+	system_catalog.CreateFunction(transaction, numpy_file_info);
+	system_catalog.CreateFunction(transaction, arrow_ipc_info);
 }
 
 static std::shared_ptr<DuckDBPyConnection> FetchOrCreateInstance(const string &database_path, DBConfig &config) {
@@ -2254,6 +2793,7 @@ static std::shared_ptr<DuckDBPyConnection> FetchOrCreateInstance(const string &d
 		res->con.SetDatabase(std::move(database));
 		res->con.SetConnection(make_uniq<Connection>(res->con.GetDatabase()));
 	}
+	res->RegisterBindingStats();
 	return res;
 }
 
@@ -2298,6 +2838,13 @@ std::shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Connect(const nb::object
 	    "python_scan_all_frames",
 	    "If set, restores the old behavior of scanning all preceding frames to locate the referenced variable.",
 	    LogicalType::BOOLEAN, Value::BOOLEAN(false));
+	config.AddExtensionOption("python_statement_cache_size",
+	                          "The number of statements prepared by execute() that are kept for reuse, 0 disables it.",
+	                          LogicalType::UBIGINT, Value::UBIGINT(0));
+	config.AddExtensionOption("python_binding_stats",
+	                          "Whether to count the time the Python binding spends outside of query execution, see "
+	                          "binding_stats().",
+	                          LogicalType::BOOLEAN, Value::BOOLEAN(false));
 	if (!DuckDBPyConnection::IsJupyter()) {
 		config_dict["duckdb_api"] = Value("python/" + DuckDBPyConnection::FormattedPythonVersion());
 	} else {
@@ -2351,6 +2898,7 @@ PythonImportCache *DuckDBPyConnection::ImportCache() {
 }
 
 ModifiedMemoryFileSystem &DuckDBPyConnection::GetObjectFileSystem() {
+	ConnectionLockGuard conn_lock(*this);
 	if (!internal_object_filesystem) {
 		D_ASSERT(!FileSystemIsRegistered("DUCKDB_INTERNAL_OBJECTSTORE"));
 		auto &import_cache_py = *ImportCache();
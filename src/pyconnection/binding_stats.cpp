@@ -0,0 +1,129 @@
+#include "duckdb_python/pyconnection/binding_stats.hpp"
+
+#include "duckdb/common/string_util.hpp"
+#include "duckdb/main/client_context.hpp"
+
+namespace duckdb {
+
+static constexpr const char *METRIC_NAMES[] = {
+    "gil", "connection_lock", "replacement_scan", "fetchone", "fetchmany", "fetchall", "fetchnumpy", "df", "torch",
+    "tf",  "arrow",           "arrow_stream"};
+static_assert(sizeof(METRIC_NAMES) / sizeof(METRIC_NAMES[0]) == PYTHON_BINDING_METRIC_COUNT,
+              "every metric needs a name");
+
+static bool IsFetchMetric(idx_t index) {
+	return index >= static_cast<idx_t>(PythonBindingMetric::FETCHONE);
+}
+
+static double ToSeconds(idx_t nanoseconds) {
+	return static_cast<double>(nanoseconds) / 1e9;
+}
+
+void PythonBindingTiming::Record(std::chrono::steady_clock::duration elapsed) {
+	count++;
+	nanoseconds += NumericCast<idx_t>(std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count());
+}
+
+nb::dict PythonBindingCounters::ToDict() const {
+	nb::dict result;
+	nb::dict fetch;
+	for (idx_t i = 0; i < PYTHON_BINDING_METRIC_COUNT; i++) {
+		nb::dict timing;
+		timing["count"] = timings[i].count.load();
+		timing["time"] = ToSeconds(timings[i].nanoseconds);
+		if (IsFetchMetric(i)) {
+			fetch[METRIC_NAMES[i]] = timing;
+		} else {
+			result[METRIC_NAMES[i]] = timing;
+		}
+	}
+	result["fetch"] = fetch;
+	return result;
+}
+
+string PythonBindingCounters::ToJSON() const {
+	vector<string> entries;
+	vector<string> fetch;
+	for (idx_t i = 0; i < PYTHON_BINDING_METRIC_COUNT; i++) {
+		auto timing = StringUtil::Format("\"%s\": {\"count\": %llu, \"time\": %f}", METRIC_NAMES[i],
+		                                 timings[i].count.load(), ToSeconds(timings[i].nanoseconds));
+		if (IsFetchMetric(i)) {
+			fetch.push_back(std::move(timing));
+		} else {
+			entries.push_back(std::move(timing));
+		}
+	}
+	entries.push_back("\"fetch\": {" + StringUtil::Join(fetch, ", ") + "}");
+	return "{" + StringUtil::Join(entries, ", ") + "}";
+}
+
+shared_ptr<PythonBindingStats> PythonBindingStats::Get(ClientContext &context) {
+	auto stats = context.registered_state->Get<PythonBindingStats>(NAME);
+	if (!stats || !stats->Enabled()) {
+		return nullptr;
+	}
+	return stats;
+}
+
+PythonBindingCounters &PythonBindingStats::Totals() {
+	static PythonBindingCounters totals;
+	return totals;
+}
+
+void PythonBindingStats::Refresh(ClientContext &context) {
+	Value setting;
+	enabled = context.TryGetCurrentSetting("python_binding_stats", setting) && setting.GetValue<bool>();
+}
+
+void PythonBindingStats::Record(PythonBindingMetric metric, std::chrono::steady_clock::duration elapsed) {
+	counters.Get(metric).Record(elapsed);
+	Totals().Get(metric).Record(elapsed);
+}
+
+void PythonBindingStats::QueryBegin(ClientContext &context) {
+	Refresh(context);
+}
+
+void PythonBindingStats::WriteProfilingInformation(std::ostream &ss) {
+	if (!enabled) {
+		return;
+	}
+	ss << "Python Binding Stats: " << counters.ToJSON() << "\n";
+}
+
+PythonBindingStatsScope::PythonBindingStatsScope(optional_ptr<PythonBindingStats> stats_p, PythonBindingMetric metric_p)
+    : stats(stats_p), metric(metric_p) {
+	if (stats) {
+		start = std::chrono::steady_clock::now();
+	}
+}
+
+PythonBindingStatsScope::~PythonBindingStatsScope() {
+	if (stats) {
+		stats->Record(metric, std::chrono::steady_clock::now() - start);
+	}
+}
+
+InstrumentedGILAcquire::InstrumentedGILAcquire(optional_ptr<PythonBindingStats> stats)
+    : start(stats ? std::chrono::steady_clock::now() : std::chrono::steady_clock::time_point()) {
+	// the GIL is taken by the member, before the body runs
+	if (stats) {
+		stats->Record(PythonBindingMetric::GIL_WAIT, std::chrono::steady_clock::now() - start);
+	}
+}
+
+InstrumentedGILRelease::InstrumentedGILRelease(optional_ptr<PythonBindingStats> stats_p)
+    : stats(stats_p), thread_state(PyEval_SaveThread()) {
+}
+
+InstrumentedGILRelease::~InstrumentedGILRelease() {
+	if (!stats) {
+		PyEval_RestoreThread(thread_state);
+		return;
+	}
+	auto start = std::chrono::steady_clock::now();
+	PyEval_RestoreThread(thread_state);
+	stats->Record(PythonBindingMetric::GIL_WAIT, std::chrono::steady_clock::now() - start);
+}
+
+} // namespace duckdb
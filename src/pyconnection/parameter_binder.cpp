@@ -0,0 +1,152 @@
+#include "duckdb_python/pyconnection/parameter_binder.hpp"
+
+#include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/python_conversion.hpp"
+#include "duckdb_python/python_objects.hpp"
+#include "duckdb_python/pyutil.hpp"
+
+namespace duckdb {
+
+identifier_map_t<BoundParameterData> PythonParameterBinder::BindList(ClientContext &context, PreparedStatement &prep,
+                                                                     const nb::handle &params) {
+	identifier_map_t<BoundParameterData> values;
+	idx_t index = 0;
+	for (auto param : params) {
+		auto identifier = Identifier(std::to_string(index + 1));
+		if (index == positional.size()) {
+			positional.push_back(CreateSlot(prep, identifier));
+		}
+		values[identifier] = BoundParameterData(Transform(context, positional[index], param));
+		index++;
+	}
+	return values;
+}
+
+identifier_map_t<BoundParameterData> PythonParameterBinder::BindDict(ClientContext &context, PreparedStatement &prep,
+                                                                     const nb::dict &params) {
+	identifier_map_t<BoundParameterData> values;
+	for (auto item : params) {
+		auto identifier = Identifier(duckdb::PyUtil::CastToString(item.first));
+		auto entry = named.find(identifier);
+		if (entry == named.end()) {
+			if (prep.named_param_map.find(identifier) == prep.named_param_map.end()) {
+				// not a parameter of the statement, executing fails with a proper error
+				values[identifier] =
+				    BoundParameterData(TransformPythonValue(context, item.second, LogicalType::UNKNOWN, false));
+				continue;
+			}
+			entry = named.emplace(identifier, CreateSlot(prep, identifier)).first;
+		}
+		values[identifier] = BoundParameterData(Transform(context, entry->second, item.second));
+	}
+	return values;
+}
+
+PythonParameterBinder::ParameterSlot PythonParameterBinder::CreateSlot(PreparedStatement &prep,
+                                                                       const Identifier &identifier) {
+	ParameterSlot slot;
+	auto &data = *prep.data;
+	if (data.properties.bound_all_parameters) {
+		auto entry = data.value_map.find(identifier);
+		slot.expects_bigint = entry != data.value_map.end() && entry->second->return_type == LogicalType::BIGINT;
+	}
+	return slot;
+}
+
+PythonParameterConversion PythonParameterBinder::GetConversion(nb::handle value) {
+	// only exact types, subclasses (e.g. pandas.Timestamp) can carry semantics the generic path knows about
+	auto type = Py_TYPE(value.ptr());
+	if (value.is_none()) {
+		return PythonParameterConversion::NONE;
+	} else if (type == &PyBool_Type) {
+		return PythonParameterConversion::BOOLEAN;
+	} else if (type == &PyLong_Type) {
+		return PythonParameterConversion::INTEGER;
+	} else if (type == &PyFloat_Type) {
+		return PythonParameterConversion::DOUBLE;
+	} else if (type == &PyUnicode_Type) {
+		return PythonParameterConversion::VARCHAR;
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	auto type_object = reinterpret_cast<PyObject *>(type);
+	if (type_object == import_cache.datetime.datetime().ptr()) {
+		return PythonParameterConversion::TIMESTAMP;
+	} else if (type_object == import_cache.datetime.date().ptr()) {
+		return PythonParameterConversion::DATE;
+	}
+	return PythonParameterConversion::GENERIC;
+}
+
+bool PythonParameterBinder::TryTransformDirect(ParameterSlot &slot, nb::handle value, Value &result) {
+	auto ptr = value.ptr();
+	// the type is not referenced, a freed type can only be matched by a new type in a GENERIC slot,
+	// the types with a direct conversion are never freed
+	if (Py_TYPE(ptr) != slot.type) {
+		slot.type = Py_TYPE(ptr);
+		slot.conversion = GetConversion(value);
+	}
+	switch (slot.conversion) {
+	case PythonParameterConversion::NONE:
+		result = Value();
+		return true;
+	case PythonParameterConversion::BOOLEAN:
+		result = Value::BOOLEAN(ptr == Py_True);
+		return true;
+	case PythonParameterConversion::INTEGER: {
+		int overflow;
+		int64_t integer = PyLong_AsLongLongAndOverflow(ptr, &overflow);
+		if (overflow != 0 || (integer == -1 && PyErr_Occurred())) {
+			// values beyond int64 are sniffed by the generic path
+			PyErr_Clear();
+			return false;
+		}
+		if (slot.expects_bigint || integer < NumericLimits<int32_t>::Minimum() ||
+		    integer > NumericLimits<int32_t>::Maximum()) {
+			result = Value::BIGINT(integer);
+		} else {
+			result = Value::INTEGER(static_cast<int32_t>(integer));
+		}
+		return true;
+	}
+	case PythonParameterConversion::DOUBLE:
+		result = Value::DOUBLE(PyFloat_AS_DOUBLE(ptr));
+		return true;
+	case PythonParameterConversion::VARCHAR: {
+		Py_ssize_t size;
+		auto data = PyUnicode_AsUTF8AndSize(ptr, &size);
+		if (!data) {
+			// e.g. lone surrogates, the generic path raises the error
+			PyErr_Clear();
+			return false;
+		}
+		result = Value(string(data, static_cast<size_t>(size)));
+		return true;
+	}
+	case PythonParameterConversion::TIMESTAMP: {
+		PyDateTime datetime(value);
+		result = datetime.ToDuckValue(LogicalType::UNKNOWN);
+		return true;
+	}
+	case PythonParameterConversion::DATE: {
+		PyDate date(value);
+		result = date.ToDuckValue();
+		return true;
+	}
+	default:
+		return false;
+	}
+}
+
+Value PythonParameterBinder::Transform(ClientContext &context, ParameterSlot &slot, nb::handle value) {
+	Value result;
+	if (TryTransformDirect(slot, value, result)) {
+		direct_conversions++;
+		return result;
+	}
+	generic_conversions++;
+	return TransformPythonValue(context, value, LogicalType::UNKNOWN, false);
+}
+
+} // namespace duckdb
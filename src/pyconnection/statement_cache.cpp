@@ -0,0 +1,88 @@
+#include "duckdb_python/pyconnection/statement_cache.hpp"
+
+#include "duckdb/catalog/catalog_search_path.hpp"
+#include "duckdb/main/client_context.hpp"
+#include "duckdb/main/client_data.hpp"
+#include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/parser/sql_statement.hpp"
+#include "duckdb_python/pyutil.hpp"
+
+namespace duckdb {
+
+RebindQueryInfo PythonStatementCacheState::OnExecutePrepared(ClientContext &context,
+                                                             PreparedStatementCallbackInfo &info,
+                                                             RebindQueryInfo current_rebind) {
+	if (current_rebind == RebindQueryInfo::ATTEMPT_TO_REBIND) {
+		rebinds++;
+	}
+	return current_rebind;
+}
+
+PreparedStatementCache::PreparedStatementCache(ClientContext &context)
+    : state(context.registered_state->GetOrCreate<PythonStatementCacheState>(PythonStatementCacheState::NAME)) {
+}
+
+bool PreparedStatementCache::CanCache(const SQLStatement &statement) {
+	switch (statement.type) {
+	case StatementType::SELECT_STATEMENT:
+	case StatementType::INSERT_STATEMENT:
+	case StatementType::UPDATE_STATEMENT:
+	case StatementType::DELETE_STATEMENT:
+		return true;
+	default:
+		return false;
+	}
+}
+
+string PreparedStatementCache::GetKey(ClientContext &context, const string &query, const nb::object &params) {
+	// list and dict parameters are matched to the statement differently, and unqualified names resolve to other
+	// tables after USE or SET search_path, which a rebind wouldn't notice as the bound tables still exist
+	auto search_path = CatalogSearchEntry::ListToString(ClientData::Get(context).catalog_search_path->Get());
+	return (duckdb::PyUtil::IsDictLike(params) ? "D" : "L") + search_path + "\n" + query;
+}
+
+shared_ptr<CachedStatement> PreparedStatementCache::Get(const string &key) {
+	if (!statements) {
+		return nullptr;
+	}
+	return statements->Get(key);
+}
+
+void PreparedStatementCache::Put(const string &key, shared_ptr<CachedStatement> statement) {
+	D_ASSERT(statements);
+	statements->Put(key, std::move(statement));
+}
+
+void PreparedStatementCache::Delete(const string &key) {
+	if (statements) {
+		statements->Delete(key);
+	}
+}
+
+void PreparedStatementCache::Resize(idx_t capacity) {
+	if (capacity == Capacity()) {
+		return;
+	}
+	statements.reset();
+	if (capacity > 0) {
+		statements = make_uniq<SharedLruCache<string, CachedStatement>>(capacity);
+	}
+}
+
+idx_t PreparedStatementCache::Capacity() const {
+	return statements ? statements->Capacity() : 0;
+}
+
+nb::dict PreparedStatementCache::GetStats() const {
+	nb::dict stats;
+	stats["hits"] = hits;
+	stats["misses"] = misses;
+	stats["rebinds"] = rebinds;
+	stats["direct_parameters"] = direct_parameters;
+	stats["generic_parameters"] = generic_parameters;
+	stats["cached_statements"] = statements ? statements->Size() : 0;
+	stats["cache_size"] = Capacity();
+	return stats;
+}
+
+} // namespace duckdb
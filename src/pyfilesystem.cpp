@@ -1,17 +1,260 @@
 #include "duckdb_python/pyfilesystem.hpp"
 
+#include "duckdb/common/file_opener.hpp"
 #include "duckdb/common/string_util.hpp"
+#include "duckdb/main/client_context.hpp"
 #include "duckdb_python/nb/casters.hpp"
 
+#include <thread>
+
 namespace duckdb {
 
+PythonFilesystemState::PythonFilesystemState(PythonFilesystemOptions options_p)
+    : options(options_p), cache_hits(0), cache_misses(0), pending_waits(0), bytes_fetched(0), fetches(0),
+      metadata_hits(0), metadata_misses(0), writes(0), bytes_written(0), blocks(options_p.cache_size) {
+}
+
+shared_ptr<string> PythonFilesystemState::GetBlock(const string &key) {
+	lock_guard<mutex> guard(lock);
+	return blocks.Get(key);
+}
+
+shared_ptr<PythonPendingBlock> PythonFilesystemState::BeginFetch(const string &key,
+                                                                 shared_ptr<PythonPendingBlock> &claimed) {
+	lock_guard<mutex> guard(lock);
+	auto entry = pending_blocks.find(key);
+	if (entry != pending_blocks.end()) {
+		return entry->second;
+	}
+	auto block = blocks.Get(key);
+	if (block) {
+		// cached in the meantime
+		auto pending = make_shared_ptr<PythonPendingBlock>();
+		pending->done = true;
+		pending->block = std::move(block);
+		return pending;
+	}
+	claimed = make_shared_ptr<PythonPendingBlock>();
+	pending_blocks[key] = claimed;
+	return nullptr;
+}
+
+void PythonFilesystemState::FinishFetch(const string &key, PythonPendingBlock &pending, shared_ptr<string> block,
+                                        const string &error) {
+	{
+		lock_guard<mutex> guard(lock);
+		if (block) {
+			auto size = block->size();
+			blocks.Put(key, block, size);
+		}
+		pending_blocks.erase(key);
+	}
+	lock_guard<mutex> guard(pending.lock);
+	pending.done = true;
+	pending.block = std::move(block);
+	pending.error = error;
+	pending.fetched.notify_all();
+}
+
+shared_ptr<string> PythonFilesystemState::WaitForFetch(PythonPendingBlock &pending) {
+	std::unique_lock<mutex> guard(pending.lock);
+	pending.fetched.wait(guard, [&]() { return pending.done; });
+	if (!pending.block) {
+		throw IOException(pending.error);
+	}
+	return pending.block;
+}
+
+string
+PythonFilesystemState::FetchRange(const shared_ptr<PythonRangeRequest> &request,
+                                  const std::function<void(const vector<shared_ptr<PythonRangeRequest>> &)> &dispatch) {
+	// the read dispatching the ranges needs the GIL, a read waiting for it must not hold it
+	unique_ptr<nb::gil_scoped_release> release;
+	if (duckdb::PyUtil::GilCheck()) {
+		release = make_uniq<nb::gil_scoped_release>();
+	}
+	std::unique_lock<mutex> guard(range_lock);
+	queued_ranges.push_back(request);
+	while (!request->done) {
+		if (dispatching_ranges) {
+			ranges_dispatched.wait(guard);
+			continue;
+		}
+		// no dispatch is running, send every range that was queued in the meantime
+		auto batch = std::move(queued_ranges);
+		queued_ranges.clear();
+		dispatching_ranges = true;
+		guard.unlock();
+		string error;
+		try {
+			dispatch(batch);
+		} catch (std::exception &ex) {
+			error = ex.what();
+		}
+		guard.lock();
+		dispatching_ranges = false;
+		for (auto &dispatched : batch) {
+			if (!error.empty()) {
+				dispatched->error = error;
+			}
+			dispatched->done = true;
+		}
+		ranges_dispatched.notify_all();
+	}
+	if (!request->error.empty()) {
+		throw IOException(request->error);
+	}
+	return std::move(request->data);
+}
+
+idx_t PythonFilesystemState::GetGeneration(const string &path) {
+	lock_guard<mutex> guard(lock);
+	// removing or moving a directory invalidates the files below it, generations only increase so the newest of the
+	// path and its parent directories wins
+	auto generation = base_generation;
+	auto prefix = NormalizePath(path);
+	while (true) {
+		auto entry = generations.find(prefix);
+		if (entry != generations.end()) {
+			generation = MaxValue(generation, entry->second);
+		}
+		auto slash = prefix.rfind('/');
+		if (slash == string::npos) {
+			break;
+		}
+		prefix = prefix.substr(0, slash);
+	}
+	return generation;
+}
+
+string PythonFilesystemState::NormalizePath(const string &path) {
+	auto start = path.find("://");
+	start = start == string::npos ? 0 : start + 3;
+	while (start < path.size() && path[start] == '/') {
+		start++;
+	}
+	return path.substr(start);
+}
+
+bool PythonFilesystemState::IsFresh(std::chrono::steady_clock::time_point fetched_at) const {
+	std::chrono::duration<double> age = std::chrono::steady_clock::now() - fetched_at;
+	return age.count() < options.metadata_ttl;
+}
+
+bool PythonFilesystemState::GetMetadata(const string &path, PythonFileMetadata &result) {
+	lock_guard<mutex> guard(lock);
+	auto entry = metadata.find(NormalizePath(path));
+	if (entry == metadata.end() || !IsFresh(entry->second.fetched_at)) {
+		metadata_misses++;
+		return false;
+	}
+	metadata_hits++;
+	result = entry->second;
+	return true;
+}
+
+void PythonFilesystemState::PutMetadata(const string &path, const PythonFileMetadata &new_metadata) {
+	lock_guard<mutex> guard(lock);
+	auto &entry = metadata[NormalizePath(path)];
+	if (!IsFresh(entry.fetched_at) || entry.exists != new_metadata.exists ||
+	    entry.is_directory != new_metadata.is_directory) {
+		entry = PythonFileMetadata();
+		entry.exists = new_metadata.exists;
+		entry.is_directory = new_metadata.is_directory;
+		entry.fetched_at = std::chrono::steady_clock::now();
+	}
+	// keep what is known already, e.g. a glob doesn't report modification times that were fetched before
+	if (new_metadata.size.IsValid()) {
+		entry.size = new_metadata.size;
+	}
+	if (new_metadata.has_last_modified) {
+		entry.has_last_modified = true;
+		entry.last_modified = new_metadata.last_modified;
+	}
+}
+
+bool PythonFilesystemState::GetListing(const string &key, PythonFileListing &result) {
+	lock_guard<mutex> guard(lock);
+	auto entry = listings.find(key);
+	if (entry == listings.end() || !IsFresh(entry->second.fetched_at)) {
+		metadata_misses++;
+		return false;
+	}
+	metadata_hits++;
+	result = entry->second;
+	return true;
+}
+
+void PythonFilesystemState::PutListing(const string &key, PythonFileListing listing) {
+	lock_guard<mutex> guard(lock);
+	listing.fetched_at = std::chrono::steady_clock::now();
+	listings[key] = std::move(listing);
+}
+
+void PythonFilesystemState::Invalidate(const string &path) {
+	// the blocks of older generations are never looked up again and age out of the cache, GetGeneration also applies
+	// the generation to the paths below this one
+	auto normalized = NormalizePath(path);
+	while (!normalized.empty() && normalized.back() == '/') {
+		normalized.pop_back();
+	}
+	lock_guard<mutex> guard(lock);
+	generations[normalized] = ++next_generation;
+	for (auto entry = metadata.begin(); entry != metadata.end();) {
+		if (entry->first == normalized || StringUtil::StartsWith(entry->first, normalized + "/")) {
+			entry = metadata.erase(entry);
+		} else {
+			entry++;
+		}
+	}
+	// any glob or listing may contain the path
+	listings.clear();
+}
+
+void PythonFilesystemState::InvalidateAll() {
+	lock_guard<mutex> guard(lock);
+	base_generation = ++next_generation;
+	generations.clear();
+	blocks.Clear();
+	metadata.clear();
+	listings.clear();
+}
+
+nb::dict PythonFilesystemState::GetStats() {
+	idx_t cached_bytes;
+	{
+		lock_guard<mutex> guard(lock);
+		cached_bytes = blocks.CurrentTotalWeight();
+	}
+	nb::dict stats;
+	stats["cache_hits"] = cache_hits.load();
+	stats["cache_misses"] = cache_misses.load();
+	stats["pending_waits"] = pending_waits.load();
+	stats["bytes_fetched"] = bytes_fetched.load();
+	stats["fetches"] = fetches.load();
+	stats["metadata_hits"] = metadata_hits.load();
+	stats["metadata_misses"] = metadata_misses.load();
+	stats["writes"] = writes.load();
+	stats["bytes_written"] = bytes_written.load();
+	stats["cached_bytes"] = cached_bytes;
+	stats["cache_size"] = options.cache_size;
+	return stats;
+}
+
 PythonFileHandle::PythonFileHandle(FileSystem &file_system, const string &path, const nb::object &handle,
-                                   FileOpenFlags flags)
-    : FileHandle(file_system, path, flags), handle(handle) {
+                                   FileOpenFlags flags, shared_ptr<PythonFilesystemState> state)
+    : FileHandle(file_system, path, flags), supports_readinto(nb::hasattr(handle, "readinto")), handle(handle),
+      state(std::move(state)) {
 }
 PythonFileHandle::~PythonFileHandle() {
 	try {
 		nb::gil_scoped_acquire gil;
+		try {
+			// the handle wasn't closed, hand the buffered writes to Python before the file object is released, this is
+			// best effort as a destructor can't report errors, Close() does
+			FlushWrites();
+		} catch (...) { // NOLINT
+		}
 		handle.dec_ref();
 		handle.release();
 	} catch (...) { // NOLINT
@@ -22,8 +265,135 @@ const nb::object &PythonFileHandle::GetHandle(const FileHandle &handle) {
 	return handle.Cast<PythonFileHandle>().handle;
 }
 
+idx_t PythonFileHandle::ReadInto(data_ptr_t buffer, idx_t nr_bytes) {
+	if (nr_bytes == 0) {
+		return 0;
+	}
+	// A non-blocking stream returns None while no data is available yet, which is not the end of the file: wait for
+	// the data instead of handing DuckDB a short read
+	static constexpr auto MAX_BACKOFF = std::chrono::milliseconds(100);
+	auto read_timeout = state->options.read_timeout;
+	auto start = std::chrono::steady_clock::now();
+	auto backoff = std::chrono::milliseconds(1);
+	while (true) {
+		if (supports_readinto) {
+			// let Python write straight into `buffer` through a memoryview, rather than allocating a bytes object
+			auto view = nb::steal(
+			    PyMemoryView_FromMemory(char_ptr_cast(buffer), UnsafeNumericCast<Py_ssize_t>(nr_bytes), PyBUF_WRITE));
+			if (!view) {
+				throw nb::python_error();
+			}
+			nb::object result;
+			try {
+				result = handle.attr("readinto")(view);
+			} catch (...) {
+				view.attr("release")();
+				throw;
+			}
+			// `buffer` must not be reachable from Python after this call
+			view.attr("release")();
+			if (!result.is_none()) {
+				return MinValue(nb::cast<idx_t>(result), nr_bytes);
+			}
+		} else {
+			auto result = handle.attr("read")(nr_bytes);
+			if (!result.is_none()) {
+				nb::bytes data = nb::bytes(result);
+				// `buffer` is sized for nr_bytes. A misbehaving fsspec read(n) may return MORE than n bytes; clamp so
+				// the copy can never overflow `buffer`. Returning fewer than nr_bytes is a legal short read (EOF).
+				auto bytes_to_copy = MinValue<idx_t>(data.size(), nr_bytes);
+				memcpy(buffer, data.c_str(), bytes_to_copy);
+				return bytes_to_copy;
+			}
+		}
+		auto client = context.lock();
+		if (client && client->IsInterrupted()) {
+			throw InterruptException();
+		}
+		// only raises on the main thread, where DuckDB may read while the caller waits for the query
+		if (PyErr_CheckSignals() != 0) {
+			throw nb::python_error();
+		}
+		if (std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count() >= read_timeout) {
+			throw IOException("Python file '%s' had no data available for %g seconds (the read_timeout of the "
+			                  "filesystem), reading from a non-blocking stream that stays empty is not supported",
+			                  path, read_timeout);
+		}
+		{
+			nb::gil_scoped_release release;
+			std::this_thread::sleep_for(backoff);
+		}
+		backoff = MinValue<std::chrono::milliseconds>(backoff * 2, MAX_BACKOFF);
+	}
+}
+
+bool PythonFileHandle::BufferWrite(const_data_ptr_t buffer, idx_t nr_bytes, optional_idx location) {
+	if (write_buffer.empty()) {
+		if (nr_bytes >= write_buffer_size) {
+			// nothing to combine, large writes go to Python as they are
+			return false;
+		}
+		write_offset = location;
+	} else {
+		// only a write that continues the buffered writes can be combined with them
+		bool contiguous = !location.IsValid() || (write_offset.IsValid() &&
+		                                          location.GetIndex() == write_offset.GetIndex() + write_buffer.size());
+		if (!contiguous || write_buffer.size() + nr_bytes > write_buffer_size) {
+			return false;
+		}
+	}
+	write_buffer.append(const_char_ptr_cast(buffer), nr_bytes);
+	return true;
+}
+
+void PythonFileHandle::FlushWrites() {
+	if (write_buffer.empty()) {
+		return;
+	}
+	try {
+		if (write_offset.IsValid()) {
+			handle.attr("seek")(write_offset.GetIndex());
+		}
+		WriteAll(const_data_ptr_cast(write_buffer.data()), write_buffer.size());
+	} catch (...) {
+		// the writes are lost either way, don't repeat them (and the error) when the handle is closed
+		write_buffer.clear();
+		write_offset = optional_idx();
+		throw;
+	}
+	write_buffer.clear();
+	write_offset = optional_idx();
+}
+
+void PythonFileHandle::WriteAll(const_data_ptr_t buffer, idx_t nr_bytes) {
+	idx_t total = 0;
+	while (total < nr_bytes) {
+		auto remaining = nr_bytes - total;
+		auto result = handle.attr("write")(nb::bytes(const_char_ptr_cast(buffer + total), remaining));
+		state->writes++;
+		// fsspec and buffered files write everything, raw files can report a partial write
+		auto written = result.is_none() ? remaining : MinValue(nb::cast<idx_t>(result), remaining);
+		if (written == 0) {
+			throw IOException("Failed to write " + std::to_string(nr_bytes) + " bytes to Python file \"" + path +
+			                  "\": only " + std::to_string(total) + " bytes were written");
+		}
+		total += written;
+	}
+	state->bytes_written += nr_bytes;
+}
+
 void PythonFileHandle::Close() {
 	nb::gil_scoped_acquire gil;
+	// unlike the destructor, a failed flush is reported here, the file object is closed either way
+	try {
+		FlushWrites();
+	} catch (...) {
+		try {
+			handle.attr("close")();
+		} catch (...) { // NOLINT
+		}
+		throw;
+	}
 	handle.attr("close")();
 }
 
@@ -83,64 +453,385 @@ unique_ptr<FileHandle> PythonFilesystem::OpenFile(const string &path, FileOpenFl
 
 	string flags_s = DecodeFlags(flags);
 
-	const auto &handle = filesystem.attr("open")(path, nb::str(flags_s.c_str(), flags_s.size()));
-	return make_uniq<PythonFileHandle>(*this, path, handle, flags);
+	if (flags.OpenForWriting()) {
+		state->Invalidate(path);
+	}
+	nb::object handle;
+	auto &options = state->options;
+	if (flags.OpenForWriting() && options.upload_block_size.IsValid()) {
+		// object store implementations upload what is written in parts of block_size
+		handle = filesystem.attr("open")(path, nb::str(flags_s.c_str(), flags_s.size()),
+		                                 nb::arg("block_size") = options.upload_block_size.GetIndex());
+	} else {
+		handle = filesystem.attr("open")(path, nb::str(flags_s.c_str(), flags_s.size()));
+	}
+	auto result = make_uniq<PythonFileHandle>(*this, path, handle, flags, state);
+	auto context = FileOpener::TryGetClientContext(opener);
+	if (context) {
+		result->context = context->shared_from_this();
+	}
+	if (flags.OpenForWriting()) {
+		result->write_buffer_size = options.write_buffer_size;
+	}
+	if (!flags.OpenForWriting() && nb::hasattr(handle, "seekable")) {
+		// a stream that can't seek (e.g. a socket or a pipe wrapped by a file-like object) is read front to back
+		result->is_pipe = !nb::cast<bool>(handle.attr("seekable")());
+	}
+	if (state->CacheEnabled() && !flags.OpenForWriting() && !result->is_pipe) {
+		InitializeCache(*result);
+	}
+	return std::move(result);
 }
 
-int64_t PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes) {
-	nb::gil_scoped_acquire gil;
+void PythonFilesystem::InitializeCache(PythonFileHandle &handle) {
+	// the size and modification time identify the version of the file, so blocks cached for an older version
+	// (e.g. when the file was changed outside of DuckDB) are not served
+	handle.file_size = GetSize(handle);
+	string modified;
+	try {
+		modified = to_string(GetModified(handle).value);
+	} catch (nb::python_error &) {
+		// not every fsspec implementation reports modification times
+	}
+	handle.cache_key = handle.path + "\n" + to_string(handle.file_size) + "\n" + modified + "\n" +
+	                   to_string(state->GetGeneration(handle.path)) + "\n";
+	handle.cached = true;
+}
 
-	const auto &write = PythonFileHandle::GetHandle(handle).attr("write");
+idx_t PythonFilesystem::GetSize(PythonFileHandle &handle) {
+	if (handle.cached || handle.has_file_size) {
+		return handle.file_size;
+	}
+	// the size of a handle that is being written to changes, so it is only remembered for read-only handles
+	bool read_only = !handle.GetFlags().OpenForWriting();
+	PythonFileMetadata metadata;
+	if (read_only && state->MetadataEnabled() && state->GetMetadata(handle.path, metadata) && metadata.size.IsValid()) {
+		handle.file_size = metadata.size.GetIndex();
+	} else {
+		handle.file_size = nb::cast<idx_t>(filesystem.attr("size")(handle.path));
+		if (read_only && state->MetadataEnabled()) {
+			metadata = PythonFileMetadata();
+			metadata.exists = true;
+			metadata.size = handle.file_size;
+			state->PutMetadata(handle.path, metadata);
+		}
+	}
+	handle.has_file_size = read_only;
+	return handle.file_size;
+}
 
-	auto data = nb::bytes(const_char_ptr_cast(buffer), nr_bytes);
+timestamp_t PythonFilesystem::GetModified(PythonFileHandle &handle) {
+	if (handle.has_last_modified) {
+		return handle.last_modified;
+	}
+	bool read_only = !handle.GetFlags().OpenForWriting();
+	PythonFileMetadata metadata;
+	if (read_only && state->MetadataEnabled() && state->GetMetadata(handle.path, metadata) &&
+	    metadata.has_last_modified) {
+		handle.last_modified = metadata.last_modified;
+	} else {
+		auto last_mod = filesystem.attr("modified")(handle.path);
+		// datetime.timestamp() returns a float; truncate to int64 seconds (nb::cast<int64_t> would reject a float)
+		handle.last_modified = Timestamp::FromEpochSeconds((int64_t)nb::cast<double>(last_mod.attr("timestamp")()));
+		if (read_only && state->MetadataEnabled()) {
+			metadata = PythonFileMetadata();
+			metadata.exists = true;
+			metadata.has_last_modified = true;
+			metadata.last_modified = handle.last_modified;
+			state->PutMetadata(handle.path, metadata);
+		}
+	}
+	handle.has_last_modified = read_only;
+	return handle.last_modified;
+}
 
-	return nb::cast<int64_t>(write(data));
+PythonFileMetadata PythonFilesystem::GetMetadata(const string &path) {
+	PythonFileMetadata metadata;
+	if (state->GetMetadata(path, metadata)) {
+		return metadata;
+	}
+	try {
+		metadata = ParseInfo(filesystem.attr("info")(nb::str(path.c_str(), path.size())));
+	} catch (nb::python_error &e) {
+		if (!e.matches(PyExc_FileNotFoundError)) {
+			throw;
+		}
+	}
+	state->PutMetadata(path, metadata);
+	return metadata;
 }
-void PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes, idx_t location) {
-	nb::gil_scoped_acquire gil;
-	auto &py_handle = PythonFileHandle::GetHandle(handle);
-	py_handle.attr("seek")(location);
-	auto data = nb::bytes(const_char_ptr_cast(buffer), nr_bytes);
-	py_handle.attr("write")(data);
+
+PythonFileMetadata PythonFilesystem::ParseInfo(const nb::handle &info) {
+	PythonFileMetadata metadata;
+	metadata.exists = true;
+	auto type = info.attr("get")("type");
+	metadata.is_directory = !type.is_none() && nb::cast<std::string>(nb::str(type)) == "directory";
+	auto size = info.attr("get")("size");
+	if (!metadata.is_directory && !size.is_none()) {
+		metadata.size = nb::cast<idx_t>(size);
+	}
+	return metadata;
 }
 
-int64_t PythonFilesystem::Read(FileHandle &handle, void *buffer, int64_t nr_bytes) {
+shared_ptr<string> PythonFilesystem::GetBlock(PythonFileHandle &handle, idx_t block_idx, idx_t last_block) {
+	auto key = handle.cache_key + to_string(block_idx);
+	auto block = state->GetBlock(key);
+	if (block) {
+		state->cache_hits++;
+		return block;
+	}
+	shared_ptr<PythonPendingBlock> claimed;
+	auto pending = state->BeginFetch(key, claimed);
+	if (pending) {
+		// another read is fetching this block already
+		state->pending_waits++;
+		return PythonFilesystemState::WaitForFetch(*pending);
+	}
+	state->cache_misses++;
+
+	// fetch the missing blocks of this read in one go, and read ahead when the file is read sequentially
+	auto &options = state->options;
+	auto block_count = (handle.file_size + options.block_size - 1) / options.block_size;
+	auto fetch_end =
+	    MinValue<idx_t>(block_idx + 1 + (block_idx == handle.next_block ? options.read_ahead : 0), block_count);
+	fetch_end = MaxValue<idx_t>(fetch_end, last_block + 1);
+	vector<shared_ptr<PythonPendingBlock>> claimed_blocks {std::move(claimed)};
+	for (idx_t next = block_idx + 1; next < fetch_end; next++) {
+		shared_ptr<PythonPendingBlock> next_claimed;
+		if (state->BeginFetch(handle.cache_key + to_string(next), next_claimed)) {
+			break;
+		}
+		claimed_blocks.push_back(std::move(next_claimed));
+	}
+
+	vector<shared_ptr<string>> fetched;
+	try {
+		fetched = FetchBlocks(handle, block_idx, claimed_blocks.size());
+	} catch (std::exception &ex) {
+		for (idx_t i = 0; i < claimed_blocks.size(); i++) {
+			state->FinishFetch(handle.cache_key + to_string(block_idx + i), *claimed_blocks[i], nullptr, ex.what());
+		}
+		throw;
+	}
+	for (idx_t i = 0; i < claimed_blocks.size(); i++) {
+		state->FinishFetch(handle.cache_key + to_string(block_idx + i), *claimed_blocks[i], fetched[i], string());
+	}
+	return fetched[0];
+}
+
+vector<shared_ptr<string>> PythonFilesystem::FetchBlocks(PythonFileHandle &handle, idx_t block_idx, idx_t block_count) {
+	auto block_size = state->options.block_size;
+	auto location = block_idx * block_size;
+	auto nr_bytes = MinValue<idx_t>((block_idx + block_count) * block_size, handle.file_size) - location;
+
+	vector<shared_ptr<string>> result;
+	if (state->fetch_ranges) {
+		// the claimed blocks are adjacent, they are requested as a single range and split up again
+		auto request = make_shared_ptr<PythonRangeRequest>(handle.path, location, location + nr_bytes);
+		auto data = state->FetchRange(
+		    request, [&](const vector<shared_ptr<PythonRangeRequest>> &requests) { DispatchRanges(requests); });
+		for (idx_t offset = 0; offset < nr_bytes; offset += block_size) {
+			result.push_back(make_shared_ptr<string>(data, offset, MinValue<idx_t>(block_size, nr_bytes - offset)));
+		}
+		return result;
+	}
 	nb::gil_scoped_acquire gil;
+	PythonFileHandle::GetHandle(handle).attr("seek")(location);
+	for (idx_t offset = 0; offset < nr_bytes; offset += block_size) {
+		auto block = make_shared_ptr<string>(MinValue<idx_t>(block_size, nr_bytes - offset), '\0');
+		ReadExactly(handle, data_ptr_cast(&(*block)[0]), block->size(), location + offset);
+		result.push_back(std::move(block));
+	}
+	if (result.size() != block_count) {
+		throw IOException("Failed to read %llu blocks from Python file '%s'", block_count, handle.path);
+	}
+	state->fetches++;
+	state->bytes_fetched += nr_bytes;
+	return result;
+}
 
-	const auto &read = PythonFileHandle::GetHandle(handle).attr("read");
+void PythonFilesystem::DispatchRanges(const vector<shared_ptr<PythonRangeRequest>> &requests) {
+	// merge the requests into the ranges that are sent, in order of file and offset
+	vector<idx_t> order(requests.size());
+	for (idx_t i = 0; i < order.size(); i++) {
+		order[i] = i;
+	}
+	std::sort(order.begin(), order.end(), [&](idx_t a, idx_t b) {
+		auto &left = *requests[a];
+		auto &right = *requests[b];
+		return left.path != right.path ? left.path < right.path : left.start < right.start;
+	});
+	vector<idx_t> request_ranges(requests.size());
+	vector<string> range_paths;
+	vector<idx_t> range_starts;
+	vector<idx_t> range_ends;
+	for (auto i : order) {
+		auto &request = *requests[i];
+		if (range_paths.empty() || range_paths.back() != request.path || request.start > range_ends.back()) {
+			range_paths.push_back(request.path);
+			range_starts.push_back(request.start);
+			range_ends.push_back(request.end);
+		} else {
+			range_ends.back() = MaxValue(range_ends.back(), request.end);
+		}
+		request_ranges[i] = range_paths.size() - 1;
+	}
 
-	nb::bytes data = nb::bytes(read(nr_bytes));
+	vector<string> ranges;
+	{
+		nb::gil_scoped_acquire gil;
+		nb::list paths;
+		nb::list starts;
+		nb::list ends;
+		for (idx_t i = 0; i < range_paths.size(); i++) {
+			paths.append(nb::str(range_paths[i].c_str(), range_paths[i].size()));
+			starts.append(range_starts[i]);
+			ends.append(range_ends[i]);
+		}
+		auto fetched = filesystem.attr("cat_ranges")(paths, starts, ends, nb::arg("on_error") = "raise");
+		for (auto range : fetched) {
+			auto data = nb::cast<nb::bytes>(range);
+			ranges.emplace_back(data.c_str(), data.size());
+		}
+	}
+	if (ranges.size() != range_paths.size()) {
+		throw IOException("Failed to read %llu ranges from Python filesystem: %llu returned", range_paths.size(),
+		                  ranges.size());
+	}
+	state->fetches++;
+	for (idx_t i = 0; i < ranges.size(); i++) {
+		state->bytes_fetched += ranges[i].size();
+	}
 
-	// `buffer` is sized for nr_bytes. A misbehaving fsspec read(n) may return MORE than n bytes; clamp so
-	// the copy can never overflow `buffer`. Returning fewer than nr_bytes is a legal short read (EOF).
-	int64_t data_size = static_cast<int64_t>(data.size());
-	int64_t bytes_to_copy = data_size < nr_bytes ? data_size : nr_bytes;
-	memcpy(buffer, data.c_str(), static_cast<size_t>(bytes_to_copy));
+	for (idx_t i = 0; i < requests.size(); i++) {
+		auto &request = *requests[i];
+		auto &range = ranges[request_ranges[i]];
+		auto offset = request.start - range_starts[request_ranges[i]];
+		auto expected = request.end - request.start;
+		if (range.size() < offset + expected) {
+			auto returned = range.size() > offset ? range.size() - offset : 0;
+			request.error = "Failed to read " + std::to_string(expected) + " bytes from Python file at offset " +
+			                std::to_string(request.start) + ": only " + std::to_string(returned) + " bytes returned";
+			continue;
+		}
+		request.data = range.substr(offset, expected);
+	}
+}
+
+void PythonFilesystem::ReadCached(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location) {
+	if (location + nr_bytes > handle.file_size) {
+		throw IOException("Failed to read " + std::to_string(nr_bytes) + " bytes from Python file at offset " +
+		                  std::to_string(location) + ": the file is only " + std::to_string(handle.file_size) +
+		                  " bytes");
+	}
+	if (nr_bytes == 0) {
+		return;
+	}
+	auto block_size = state->options.block_size;
+	auto last_block = (location + nr_bytes - 1) / block_size;
+	while (nr_bytes > 0) {
+		auto block_idx = location / block_size;
+		auto block = GetBlock(handle, block_idx, last_block);
+		auto offset = location - block_idx * block_size;
+		auto to_copy = MinValue<idx_t>(block->size() - offset, nr_bytes);
+		memcpy(buffer, block->data() + offset, to_copy);
+		buffer += to_copy;
+		location += to_copy;
+		nr_bytes -= to_copy;
+		handle.next_block = block_idx + 1;
+	}
+}
+
+int64_t PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	auto data = static_cast<const_data_ptr_t>(buffer);
+	auto size = UnsafeNumericCast<idx_t>(nr_bytes);
+	// small writes are combined in C++, without taking the GIL
+	if (py_handle.BufferWrite(data, size, optional_idx())) {
+		return nr_bytes;
+	}
+	nb::gil_scoped_acquire gil;
 
-	return bytes_to_copy;
+	py_handle.FlushWrites();
+	if (!py_handle.BufferWrite(data, size, optional_idx())) {
+		py_handle.WriteAll(data, size);
+	}
+	return nr_bytes;
+}
+void PythonFilesystem::Write(FileHandle &handle, void *buffer, int64_t nr_bytes, idx_t location) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	auto data = static_cast<const_data_ptr_t>(buffer);
+	auto size = UnsafeNumericCast<idx_t>(nr_bytes);
+	// consecutive positional writes are combined, so they take a single seek and write
+	if (py_handle.BufferWrite(data, size, location)) {
+		return;
+	}
+	nb::gil_scoped_acquire gil;
+
+	py_handle.FlushWrites();
+	if (!py_handle.BufferWrite(data, size, location)) {
+		PythonFileHandle::GetHandle(handle).attr("seek")(location);
+		py_handle.WriteAll(data, size);
+	}
+}
+
+int64_t PythonFilesystem::Read(FileHandle &handle, void *buffer, int64_t nr_bytes) {
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.cached) {
+		auto to_read = MinValue<idx_t>(UnsafeNumericCast<idx_t>(nr_bytes),
+		                               py_handle.file_size - MinValue(py_handle.position, py_handle.file_size));
+		ReadCached(py_handle, static_cast<data_ptr_t>(buffer), to_read, py_handle.position);
+		py_handle.position += to_read;
+		return UnsafeNumericCast<int64_t>(to_read);
+	}
+	nb::gil_scoped_acquire gil;
+	py_handle.FlushWrites();
+	return UnsafeNumericCast<int64_t>(
+	    py_handle.ReadInto(static_cast<data_ptr_t>(buffer), UnsafeNumericCast<idx_t>(nr_bytes)));
 }
 
 void PythonFilesystem::Read(duckdb::FileHandle &handle, void *buffer, int64_t nr_bytes, uint64_t location) {
+	auto &cached_handle = handle.Cast<PythonFileHandle>();
+	if (cached_handle.cached) {
+		ReadCached(cached_handle, static_cast<data_ptr_t>(buffer), UnsafeNumericCast<idx_t>(nr_bytes), location);
+		return;
+	}
 	nb::gil_scoped_acquire gil;
-	auto &py_handle = PythonFileHandle::GetHandle(handle);
-	py_handle.attr("seek")(location);
-	nb::bytes data = nb::bytes(py_handle.attr("read")(nr_bytes));
-	// This overload must populate exactly nr_bytes: DuckDB assumes the whole buffer is filled. A short read
+	cached_handle.FlushWrites();
+	PythonFileHandle::GetHandle(handle).attr("seek")(location);
+	ReadExactly(cached_handle, static_cast<data_ptr_t>(buffer), UnsafeNumericCast<idx_t>(nr_bytes), location);
+}
+
+void PythonFilesystem::ReadExactly(PythonFileHandle &handle, data_ptr_t buffer, idx_t nr_bytes, idx_t location) {
+	// Positional reads must populate exactly nr_bytes: DuckDB assumes the whole buffer is filled. A short read
 	// would leave the tail uninitialized (garbage handed back to the engine), so surface it as an error.
-	// A read returning more than nr_bytes is clamped so it can never overflow `buffer`.
-	int64_t data_size = static_cast<int64_t>(data.size());
-	if (data_size < nr_bytes) {
-		throw IOException("Failed to read " + std::to_string(nr_bytes) + " bytes from Python file at offset " +
-		                  std::to_string(location) + ": only " + std::to_string(data_size) + " bytes returned");
+	idx_t total = 0;
+	while (total < nr_bytes) {
+		auto bytes_read = handle.ReadInto(buffer + total, nr_bytes - total);
+		if (bytes_read == 0) {
+			throw IOException("Failed to read " + std::to_string(nr_bytes) + " bytes from Python file at offset " +
+			                  std::to_string(location) + ": only " + std::to_string(total) + " bytes returned");
+		}
+		total += bytes_read;
 	}
-	memcpy(buffer, data.c_str(), static_cast<size_t>(nr_bytes));
 }
 bool PythonFilesystem::FileExists(const string &filename, optional_ptr<FileOpener> opener) {
 	return Exists(filename, "isfile");
 }
-bool PythonFilesystem::Exists(const string &filename, const char *func_name) const {
+bool PythonFilesystem::Exists(const string &filename, const char *func_name) {
 	nb::gil_scoped_acquire gil;
 
+	if (state->MetadataEnabled()) {
+		PythonFileMetadata metadata;
+		try {
+			metadata = GetMetadata(filename);
+		} catch (nb::python_error &) {
+			// like isfile() and isdir(), a path that can't be inspected doesn't exist
+			return false;
+		}
+		bool is_directory = strcmp(func_name, "isdir") == 0;
+		return metadata.exists && metadata.is_directory == is_directory;
+	}
 	return nb::cast<bool>(filesystem.attr(func_name)(filename));
 }
 vector<OpenFileInfo> PythonFilesystem::Glob(const string &path, FileOpener *opener) {
@@ -149,10 +840,31 @@ vector<OpenFileInfo> PythonFilesystem::Glob(const string &path, FileOpener *open
 	if (path.empty()) {
 		return {path};
 	}
-	auto returner = nb::list(filesystem.attr("glob")(path));
-
 	vector<OpenFileInfo> results;
 	auto unstrip_protocol = filesystem.attr("unstrip_protocol");
+	if (state->MetadataEnabled()) {
+		// glob(detail=True) returns the info of every match from a single find(), so the files don't have to be
+		// inspected one by one, and the result is reused by later globs (e.g. when the scan is bound again)
+		PythonFileListing listing;
+		auto key = "glob\n" + path;
+		if (!state->GetListing(key, listing)) {
+			auto matches = filesystem.attr("glob")(path, nb::arg("detail") = true);
+			for (auto item : matches.attr("items")()) {
+				auto name = nb::cast<std::string>(nb::str(item[0]));
+				auto metadata = ParseInfo(item[1]);
+				state->PutMetadata(name, metadata);
+				listing.files.push_back(nb::cast<std::string>(unstrip_protocol(name)));
+				listing.is_directory.push_back(metadata.is_directory);
+			}
+			state->PutListing(key, listing);
+		}
+		for (auto &file : listing.files) {
+			results.emplace_back(file);
+		}
+		return results;
+	}
+	auto returner = nb::list(filesystem.attr("glob")(path));
+
 	for (auto item : returner) {
 		string file_path = nb::cast<std::string>(unstrip_protocol(nb::str(item)));
 		results.emplace_back(file_path);
@@ -164,14 +876,24 @@ string PythonFilesystem::PathSeparator(const string &path) {
 }
 int64_t PythonFilesystem::GetFileSize(FileHandle &handle) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
-	// TODO: this value should be cached on the PythonFileHandle
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.cached || py_handle.has_file_size) {
+		return UnsafeNumericCast<int64_t>(py_handle.file_size);
+	}
 	nb::gil_scoped_acquire gil;
+	py_handle.FlushWrites();
 
-	return nb::cast<int64_t>(filesystem.attr("size")(handle.path));
+	return UnsafeNumericCast<int64_t>(GetSize(py_handle));
 }
 void PythonFilesystem::Seek(duckdb::FileHandle &handle, uint64_t location) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.cached) {
+		py_handle.position = location;
+		return;
+	}
 	nb::gil_scoped_acquire gil;
+	py_handle.FlushWrites();
 
 	auto seek = PythonFileHandle::GetHandle(handle).attr("seek");
 	seek(location);
@@ -190,6 +912,8 @@ bool PythonFilesystem::CanHandleFile(const string &fpath) {
 }
 void PythonFilesystem::MoveFile(const string &source, const string &dest, optional_ptr<FileOpener> opener) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	state->Invalidate(source);
+	state->Invalidate(dest);
 	nb::gil_scoped_acquire gil;
 
 	auto move = filesystem.attr("mv");
@@ -197,6 +921,7 @@ void PythonFilesystem::MoveFile(const string &source, const string &dest, option
 }
 void PythonFilesystem::RemoveFile(const string &filename, optional_ptr<FileOpener> opener) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	state->Invalidate(filename);
 	nb::gil_scoped_acquire gil;
 
 	auto remove = filesystem.attr("rm");
@@ -204,17 +929,18 @@ void PythonFilesystem::RemoveFile(const string &filename, optional_ptr<FileOpene
 }
 timestamp_t PythonFilesystem::GetLastModifiedTime(FileHandle &handle) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
-	// TODO: this value should be cached on the PythonFileHandle
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.has_last_modified) {
+		return py_handle.last_modified;
+	}
 	nb::gil_scoped_acquire gil;
 
-	auto last_mod = filesystem.attr("modified")(handle.path);
-
-	// datetime.timestamp() returns a float; truncate to int64 seconds (nb::cast<int64_t> would reject a float)
-	return Timestamp::FromEpochSeconds((int64_t)nb::cast<double>(last_mod.attr("timestamp")()));
+	return GetModified(py_handle);
 }
 void PythonFilesystem::FileSync(FileHandle &handle) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
 	nb::gil_scoped_acquire gil;
+	handle.Cast<PythonFileHandle>().FlushWrites();
 
 	PythonFileHandle::GetHandle(handle).attr("flush")();
 }
@@ -223,12 +949,14 @@ bool PythonFilesystem::DirectoryExists(const string &directory, optional_ptr<Fil
 }
 void PythonFilesystem::RemoveDirectory(const string &directory, optional_ptr<FileOpener> opener) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	state->Invalidate(directory);
 	nb::gil_scoped_acquire gil;
 
 	filesystem.attr("rm")(directory, nb::arg("recursive") = true);
 }
 void PythonFilesystem::CreateDirectory(const string &directory, optional_ptr<FileOpener> opener) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	state->Invalidate(directory);
 	nb::gil_scoped_acquire gil;
 
 	filesystem.attr("mkdir")(nb::str(directory.c_str(), directory.size()));
@@ -237,19 +965,33 @@ bool PythonFilesystem::ListFiles(const string &directory, const std::function<vo
                                  FileOpener *opener) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
 	nb::gil_scoped_acquire gil;
-	bool nonempty = false;
 
-	for (auto item : filesystem.attr("ls")(nb::str(directory.c_str(), directory.size()))) {
-		bool is_dir = nb::cast<std::string>(item["type"]) == "directory";
-		callback(nb::cast<std::string>(item["name"]), is_dir);
-		nonempty = true;
+	PythonFileListing listing;
+	auto key = "ls\n" + directory;
+	if (!state->MetadataEnabled() || !state->GetListing(key, listing)) {
+		for (auto item : filesystem.attr("ls")(nb::str(directory.c_str(), directory.size()))) {
+			auto name = nb::cast<std::string>(item["name"]);
+			bool is_dir = nb::cast<std::string>(item["type"]) == "directory";
+			if (state->MetadataEnabled()) {
+				state->PutMetadata(name, ParseInfo(item));
+			}
+			listing.files.push_back(std::move(name));
+			listing.is_directory.push_back(is_dir);
+		}
+		if (state->MetadataEnabled()) {
+			state->PutListing(key, listing);
+		}
 	}
-
-	return nonempty;
+	for (idx_t i = 0; i < listing.files.size(); i++) {
+		callback(listing.files[i], listing.is_directory[i]);
+	}
+	return !listing.files.empty();
 }
 void PythonFilesystem::Truncate(FileHandle &handle, int64_t new_size) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	state->Invalidate(handle.path);
 	nb::gil_scoped_acquire gil;
+	handle.Cast<PythonFileHandle>().FlushWrites();
 
 	filesystem.attr("touch")(handle.path, nb::arg("truncate") = true);
 }
@@ -258,7 +1000,12 @@ bool PythonFilesystem::IsPipe(const string &filename, optional_ptr<FileOpener> o
 }
 idx_t PythonFilesystem::SeekPosition(FileHandle &handle) {
 	D_ASSERT(!duckdb::PyUtil::GilCheck());
+	auto &py_handle = handle.Cast<PythonFileHandle>();
+	if (py_handle.cached) {
+		return py_handle.position;
+	}
 	nb::gil_scoped_acquire gil;
+	py_handle.FlushWrites();
 
 	return nb::cast<idx_t>(PythonFileHandle::GetHandle(handle).attr("tell")());
 }
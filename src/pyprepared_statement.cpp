@@ -0,0 +1,163 @@
+#include "duckdb_python/pyprepared_statement.hpp"
+
+#include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/pytype.hpp"
+
+namespace duckdb {
+
+static void InitializeReadOnlyProperties(nb::class_<DuckDBPyPreparedStatement> &m) {
+	m.def_prop_ro("query", &DuckDBPyPreparedStatement::Query, "Get the query of the prepared statement.")
+	    .def_prop_ro("type", &DuckDBPyPreparedStatement::Type, "Get the type of the statement.")
+	    .def_prop_ro("parameter_types", &DuckDBPyPreparedStatement::ParameterTypes,
+	                 "Get the parameters of the statement by name, with their types or None if the type is decided "
+	                 "by the values passed to execute.")
+	    .def_prop_ro("columns", &DuckDBPyPreparedStatement::Columns,
+	                 "Get the names of the columns of the result produced by this statement.")
+	    .def_prop_ro("types", &DuckDBPyPreparedStatement::ColumnTypes,
+	                 "Get the types of the columns of the result produced by this statement.")
+	    .def_prop_ro(
+	        "description", [](const DuckDBPyPreparedStatement &self) { return self.GetConnection().GetDescription(); },
+	        "Get result set attributes of the last execution, mainly column names");
+}
+
+static void InitializeConsumers(nb::class_<DuckDBPyPreparedStatement> &m) {
+	// Execute returns *this, reference_internal returns the existing object instead of a copy
+	m.def("execute", &DuckDBPyPreparedStatement::Execute, nb::rv_policy::reference_internal,
+	      "Execute the prepared statement with the given parameters", nb::arg("parameters") = nb::none());
+	m.def("executemany", &DuckDBPyPreparedStatement::ExecuteMany, nb::rv_policy::reference_internal,
+	      "Execute the prepared statement once for every parameter set in parameters", nb::arg("parameters"));
+	m.def("close", &DuckDBPyPreparedStatement::Close, "Release the prepared statement");
+
+	m.def(
+	    "fetchone", [](DuckDBPyPreparedStatement &self) { return self.GetConnection().FetchOne(); },
+	    "Fetch a single row from a result following execute");
+	m.def(
+	    "fetchmany", [](DuckDBPyPreparedStatement &self, idx_t size) { return self.GetConnection().FetchMany(size); },
+	    "Fetch the next set of rows from a result following execute", nb::arg("size") = 1);
+	m.def(
+	    "fetchall", [](DuckDBPyPreparedStatement &self) { return self.GetConnection().FetchAll(); },
+	    "Fetch all rows from a result following execute");
+	m.def(
+	    "fetchnumpy", [](DuckDBPyPreparedStatement &self) { return self.GetConnection().FetchNumpy(); },
+	    "Fetch a result as list of NumPy arrays following execute");
+	for (auto name : {"fetchdf", "fetch_df", "df"}) {
+		m.def(
+		    name,
+		    [](DuckDBPyPreparedStatement &self, bool date_as_object) {
+			    return self.GetConnection().FetchDF(date_as_object);
+		    },
+		    "Fetch a result as DataFrame following execute()", nb::kw_only(), nb::arg("date_as_object") = false);
+	}
+	m.def(
+	    "fetch_df_chunk",
+	    [](DuckDBPyPreparedStatement &self, idx_t vectors_per_chunk, bool date_as_object) {
+		    return self.GetConnection().FetchDFChunk(vectors_per_chunk, date_as_object);
+	    },
+	    "Fetch a chunk of the result as DataFrame following execute()", nb::arg("vectors_per_chunk") = 1, nb::kw_only(),
+	    nb::arg("date_as_object") = false);
+	m.def(
+	    "pl",
+	    [](DuckDBPyPreparedStatement &self, idx_t rows_per_batch, bool lazy) {
+		    return self.GetConnection().FetchPolars(rows_per_batch, lazy);
+	    },
+	    "Fetch a result as Polars DataFrame following execute()", nb::arg("rows_per_batch") = 1000000, nb::kw_only(),
+	    nb::arg("lazy") = false);
+	m.def(
+	    "to_arrow_table",
+	    [](DuckDBPyPreparedStatement &self, idx_t batch_size) { return self.GetConnection().FetchArrow(batch_size); },
+	    "Fetch a result as Arrow table following execute()", nb::arg("batch_size") = 1000000);
+	m.def(
+	    "to_arrow_reader",
+	    [](DuckDBPyPreparedStatement &self, idx_t batch_size) {
+		    return self.GetConnection().FetchRecordBatchReader(batch_size);
+	    },
+	    "Fetch an Arrow RecordBatchReader following execute()", nb::arg("batch_size") = 1000000);
+}
+
+void DuckDBPyPreparedStatement::Initialize(nb::handle &m) {
+	// nanobind types aren't weak-referenceable by default.
+	auto prepared_module = nb::class_<DuckDBPyPreparedStatement>(m, "PreparedStatement", nb::is_weak_referenceable());
+	InitializeReadOnlyProperties(prepared_module);
+	InitializeConsumers(prepared_module);
+}
+
+DuckDBPyPreparedStatement::DuckDBPyPreparedStatement(std::shared_ptr<DuckDBPyConnection> connection_p,
+                                                     unique_ptr<PreparedStatement> prepared_p)
+    : connection(std::move(connection_p)), prepared(std::move(prepared_p)) {
+}
+
+DuckDBPyConnection &DuckDBPyPreparedStatement::GetConnection() const {
+	return *connection;
+}
+
+PreparedStatement &DuckDBPyPreparedStatement::GetPrepared() const {
+	if (!prepared) {
+		throw InvalidInputException("This prepared statement has already been closed");
+	}
+	return *prepared;
+}
+
+DuckDBPyPreparedStatement &DuckDBPyPreparedStatement::Execute(nb::object params) {
+	connection->ExecutePrepared(GetPrepared(), std::move(params), binder);
+	return *this;
+}
+
+DuckDBPyPreparedStatement &DuckDBPyPreparedStatement::ExecuteMany(nb::object params) {
+	connection->ExecutePreparedMany(GetPrepared(), std::move(params), binder);
+	return *this;
+}
+
+void DuckDBPyPreparedStatement::Close() {
+	prepared.reset();
+	binder = PythonParameterBinder();
+}
+
+string DuckDBPyPreparedStatement::Query() const {
+	return GetPrepared().query;
+}
+
+StatementType DuckDBPyPreparedStatement::Type() const {
+	return GetPrepared().GetStatementType();
+}
+
+nb::dict DuckDBPyPreparedStatement::ParameterTypes() const {
+	auto &prep = GetPrepared();
+	// the value map only holds the parameters whose type could be resolved while binding
+	auto expected_types = prep.GetExpectedParameterTypes();
+	vector<pair<idx_t, string>> parameters;
+	for (auto &entry : prep.named_param_map) {
+		parameters.emplace_back(entry.second, entry.first.GetIdentifierName());
+	}
+	std::sort(parameters.begin(), parameters.end());
+	nb::dict result;
+	for (auto &parameter : parameters) {
+		auto &name = parameter.second;
+		auto entry = expected_types.find(name);
+		if (entry == expected_types.end() || entry->second.id() == LogicalTypeId::UNKNOWN) {
+			result[name.c_str()] = nb::none();
+		} else {
+			result[name.c_str()] = DuckDBPyType(entry->second);
+		}
+	}
+	return result;
+}
+
+nb::list DuckDBPyPreparedStatement::Columns() const {
+	nb::list res;
+	for (auto &name : GetPrepared().GetNames()) {
+		res.append(name.GetIdentifierName());
+	}
+	return res;
+}
+
+nb::list DuckDBPyPreparedStatement::ColumnTypes() const {
+	nb::list res;
+	for (auto &type : GetPrepared().GetTypes()) {
+		res.append(DuckDBPyType(type));
+	}
+	return res;
+}
+
+} // namespace duckdb
@@ -0,0 +1,202 @@
+#include "duckdb_python/pyquery_future.hpp"
+
+#include "duckdb/parser/sql_statement.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/pyrelation.hpp"
+#include "duckdb_python/pyresult.hpp"
+
+#include <chrono>
+
+namespace duckdb {
+
+void DuckDBPyQueryFuture::Initialize(nb::handle &m) {
+	auto future_class = nb::class_<DuckDBPyQueryFuture>(m, "QueryFuture");
+	future_class.def("result", &DuckDBPyQueryFuture::Result,
+	                 "Wait for the query to finish and return its result as a relation, raising its error if it "
+	                 "failed. Raises TimeoutError when it did not finish within timeout seconds",
+	                 nb::arg("timeout") = nb::none());
+	future_class.def("done", &DuckDBPyQueryFuture::Done, "Whether the query finished");
+	future_class.def("cancel", &DuckDBPyQueryFuture::Cancel,
+	                 "Interrupt the query, returns False if it already finished");
+	future_class.def("cancelled", &DuckDBPyQueryFuture::Cancelled, "Whether cancel interrupted the query");
+	future_class.def("progress", &DuckDBPyQueryFuture::Progress,
+	                 "Progress of the query as a percentage, -1 if it can't be determined");
+}
+
+DuckDBPyQueryFuture::DuckDBPyQueryFuture(std::shared_ptr<DuckDBPyConnection> connection_p)
+    : connection(std::move(connection_p)) {
+	thread = std::thread(&DuckDBPyQueryFuture::Run, this);
+}
+
+DuckDBPyQueryFuture::~DuckDBPyQueryFuture() {
+	if (!thread.joinable()) {
+		return;
+	}
+	// the connection can't be released before the query stopped, the thread uses it
+	Cancel();
+	Abort();
+	if (duckdb::PyUtil::GilCheck()) {
+		nb::gil_scoped_release release;
+		thread.join();
+	} else {
+		thread.join();
+	}
+}
+
+void DuckDBPyQueryFuture::WaitForConnection() {
+	auto stats = connection->GetBindingStats();
+	InstrumentedGILRelease release(stats);
+	PythonBindingStatsScope wait(stats, PythonBindingMetric::CONNECTION_LOCK_WAIT);
+	unique_lock<mutex> guard(lock);
+	handoff_condition.wait(guard, [&]() { return connection_locked; });
+}
+
+void DuckDBPyQueryFuture::Start(unique_ptr<PendingQueryResult> pending_query_p) {
+	lock_guard<mutex> guard(lock);
+	D_ASSERT(connection_locked && !handed_over);
+	pending_query = std::move(pending_query_p);
+	handed_over = true;
+	started = true;
+	handoff_condition.notify_all();
+}
+
+void DuckDBPyQueryFuture::Abort() {
+	lock_guard<mutex> guard(lock);
+	if (handed_over) {
+		return;
+	}
+	handed_over = true;
+	handoff_condition.notify_all();
+}
+
+void DuckDBPyQueryFuture::Run() {
+	unique_ptr<QueryResult> query_result;
+	ErrorData query_error;
+	{
+		// held while submit binds the query and until it finished, Python scans and UDFs acquire the GIL themselves
+		unique_lock<std::recursive_mutex> connection_lock(connection->py_connection_lock);
+		unique_ptr<PendingQueryResult> pending;
+		{
+			unique_lock<mutex> guard(lock);
+			connection_locked = true;
+			handoff_condition.notify_all();
+			handoff_condition.wait(guard, [&]() { return handed_over; });
+			pending = std::move(pending_query);
+		}
+		if (pending) {
+			try {
+				if (cancelled) {
+					throw InterruptException();
+				}
+				PendingExecutionResult execution_result;
+				while (!PendingQueryResult::IsResultReady(execution_result = pending->ExecuteTask())) {
+					if (cancelled) {
+						throw InterruptException();
+					}
+					if (execution_result == PendingExecutionResult::BLOCKED) {
+						pending->WaitForTask();
+					}
+				}
+				if (execution_result == PendingExecutionResult::EXECUTION_ERROR) {
+					pending->ThrowError();
+				}
+				query_result = pending->Execute();
+				if (query_result->HasError()) {
+					query_result->ThrowError();
+				}
+			} catch (std::exception &ex) {
+				query_result.reset();
+				query_error = ErrorData(ex);
+			}
+		}
+	}
+	lock_guard<mutex> guard(lock);
+	result = std::move(query_result);
+	error = std::move(query_error);
+	finished = true;
+	finished_condition.notify_all();
+}
+
+bool DuckDBPyQueryFuture::Wait(const nb::object &timeout) {
+	using clock = std::chrono::steady_clock;
+	auto deadline = clock::time_point::max();
+	if (!timeout.is_none()) {
+		auto seconds = nb::cast<double>(timeout);
+		deadline = clock::now() + std::chrono::duration_cast<clock::duration>(std::chrono::duration<double>(seconds));
+	}
+	while (true) {
+		{
+			nb::gil_scoped_release release;
+			unique_lock<mutex> guard(lock);
+			// wake up regularly to let Ctrl-C interrupt the wait
+			auto wakeup = MinValue(deadline, clock::now() + std::chrono::milliseconds(100));
+			if (finished_condition.wait_until(guard, wakeup, [&]() { return finished; })) {
+				return true;
+			}
+		}
+		if (PyErr_CheckSignals() != 0) {
+			throw nb::python_error();
+		}
+		if (clock::now() >= deadline) {
+			return false;
+		}
+	}
+}
+
+nb::object DuckDBPyQueryFuture::Result(const nb::object &timeout) {
+	if (!Wait(timeout)) {
+		PyErr_SetString(PyExc_TimeoutError, "The query did not finish within the timeout");
+		throw nb::python_error();
+	}
+	if (thread.joinable()) {
+		thread.join();
+	}
+	if (error.HasError()) {
+		error.Throw();
+	}
+	if (!relation.is_valid()) {
+		auto py_relation = std::make_unique<DuckDBPyRelation>(
+		    std::make_shared<DuckDBPyResult>(std::move(result), connection->GetBindingStats()));
+		py_relation->SetConnectionOwner(nb::cast(connection));
+		relation = nb::cast(py_relation.release(), nb::rv_policy::take_ownership);
+	}
+	return relation;
+}
+
+bool DuckDBPyQueryFuture::Done() {
+	lock_guard<mutex> guard(lock);
+	return finished;
+}
+
+bool DuckDBPyQueryFuture::Cancel() {
+	lock_guard<mutex> guard(lock);
+	if (finished) {
+		return false;
+	}
+	cancelled = true;
+	// also stops a task that runs for a long time, the thread only checks the flag between tasks. Until the query was
+	// handed to the thread it may still be bound, the thread checks the flag before it executes it
+	if (started && !connection->con.ConnectionIsClosed()) {
+		connection->con.GetConnection().Interrupt();
+	}
+	return true;
+}
+
+bool DuckDBPyQueryFuture::Cancelled() {
+	return cancelled;
+}
+
+double DuckDBPyQueryFuture::Progress() {
+	{
+		lock_guard<mutex> guard(lock);
+		if (finished) {
+			return error.HasError() ? -1 : 100;
+		}
+	}
+	if (!started) {
+		return 0;
+	}
+	return connection->con.GetConnection().GetQueryProgress();
+}
+
+} // namespace duckdb
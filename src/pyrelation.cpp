@@ -1,6 +1,7 @@
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/pyfilesystem.hpp"
 #include "duckdb_python/pytype.hpp"
 #include "duckdb_python/pyresult.hpp"
 #include "duckdb/parser/qualified_name.hpp"
@@ -796,6 +797,7 @@ std::unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Distinct() {
 }
 
 duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::FetchRecordBatchReader(idx_t rows_per_batch) {
+	RelationLockGuard relation_lock(*this);
 	AssertResult();
 	return result->FetchRecordBatchReader(rows_per_batch);
 }
@@ -806,9 +808,10 @@ static unique_ptr<QueryResult> PyExecuteRelation(const shared_ptr<Relation> &rel
 	}
 	auto context = rel->context->GetContext();
 	D_ASSERT(duckdb::PyUtil::GilCheck());
-	nb::gil_scoped_release release;
+	auto stats = PythonBindingStats::Get(*context);
+	InstrumentedGILRelease release(stats);
 	auto pending_query = context->PendingQuery(rel, stream_result);
-	return DuckDBPyConnection::CompletePendingQuery(*pending_query);
+	return DuckDBPyConnection::CompletePendingQuery(*pending_query, stats);
 }
 
 unique_ptr<QueryResult> DuckDBPyRelation::ExecuteInternal(bool stream_result) {
@@ -818,6 +821,7 @@ unique_ptr<QueryResult> DuckDBPyRelation::ExecuteInternal(bool stream_result) {
 
 void DuckDBPyRelation::ExecuteOrThrow(bool stream_result) {
 	nb::gil_scoped_acquire gil;
+	RelationLockGuard relation_lock(*this);
 	result.reset();
 	auto query_result = ExecuteInternal(stream_result);
 	if (!query_result) {
@@ -826,10 +830,12 @@ void DuckDBPyRelation::ExecuteOrThrow(bool stream_result) {
 	if (query_result->HasError()) {
 		query_result->ThrowError();
 	}
-	result = std::make_unique<DuckDBPyResult>(std::move(query_result));
+	result =
+	    std::make_unique<DuckDBPyResult>(std::move(query_result), PythonBindingStats::Get(*rel->context->GetContext()));
 }
 
 PandasDataFrame DuckDBPyRelation::FetchDF(bool date_as_object) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::none();
@@ -845,6 +851,7 @@ PandasDataFrame DuckDBPyRelation::FetchDF(bool date_as_object) {
 }
 
 Optional<nb::tuple> DuckDBPyRelation::FetchOne() {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::none();
@@ -858,6 +865,7 @@ Optional<nb::tuple> DuckDBPyRelation::FetchOne() {
 }
 
 nb::list DuckDBPyRelation::FetchMany(idx_t size) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::list();
@@ -872,6 +880,7 @@ nb::list DuckDBPyRelation::FetchMany(idx_t size) {
 }
 
 nb::list DuckDBPyRelation::FetchAll() {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::list();
@@ -887,6 +896,7 @@ nb::list DuckDBPyRelation::FetchAll() {
 }
 
 nb::dict DuckDBPyRelation::FetchNumpy() {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::borrow<nb::dict>(nb::none());
@@ -902,6 +912,7 @@ nb::dict DuckDBPyRelation::FetchNumpy() {
 }
 
 nb::dict DuckDBPyRelation::FetchPyTorch() {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::borrow<nb::dict>(nb::none());
@@ -917,6 +928,7 @@ nb::dict DuckDBPyRelation::FetchPyTorch() {
 }
 
 nb::dict DuckDBPyRelation::FetchTF() {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::borrow<nb::dict>(nb::none());
@@ -932,6 +944,7 @@ nb::dict DuckDBPyRelation::FetchTF() {
 }
 
 nb::dict DuckDBPyRelation::FetchNumpyInternal(bool stream, idx_t vectors_per_chunk) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::borrow<nb::dict>(nb::none());
@@ -946,6 +959,7 @@ nb::dict DuckDBPyRelation::FetchNumpyInternal(bool stream, idx_t vectors_per_chu
 
 //! Should this also keep track of when the result is empty and set result->result_closed accordingly?
 PandasDataFrame DuckDBPyRelation::FetchDFChunk(idx_t vectors_per_chunk, bool date_as_object) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::none();
@@ -957,6 +971,7 @@ PandasDataFrame DuckDBPyRelation::FetchDFChunk(idx_t vectors_per_chunk, bool dat
 }
 
 pyarrow::Table DuckDBPyRelation::ToArrowTableInternal(idx_t batch_size, bool to_polars) {
+	RelationLockGuard relation_lock(*this);
 	if (!result && !rel) {
 		return nb::none();
 	}
@@ -983,6 +998,7 @@ duckdb::pyarrow::Table DuckDBPyRelation::ToArrowTable(idx_t batch_size) {
 }
 
 nb::object DuckDBPyRelation::ToArrowCapsule(const nb::object &requested_schema) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::none();
@@ -1031,6 +1047,7 @@ PolarsDataFrame DuckDBPyRelation::ToPolars(idx_t batch_size, bool lazy) {
 }
 
 duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_size) {
+	RelationLockGuard relation_lock(*this);
 	if (!result) {
 		if (!rel) {
 			return nb::none();
@@ -1044,7 +1061,17 @@ duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_s
 	return res;
 }
 
+nb::object DuckDBPyRelation::ToSharedMemory(const string &name, idx_t batch_size) {
+	auto reader = ToRecordBatch(batch_size);
+	if (reader.is_none()) {
+		throw InvalidInputException("This relation does not produce a result that can be shared");
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	return import_cache.duckdb.shared_memory._export_shared_result()(reader, name);
+}
+
 void DuckDBPyRelation::Close() {
+	RelationLockGuard relation_lock(*this);
 	// We always want to execute the query at least once, for side-effect purposes.
 	// if it has already been executed, we don't need to do it again.
 	if (!executed && !result) {
@@ -1253,7 +1280,71 @@ static Value NestedDictToStruct(const nb::object &dictionary) {
 	return Value::STRUCT(std::move(children));
 }
 
-void DuckDBPyRelation::ToParquet(const string &filename, const nb::object &compression, const nb::object &field_ids,
+//! The file a relation is written to. A writable file-like object is registered in the object store of the
+//! connection for the duration of the write, DuckDB streams the file into it through the Python filesystem.
+class WriteTarget {
+public:
+	WriteTarget(const nb::object &file_name, const nb::object &connection_owner, const char *method) {
+		if (nb::isinstance<nb::str>(file_name)) {
+			path = nb::cast<std::string>(file_name);
+			return;
+		}
+		if (nb::isinstance<nb::bytes>(file_name) || nb::hasattr(file_name, "__fspath__")) {
+			auto fsdecode = nb::module_::import_("os").attr("fsdecode");
+			path = nb::cast<std::string>(nb::str(fsdecode(file_name)));
+			return;
+		}
+		if (!nb::hasattr(file_name, "write")) {
+			throw InvalidInputException("%s only accepts 'file_name' as a path or a writable file-like object", method);
+		}
+		if (connection_owner.is_none()) {
+			throw InvalidInputException("%s can only write to a file-like object from a relation of a connection",
+			                            method);
+		}
+		auto &connection = nb::cast<DuckDBPyConnection &>(connection_owner);
+		object_store = &connection.GetObjectFileSystem();
+		path = StringUtil::Format("%s://%s", "DUCKDB_INTERNAL_OBJECTSTORE", StringUtil::GenerateRandomName());
+		object_store->attr("add_writer")(file_name, path);
+	}
+	~WriteTarget() {
+		if (!object_store) {
+			return;
+		}
+		try {
+			object_store->attr("delete")(path);
+		} catch (...) { // NOLINT
+		}
+	}
+
+	//! A file-like object receives exactly one file, written in place
+	void CheckOptions(case_insensitive_map_t<vector<Value>> &options, const char *method) {
+		if (!object_store) {
+			return;
+		}
+		for (auto name :
+		     {"partition_by", "per_thread_output", "file_size_bytes", "filename_pattern", "append", "use_tmp_file"}) {
+			auto entry = options.find(name);
+			if (entry == options.end()) {
+				continue;
+			}
+			auto &values = entry->second;
+			if (values.size() == 1 && values[0].type() == LogicalType::BOOLEAN && !BooleanValue::Get(values[0])) {
+				continue;
+			}
+			throw InvalidInputException("%s writes a single file to a file-like object, '%s' is not supported", method,
+			                            name);
+		}
+		options["use_tmp_file"] = {Value::BOOLEAN(false)};
+	}
+
+public:
+	string path;
+
+private:
+	optional_ptr<ModifiedMemoryFileSystem> object_store;
+};
+
+void DuckDBPyRelation::ToParquet(const nb::object &filename, const nb::object &compression, const nb::object &field_ids,
                                  const nb::object &row_group_size_bytes, const nb::object &row_group_size,
                                  const nb::object &overwrite, const nb::object &per_thread_output,
                                  const nb::object &use_tmp_file, const nb::object &partition_by,
@@ -1367,11 +1458,13 @@ void DuckDBPyRelation::ToParquet(const string &filename, const nb::object &compr
 		}
 	}
 
-	auto write_parquet = rel->WriteParquetRel(filename, std::move(options));
+	WriteTarget target(filename, connection_owner, "to_parquet");
+	target.CheckOptions(options, "to_parquet");
+	auto write_parquet = rel->WriteParquetRel(target.path, std::move(options));
 	PyExecuteRelation(write_parquet);
 }
 
-void DuckDBPyRelation::ToCSV(const string &filename, const nb::object &sep, const nb::object &na_rep,
+void DuckDBPyRelation::ToCSV(const nb::object &filename, const nb::object &sep, const nb::object &na_rep,
                              const nb::object &header, const nb::object &quotechar, const nb::object &escapechar,
                              const nb::object &date_format, const nb::object &timestamp_format,
                              const nb::object &quoting, const nb::object &encoding, const nb::object &compression,
@@ -1511,7 +1604,9 @@ void DuckDBPyRelation::ToCSV(const string &filename, const nb::object &sep, cons
 		options["write_partition_columns"] = {Value::BOOLEAN((bool)nb::bool_(write_partition_columns))};
 	}
 
-	auto write_csv = rel->WriteCSVRel(filename, std::move(options));
+	WriteTarget target(filename, connection_owner, "to_csv");
+	target.CheckOptions(options, "to_csv");
+	auto write_csv = rel->WriteCSVRel(target.path, std::move(options));
 	PyExecuteRelation(write_csv);
 }
 
@@ -1639,11 +1734,33 @@ void DuckDBPyRelation::Create(const string &table) {
 	PyExecuteRelation(create);
 }
 
-std::unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Map(nb::callable fun, Optional<nb::object> schema) {
+std::unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Map(nb::callable fun, Optional<nb::object> schema,
+                                                        const string &format, const nb::object &batch_rows,
+                                                        bool parallel) {
 	AssertRelation();
+	auto lower_format = StringUtil::Lower(format);
+	if (lower_format != "pandas" && lower_format != "arrow" && lower_format != "polars") {
+		throw InvalidInputException("'format' has to be one of 'pandas', 'arrow' or 'polars', not '%s'", format);
+	}
+	if (lower_format != "pandas" && !DuckDBPyConnection::ImportCache()->pyarrow()) {
+		throw InvalidInputException("'pyarrow' is required for format='%s', but it wasn't installed", lower_format);
+	}
+	idx_t batch_size = 0;
+	if (!batch_rows.is_none()) {
+		if (lower_format == "pandas") {
+			throw InvalidInputException("'batch_rows' is only supported for format='arrow' and format='polars'");
+		}
+		if (!nb::isinstance<nb::int_>(batch_rows) || nb::cast<int64_t>(batch_rows) <= 0) {
+			throw InvalidInputException("'batch_rows' has to be a positive integer");
+		}
+		batch_size = nb::cast<idx_t>(batch_rows);
+	}
 	vector<Value> params;
 	params.emplace_back(Value::POINTER(CastPointerToValue(fun.ptr())));
 	params.emplace_back(Value::POINTER(CastPointerToValue(schema.ptr())));
+	params.emplace_back(Value(lower_format));
+	params.emplace_back(Value::UBIGINT(batch_size));
+	params.emplace_back(Value::BOOLEAN(parallel));
 	auto relation = DeriveRelation(rel->TableFunction("python_map_function", params));
 	auto rel_dependency = make_uniq<ExternalDependency>();
 	rel_dependency->AddDependency("map", PythonDependencyItem::Create(std::move(fun)));
@@ -82,6 +82,10 @@ static void InitializeConsumers(nb::class_<DuckDBPyRelation> &m) {
 		        return self.attr("to_arrow_table")(batch_size);
 	        },
 	        "Execute and fetch all rows as an Arrow Table", nb::arg("batch_size") = 1000000)
+	    .def("to_shared_memory", &DuckDBPyRelation::ToSharedMemory,
+	         "Execute and write the result as Arrow IPC into the shared memory segment 'name', which other processes "
+	         "open with duckdb.attach_shared_result()",
+	         nb::arg("name"), nb::kw_only(), nb::arg("batch_size") = 1000000)
 	    .def("pl", &DuckDBPyRelation::ToPolars, "Execute and fetch all rows as a Polars DataFrame",
 	         nb::arg("batch_size") = 1000000, nb::kw_only(), nb::arg("lazy") = false)
 	    .def("torch", &DuckDBPyRelation::FetchPyTorch, "Fetch a result as dict of PyTorch Tensors")
@@ -362,6 +366,7 @@ void DuckDBPyRelation::Initialize(nb::handle &m) {
 
 	relation_module
 	    .def("map", &DuckDBPyRelation::Map, nb::arg("map_function"), nb::kw_only(), nb::arg("schema") = nb::none(),
+	         nb::arg("format") = "pandas", nb::arg("batch_rows").none() = nb::none(), nb::arg("parallel") = true,
 	         "Calls the passed function on the relation")
 	    .def("show", &DuckDBPyRelation::Print, "Display a summary of the data", nb::kw_only(),
 	         nb::arg("max_width") = nb::none(), nb::arg("max_rows") = nb::none(), nb::arg("max_col_width") = nb::none(),
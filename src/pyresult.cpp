@@ -29,12 +29,28 @@ using namespace nanobind::literals;
 
 namespace duckdb {
 
-DuckDBPyResult::DuckDBPyResult(unique_ptr<QueryResult> result_p) : result(std::move(result_p)) {
+DuckDBPyResult::DuckDBPyResult(unique_ptr<QueryResult> result_p, shared_ptr<PythonBindingStats> binding_stats_p)
+    : result(std::move(result_p)), binding_stats(std::move(binding_stats_p)) {
 	if (!result) {
 		throw InternalException("PyResult created without a result object");
 	}
 }
 
+DuckDBPyResult::FetchTimer::FetchTimer(DuckDBPyResult &result_p, PythonBindingMetric metric) : result(result_p) {
+	if (!result.binding_stats || !result.binding_stats->Enabled() || result.timing_fetch) {
+		return;
+	}
+	result.timing_fetch = true;
+	scope = make_uniq<PythonBindingStatsScope>(result.binding_stats, metric);
+}
+
+DuckDBPyResult::FetchTimer::~FetchTimer() {
+	if (scope) {
+		scope.reset();
+		result.timing_fetch = false;
+	}
+}
+
 DuckDBPyResult::~DuckDBPyResult() {
 	// The destructor must run with the GIL held: `result` and `current_chunk`
 	// can transitively own Python references (registered
@@ -124,6 +140,7 @@ unique_ptr<DataChunk> DuckDBPyResult::FetchNextRaw(QueryResult &query_result) {
 }
 
 Optional<nb::tuple> DuckDBPyResult::Fetchone() {
+	FetchTimer timer(*this, PythonBindingMetric::FETCHONE);
 	if (!result) {
 		throw InvalidInputException("result closed");
 	}
@@ -151,6 +168,7 @@ Optional<nb::tuple> DuckDBPyResult::Fetchone() {
 }
 
 nb::list DuckDBPyResult::Fetchmany(idx_t size) {
+	FetchTimer timer(*this, PythonBindingMetric::FETCHMANY);
 	nb::list res;
 	for (idx_t i = 0; i < size; i++) {
 		auto fres = Fetchone();
@@ -163,6 +181,7 @@ nb::list DuckDBPyResult::Fetchmany(idx_t size) {
 }
 
 nb::list DuckDBPyResult::Fetchall() {
+	FetchTimer timer(*this, PythonBindingMetric::FETCHALL);
 	nb::list res;
 	while (true) {
 		auto fres = Fetchone();
@@ -238,6 +257,7 @@ std::unique_ptr<NumpyResultConversion> DuckDBPyResult::InitializeNumpyConversion
 
 nb::dict DuckDBPyResult::FetchNumpyInternal(bool stream, idx_t vectors_per_chunk,
                                             std::unique_ptr<NumpyResultConversion> conversion_p) {
+	FetchTimer timer(*this, PythonBindingMetric::FETCHNUMPY);
 	if (!result) {
 		throw InvalidInputException("result closed");
 	}
@@ -393,16 +413,19 @@ PandasDataFrame DuckDBPyResult::FrameFromNumpy(bool date_as_object, const nb::ha
 }
 
 PandasDataFrame DuckDBPyResult::FetchDF(bool date_as_object) {
+	FetchTimer timer(*this, PythonBindingMetric::DF);
 	auto conversion = InitializeNumpyConversion(true);
 	return FrameFromNumpy(date_as_object, FetchNumpyInternal(false, 1, std::move(conversion)));
 }
 
 PandasDataFrame DuckDBPyResult::FetchDFChunk(idx_t num_of_vectors, bool date_as_object) {
+	FetchTimer timer(*this, PythonBindingMetric::DF);
 	auto conversion = InitializeNumpyConversion(true);
 	return FrameFromNumpy(date_as_object, FetchNumpyInternal(true, num_of_vectors, std::move(conversion)));
 }
 
 nb::dict DuckDBPyResult::FetchPyTorch() {
+	FetchTimer timer(*this, PythonBindingMetric::TORCH);
 	auto result_dict = FetchNumpyInternal();
 	auto from_numpy = nb::module_::import_("torch").attr("from_numpy");
 	for (auto item : result_dict) { // nanobind dict iteration yields std::pair<handle,handle> by value
@@ -412,6 +435,7 @@ nb::dict DuckDBPyResult::FetchPyTorch() {
 }
 
 nb::dict DuckDBPyResult::FetchTF() {
+	FetchTimer timer(*this, PythonBindingMetric::TF);
 	auto result_dict = FetchNumpyInternal();
 	auto convert_to_tensor = nb::module_::import_("tensorflow").attr("convert_to_tensor");
 	for (auto item : result_dict) { // nanobind dict iteration yields std::pair<handle,handle> by value
@@ -523,6 +547,7 @@ duckdb::pyarrow::Table DuckDBPyResult::MaterializedResultToArrowTable(const Arro
 }
 
 duckdb::pyarrow::Table DuckDBPyResult::FetchArrowTable(const idx_t rows_per_batch, const bool to_polars) {
+	FetchTimer timer(*this, PythonBindingMetric::ARROW);
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
@@ -571,6 +596,7 @@ ArrowArrayStream DuckDBPyResult::FetchArrowArrayStream(idx_t rows_per_batch) {
 }
 
 duckdb::pyarrow::RecordBatchReader DuckDBPyResult::FetchRecordBatchReader(idx_t rows_per_batch) {
+	FetchTimer timer(*this, PythonBindingMetric::ARROW_STREAM);
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
@@ -609,6 +635,7 @@ static void ArrowArrayStreamPyCapsuleDestructor(void *data) noexcept {
 }
 
 nb::object DuckDBPyResult::FetchArrowCapsule(const idx_t rows_per_batch) {
+	FetchTimer timer(*this, PythonBindingMetric::ARROW_STREAM);
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
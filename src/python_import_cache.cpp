@@ -11,7 +11,7 @@ namespace duckdb {
 
 nb::handle PythonImportCacheItem::operator()(bool load) {
 	if (IsLoaded()) {
-		return object;
+		return object.load(std::memory_order_acquire);
 	}
 	stack<reference<PythonImportCacheItem>> hierarchy;
 
@@ -28,50 +28,48 @@ bool PythonImportCacheItem::LoadSucceeded() const {
 }
 
 inline bool PythonImportCacheItem::IsLoaded() const {
-	return object.ptr() != nullptr;
+	return object.load(std::memory_order_acquire) != nullptr;
 }
 
-nb::handle PythonImportCacheItem::AddCache(PythonImportCache &cache, nb::object object) {
-	return cache.AddCache(std::move(object));
+nb::handle PythonImportCacheItem::AddCache(PythonImportCache &cache, nb::object loaded) {
+	return cache.AddCache(object, std::move(loaded));
 }
 
 void PythonImportCacheItem::LoadModule(PythonImportCache &cache) {
 	try {
 		duckdb::PyUtil::GilAssert();
-		object = AddCache(cache, std::move(nb::module_::import_(name.c_str())));
+		// imported without holding the cache lock, the import can run code that uses the cache
+		AddCache(cache, nb::module_::import_(name.c_str()));
 		load_succeeded = true;
 	} catch (nb::python_error &e) {
 		if (IsRequired()) {
 			throw InvalidInputException(
 			    "Required module '%s' failed to import, due to the following Python exception:\n%s", name, e.what());
 		}
-		object = nullptr;
 		return;
 	}
 }
 
 void PythonImportCacheItem::LoadAttribute(PythonImportCache &cache, nb::handle source) {
 	if (nb::hasattr(source, name.c_str())) {
-		object = AddCache(cache, std::move(source.attr(name.c_str())));
-	} else {
-		object = nullptr;
+		AddCache(cache, source.attr(name.c_str()));
 	}
 }
 
 nb::handle PythonImportCacheItem::Load(PythonImportCache &cache, nb::handle source, bool load) {
 	if (IsLoaded()) {
-		return object;
+		return object.load(std::memory_order_acquire);
 	}
 	if (!load) {
 		// Don't load the item if it's not already loaded
-		return object;
+		return nullptr;
 	}
 	if (is_module) {
 		LoadModule(cache);
 	} else {
 		LoadAttribute(cache, source);
 	}
-	return object;
+	return object.load(std::memory_order_acquire);
 }
 
 //===--------------------------------------------------------------------===//
@@ -86,10 +84,15 @@ PythonImportCache::~PythonImportCache() {
 	}
 }
 
-nb::handle PythonImportCache::AddCache(nb::object item) {
-	auto object_ptr = item.ptr();
+nb::handle PythonImportCache::AddCache(atomic<PyObject *> &slot, nb::object item) {
+	lock_guard<mutex> guard(lock);
+	auto existing = slot.load(std::memory_order_relaxed);
+	if (existing) {
+		return existing;
+	}
+	slot.store(item.ptr(), std::memory_order_release);
 	owned_objects.push_back(std::move(item));
-	return object_ptr;
+	return slot.load(std::memory_order_relaxed);
 }
 
 } // namespace duckdb
@@ -244,7 +244,8 @@ static nb::dict FrameDictToDict(const nb::object &frame_dict) {
 	return materialized;
 }
 
-static unique_ptr<TableRef> ReplaceInternal(ClientContext &context, const string &table_name) {
+static unique_ptr<TableRef> ReplaceInternal(ClientContext &context, const string &table_name,
+                                            optional_ptr<PythonBindingStats> stats) {
 	Value result;
 	auto lookup_result = context.TryGetCurrentSetting("python_enable_replacements", result);
 	D_ASSERT((bool)lookup_result);
@@ -258,7 +259,7 @@ static unique_ptr<TableRef> ReplaceInternal(ClientContext &context, const string
 	D_ASSERT((bool)lookup_result);
 	auto scan_all_frames = result.GetValue<bool>();
 
-	nb::gil_scoped_acquire acquire;
+	InstrumentedGILAcquire acquire(stats);
 	nb::object current_frame;
 	try {
 		current_frame = nb::module_::import_("inspect").attr("currentframe")();
@@ -323,7 +324,17 @@ unique_ptr<TableRef> PythonReplacementScan::Replace(ClientContext &context, Repl
 	}
 
 	unique_ptr<TableRef> result;
-	result = ReplaceInternal(context, table_name);
+	{
+		auto stats = PythonBindingStats::Get(context);
+		PythonBindingStatsScope timer(stats, PythonBindingMetric::REPLACEMENT_SCAN);
+		result = ReplaceInternal(context, table_name, stats);
+	}
+	if (result) {
+		auto cache_state = context.registered_state->Get<PythonStatementCacheState>(PythonStatementCacheState::NAME);
+		if (cache_state) {
+			cache_state->replacement_scans++;
+		}
+	}
 	return result;
 }
 
@@ -1,6 +1,7 @@
 #include "duckdb/main/query_result.hpp"
 #include "duckdb_python/nb/casters.hpp"
 #include "duckdb/function/scalar_function.hpp"
+#include "duckdb/function/aggregate_function.hpp"
 #include "duckdb_python/pytype.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pandas/pandas_scan.hpp"
@@ -175,12 +176,19 @@ static void VerifyVectorizedNullHandling(Vector &result, idx_t count) {
 	throw InvalidInputException(NullHandlingError());
 }
 
+static shared_ptr<PythonBindingStats> GetBindingStats(ExpressionState &state) {
+	if (!state.HasContext()) {
+		return nullptr;
+	}
+	return PythonBindingStats::Get(state.GetContext());
+}
+
 static scalar_function_t CreateVectorizedFunction(PyObject *function, PythonExceptionHandling exception_handling,
                                                   FunctionNullHandling null_handling) {
 	// Through the capture of the lambda, we have access to the function pointer
 	// We just need to make sure that it doesn't get garbage collected
 	scalar_function_t func = [=](DataChunk &input, ExpressionState &state, Vector &result) -> void {
-		nb::gil_scoped_acquire gil;
+		InstrumentedGILAcquire gil(GetBindingStats(state));
 
 		const bool default_null_handling = null_handling == FunctionNullHandling::DEFAULT_NULL_HANDLING;
 
@@ -323,7 +331,7 @@ static scalar_function_t CreateNativeFunction(PyObject *function, PythonExceptio
 	// Through the capture of the lambda, we have access to the function pointer
 	// We just need to make sure that it doesn't get garbage collected
 	scalar_function_t func = [=](DataChunk &input, ExpressionState &state, Vector &result) -> void { // NOLINT
-		nb::gil_scoped_acquire gil;
+		InstrumentedGILAcquire gil(GetBindingStats(state));
 
 		const bool default_null_handling = null_handling == FunctionNullHandling::DEFAULT_NULL_HANDLING;
 
@@ -383,6 +391,133 @@ static scalar_function_t CreateNativeFunction(PyObject *function, PythonExceptio
 	return func;
 }
 
+//! Where the value of 'row' is stored in 'column', or INVALID_INDEX when the vector is flat and every row has its own
+static idx_t SharedValuePosition(Vector &column, idx_t row) {
+	switch (column.GetVectorType()) {
+	case VectorType::CONSTANT_VECTOR:
+		return 0;
+	case VectorType::DICTIONARY_VECTOR:
+		return DictionaryVector::SelVector(column).get_index(row);
+	default:
+		return DConstants::INVALID_INDEX;
+	}
+}
+
+static scalar_function_t CreateChunkedNativeFunction(PyObject *function, PyObject *cache, bool is_async,
+                                                     PythonExceptionHandling exception_handling,
+                                                     const ClientProperties &client_properties,
+                                                     FunctionNullHandling null_handling, idx_t max_concurrency,
+                                                     double timeout) {
+	// Same contract as CreateNativeFunction, but instead of calling 'function' once per row, we collect the argument
+	// tuples of the whole chunk and hand them to Python at once: an 'async def' gets all its coroutines awaited
+	// concurrently, and a cached function only gets called for the arguments missing from 'cache'.
+	scalar_function_t func = [=](DataChunk &input, ExpressionState &state, Vector &result) -> void { // NOLINT
+		InstrumentedGILAcquire gil(GetBindingStats(state));
+
+		const bool default_null_handling = null_handling == FunctionNullHandling::DEFAULT_NULL_HANDLING;
+		const bool return_null = exception_handling == PythonExceptionHandling::RETURN_NULL;
+
+		// A cached function is deterministic, so when every argument comes from a CONSTANT or DICTIONARY vector, rows
+		// reading the same positions are converted and resolved only once.
+		bool deduplicate = cache != nullptr;
+		for (idx_t i = 0; i < input.ColumnCount() && deduplicate; i++) {
+			deduplicate = SharedValuePosition(input.data[i], 0) != DConstants::INVALID_INDEX;
+		}
+		map<vector<idx_t>, idx_t> distinct_calls;
+		idx_t deduplicated = 0;
+
+		// For every row the call that produces its result (INVALID_INDEX for rows that are NULL without a call), the
+		// first row of every call, and the arguments to call them with
+		vector<idx_t> row_calls(input.size(), DConstants::INVALID_INDEX);
+		vector<idx_t> called_rows;
+		called_rows.reserve(input.size());
+		nb::list arguments;
+		for (idx_t row = 0; row < input.size(); row++) {
+			vector<idx_t> positions;
+			if (deduplicate) {
+				positions.reserve(input.ColumnCount());
+				for (idx_t i = 0; i < input.ColumnCount(); i++) {
+					positions.push_back(SharedValuePosition(input.data[i], row));
+				}
+				auto entry = distinct_calls.find(positions);
+				if (entry != distinct_calls.end()) {
+					row_calls[row] = entry->second;
+					if (entry->second != DConstants::INVALID_INDEX) {
+						deduplicated++;
+					}
+					continue;
+				}
+			}
+			duckdb::PyUtil::TupleBuilder parameter_builder(input.ColumnCount());
+			bool contains_null = false;
+			for (idx_t i = 0; i < input.ColumnCount(); i++) {
+				auto &column = input.data[i];
+				auto value = column.GetValue(row);
+				if (value.IsNull() && default_null_handling) {
+					contains_null = true;
+					break;
+				}
+				parameter_builder.append(PythonObject::FromValue(value, column.GetType(), client_properties));
+			}
+			if (!contains_null) {
+				row_calls[row] = called_rows.size();
+				arguments.append(parameter_builder.take());
+				called_rows.push_back(row);
+			}
+			if (deduplicate) {
+				distinct_calls.emplace(std::move(positions), row_calls[row]);
+			}
+		}
+
+		nb::list results;
+		if (!called_rows.empty()) {
+			auto &import_cache = *DuckDBPyConnection::ImportCache();
+			nb::object concurrency = max_concurrency ? nb::cast(max_concurrency) : nb::none();
+			nb::object timeout_seconds = timeout > 0 ? nb::cast(timeout) : nb::none();
+			try {
+				if (cache) {
+					auto call_cached = import_cache.duckdb.udf._call_cached();
+					results = nb::list(call_cached(nb::handle(cache), nb::handle(function), arguments, concurrency,
+					                               timeout_seconds, nb::arg("is_async") = is_async,
+					                               nb::arg("return_exceptions") = return_null,
+					                               nb::arg("deduplicated") = deduplicated));
+				} else {
+					auto gather_async = import_cache.duckdb.udf._gather_async();
+					results = nb::list(gather_async(nb::handle(function), arguments, concurrency, timeout_seconds,
+					                                nb::arg("return_exceptions") = return_null));
+				}
+			} catch (nb::python_error &exception) {
+				throw InvalidInputException("Python exception occurred while executing the UDF: %s",
+				                            FormatUDFPythonError(exception));
+			}
+			D_ASSERT(results.size() == called_rows.size());
+		}
+
+		for (idx_t row = 0; row < input.size(); row++) {
+			auto call = row_calls[row];
+			if (call == DConstants::INVALID_INDEX) {
+				// Immediately insert None, no need to call the function
+				FlatVector::SetNull(result, row, true);
+				continue;
+			}
+			nb::object ret = results[call];
+			if (return_null && PyExceptionInstance_Check(ret.ptr())) {
+				FlatVector::SetNull(result, row, true);
+				continue;
+			}
+			if (ret.is_none() && default_null_handling) {
+				throw InvalidInputException(NullHandlingError());
+			}
+			TransformPythonObject(state.GetContext(), ret, result, row);
+		}
+
+		if (input.size() == 1) {
+			result.SetVectorType(VectorType::CONSTANT_VECTOR);
+		}
+	};
+	return func;
+}
+
 namespace {
 
 struct ParameterKind {
@@ -418,7 +553,8 @@ static bool NumpyDeprecatesAccessToCore(const nb::tuple &numpy_version) {
 struct PythonUDFData {
 public:
 	PythonUDFData(const string &name, bool vectorized, FunctionNullHandling null_handling)
-	    : name(name), null_handling(null_handling), vectorized(vectorized) {
+	    : name(name), null_handling(null_handling), vectorized(vectorized), is_async(false), max_concurrency(0),
+	      timeout(0) {
 		return_type = LogicalType::INVALID;
 		param_count = DConstants::INVALID_INDEX;
 	}
@@ -431,6 +567,14 @@ public:
 	FunctionNullHandling null_handling;
 	idx_t param_count;
 	bool vectorized;
+	//! Whether the function is an 'async def', awaited concurrently per chunk
+	bool is_async;
+	//! The maximum amount of calls of an async function in flight at once (0 means unbounded)
+	idx_t max_concurrency;
+	//! The timeout in seconds for every call of an async function (0 means no timeout)
+	double timeout;
+	//! The duckdb.udf.FunctionCache memoizing the results of the function, if any
+	nb::object cache;
 
 public:
 	void Verify() {
@@ -482,6 +626,63 @@ public:
 		}
 	}
 
+	void OverrideAsyncOptions(const nb::object &concurrency, const nb::object &timeout_p) {
+		const bool has_concurrency = !nb::none().is(concurrency);
+		const bool has_timeout = !nb::none().is(timeout_p);
+		if (!is_async) {
+			if (has_concurrency || has_timeout) {
+				throw InvalidInputException(
+				    "'concurrency' and 'timeout' can only be provided for functions defined with 'async def'");
+			}
+			return;
+		}
+		if (vectorized) {
+			throw InvalidInputException("Functions defined with 'async def' are not supported for type='arrow'");
+		}
+		if (has_concurrency) {
+			if (!nb::isinstance<nb::int_>(concurrency) || nb::cast<int64_t>(concurrency) <= 0) {
+				throw InvalidInputException("'concurrency' has to be a positive integer");
+			}
+			max_concurrency = nb::cast<idx_t>(concurrency);
+		}
+		if (has_timeout) {
+			if (!nb::isinstance<nb::int_>(timeout_p) && !nb::isinstance<nb::float_>(timeout_p)) {
+				throw InvalidInputException("'timeout' has to be a number of seconds");
+			}
+			timeout = nb::cast<double>(timeout_p);
+			if (timeout <= 0) {
+				throw InvalidInputException("'timeout' has to be a positive number of seconds");
+			}
+		}
+	}
+
+	void OverrideCacheOptions(const nb::object &cache_p, bool side_effects) {
+		if (nb::none().is(cache_p) || (nb::isinstance<nb::bool_>(cache_p) && !nb::cast<bool>(cache_p))) {
+			return;
+		}
+		if (vectorized) {
+			throw InvalidInputException("'cache' is not supported for type='arrow'");
+		}
+		if (side_effects) {
+			throw InvalidInputException("A function with 'side_effects' can not be cached");
+		}
+		auto &import_cache = *DuckDBPyConnection::ImportCache();
+		auto function_cache = import_cache.duckdb.udf.FunctionCache();
+		if (nb::isinstance<nb::bool_>(cache_p)) {
+			cache = function_cache();
+		} else if (nb::isinstance<nb::int_>(cache_p)) {
+			if (nb::cast<int64_t>(cache_p) <= 0) {
+				throw InvalidInputException("'cache' has to be a positive integer when it sets the maximum size");
+			}
+			cache = function_cache(cache_p);
+		} else if (duckdb::PyUtil::IsInstance(cache_p, function_cache)) {
+			cache = cache_p;
+		} else {
+			throw InvalidInputException(
+			    "'cache' has to be a bool, the maximum amount of cached results, or a duckdb.udf.FunctionCache");
+		}
+	}
+
 	nb::object GetSignature(const nb::object &udf) {
 		const int32_t PYTHON_3_10_HEX = 0x030a00f0;
 		auto python_version = PY_VERSION_HEX;
@@ -495,6 +696,7 @@ public:
 	}
 
 	void AnalyzeSignature(const nb::object &udf) {
+		is_async = nb::cast<bool>(nb::module_::import_("inspect").attr("iscoroutinefunction")(udf));
 		auto signature = GetSignature(udf);
 		nb::object sig_params = signature.attr("parameters");
 		auto return_annotation = signature.attr("return_annotation");
@@ -551,6 +753,9 @@ public:
 		scalar_function_t func;
 		if (vectorized) {
 			func = CreateVectorizedFunction(udf.ptr(), exception_handling, null_handling);
+		} else if (is_async || cache) {
+			func = CreateChunkedNativeFunction(udf.ptr(), cache.ptr(), is_async, exception_handling, client_properties,
+			                                   null_handling, max_concurrency, timeout);
 		} else {
 			func = CreateNativeFunction(udf.ptr(), exception_handling, client_properties, null_handling);
 		}
@@ -567,15 +772,509 @@ public:
 ScalarFunction DuckDBPyConnection::CreateScalarUDF(const string &name, const nb::callable &udf,
                                                    const nb::object &parameters, const nb::object &return_type,
                                                    bool vectorized, FunctionNullHandling null_handling,
-                                                   PythonExceptionHandling exception_handling, bool side_effects) {
+                                                   PythonExceptionHandling exception_handling, bool side_effects,
+                                                   const nb::object &concurrency, const nb::object &timeout,
+                                                   const nb::object &cache, ExternalDependency &dependency) {
 	PythonUDFData data(name, vectorized, null_handling);
 	auto &connection = con.GetConnection();
 
 	data.AnalyzeSignature(udf);
 	data.OverrideParameters(parameters);
 	data.OverrideReturnType(return_type);
+	data.OverrideAsyncOptions(concurrency, timeout);
+	data.OverrideCacheOptions(cache, side_effects);
 	data.Verify();
+	if (data.cache) {
+		dependency.AddDependency("cache", PythonDependencyItem::Create(data.cache));
+	}
 	return data.GetFunction(udf, exception_handling, side_effects, connection.context->GetClientProperties());
 }
 
+namespace {
+
+//! The Python callables of an aggregate created through create_aggregate_function, kept alive by the connection's
+//! registered_functions
+struct PythonAggregateFunctionInfo : public AggregateFunctionInfo {
+	PythonAggregateFunctionInfo(PyObject *init, PyObject *update, PyObject *combine, PyObject *finalize, bool as_numpy,
+	                            FunctionNullHandling null_handling)
+	    : init(init), update(update), combine(combine), finalize(finalize), as_numpy(as_numpy),
+	      null_handling(null_handling) {
+	}
+
+	PyObject *init;
+	PyObject *update;
+	PyObject *combine;
+	PyObject *finalize;
+	//! Whether 'update' receives NumPy arrays instead of pyarrow arrays
+	bool as_numpy;
+	FunctionNullHandling null_handling;
+};
+
+//! The context the aggregate is executed in, needed to convert the input to and the results from Python
+struct PythonAggregateBindData : public FunctionData {
+	explicit PythonAggregateBindData(ClientContext &context) : context(context) {
+	}
+
+	ClientContext &context;
+
+public:
+	unique_ptr<FunctionData> Copy() const override {
+		return make_uniq<PythonAggregateBindData>(context);
+	}
+	bool Equals(const FunctionData &other_p) const override {
+		return &context == &other_p.Cast<PythonAggregateBindData>().context;
+	}
+};
+
+//! The state of a single group: an owned reference to the object returned by 'init', or nullptr before the group saw
+//! any input
+struct PythonAggregateState {
+	PyObject *state;
+};
+
+} // namespace
+
+static idx_t PythonAggregateStateSize(const BoundAggregateFunction &) {
+	return sizeof(PythonAggregateState);
+}
+
+static void PythonAggregateInitialize(const BoundAggregateFunction &, data_ptr_t state) {
+	reinterpret_cast<PythonAggregateState *>(state)->state = nullptr;
+}
+
+static unique_ptr<FunctionData> PythonAggregateBind(BindAggregateFunctionInput &input) {
+	return make_uniq<PythonAggregateBindData>(input.GetClientContext());
+}
+
+static nb::list GetPythonAggregateStates(const vector<PythonAggregateState *> &states) {
+	nb::list result;
+	for (auto state : states) {
+		result.append(state->state ? nb::borrow<nb::object>(state->state) : nb::none());
+	}
+	return result;
+}
+
+static void SetPythonAggregateStates(const vector<PythonAggregateState *> &states, const nb::list &new_states) {
+	D_ASSERT(states.size() == new_states.size());
+	for (idx_t i = 0; i < states.size(); i++) {
+		nb::object new_state = new_states[i];
+		Py_XDECREF(states[i]->state);
+		states[i]->state = new_state.release().ptr();
+	}
+}
+
+static void PythonAggregateUpdate(Vector inputs[], AggregateInputData &aggr_input_data, idx_t input_count,
+                                  Vector &states, idx_t count) {
+	auto &info = aggr_input_data.function.GetExtraFunctionInfo().Cast<PythonAggregateFunctionInfo>();
+	auto &context = aggr_input_data.bind_data->Cast<PythonAggregateBindData>().context;
+	const bool default_null_handling = info.null_handling == FunctionNullHandling::DEFAULT_NULL_HANDLING;
+
+	vector<UnifiedVectorFormat> input_data(input_count);
+	for (idx_t i = 0; i < input_count; i++) {
+		inputs[i].ToUnifiedFormat(input_data[i]);
+	}
+	UnifiedVectorFormat state_data;
+	states.ToUnifiedFormat(state_data);
+	auto state_pointers = UnifiedVectorFormat::GetData<PythonAggregateState *>(state_data);
+
+	// Group the rows by their state, so every group is handed to 'update' as one contiguous slice of a single batch
+	unordered_map<PythonAggregateState *, idx_t> group_indices;
+	vector<PythonAggregateState *> groups;
+	vector<idx_t> group_offsets(1, 0);
+	vector<idx_t> rows;
+	vector<idx_t> row_groups;
+	for (idx_t row = 0; row < count; row++) {
+		bool contains_null = false;
+		for (idx_t i = 0; i < input_count && default_null_handling; i++) {
+			contains_null = !input_data[i].validity.RowIsValid(input_data[i].sel->get_index(row));
+			if (contains_null) {
+				break;
+			}
+		}
+		if (contains_null) {
+			continue;
+		}
+		auto state = state_pointers[state_data.sel->get_index(row)];
+		auto entry = group_indices.emplace(state, groups.size());
+		if (entry.second) {
+			groups.push_back(state);
+			group_offsets.push_back(0);
+		}
+		group_offsets[entry.first->second + 1]++;
+		rows.push_back(row);
+		row_groups.push_back(entry.first->second);
+	}
+	if (rows.empty()) {
+		return;
+	}
+	for (idx_t i = 1; i < group_offsets.size(); i++) {
+		group_offsets[i] += group_offsets[i - 1];
+	}
+	vector<idx_t> positions(group_offsets.begin(), group_offsets.end() - 1);
+	SelectionVector sel(rows.size());
+	for (idx_t i = 0; i < rows.size(); i++) {
+		sel.set_index(positions[row_groups[i]]++, rows[i]);
+	}
+
+	vector<LogicalType> types;
+	for (idx_t i = 0; i < input_count; i++) {
+		types.push_back(inputs[i].GetType());
+	}
+	DataChunk batch;
+	batch.InitializeEmpty(types);
+	for (idx_t i = 0; i < input_count; i++) {
+		batch.data[i].Reference(inputs[i]);
+	}
+	batch.Slice(sel, rows.size());
+
+	nb::gil_scoped_acquire gil;
+	auto options = context.GetClientProperties();
+	auto table = ConvertDataChunkToPyArrowTable(batch, options, context);
+	nb::list offsets;
+	for (auto offset : group_offsets) {
+		offsets.append(offset);
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	nb::list new_states;
+	try {
+		new_states = nb::list(import_cache.duckdb.udf._update_aggregate()(
+		    nb::handle(info.init), nb::handle(info.update), GetPythonAggregateStates(groups), table, offsets,
+		    nb::arg("as_numpy") = info.as_numpy));
+	} catch (nb::python_error &exception) {
+		throw InvalidInputException("Python exception occurred while executing the UDF: %s",
+		                            FormatUDFPythonError(exception));
+	}
+	SetPythonAggregateStates(groups, new_states);
+}
+
+static void PythonAggregateCombine(Vector &source, Vector &target, AggregateInputData &aggr_input_data, idx_t count) {
+	if (aggr_input_data.combine_multiplicities) {
+		throw NotImplementedException(
+		    "Combining the states of a Python aggregate with multiplicities is not supported");
+	}
+	auto &info = aggr_input_data.function.GetExtraFunctionInfo().Cast<PythonAggregateFunctionInfo>();
+	auto source_states = source.Values<const PythonAggregateState *>();
+	auto target_states = target.Values<PythonAggregateState *>();
+
+	vector<PythonAggregateState *> targets;
+	vector<const PythonAggregateState *> sources;
+	for (idx_t i = 0; i < count; i++) {
+		auto source_state = source_states[i].GetValueUnsafe();
+		if (!source_state->state) {
+			// Nothing to merge
+			continue;
+		}
+		sources.push_back(source_state);
+		targets.push_back(target_states[i].GetValueUnsafe());
+	}
+	if (sources.empty()) {
+		return;
+	}
+
+	nb::gil_scoped_acquire gil;
+	nb::list source_list;
+	for (auto state : sources) {
+		source_list.append(nb::borrow<nb::object>(state->state));
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	nb::list new_states;
+	try {
+		new_states = nb::list(import_cache.duckdb.udf._combine_aggregate()(
+		    nb::handle(info.init), nb::handle(info.combine), GetPythonAggregateStates(targets), source_list));
+	} catch (nb::python_error &exception) {
+		throw InvalidInputException("Python exception occurred while executing the UDF: %s",
+		                            FormatUDFPythonError(exception));
+	}
+	SetPythonAggregateStates(targets, new_states);
+}
+
+static void PythonAggregateFinalize(Vector &states, AggregateFinalizeInputData &finalize_input_data, Vector &result,
+                                    idx_t count, idx_t offset) {
+	auto &info = finalize_input_data.function.GetExtraFunctionInfo().Cast<PythonAggregateFunctionInfo>();
+	auto &context = finalize_input_data.bind_data->Cast<PythonAggregateBindData>().context;
+	const bool constant = states.GetVectorType() == VectorType::CONSTANT_VECTOR;
+
+	UnifiedVectorFormat state_data;
+	states.ToUnifiedFormat(state_data);
+	auto state_pointers = UnifiedVectorFormat::GetData<PythonAggregateState *>(state_data);
+	vector<PythonAggregateState *> finalized;
+	for (idx_t i = 0; i < (constant ? 1 : count); i++) {
+		finalized.push_back(state_pointers[state_data.sel->get_index(i)]);
+	}
+
+	nb::gil_scoped_acquire gil;
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	nb::list values;
+	try {
+		values = nb::list(import_cache.duckdb.udf._finalize_aggregate()(
+		    nb::handle(info.init), nb::handle(info.finalize), GetPythonAggregateStates(finalized)));
+	} catch (nb::python_error &exception) {
+		throw InvalidInputException("Python exception occurred while executing the UDF: %s",
+		                            FormatUDFPythonError(exception));
+	}
+	result.SetVectorType(VectorType::FLAT_VECTOR);
+	for (idx_t i = 0; i < finalized.size(); i++) {
+		nb::object value = values[i];
+		TransformPythonObject(context, value, result, constant ? 0 : offset + i);
+	}
+	if (constant) {
+		result.SetVectorType(VectorType::CONSTANT_VECTOR);
+	}
+}
+
+static void PythonAggregateDestroy(Vector &states, AggregateInputData &, idx_t count) {
+	auto state_pointers = states.Values<PythonAggregateState *>();
+	vector<PyObject *> objects;
+	for (idx_t i = 0; i < count; i++) {
+		auto state = state_pointers[i].GetValueUnsafe();
+		if (state->state) {
+			objects.push_back(state->state);
+			state->state = nullptr;
+		}
+	}
+	// The states can outlive the interpreter (e.g. a connection that is only closed at exit), leak them in that case
+	if (objects.empty() || !Py_IsInitialized()) {
+		return;
+	}
+	nb::gil_scoped_acquire gil;
+	for (auto object : objects) {
+		Py_DECREF(object);
+	}
+}
+
+AggregateFunction DuckDBPyConnection::CreateAggregateUDF(const string &name, const nb::callable &init,
+                                                         const nb::callable &update, const nb::callable &combine,
+                                                         const nb::callable &finalize, const nb::object &parameters,
+                                                         const nb::object &return_type, const string &format,
+                                                         FunctionNullHandling null_handling) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	if (!import_cache.pyarrow()) {
+		throw InvalidInputException("'pyarrow' is required for aggregate functions, but it wasn't installed");
+	}
+	auto lower_format = StringUtil::Lower(format);
+	if (lower_format != "arrow" && lower_format != "numpy") {
+		throw InvalidInputException("'format' has to be either 'arrow' or 'numpy', not '%s'", format);
+	}
+	if (!nb::isinstance<nb::list>(parameters)) {
+		throw InvalidInputException("'parameters' has to be a list of DuckDBPyType objects");
+	}
+	vector<LogicalType> arguments;
+	for (auto param : nb::list(parameters)) {
+		std::unique_ptr<DuckDBPyType> type;
+		if (!DuckDBPyType::TryConvert(nb::borrow<nb::object>(param), type)) {
+			throw InvalidInputException("Could not convert a provided parameter to a DuckDBPyType");
+		}
+		arguments.push_back(type->Type());
+	}
+	std::unique_ptr<DuckDBPyType> converted_return_type;
+	if (!DuckDBPyType::TryConvert(return_type, converted_return_type)) {
+		throw InvalidInputException("Could not convert the provided 'return_type' to a DuckDBPyType");
+	}
+
+	AggregateFunction aggregate(Identifier(name), arguments, converted_return_type->Type(), PythonAggregateStateSize,
+	                            PythonAggregateInitialize, PythonAggregateUpdate, PythonAggregateCombine,
+	                            PythonAggregateFinalize, null_handling, nullptr, PythonAggregateBind,
+	                            PythonAggregateDestroy);
+	aggregate.SetExtraFunctionInfo<PythonAggregateFunctionInfo>(init.ptr(), update.ptr(), combine.ptr(), finalize.ptr(),
+	                                                            lower_format == "numpy", null_handling);
+	return aggregate;
+}
+
+namespace {
+
+//! The Python generator and the declared schema of a table function created through create_table_function, the
+//! callables are kept alive by the connection's registered_functions
+struct PythonTableFunctionInfo : public TableFunctionInfo {
+	PythonTableFunctionInfo(PyObject *function, vector<string> names, vector<LogicalType> types, PyObject *cardinality,
+	                        optional_idx fixed_cardinality, bool projection_pushdown)
+	    : function(function), names(std::move(names)), types(std::move(types)), cardinality(cardinality),
+	      fixed_cardinality(fixed_cardinality), projection_pushdown(projection_pushdown) {
+	}
+
+	PyObject *function;
+	vector<string> names;
+	vector<LogicalType> types;
+	//! (Optional) callable estimating the cardinality from the arguments
+	PyObject *cardinality;
+	//! (Optional) cardinality estimate provided up front
+	optional_idx fixed_cardinality;
+	//! Whether the projected columns are passed to the function as 'columns'
+	bool projection_pushdown;
+};
+
+//! Produces the Arrow stream of a single table function call, the generator is invoked again for every scan
+struct PythonTableFunctionStreamFactory {
+	PythonTableFunctionStreamFactory(PyObject *function, nb::object arguments, nb::object schema,
+	                                 bool projection_pushdown)
+	    : function(function), arguments(std::move(arguments)), schema(std::move(schema)),
+	      projection_pushdown(projection_pushdown) {
+	}
+	~PythonTableFunctionStreamFactory() {
+		// The bind data can outlive the interpreter, leak the objects in that case
+		if (!Py_IsInitialized()) {
+			arguments.release();
+			schema.release();
+			return;
+		}
+		nb::gil_scoped_acquire acquire;
+		arguments = nb::object();
+		schema = nb::object();
+	}
+
+	static unique_ptr<ArrowArrayStreamWrapper> Produce(uintptr_t factory_ptr, ArrowStreamParameters &parameters) {
+		nb::gil_scoped_acquire acquire;
+		auto factory = reinterpret_cast<PythonTableFunctionStreamFactory *>(factory_ptr); // NOLINT
+		auto &column_list = parameters.projected_columns.columns;
+		nb::object columns = column_list.empty() ? nb::none() : nb::object(nb::cast(column_list));
+
+		auto &import_cache = *DuckDBPyConnection::ImportCache();
+		nb::object reader;
+		try {
+			reader = import_cache.duckdb.udf._table_function_reader()(
+			    nb::handle(factory->function), factory->arguments, factory->schema, columns,
+			    nb::arg("projection_pushdown") = factory->projection_pushdown);
+		} catch (nb::python_error &e) {
+			throw InvalidInputException("Python exception occurred while executing the table function: %s",
+			                            FormatUDFPythonError(e));
+		}
+		auto res = make_uniq<ArrowArrayStreamWrapper>();
+		reader.attr("_export_to_c")(reinterpret_cast<uint64_t>(&res->arrow_array_stream));
+		return res;
+	}
+
+	PyObject *function;
+	nb::object arguments;
+	nb::object schema;
+	bool projection_pushdown;
+};
+
+//! Scans the stream of the table function like arrow_scan does, owning the factory instead of a replacement scan
+struct PythonTableFunctionData : public ArrowScanFunctionData {
+	PythonTableFunctionData(unique_ptr<PythonTableFunctionStreamFactory> factory_p, optional_idx cardinality)
+	    : ArrowScanFunctionData(PythonTableFunctionStreamFactory::Produce,
+	                            reinterpret_cast<uintptr_t>(factory_p.get())),
+	      factory(std::move(factory_p)), cardinality(cardinality) {
+	}
+
+	unique_ptr<PythonTableFunctionStreamFactory> factory;
+	optional_idx cardinality;
+};
+
+} // namespace
+
+static optional_idx EstimateTableFunctionCardinality(const PythonTableFunctionInfo &info, const nb::list &arguments) {
+	if (!info.cardinality) {
+		return info.fixed_cardinality;
+	}
+	nb::object estimate;
+	try {
+		estimate = nb::handle(info.cardinality)(*arguments);
+	} catch (nb::python_error &e) {
+		throw InvalidInputException("Python exception occurred while estimating the cardinality: %s",
+		                            FormatUDFPythonError(e));
+	}
+	if (estimate.is_none()) {
+		return optional_idx();
+	}
+	if (!nb::isinstance<nb::int_>(estimate) || nb::cast<int64_t>(estimate) < 0) {
+		throw InvalidInputException("The 'cardinality' function has to return a non-negative integer or None");
+	}
+	return optional_idx(nb::cast<idx_t>(estimate));
+}
+
+static unique_ptr<FunctionData> PythonTableFunctionBind(ClientContext &context, TableFunctionBindInput &input,
+                                                        vector<LogicalType> &return_types, vector<string> &names) {
+	auto &info = input.info->Cast<PythonTableFunctionInfo>();
+	auto client_properties = context.GetClientProperties();
+
+	nb::gil_scoped_acquire acquire;
+	nb::list arguments;
+	for (auto &value : input.inputs) {
+		arguments.append(PythonObject::FromValue(value, value.type(), client_properties));
+	}
+	auto cardinality = EstimateTableFunctionCardinality(info, arguments);
+
+	ArrowSchema schema;
+	ArrowConverter::ToArrowSchema(&schema, info.types, info.names, client_properties);
+	auto factory = make_uniq<PythonTableFunctionStreamFactory>(
+	    info.function, std::move(arguments), pyarrow::ToPyArrowSchema(schema), info.projection_pushdown);
+	auto res = make_uniq<PythonTableFunctionData>(std::move(factory), cardinality);
+
+	ArrowConverter::ToArrowSchema(&res->schema_root.arrow_schema, info.types, info.names, client_properties);
+	ArrowTableFunction::PopulateArrowTableSchema(context, res->arrow_table, res->schema_root.arrow_schema);
+	names = res->arrow_table.GetNames();
+	return_types = res->arrow_table.GetTypes();
+	res->all_types = return_types;
+	return std::move(res);
+}
+
+static unique_ptr<NodeStatistics> PythonTableFunctionCardinality(ClientContext &, const FunctionData *bind_data) {
+	auto &data = bind_data->Cast<PythonTableFunctionData>();
+	if (!data.cardinality.IsValid()) {
+		return make_uniq<NodeStatistics>();
+	}
+	return make_uniq<NodeStatistics>(data.cardinality.GetIndex());
+}
+
+duckdb::TableFunction DuckDBPyConnection::CreateTableUDF(const string &name, const nb::callable &function,
+                                                         const nb::object &schema, const nb::object &parameters,
+                                                         const nb::object &cardinality, bool projection_pushdown) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	if (!import_cache.pyarrow()) {
+		throw InvalidInputException("'pyarrow' is required for table functions, but it wasn't installed");
+	}
+	if (!nb::isinstance<nb::dict>(schema) || nb::len(schema) == 0) {
+		throw InvalidInputException("'schema' has to be a non-empty dict mapping column names to DuckDBPyType objects");
+	}
+	vector<string> names;
+	vector<LogicalType> types;
+	for (auto item : nb::borrow<nb::dict>(schema)) {
+		std::unique_ptr<DuckDBPyType> type;
+		if (!DuckDBPyType::TryConvert(nb::borrow<nb::object>(item.second), type)) {
+			throw InvalidInputException("Could not convert the type of column '%s' to a DuckDBPyType",
+			                            nb::cast<std::string>(nb::str(item.first)));
+		}
+		names.push_back(nb::cast<std::string>(nb::str(item.first)));
+		types.push_back(type->Type());
+	}
+
+	vector<LogicalType> arguments;
+	if (!parameters.is_none()) {
+		if (!nb::isinstance<nb::list>(parameters)) {
+			throw InvalidInputException("'parameters' has to be a list of DuckDBPyType objects");
+		}
+		for (auto param : nb::list(parameters)) {
+			std::unique_ptr<DuckDBPyType> type;
+			if (!DuckDBPyType::TryConvert(nb::borrow<nb::object>(param), type)) {
+				throw InvalidInputException("Could not convert a provided parameter to a DuckDBPyType");
+			}
+			arguments.push_back(type->Type());
+		}
+	}
+
+	PyObject *cardinality_function = nullptr;
+	optional_idx fixed_cardinality;
+	if (nb::isinstance<nb::int_>(cardinality)) {
+		if (nb::cast<int64_t>(cardinality) < 0) {
+			throw InvalidInputException("'cardinality' has to be a non-negative integer");
+		}
+		fixed_cardinality = nb::cast<idx_t>(cardinality);
+	} else if (PyCallable_Check(cardinality.ptr())) {
+		cardinality_function = cardinality.ptr();
+	} else if (!cardinality.is_none()) {
+		throw InvalidInputException("'cardinality' has to be an integer or a function returning one");
+	}
+
+	duckdb::TableFunction table_function(Identifier(name), arguments, ArrowTableFunction::ArrowScanFunction,
+	                                     PythonTableFunctionBind, ArrowTableFunction::ArrowScanInitGlobal,
+	                                     ArrowTableFunction::ArrowScanInitLocal);
+	table_function.cardinality = PythonTableFunctionCardinality;
+	table_function.projection_pushdown = true;
+	table_function.parallelism = TableFunctionParallelism::SEQUENTIAL;
+	table_function.function_info =
+	    make_shared_ptr<PythonTableFunctionInfo>(function.ptr(), std::move(names), std::move(types),
+	                                             cardinality_function, fixed_cardinality, projection_pushdown);
+	return table_function;
+}
+
 } // namespace duckdb
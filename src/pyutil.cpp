@@ -15,6 +15,34 @@ void PyUtil::GilAssert() {
 	}
 }
 
+nb::object PyUtil::DictGetItem(nb::handle dict, nb::handle key) {
+#if PY_VERSION_HEX >= 0x030D0000
+	PyObject *result;
+	if (PyDict_GetItemRef(dict.ptr(), key.ptr(), &result) < 0) {
+		throw nb::python_error();
+	}
+	return nb::steal(result);
+#else
+	auto result = PyDict_GetItemWithError(dict.ptr(), key.ptr());
+	if (!result && PyErr_Occurred()) {
+		throw nb::python_error();
+	}
+	return nb::borrow(result);
+#endif
+}
+
+nb::object PyUtil::ListGetItem(nb::handle list, idx_t index) {
+#if PY_VERSION_HEX >= 0x030D0000
+	auto result = PyList_GetItemRef(list.ptr(), static_cast<Py_ssize_t>(index));
+#else
+	auto result = Py_XNewRef(PyList_GetItem(list.ptr(), static_cast<Py_ssize_t>(index)));
+#endif
+	if (!result) {
+		throw nb::python_error();
+	}
+	return nb::steal(result);
+}
+
 bool PyUtil::IsListLike(nb::handle obj) {
 	if (nb::isinstance<nb::str>(obj) || nb::isinstance<nb::bytes>(obj)) {
 		return false;
@@ -0,0 +1,105 @@
+import asyncio
+import platform
+
+import pytest
+
+import duckdb
+import duckdb.aio
+
+pytestmark = pytest.mark.xfail(
+    condition=platform.system() == "Emscripten",
+    reason="threads not allowed on Emscripten",
+)
+
+
+class TestAsyncConnection:
+    def test_execute(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("create table t as select range i from range(5)")
+                await con.execute("select i from t where i < ? order by i", [3])
+                return await con.fetchall()
+
+        assert asyncio.run(main()) == [(0,), (1,), (2,)]
+
+    def test_fetch(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("select range i from range(5)")
+                first = await con.fetchone()
+                many = await con.fetchmany(2)
+                rest = await con.fetchall()
+                return first, many, rest
+
+        assert asyncio.run(main()) == ((0,), [(1,), (2,)], [(3,), (4,)])
+
+    def test_async_iteration(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("select range i from range(25000)")
+                return [row async for row in con]
+
+        assert asyncio.run(main()) == [(i,) for i in range(25000)]
+
+    def test_record_batches(self):
+        pytest.importorskip("pyarrow")
+
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("select range i from range(10000)")
+                reader = await con.fetch_record_batch(1000)
+                return [batch.num_rows async for batch in reader]
+
+        batches = asyncio.run(main())
+        assert sum(batches) == 10000
+        assert len(batches) >= 10
+
+    def test_event_loop_not_blocked(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                ticks = 0
+
+                async def tick():
+                    nonlocal ticks
+                    while True:
+                        ticks += 1
+                        await asyncio.sleep(0.001)
+
+                ticker = asyncio.create_task(tick())
+                await con.execute("select count(*) from range(300000000)")
+                ticker.cancel()
+                return ticks
+
+        assert asyncio.run(main()) > 1
+
+    def test_cancel(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                task = asyncio.create_task(con.execute("select count(*) from range(100000000000)"))
+                await asyncio.sleep(0.1)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                # the connection is usable again once the interrupted query stopped
+                await con.execute("select 42")
+                return await con.fetchall()
+
+        assert asyncio.run(main()) == [(42,)]
+
+    def test_errors(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("select * from missing_table")
+
+        with pytest.raises(duckdb.CatalogException):
+            asyncio.run(main())
+
+    def test_cursor(self):
+        async def main():
+            async with await duckdb.aio.connect() as con:
+                await con.execute("create table t as select 1 i")
+                async with con.cursor() as cursor:
+                    await cursor.execute("select i from t")
+                    return await cursor.fetchall()
+
+        assert asyncio.run(main()) == [(1,)]
@@ -0,0 +1,72 @@
+import pytest
+
+import duckdb
+
+
+@pytest.fixture
+def con():
+    with duckdb.connect(config={"python_binding_stats": True}) as con:
+        yield con
+
+
+class TestBindingStats:
+    def test_disabled_by_default(self):
+        con = duckdb.connect()
+        con.execute("select 42").fetchall()
+        stats = con.binding_stats()
+        assert not stats["enabled"]
+        assert stats["gil"] == {"count": 0, "time": 0.0}
+        assert stats["fetch"]["fetchall"] == {"count": 0, "time": 0.0}
+
+    def test_fetch(self, con):
+        assert con.execute("select range from range(3)").fetchall() == [(0,), (1,), (2,)]
+        assert con.execute("select 42").fetchone() == (42,)
+        stats = con.binding_stats()
+        assert stats["enabled"]
+        # fetchall is counted once, not as a fetchone per row
+        assert stats["fetch"]["fetchall"]["count"] == 1
+        assert stats["fetch"]["fetchone"]["count"] == 1
+        assert stats["fetch"]["fetchall"]["time"] >= 0
+
+    def test_relation_fetch(self, con):
+        assert con.sql("select 42").fetchall() == [(42,)]
+        assert con.binding_stats()["fetch"]["fetchall"]["count"] == 1
+
+    def test_df(self, con):
+        pytest.importorskip("pandas")
+        con.execute("select range from range(3)").df()
+        fetch = con.binding_stats()["fetch"]
+        assert fetch["df"]["count"] == 1
+        assert fetch["fetchnumpy"]["count"] == 0
+
+    def test_locks(self, con):
+        con.execute("select 42").fetchall()
+        stats = con.binding_stats()
+        assert stats["connection_lock"]["count"] > 0
+        assert stats["gil"]["count"] > 0
+
+    def test_replacement_scan(self, con):
+        with pytest.raises(duckdb.CatalogException):
+            con.execute("select * from not_a_table")
+        assert con.binding_stats()["replacement_scan"]["count"] >= 1
+
+    def test_set(self):
+        con = duckdb.connect()
+        con.execute("set python_binding_stats = true")
+        con.execute("select 42").fetchall()
+        assert con.binding_stats()["fetch"]["fetchall"]["count"] == 1
+        con.execute("set python_binding_stats = false")
+        con.execute("select 42").fetchall()
+        assert con.binding_stats()["fetch"]["fetchall"]["count"] == 1
+
+    def test_per_connection(self, con):
+        cursor = con.cursor()
+        cursor.execute("select 42").fetchall()
+        assert cursor.binding_stats()["fetch"]["fetchall"]["count"] == 1
+        assert con.binding_stats()["fetch"]["fetchall"]["count"] == 0
+        assert con.binding_stats(aggregate=True)["fetch"]["fetchall"]["count"] >= 1
+
+    def test_profiler_output(self, con):
+        con.enable_profiling()
+        con.execute("select 42").fetchall()
+        assert "Python Binding Stats" in con.get_profiling_information(format="default")
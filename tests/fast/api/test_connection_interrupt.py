@@ -26,6 +26,35 @@ class TestConnectionInterrupt:
             conn.execute("select count(*) from range(100000000000)").fetchall()
         thread.join()
 
+    @pytest.mark.xfail(
+        condition=platform.system() == "Emscripten",
+        reason="threads not allowed on Emscripten",
+    )
+    def test_interrupt_query_of_other_thread(self):
+        # queries started outside of the main thread don't take the GIL back to check for signals while they run,
+        # interrupt() still stops them
+        conn = duckdb.connect()
+        errors = []
+
+        def run() -> None:
+            try:
+                conn.execute("select count(*) from range(100000000000)").fetchall()
+            except duckdb.Error as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        # an interrupt that arrives before the query started is lost, repeat it until the query stopped
+        for _ in range(600):
+            conn.interrupt()
+            thread.join(0.1)
+            if not thread.is_alive():
+                break
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        assert isinstance(errors[0], duckdb.InterruptException)
+        assert conn.execute("select 42").fetchall() == [(42,)]
+
     def test_interrupt_closed_connection(self):
         conn = duckdb.connect()
         conn.close()
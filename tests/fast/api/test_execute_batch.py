@@ -0,0 +1,84 @@
+import pytest
+
+import duckdb
+
+
+class TestExecuteBatch:
+    def test_results(self):
+        con = duckdb.connect()
+        results = con.execute_batch(
+            [
+                "create table t (i integer)",
+                ("insert into t values (?), (?)", [1, 2]),
+                ("insert into t values ($i)", {"i": 3}),
+                "select sum(i) from t",
+            ]
+        )
+        assert len(results) == 4
+        assert results[1].fetchall() == [(2,)]
+        assert results[3].fetchall() == [(6,)]
+
+    def test_no_results(self):
+        con = duckdb.connect()
+        assert con.execute_batch(["create table t as select 42 as i"], return_results=False) is None
+        assert con.sql("select i from t").fetchall() == [(42,)]
+
+    def test_multiple_statements(self):
+        con = duckdb.connect()
+        (result,) = con.execute_batch([("create table t (i integer); insert into t values (?)", [5])])
+        assert result.fetchall() == [(1,)]
+        assert con.sql("select i from t").fetchall() == [(5,)]
+
+    def test_results_outlive_connection_result(self):
+        con = duckdb.connect()
+        first, second = con.execute_batch(["select 1", "select 2"])
+        con.execute("select 3")
+        assert second.fetchall() == [(2,)]
+        assert first.fetchall() == [(1,)]
+
+    def test_transaction_rollback(self):
+        con = duckdb.connect()
+        con.execute("create table t (i integer primary key)")
+        with pytest.raises(duckdb.ConstraintException):
+            con.execute_batch(
+                ["insert into t values (1)", "insert into t values (1)"], return_results=False, transaction=True
+            )
+        assert con.sql("select count(*) from t").fetchall() == [(0,)]
+        # the connection is back in auto-commit mode
+        con.execute("insert into t values (2)")
+        assert con.sql("select i from t").fetchall() == [(2,)]
+
+    def test_without_transaction(self):
+        con = duckdb.connect()
+        con.execute("create table t (i integer primary key)")
+        with pytest.raises(duckdb.ConstraintException):
+            con.execute_batch(["insert into t values (1)", "insert into t values (1)"], return_results=False)
+        assert con.sql("select i from t").fetchall() == [(1,)]
+
+    def test_inside_open_transaction(self):
+        con = duckdb.connect()
+        con.execute("create table t (i integer)")
+        con.begin()
+        con.execute_batch(["insert into t values (1)"], return_results=False, transaction=True)
+        con.rollback()
+        assert con.sql("select count(*) from t").fetchall() == [(0,)]
+
+    def test_invalid_entry_runs_nothing(self):
+        con = duckdb.connect()
+        con.execute("create table t (i integer)")
+        with pytest.raises(duckdb.InvalidInputException, match="tuple of 3"):
+            con.execute_batch(["insert into t values (1)", ("select ?", [1], None)])
+        assert con.sql("select count(*) from t").fetchall() == [(0,)]
+
+    def test_single_query(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match="list of queries"):
+            con.execute_batch("select 42")
+
+    def test_empty(self):
+        con = duckdb.connect()
+        assert con.execute_batch([]) == []
+
+    def test_default_connection(self):
+        (result,) = duckdb.execute_batch([("select ?", [42])])
+        assert result.fetchall() == [(42,)]
@@ -0,0 +1,132 @@
+import datetime
+
+import pytest
+
+import duckdb
+from duckdb.sqltypes import BIGINT, VARCHAR
+
+
+@pytest.fixture
+def con():
+    with duckdb.connect() as con:
+        con.execute("create table t as select range i, range::varchar s from range(10)")
+        yield con
+
+
+class TestPreparedStatement:
+    def test_execute(self, con):
+        stmt = con.prepare("select s from t where i = ?")
+        for i in range(3):
+            assert stmt.execute([i]).fetchall() == [(str(i),)]
+        assert stmt.execute((5,)).fetchone() == ("5",)
+
+    def test_named_parameters(self, con):
+        stmt = con.prepare("select i from t where i >= $low and i < $high order by i")
+        assert stmt.execute({"low": 2, "high": 5}).fetchall() == [(2,), (3,), (4,)]
+        assert stmt.execute({"high": 2, "low": 0}).fetchmany(1) == [(0,)]
+        with pytest.raises(duckdb.InvalidInputException, match="were not provided"):
+            stmt.execute({"low": 2})
+
+    def test_parameter_count(self, con):
+        stmt = con.prepare("select ?, ?")
+        with pytest.raises(duckdb.InvalidInputException, match="Prepared statement needs 2 parameters, 1 given"):
+            stmt.execute([1])
+
+    def test_executemany(self, con):
+        stmt = con.prepare("insert into t values (?, ?)")
+        stmt.executemany([[10, "ten"], [11, "eleven"]])
+        assert con.execute("select s from t where i >= 10 order by i").fetchall() == [("ten",), ("eleven",)]
+        with pytest.raises(duckdb.InvalidInputException, match="non-empty list"):
+            stmt.executemany([])
+
+    def test_metadata(self, con):
+        stmt = con.prepare("select i, s from t where i = $i")
+        assert stmt.query == "select i, s from t where i = $i"
+        assert stmt.type == duckdb.StatementType.SELECT
+        assert stmt.columns == ["i", "s"]
+        assert stmt.types == [BIGINT, VARCHAR]
+        assert stmt.parameter_types == {"i": BIGINT}
+
+        stmt = con.prepare("select ?, ?::varchar")
+        assert stmt.parameter_types == {"1": None, "2": VARCHAR}
+
+    def test_description(self, con):
+        stmt = con.prepare("select i from t limit 1")
+        stmt.execute()
+        assert stmt.description[0][0] == "i"
+        assert con.fetchall() == [(0,)]
+
+    def test_fetch_df(self, con):
+        pd = pytest.importorskip("pandas")
+        stmt = con.prepare("select i from t where i < ? order by i")
+        df = stmt.execute([3]).df()
+        pd.testing.assert_frame_equal(df, pd.DataFrame({"i": [0, 1, 2]}))
+
+    def test_catalog_change(self, con):
+        stmt = con.prepare("select * from t where i = 1")
+        con.execute("alter table t add column d double default 0.5")
+        assert stmt.execute().fetchall() == [(1, "1", 0.5)]
+
+    def test_replacement_scan(self, con):
+        rel = con.sql("select 1 a")
+        stmt = con.prepare("select a from rel")
+        assert stmt.execute().fetchall() == [(1,)]
+        rel = con.sql("select 2 a")  # noqa: F841
+        assert stmt.execute().fetchall() == [(2,)]
+
+    def test_multiple_statements(self, con):
+        with pytest.raises(duckdb.InvalidInputException, match="single statement"):
+            con.prepare("select 1; select 2")
+
+    def test_statement_object(self, con):
+        statement = con.extract_statements("select 42")[0]
+        assert con.prepare(statement).execute().fetchall() == [(42,)]
+
+    def test_closed(self, con):
+        stmt = con.prepare("select 42")
+        stmt.close()
+        with pytest.raises(duckdb.InvalidInputException, match="closed"):
+            stmt.execute()
+
+    def test_closed_connection(self):
+        con = duckdb.connect()
+        stmt = con.prepare("select 42")
+        con.close()
+        with pytest.raises(duckdb.ConnectionException):
+            stmt.execute()
+
+    def test_module_level(self):
+        stmt = duckdb.prepare("select ?::integer + 1")
+        assert stmt.execute([41]).fetchall() == [(42,)]
+
+    def test_parameter_type_changes(self, con):
+        stmt = con.prepare("select ?, typeof(?)")
+        values = [
+            (1, "INTEGER"),
+            (2**40, "BIGINT"),
+            (2**70, "HUGEINT"),
+            ("x", "VARCHAR"),
+            (None, '"NULL"'),
+            (True, "BOOLEAN"),
+            (1.5, "DOUBLE"),
+            (datetime.datetime(2024, 1, 2, 3, 4, 5), "TIMESTAMP"),
+            (datetime.date(2024, 1, 2), "DATE"),
+            (3, "INTEGER"),
+        ]
+        for value, type_name in values:
+            assert stmt.execute([value, value]).fetchone() == (value, type_name)
+
+    def test_parameter_subclass(self, con):
+        class MyInt(int):
+            pass
+
+        stmt = con.prepare("select ?")
+        assert stmt.execute([1]).fetchone() == (1,)
+        assert stmt.execute([MyInt(2)]).fetchone() == (2,)
+
+    def test_bigint_parameter(self, con):
+        stmt = con.prepare("select s from t where i = ?")
+        for i in range(3):
+            assert stmt.execute([i]).fetchone() == (str(i),)
+        assert stmt.execute(["4"]).fetchone() == ("4",)
+        assert stmt.execute([2**40]).fetchone() is None
@@ -0,0 +1,120 @@
+import platform
+import threading
+
+import pytest
+
+import duckdb
+from duckdb.sqltypes import INTEGER
+
+pytestmark = pytest.mark.xfail(
+    condition=platform.system() == "Emscripten",
+    reason="threads not allowed on Emscripten",
+)
+
+LONG_QUERY = "select count(*) from range(100000000000)"
+
+
+class TestQueryFuture:
+    def test_result(self):
+        con = duckdb.connect()
+        future = con.submit("select range i from range(5) where i < ?", [3])
+        rel = future.result()
+        assert rel.fetchall() == [(0,), (1,), (2,)]
+        assert future.done()
+        assert future.progress() == 100
+        assert future.result() is rel
+
+    def test_many_in_flight(self):
+        con = duckdb.connect()
+        cursors = [con.cursor() for _ in range(4)]
+        futures = [
+            cursor.submit("select sum(range) from range(?)", [1000000 * (i + 1)]) for i, cursor in enumerate(cursors)
+        ]
+        results = [future.result().fetchone()[0] for future in futures]
+        assert results == [sum(range(1000000 * (i + 1))) for i in range(4)]
+
+    def test_error(self):
+        con = duckdb.connect()
+        # fails while executing, binding errors are raised by submit
+        future = con.submit("select (i::varchar || 'a')::integer from range(10) t(i)")
+        with pytest.raises(duckdb.ConversionException):
+            future.result()
+        assert future.done()
+
+    def test_cancel(self):
+        con = duckdb.connect()
+        future = con.submit(LONG_QUERY)
+        assert not future.done()
+        assert future.cancel()
+        with pytest.raises(duckdb.InterruptException):
+            future.result()
+        assert future.cancelled()
+        assert not future.cancel()
+        assert con.execute("select 42").fetchall() == [(42,)]
+
+    def test_timeout(self):
+        con = duckdb.connect()
+        future = con.submit(LONG_QUERY)
+        with pytest.raises(TimeoutError):
+            future.result(timeout=0.01)
+        future.cancel()
+
+    def test_serialized_on_connection(self):
+        con = duckdb.connect()
+        running = threading.Event()
+        proceed = threading.Event()
+
+        def block(x):
+            running.set()
+            proceed.wait(10)
+            return x
+
+        con.create_function("block", block, [INTEGER], INTEGER)
+        future = con.submit("select block(42)")
+        assert running.wait(10)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(con.execute("select 1").fetchone()))
+        thread.start()
+        # the submitted query holds the connection until it finished, so the other query can't run yet
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert results == []
+        proceed.set()
+        thread.join()
+        assert results == [(1,)]
+        assert future.done()
+        assert future.result().fetchall() == [(42,)]
+
+    def test_local_dataframe(self):
+        pd = pytest.importorskip("pandas")
+        con = duckdb.connect()
+        local_df = pd.DataFrame({"a": [1, 2, 3]})  # noqa: F841
+        # the query is bound on this thread, so the replacement scan finds the local variable
+        future = con.submit("select sum(a) from local_df where a > ?", [1])
+        assert future.result().fetchall() == [(5,)]
+
+    def test_local_arrow_table(self):
+        pa = pytest.importorskip("pyarrow")
+        con = duckdb.connect()
+        local_table = pa.table({"a": [1, 2, 3]})  # noqa: F841
+        assert con.submit("select sum(a) from local_table").result().fetchall() == [(6,)]
+
+    def test_bind_error_releases_connection(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.CatalogException):
+            con.submit("select * from missing_table")
+        assert con.execute("select 42").fetchall() == [(42,)]
+
+    def test_preceding_statements(self):
+        con = duckdb.connect()
+        future = con.submit("create table t as select 1 i; select i + 1 from t")
+        assert future.result().fetchall() == [(2,)]
+
+    def test_module_level(self):
+        assert duckdb.submit("select 42").result().fetchall() == [(42,)]
+
+    def test_discarded_future(self):
+        con = duckdb.connect()
+        con.submit(LONG_QUERY)
+        # the discarded query is interrupted instead of holding the connection
+        assert con.execute("select 42").fetchall() == [(42,)]
@@ -1,7 +1,7 @@
 import datetime
 import platform
 import sys
-from io import BytesIO, StringIO
+from io import BytesIO, StringIO, UnsupportedOperation
 from pathlib import Path
 from typing import NoReturn
 
@@ -379,6 +379,83 @@ class TestReadCSV:
         res = duckdb_cursor.read_csv(obj).fetchall()
         assert res == [("a", "b", "c")]
 
+    def test_filelike_read_in_place(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+
+        class NoCopyIO(BytesIO):
+            def read(self, amount=-1):
+                msg = "the object should be read in place, not copied"
+                raise AssertionError(msg)
+
+        obj = NoCopyIO(b"i\n" + b"".join(b"%d\n" % i for i in range(100_000)))
+        obj.seek(2)
+        rel = duckdb_cursor.read_csv(obj, header=False)
+        # reading starts at the position of the object, like read() would
+        assert rel.aggregate("sum(column0)").fetchall() == [(sum(range(100_000)),)]
+        assert rel.aggregate("count(*)").fetchall() == [(100_000,)]
+
+    def test_filelike_position_is_kept(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+        obj = BytesIO(b"a,b\n1,2\n3,4\n")
+        rel = duckdb_cursor.read_csv(obj)
+        obj.seek(5)
+        assert rel.fetchall() == [(1, 2), (3, 4)]
+        assert obj.tell() == 5
+        assert obj.read() == b",2\n3,4\n"
+
+    def test_filelike_without_tell_is_copied(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+
+        class NoTellIO(BytesIO):
+            def tell(self) -> NoReturn:
+                raise UnsupportedOperation
+
+        obj = NoTellIO(b"a,b\n1,2\n")
+        rel = duckdb_cursor.read_csv(obj)
+        obj.close()
+        # copied when it was registered, closing it doesn't matter
+        assert rel.fetchall() == [(1, 2)]
+
+    def test_filelike_closed_before_execution(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+        obj = BytesIO(b"a,b\n1,2\n")
+        rel = duckdb_cursor.read_csv(obj)
+        obj.close()
+        with pytest.raises(duckdb.Error, match="closed before the relation reading it was executed"):
+            rel.fetchall()
+
+    def test_filelike_changed_before_execution(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+        obj = BytesIO(b"a,b\n1,2\n")
+        rel = duckdb_cursor.read_csv(obj)
+        assert rel.fetchall() == [(1, 2)]
+        # the object is read again on every execution, so the change is visible
+        obj.seek(4)
+        obj.write(b"3,4")
+        assert rel.fetchall() == [(3, 4)]
+
+    def test_filelike_non_seekable(self, duckdb_cursor):
+        _ = pytest.importorskip("fsspec")
+
+        class Stream:
+            def __init__(self, data) -> None:
+                self.data = BytesIO(data)
+
+            def read(self, amount=-1):
+                return self.data.read(amount)
+
+            def seek(self, loc):
+                msg = "not seekable"
+                raise OSError(msg)
+
+            def seekable(self):
+                return False
+
+        rel = duckdb_cursor.read_csv(Stream(b"a,b\n1,2\n3,4\n"))
+        assert rel.fetchall() == [(1, 2), (3, 4)]
+        # the consumed bytes are kept, so the relation can be executed again
+        assert rel.fetchall() == [(1, 2), (3, 4)]
+
     def test_filelike_non_readable(self, duckdb_cursor):
         _ = pytest.importorskip("fsspec")
         obj = 5
@@ -0,0 +1,125 @@
+import pytest
+
+import duckdb
+
+
+@pytest.fixture
+def con():
+    with duckdb.connect(config={"python_statement_cache_size": 2}) as con:
+        con.execute("create table t as select range i, range::varchar s from range(10)")
+        yield con
+
+
+class TestStatementCache:
+    def test_disabled_by_default(self):
+        con = duckdb.connect()
+        con.execute("select 42").fetchall()
+        con.execute("select 42").fetchall()
+        assert con.statement_cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "rebinds": 0,
+            "direct_parameters": 0,
+            "generic_parameters": 0,
+            "cached_statements": 0,
+            "cache_size": 0,
+        }
+
+    def test_hits(self, con):
+        for i in range(5):
+            assert con.execute("select s from t where i = ?", [i]).fetchall() == [(str(i),)]
+        stats = con.statement_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 4
+        assert stats["cached_statements"] == 1
+        assert stats["cache_size"] == 2
+
+    def test_parameter_conversion(self, con):
+        from decimal import Decimal
+
+        for i in range(5):
+            assert con.execute("select s from t where i = ? and s = ?", [i, str(i)]).fetchall() == [(str(i),)]
+        stats = con.statement_cache_stats()
+        # ints and strs are converted without going through the generic conversion
+        assert stats["direct_parameters"] == 10
+        assert stats["generic_parameters"] == 0
+
+        assert con.execute("select s from t where i = ?", [Decimal(3)]).fetchall() == [("3",)]
+        stats = con.statement_cache_stats()
+        assert stats["direct_parameters"] == 10
+        assert stats["generic_parameters"] == 1
+
+    def test_parameter_style(self, con):
+        assert con.execute("select $x", {"x": 1}).fetchall() == [(1,)]
+        with pytest.raises(duckdb.Error):
+            con.execute("select $x", [1])
+        assert con.execute("select $x", {"x": 2}).fetchall() == [(2,)]
+        stats = con.statement_cache_stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 1
+
+    def test_eviction(self, con):
+        for query in ["select 1", "select 2", "select 3", "select 1"]:
+            con.execute(query).fetchall()
+        stats = con.statement_cache_stats()
+        assert stats["misses"] == 4
+        assert stats["cached_statements"] == 2
+
+    def test_uncached_statements(self, con):
+        con.execute("create table u (i integer)")
+        con.execute("insert into u values (1); insert into u values (2)")
+        assert con.execute("select count(*) from u").fetchall() == [(2,)]
+        assert con.statement_cache_stats()["misses"] == 1
+
+    def test_catalog_change(self, con):
+        assert con.execute("select * from t where i = 1").fetchall() == [(1, "1")]
+        con.execute("alter table t add column d double default 0.5")
+        assert con.execute("select * from t where i = 1").fetchall() == [(1, "1", 0.5)]
+        con.execute("drop table t")
+        with pytest.raises(duckdb.CatalogException):
+            con.execute("select * from t where i = 1")
+        con.execute("create table t as select 1 i, 'one' s")
+        assert con.execute("select * from t where i = 1").fetchall() == [(1, "one")]
+        assert con.execute("select * from t where i = 1").fetchall() == [(1, "one")]
+        stats = con.statement_cache_stats()
+        # the rebound statement is dropped from the cache and prepared again by the next execution
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["rebinds"] == 1
+
+    def test_use_schema(self, con):
+        con.execute("create schema other")
+        con.execute("create table other.t as select range i, 'other ' || range s from range(10)")
+        assert con.execute("select s from t where i = ?", [1]).fetchall() == [("1",)]
+        con.execute("use other")
+        assert con.execute("select s from t where i = ?", [1]).fetchall() == [("other 1",)]
+        assert con.execute("select s from t where i = ?", [2]).fetchall() == [("other 2",)]
+        stats = con.statement_cache_stats()
+        # the statement is prepared again for the new search path, and reused within it
+        assert stats["misses"] == 2
+        assert stats["hits"] == 1
+        con.execute("set search_path = 'main'")
+        assert con.execute("select s from t where i = ?", [1]).fetchall() == [("1",)]
+
+    def test_replacement_scan(self, con):
+        rel = con.sql("select 1 a")
+        assert con.execute("select a from rel").fetchall() == [(1,)]
+        rel = con.sql("select 2 a")  # noqa: F841
+        assert con.execute("select a from rel").fetchall() == [(2,)]
+        assert con.statement_cache_stats()["hits"] == 1
+
+    def test_setting(self, con):
+        con.execute("select 1").fetchall()
+        con.execute("set python_statement_cache_size = 0")
+        con.execute("select 1").fetchall()
+        stats = con.statement_cache_stats()
+        assert stats["cache_size"] == 0
+        assert stats["cached_statements"] == 0
+        assert stats["hits"] == 0
+
+    def test_cursor(self, con):
+        cursor = con.cursor()
+        cursor.execute("select 1").fetchall()
+        cursor.execute("select 1").fetchall()
+        assert cursor.statement_cache_stats()["hits"] == 1
+        assert con.statement_cache_stats()["hits"] == 0
@@ -1,5 +1,6 @@
 import csv
 import datetime
+import io
 import os
 import tempfile
 
@@ -299,3 +300,16 @@ class TestToCSV:
         rel.to_csv(temp_file_name, header=True, use_tmp_file=True)
         csv_rel = duckdb.read_csv(temp_file_name, header=True)
         assert rel.execute().fetchall() == csv_rel.execute().fetchall()
+
+    def test_to_csv_file_like_object(self):
+        pytest.importorskip("fsspec")
+        rel = duckdb.sql("select i, 'välue_' || i as s from range(100000) t(i)")
+        buffer = io.BytesIO()
+        rel.to_csv(buffer, header=True)
+        assert buffer.getvalue().startswith(b"i,s\n0,v\xc3\xa4lue_0\n")
+
+        # text objects receive the decoded file
+        text = io.StringIO()
+        rel.to_csv(text, header=True)
+        assert text.getvalue() == buffer.getvalue().decode()
+        assert duckdb.read_csv(io.StringIO(text.getvalue())).fetchall() == rel.fetchall()
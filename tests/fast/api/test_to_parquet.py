@@ -1,3 +1,4 @@
+import io
 import os
 import pathlib
 import re
@@ -247,3 +248,21 @@ class TestToParquet:
         # With large file size limits, should create just one file
         parquet_rel = duckdb.read_parquet(temp_file_name)
         assert rel.execute().fetchall() == parquet_rel.execute().fetchall()
+
+    def test_file_like_object(self):
+        pytest.importorskip("fsspec")
+        rel = duckdb.sql("select i, 'value_' || i as s from range(10000) t(i)")
+        buffer = io.BytesIO()
+        rel.to_parquet(buffer, row_group_size=2000)
+        assert buffer.getvalue()[:4] == b"PAR1"
+
+        buffer.seek(0)
+        assert duckdb.read_parquet(buffer).fetchall() == rel.fetchall()
+
+    def test_file_like_object_single_file(self):
+        pytest.importorskip("fsspec")
+        rel = duckdb.sql("select 1 as a")
+        with pytest.raises(duckdb.InvalidInputException, match="'partition_by' is not supported"):
+            rel.to_parquet(io.BytesIO(), partition_by=["a"])
+        with pytest.raises(duckdb.InvalidInputException, match="'file_name' as a path or a writable file-like object"):
+            rel.to_parquet(42)
@@ -0,0 +1,123 @@
+import struct
+
+import pytest
+
+import duckdb
+
+pa = pytest.importorskip("pyarrow")
+ipc = pytest.importorskip("pyarrow.ipc")
+
+
+def get_table():
+    return pa.table(
+        {
+            "i": pa.array([1, 2, None, 4], pa.int64()),
+            "s": pa.array(["foo", None, "baz", "qux"]),
+            "l": pa.array([[1], [], None, [2, 3]], pa.list_(pa.int32())),
+            "st": pa.array([{"x": 1.5}, None, {"x": None}, {"x": 2.5}]),
+        }
+    )
+
+
+def write_file(path, table, batch_size=2):
+    with ipc.new_file(path, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            writer.write_batch(batch)
+
+
+def write_stream(path, table, batch_size=2):
+    with ipc.new_stream(path, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=batch_size):
+            writer.write_batch(batch)
+
+
+class TestReadArrowIPC:
+    @pytest.mark.parametrize("writer", [write_file, write_stream])
+    def test_read_arrow_ipc(self, duckdb_cursor, tmp_path, writer):
+        path = str(tmp_path / "table.arrow")
+        table = get_table()
+        writer(path, table)
+        rel = duckdb_cursor.read_arrow_ipc(path)
+        assert rel.columns == ["i", "s", "l", "st"]
+        assert rel.fetchall() == duckdb_cursor.from_arrow(table).fetchall()
+
+    def test_read_arrow_ipc_projection(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "table.arrow")
+        write_file(path, get_table())
+        res = duckdb_cursor.sql(f"select st, i from read_arrow_ipc('{path}') where i > 1").fetchall()
+        assert res == [(None, 2), ({"x": 2.5}, 4)]
+        assert duckdb_cursor.sql(f"select count(*) from read_arrow_ipc('{path}')").fetchone() == (4,)
+
+    def test_read_arrow_ipc_types(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "table.arrow")
+        table = pa.table(
+            {
+                "b": pa.array([True, None, False]),
+                "d": pa.array([1.25, 2.5, None], pa.decimal128(10, 2)),
+                "ts": pa.array([0, None, 86400], pa.timestamp("s")),
+                "date": pa.array([0, 1, None], pa.date32()),
+                "bin": pa.array([b"a", None, b"bc"], pa.large_binary()),
+                "f": pa.array([1.0, None, 3.0], pa.float32()),
+                "u": pa.array([1, 2, None], pa.uint8()),
+            }
+        )
+        write_file(path, table)
+        assert duckdb_cursor.read_arrow_ipc(path).fetchall() == duckdb_cursor.from_arrow(table).fetchall()
+
+    def test_read_arrow_ipc_large(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "table.arrow")
+        write_file(path, pa.table({"a": pa.array(range(1_000_000))}), batch_size=100_000)
+        res = duckdb_cursor.read_arrow_ipc(path).aggregate("count(*), sum(a)").fetchone()
+        assert res == (1_000_000, sum(range(1_000_000)))
+        # the record batches keep their order
+        assert duckdb_cursor.read_arrow_ipc(path).fetchnumpy()["a"].tolist() == list(range(1_000_000))
+
+    def test_read_arrow_ipc_shards(self, duckdb_cursor, tmp_path):
+        for i in range(3):
+            write_file(str(tmp_path / f"shard_{i}.arrow"), get_table())
+        rel = duckdb_cursor.read_arrow_ipc(str(tmp_path / "shard_*.arrow"))
+        assert rel.aggregate("count(*), sum(i)").fetchone() == (12, 21)
+
+    def test_read_arrow_ipc_schema_mismatch(self, duckdb_cursor, tmp_path):
+        write_file(str(tmp_path / "shard_0.arrow"), pa.table({"a": pa.array([1, 2])}))
+        write_file(str(tmp_path / "shard_1.arrow"), pa.table({"a": pa.array(["x", "y"])}))
+        with pytest.raises(duckdb.InvalidInputException, match="does not have the same schema"):
+            duckdb_cursor.read_arrow_ipc(str(tmp_path / "shard_*.arrow")).fetchall()
+
+    def test_read_arrow_ipc_dictionary(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "table.arrow")
+        write_file(path, pa.table({"a": pa.array(["x", "y", "x"]).dictionary_encode()}))
+        with pytest.raises(duckdb.NotImplementedException, match="dictionary"):
+            duckdb_cursor.read_arrow_ipc(path)
+
+    def test_read_arrow_ipc_invalid(self, duckdb_cursor, tmp_path):
+        path = tmp_path / "table.arrow"
+        path.write_bytes(b"not an arrow file")
+        with pytest.raises(duckdb.Error):
+            duckdb_cursor.read_arrow_ipc(str(path))
+
+    def test_read_arrow_ipc_corrupted(self, duckdb_cursor, tmp_path):
+        path = tmp_path / "table.arrow"
+        write_stream(str(path), pa.table({"s": pa.array(["x" * 11, "y" * 13])}))
+        data = path.read_bytes()
+        # let the last offset of the string column point past its data
+        offsets = struct.pack("<3i", 0, 11, 24)
+        assert data.count(offsets) == 1
+        path.write_bytes(data.replace(offsets, struct.pack("<3i", 0, 11, 1 << 30)))
+        with pytest.raises(duckdb.InvalidInputException, match="not a valid Arrow IPC file"):
+            duckdb_cursor.read_arrow_ipc(str(path)).fetchall()
+
+        path.write_bytes(data.replace(offsets, struct.pack("<3i", 0, 20, 11)))
+        with pytest.raises(duckdb.InvalidInputException, match="not a valid Arrow IPC file"):
+            duckdb_cursor.read_arrow_ipc(str(path)).fetchall()
+
+        # a truncated body
+        path.write_bytes(data[: data.index(offsets) + 4])
+        with pytest.raises(duckdb.Error):
+            duckdb_cursor.read_arrow_ipc(str(path)).fetchall()
+
+    def test_read_arrow_ipc_module(self, tmp_path):
+        path = str(tmp_path / "table.arrow")
+        write_stream(path, get_table())
+        con = duckdb.connect()
+        assert duckdb.read_arrow_ipc(path, connection=con).aggregate("count(*)").fetchone() == (4,)
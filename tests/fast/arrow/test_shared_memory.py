@@ -0,0 +1,76 @@
+import subprocess
+import sys
+import uuid
+
+import pytest
+
+import duckdb
+
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def segment_name():
+    return f"duckdb_test_{uuid.uuid4().hex[:16]}"
+
+
+class TestSharedMemory:
+    def test_round_trip(self, duckdb_cursor, segment_name):
+        rel = duckdb_cursor.sql("select i, i::varchar as s from range(10000) t(i)")
+        with rel.to_shared_memory(segment_name) as shared:
+            assert shared.name == segment_name
+            with duckdb.attach_shared_result(segment_name) as attached:
+                table = attached.to_arrow_table()
+                assert table.num_rows == 10000
+                assert table.column_names == ["i", "s"]
+                res = attached.to_relation(connection=duckdb_cursor).aggregate("sum(i)").fetchone()
+                assert res == (sum(range(10000)),)
+
+    def test_table_outlives_handle(self, duckdb_cursor, segment_name):
+        shared = duckdb_cursor.sql("select 42 as a").to_shared_memory(segment_name)
+        table = shared.to_arrow_table()
+        shared.close()
+        assert shared.closed
+        assert table.to_pydict() == {"a": [42]}
+        with pytest.raises(ValueError, match="closed"):
+            shared.to_arrow_table()
+
+    def test_released_after_last_close(self, duckdb_cursor, segment_name):
+        shared = duckdb_cursor.sql("select 1 as a").to_shared_memory(segment_name)
+        attached = duckdb.attach_shared_result(segment_name)
+        shared.close()
+        # the attached handle still holds a reference
+        assert duckdb.attach_shared_result(segment_name).to_arrow_table().num_rows == 1
+        attached.close()
+        with pytest.raises(FileNotFoundError):
+            duckdb.attach_shared_result(segment_name)
+
+    def test_name_in_use(self, duckdb_cursor, segment_name):
+        with duckdb_cursor.sql("select 1").to_shared_memory(segment_name), pytest.raises(FileExistsError):
+            duckdb_cursor.sql("select 2").to_shared_memory(segment_name)
+
+    @pytest.mark.parametrize("name", ["../escape", "a/b", "/", ".."])
+    def test_invalid_name(self, duckdb_cursor, name):
+        with pytest.raises(ValueError, match="Invalid shared memory segment name"):
+            duckdb_cursor.sql("select 1").to_shared_memory(name)
+        with pytest.raises(ValueError, match="Invalid shared memory segment name"):
+            duckdb.attach_shared_result(name)
+
+    def test_multiple_batches(self, duckdb_cursor, segment_name):
+        rel = duckdb_cursor.sql("select i from range(1000000) t(i)")
+        with rel.to_shared_memory(segment_name) as shared:
+            assert shared.to_arrow_table().num_rows == 1000000
+            res = shared.to_relation(connection=duckdb_cursor).aggregate("sum(i)").fetchone()
+            assert res == (sum(range(1000000)),)
+
+    def test_other_process(self, duckdb_cursor, segment_name):
+        with duckdb_cursor.sql("select * from range(100) t(i)").to_shared_memory(segment_name):
+            script = (
+                "import duckdb\n"
+                f"with duckdb.attach_shared_result({segment_name!r}) as shared:\n"
+                "    print(shared.to_relation().aggregate('sum(i)').fetchone()[0])\n"
+            )
+            output = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
+            assert output.stdout.strip() == str(sum(range(100)))
+            # the other process released its reference only
+            assert duckdb.attach_shared_result(segment_name).to_arrow_table().num_rows == 100
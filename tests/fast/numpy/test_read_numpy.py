@@ -0,0 +1,95 @@
+import io
+
+import pytest
+
+import duckdb
+
+np = pytest.importorskip("numpy")
+
+
+def write_header(path, header):
+    # a version 1.0 .npy file with the given header and without any data
+    data = header.encode("latin1")
+    path.write_bytes(b"\x93NUMPY\x01\x00" + len(data).to_bytes(2, "little") + data)
+
+
+class TestReadNumpy:
+    def test_read_numpy(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.arange(5000, dtype=np.int64))
+        rel = duckdb_cursor.read_numpy(path)
+        assert rel.columns == ["column0"]
+        assert rel.aggregate("count(*), sum(column0)").fetchone() == (5000, sum(range(5000)))
+        assert duckdb_cursor.sql(f"select * from read_numpy('{path}') limit 2").fetchall() == [(0,), (1,)]
+
+    def test_read_numpy_2d(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.array([[1, 2, 3], [4, 5, 6]], dtype=np.int32))
+        # like a scanned ndarray, every row of a 2-D array is a column
+        assert duckdb_cursor.read_numpy(path).fetchall() == [(1, 4), (2, 5), (3, 6)]
+
+        np.save(path, np.asfortranarray(np.array([[1, 2, 3], [4, 5, 6]], dtype=np.int32)))
+        assert duckdb_cursor.read_numpy(path).fetchall() == [(1, 4), (2, 5), (3, 6)]
+
+    def test_read_numpy_structured(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "array.npy")
+        dtype = np.dtype([("a", "i2"), ("b", "f8"), ("c", "U3")], align=True)
+        np.save(path, np.array([(1, 0.5, "x"), (2, np.nan, "yz")], dtype=dtype))
+        rel = duckdb_cursor.read_numpy(path)
+        assert rel.columns == ["a", "b", "c"]
+        assert rel.fetchall() == [(1, 0.5, "x"), (2, None, "yz")]
+
+    def test_read_numpy_nulls(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.array(["2024-01-01", "NaT"], dtype="datetime64[us]"))
+        res = duckdb_cursor.read_numpy(path).fetchall()
+        assert res[0][0].year == 2024
+        assert res[1] == (None,)
+
+    def test_read_numpy_shards(self, duckdb_cursor, tmp_path):
+        for i in range(3):
+            np.save(str(tmp_path / f"shard_{i}.npy"), np.arange(i * 10, (i + 1) * 10, dtype=np.float32))
+        rel = duckdb_cursor.read_numpy(str(tmp_path / "shard_*.npy"))
+        assert rel.aggregate("count(*), sum(column0)").fetchone() == (30, sum(range(30)))
+
+        rel = duckdb_cursor.read_numpy([str(tmp_path / "shard_0.npy"), str(tmp_path / "shard_2.npy")])
+        assert rel.aggregate("count(*)").fetchone() == (20,)
+
+    def test_read_numpy_mismatch(self, duckdb_cursor, tmp_path):
+        np.save(str(tmp_path / "shard_0.npy"), np.arange(10, dtype=np.int64))
+        np.save(str(tmp_path / "shard_1.npy"), np.arange(10, dtype=np.int32))
+        with pytest.raises(duckdb.InvalidInputException, match="does not have the same columns"):
+            duckdb_cursor.read_numpy(str(tmp_path / "shard_*.npy")).fetchall()
+
+    def test_read_numpy_object(self, duckdb_cursor, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.array([1, "a"], dtype=object))
+        with pytest.raises(duckdb.NotImplementedException, match="pickle"):
+            duckdb_cursor.read_numpy(path)
+
+    def test_read_numpy_invalid_header(self, duckdb_cursor, tmp_path):
+        path = tmp_path / "array.npy"
+        write_header(path, "[" * 10000)
+        with pytest.raises(duckdb.InvalidInputException, match="nested"):
+            duckdb_cursor.read_numpy(str(path))
+
+        write_header(path, "{'descr': '<i8', 'fortran_order': False, 'shape': (99999999999999999999,)}")
+        with pytest.raises(duckdb.InvalidInputException, match="does not have a valid"):
+            duckdb_cursor.read_numpy(str(path))
+
+        # the size of the data does not fit in 64 bits
+        write_header(path, f"{{'descr': '<i8', 'fortran_order': False, 'shape': ({2**62}, 4)}}")
+        with pytest.raises(duckdb.InvalidInputException, match="too large"):
+            duckdb_cursor.read_numpy(str(path))
+
+    def test_read_numpy_file_like_object(self, duckdb_cursor):
+        buffer = io.BytesIO()
+        np.save(buffer, np.array([1.5, 2.5]))
+        buffer.seek(0)
+        assert duckdb_cursor.read_numpy(buffer).fetchall() == [(1.5,), (2.5,)]
+
+    def test_read_numpy_module(self, tmp_path):
+        path = str(tmp_path / "array.npy")
+        np.save(path, np.array([True, False]))
+        con = duckdb.connect()
+        assert duckdb.read_numpy(path, connection=con).fetchall() == [(True,), (False,)]
@@ -0,0 +1,126 @@
+import threading
+import time
+
+import pytest
+
+import duckdb
+
+
+@pytest.fixture
+def pool():
+    with duckdb.ConnectionPool(min_size=1, max_size=2) as pool:
+        with pool.connection() as con:
+            con.execute("create table t as select range i from range(10)")
+        yield pool
+
+
+class TestConnectionPool:
+    def test_shared_database(self, pool):
+        with pool.connection() as con1, pool.connection() as con2:
+            assert con1 is not con2
+            con1.execute("insert into t values (10)")
+            assert con2.execute("select count(*) from t").fetchone() == (11,)
+
+    def test_reuse(self, pool):
+        with pool.connection() as con:
+            first = con
+        with pool.connection() as con:
+            assert con is first
+        stats = pool.stats()
+        assert stats["size"] == 1
+        assert stats["idle"] == 1
+        assert stats["in_use"] == 0
+
+    def test_rollback_on_release(self, pool):
+        with pool.connection() as con:
+            con.begin()
+            con.execute("insert into t values (10)")
+        with pool.connection() as con:
+            assert con.execute("select count(*) from t").fetchone() == (10,)
+
+    def test_result_cleared_on_release(self, pool):
+        with pool.connection() as con:
+            con.execute("select * from t")
+        with pool.connection() as con, pytest.raises(duckdb.InvalidInputException, match="No open result set"):
+            con.fetchall()
+
+    def test_timeout(self, pool):
+        con1 = pool.acquire()
+        con2 = pool.acquire()
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+        assert pool.stats()["timeouts"] == 1
+        pool.release(con1)
+        pool.release(con2)
+
+    def test_wait(self, monkeypatch):
+        hold = 0.2
+        waiting = threading.Event()
+
+        class Condition(threading.Condition):
+            def wait(self, timeout=None):
+                waiting.set()
+                return super().wait(timeout)
+
+        with duckdb.ConnectionPool(max_size=1) as pool:
+            monkeypatch.setattr(pool, "_condition", Condition())
+            held = pool.acquire()
+            acquired = []
+
+            def worker():
+                with pool.connection() as con:
+                    acquired.append(con.execute("select 42").fetchone())
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            # the worker waits from before the connection is held for the known interval until it is released
+            assert waiting.wait(10)
+            time.sleep(hold)
+            pool.release(held)
+            thread.join()
+            assert acquired == [(42,)]
+            stats = pool.stats()
+            assert stats["acquisitions"] == 2
+            assert stats["waits"] == 1
+            assert stats["max_wait_time"] >= hold
+            assert stats["wait_time"] == stats["max_wait_time"]
+
+    def test_many_threads(self, pool):
+        def worker():
+            for _ in range(20):
+                with pool.connection() as con:
+                    assert con.execute("select count(*) from t").fetchone() == (10,)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert pool.stats()["size"] <= pool.max_size
+
+    def test_closed_connection(self, pool):
+        con = pool.acquire()
+        con.close()
+        pool.release(con)
+        assert pool.stats()["size"] == 0
+        with pool.connection() as con:
+            assert con.execute("select 1").fetchone() == (1,)
+
+    def test_foreign_connection(self, pool):
+        with pytest.raises(duckdb.InvalidInputException, match="not acquired from this pool"):
+            pool.release(duckdb.connect())
+
+    def test_close(self, pool):
+        con = pool.acquire()
+        pool.close()
+        with pytest.raises(duckdb.ConnectionException):
+            con.execute("select 1")
+        with pytest.raises(duckdb.ConnectionException, match="closed"):
+            pool.acquire()
+        pool.release(con)
+
+    def test_sizes(self):
+        with pytest.raises(ValueError, match="max_size"):
+            duckdb.ConnectionPool(max_size=0)
+        with pytest.raises(ValueError, match="min_size"):
+            duckdb.ConnectionPool(min_size=3, max_size=2)
@@ -1,5 +1,9 @@
+import io
+import itertools
 import logging
 import sys
+import threading
+import time
 from collections.abc import Callable
 from pathlib import Path, PurePosixPath
 from shutil import copyfileobj
@@ -128,6 +132,107 @@ class TestPythonFilesystem:
 
         assert memory.open(filename).read().startswith(b"PAR1")
 
+    def test_readinto(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem, monkeypatch):
+        from fsspec.implementations.memory import MemoryFile
+
+        calls = []
+        orig_readinto = MemoryFile.readinto
+
+        def readinto(self, buffer):
+            calls.append(len(buffer))
+            return orig_readinto(self, buffer)
+
+        monkeypatch.setattr(MemoryFile, "readinto", readinto, raising=False)
+        monkeypatch.setattr(MemoryFile, "read", None, raising=False)
+        duckdb_cursor.register_filesystem(memory)
+
+        assert duckdb_cursor.sql(f"select * from 'memory://{FILENAME}'").fetchall() == [(1, 10, 0), (2, 50, 30)]
+        assert calls
+
+    def test_readinto_without_data_yet(
+        self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem, monkeypatch
+    ):
+        from fsspec.implementations.memory import MemoryFile
+
+        orig_readinto = MemoryFile.readinto
+        calls = []
+
+        def readinto(self, buffer):
+            # a non-blocking stream reports "no data yet" with None before every read, that is not the end of the file
+            calls.append(len(buffer))
+            if len(calls) % 2 == 1:
+                return None
+            return orig_readinto(self, buffer)
+
+        monkeypatch.setattr(MemoryFile, "readinto", readinto, raising=False)
+        duckdb_cursor.register_filesystem(memory)
+
+        assert duckdb_cursor.sql(f"select * from 'memory://{FILENAME}'").fetchall() == [(1, 10, 0), (2, 50, 30)]
+        assert len(calls) >= 2
+
+    def test_read_timeout(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem, monkeypatch):
+        from fsspec.implementations.memory import MemoryFile
+
+        # a non-blocking stream that never has data
+        monkeypatch.setattr(MemoryFile, "readinto", lambda self, buffer: None, raising=False)
+        duckdb_cursor.register_filesystem(memory, read_timeout=0.2)
+
+        start = time.monotonic()
+        with pytest.raises(duckdb.IOException, match=r"had no data available for 0\.2 seconds"):
+            duckdb_cursor.sql(f"select * from 'memory://{FILENAME}'").fetchall()
+        assert time.monotonic() - start < 10
+
+        with pytest.raises(InvalidInputException, match="'read_timeout' has to be a positive number of seconds"):
+            duckdb_cursor.register_filesystem(memory, read_timeout=0)
+
+    def test_interrupt_waiting_read(
+        self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem, monkeypatch
+    ):
+        from fsspec.implementations.memory import MemoryFile
+
+        waiting = threading.Event()
+
+        def readinto(self, buffer):
+            waiting.set()
+
+        monkeypatch.setattr(MemoryFile, "readinto", readinto, raising=False)
+        duckdb_cursor.register_filesystem(memory, read_timeout=float("inf"))
+        errors = []
+
+        def run() -> None:
+            try:
+                duckdb_cursor.sql(f"select * from 'memory://{FILENAME}'").fetchall()
+            except duckdb.Error as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        assert waiting.wait(60)
+        duckdb_cursor.interrupt()
+        thread.join(60)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+        assert isinstance(errors[0], duckdb.InterruptException)
+
+    def test_read_without_readinto(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        class ReadOnlyFile:
+            def __init__(self, data) -> None:
+                self.file = io.BytesIO(data)
+                self.seek = self.file.seek
+                self.tell = self.file.tell
+                self.read = self.file.read
+                self.close = self.file.close
+
+        class ReadOnlyFileSystem(type(memory)):
+            def _open(self, path, mode="rb", **kwargs):
+                return ReadOnlyFile(self.cat_file(path))
+
+        fs = ReadOnlyFileSystem(skip_instance_cache=True)
+        fs.store = memory.store
+        duckdb_cursor.register_filesystem(fs)
+
+        assert duckdb_cursor.sql(f"select * from 'memory://{FILENAME}'").fetchall() == [(1, 10, 0), (2, 50, 30)]
+
     def test_when_fsspec_not_installed(self, duckdb_cursor: DuckDBPyConnection, monkeypatch: pytest.MonkeyPatch):
         monkeypatch.setitem(sys.modules, "fsspec", None)
 
@@ -285,6 +390,182 @@ class TestPythonFilesystem:
         assert res == [(1719568210134107692, 1)]
 
 
+class TestFilesystemBlockCache:
+    def test_repeated_scans(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        filename = "binary_string.parquet"
+        add_file(memory, filename)
+        duckdb_cursor.register_filesystem(memory, cache_size=1 << 20, block_size=1024)
+
+        query = f"select * from read_parquet('memory://{filename}')"
+        expected = [(b"foo",), (b"bar",), (b"baz",)]
+        assert duckdb_cursor.sql(query).fetchall() == expected
+        stats = duckdb_cursor.filesystem_stats("memory")
+        assert stats["cache_misses"] > 0
+        assert stats["bytes_fetched"] == memory.size(filename)
+
+        assert duckdb_cursor.sql(query).fetchall() == expected
+        cached = duckdb_cursor.filesystem_stats("memory")
+        assert cached["cache_misses"] == stats["cache_misses"]
+        assert cached["cache_hits"] > stats["cache_hits"]
+        assert cached["bytes_fetched"] == stats["bytes_fetched"]
+        assert cached["cached_bytes"] == memory.size(filename)
+
+    def test_read_ahead(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        with memory.open("big.csv", "wb") as f:
+            f.write("\n".join(str(i) for i in range(100000)).encode())
+        duckdb_cursor.register_filesystem(memory, cache_size=1 << 24, block_size=4096, read_ahead=16)
+
+        query = "select count(*), sum(column0) from read_csv('memory://big.csv', header = false)"
+        assert duckdb_cursor.sql(query).fetchone() == (100000, sum(range(100000)))
+        stats = duckdb_cursor.filesystem_stats("memory")
+        blocks = (memory.size("big.csv") + 4095) // 4096
+        assert stats["cache_misses"] < blocks
+        assert stats["bytes_fetched"] == memory.size("big.csv")
+
+    def test_invalidated_by_writes(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(memory, cache_size=1 << 20)
+
+        duckdb_cursor.execute("copy (select 1 as a) to 'memory://01.csv'")
+        assert duckdb_cursor.sql("select * from 'memory://01.csv'").fetchall() == [(1,)]
+        duckdb_cursor.execute("copy (select 2 as a) to 'memory://01.csv'")
+        assert duckdb_cursor.sql("select * from 'memory://01.csv'").fetchall() == [(2,)]
+
+        # changes made outside of DuckDB are detected through the file size
+        with memory.open("01.csv", "wb") as f:
+            f.write(b"a\n30\n")
+        assert duckdb_cursor.sql("select * from 'memory://01.csv'").fetchall() == [(30,)]
+
+    def test_invalidated_by_directory_removal(
+        self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem
+    ):
+        duckdb_cursor.register_filesystem(memory, cache_size=1 << 20)
+
+        duckdb_cursor.execute("copy (select 1 as a, 2 as b) to 'memory://root' (partition_by (a), HEADER 0)")
+        query = "select * from read_csv('memory://root/a=1/data_0.csv', header = false)"
+        assert duckdb_cursor.sql(query).fetchall() == [(2,)]
+
+        # overwriting removes the whole directory, which invalidates the files below it
+        duckdb_cursor.execute("copy (select 2 as a, 2 as b) to 'memory://root' (partition_by (a), HEADER 0, OVERWRITE)")
+        assert not memory.exists("/root/a=1/data_0.csv")
+        # a file of the same size at the same path is not served from the cache
+        with memory.open("/root/a=1/data_0.csv", "wb") as f:
+            f.write(b"3\n")
+        assert duckdb_cursor.sql(query).fetchall() == [(3,)]
+
+    def test_disabled_by_default(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(memory)
+        duckdb_cursor.execute(f"select * from 'memory://{FILENAME}'").fetchall()
+        stats = duckdb_cursor.filesystem_stats("memory")
+        assert stats == {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "pending_waits": 0,
+            "bytes_fetched": 0,
+            "fetches": 0,
+            "metadata_hits": 0,
+            "metadata_misses": 0,
+            "writes": 0,
+            "bytes_written": 0,
+            "cached_bytes": 0,
+            "cache_size": 0,
+        }
+
+        duckdb_cursor.unregister_filesystem("memory")
+        with pytest.raises(InvalidInputException, match="No Python filesystem named 'memory' is registered"):
+            duckdb_cursor.filesystem_stats("memory")
+
+    def test_async_filesystem_range_reads(self, duckdb_cursor: DuckDBPyConnection):
+        from fsspec.asyn import AsyncFileSystem
+
+        class RangeFileSystem(AsyncFileSystem):
+            protocol = "ranges"
+
+            def __init__(self, files, **kwargs) -> None:
+                super().__init__(**kwargs)
+                self.files = files
+                self.ranges = []
+
+            async def _info(self, path, **kwargs):
+                path = self._strip_protocol(path)
+                if path not in self.files:
+                    raise FileNotFoundError(path)
+                return {"name": path, "size": len(self.files[path]), "type": "file"}
+
+            async def _cat_file(self, path, start=None, end=None, **kwargs):
+                self.ranges.append((start, end))
+                return self.files[self._strip_protocol(path)][start:end]
+
+            def _open(self, path, mode="rb", **kwargs):
+                return io.BytesIO(self.files[self._strip_protocol(path)])
+
+        data = "\n".join(str(i) for i in range(5000)).encode()
+        fs = RangeFileSystem({"data.csv": data}, skip_instance_cache=True)
+        duckdb_cursor.register_filesystem(fs, cache_size=1 << 20, block_size=1024)
+
+        query = "select count(*), sum(column0) from read_csv('ranges://data.csv', header = false)"
+        assert duckdb_cursor.sql(query).fetchone() == (5000, sum(range(5000)))
+        # every byte is requested once, adjacent blocks are merged into one range
+        blocks = (len(data) + 1023) // 1024
+        ranges = sorted(fs.ranges)
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        assert all(previous[1] <= current[0] for previous, current in itertools.pairwise(ranges))
+        assert sum(end - start for start, end in ranges) == len(data)
+        assert len(ranges) < blocks
+        assert duckdb_cursor.filesystem_stats("ranges")["fetches"] < blocks
+
+    def test_async_filesystem_batches_concurrent_reads(self):
+        import asyncio
+
+        from fsspec.asyn import AsyncFileSystem
+
+        class SlowRangeFileSystem(AsyncFileSystem):
+            protocol = "slowranges"
+
+            def __init__(self, files, **kwargs) -> None:
+                super().__init__(**kwargs)
+                self.files = files
+                self.calls = []
+
+            async def _info(self, path, **kwargs):
+                path = self._strip_protocol(path)
+                if path not in self.files:
+                    raise FileNotFoundError(path)
+                return {"name": path, "size": len(self.files[path]), "type": "file"}
+
+            async def _cat_file(self, path, start=None, end=None, **kwargs):
+                return self.files[self._strip_protocol(path)][start:end]
+
+            async def _cat_ranges(self, paths, starts, ends, **kwargs):
+                self.calls.append(len(paths))
+                # the first call is slow, the reads of the other files queue up behind it meanwhile
+                if len(self.calls) == 1:
+                    await asyncio.sleep(0.5)
+                return await super()._cat_ranges(paths, starts, ends, **kwargs)
+
+            def _open(self, path, mode="rb", **kwargs):
+                return io.BytesIO(self.files[self._strip_protocol(path)])
+
+        files = {f"{i}.csv": "\n".join(str(j) for j in range(1000)).encode() for i in range(8)}
+        fs = SlowRangeFileSystem(files, skip_instance_cache=True)
+        con = duckdb.connect(config={"threads": 8})
+        con.register_filesystem(fs, cache_size=1 << 20, block_size=1 << 16)
+
+        paths = [f"slowranges://{name}" for name in files]
+        query = f"select count(*), sum(column0) from read_csv({paths}, header = false)"
+        assert con.sql(query).fetchone() == (8000, 8 * sum(range(1000)))
+        # the ranges of several files went out in the same call
+        assert max(fs.calls) > 1
+        stats = con.filesystem_stats("slowranges")
+        assert stats["fetches"] == len(fs.calls) < len(files)
+
+    def test_invalid_options(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        with pytest.raises(InvalidInputException, match="'block_size' has to be a positive integer"):
+            duckdb_cursor.register_filesystem(memory, cache_size=1 << 20, block_size=0)
+        with pytest.raises(InvalidInputException, match="'read_ahead' requires the block cache"):
+            duckdb_cursor.register_filesystem(memory, read_ahead=4)
+
+
 class TestNanobindFilesystemHardening:
     """Regressions for the pre-existing filesystem safety gaps the nanobind cutover surfaced."""
 
@@ -359,3 +640,146 @@ class TestNanobindFilesystemHardening:
         from duckdb.filesystem import ModifiedMemoryFileSystem
 
         assert ModifiedMemoryFileSystem is not None
+
+
+def count_calls(monkeypatch: pytest.MonkeyPatch, fs: fsspec.AbstractFileSystem, *names: str) -> dict[str, int]:
+    calls = dict.fromkeys(names, 0)
+    for name in names:
+        orig = getattr(fs, name)
+
+        def counted(*args, _name=name, _orig=orig, **kwargs):
+            calls[_name] += 1
+            return _orig(*args, **kwargs)
+
+        monkeypatch.setattr(fs, name, counted)
+    return calls
+
+
+class TestFilesystemMetadataCache:
+    @pytest.fixture
+    def parts(self, memory: fsspec.AbstractFileSystem) -> fsspec.AbstractFileSystem:
+        for i in range(3):
+            memory.pipe(f"part{i}.csv", b"a\n%d\n" % i)
+        return memory
+
+    def test_glob_reused(self, duckdb_cursor: DuckDBPyConnection, parts: fsspec.AbstractFileSystem, monkeypatch):
+        duckdb_cursor.register_filesystem(parts, metadata_ttl=60)
+        calls = count_calls(monkeypatch, parts, "glob", "size", "isfile")
+
+        query = "select count(*), sum(a) from 'memory://part*.csv'"
+        assert duckdb_cursor.sql(query).fetchone() == (3, 3)
+        assert duckdb_cursor.sql(query).fetchone() == (3, 3)
+        # the sizes come with the glob result, which is reused by the second scan
+        assert calls == {"glob": 1, "size": 0, "isfile": 0}
+        assert duckdb_cursor.filesystem_stats("memory")["metadata_hits"] > 0
+
+    def test_invalidation(self, duckdb_cursor: DuckDBPyConnection, parts: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(parts, metadata_ttl=60)
+        query = "select count(*), sum(a) from 'memory://part*.csv'"
+        assert duckdb_cursor.sql(query).fetchone() == (3, 3)
+
+        # writes through DuckDB invalidate the cache
+        duckdb_cursor.execute("copy (select 10 as a) to 'memory://part3.csv'")
+        assert duckdb_cursor.sql(query).fetchone() == (4, 13)
+
+        # changes made outside of DuckDB are seen once the cache is invalidated (or the TTL has passed)
+        parts.pipe("part4.csv", b"a\n20\n")
+        assert duckdb_cursor.sql(query).fetchone() == (4, 13)
+        duckdb_cursor.invalidate_filesystem_cache("memory")
+        assert duckdb_cursor.sql(query).fetchone() == (5, 33)
+
+        parts.rm("part4.csv")
+        duckdb_cursor.invalidate_filesystem_cache("memory", "memory://part4.csv")
+        assert duckdb_cursor.sql(query).fetchone() == (4, 13)
+
+    def test_ttl(self, duckdb_cursor: DuckDBPyConnection, parts: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(parts, metadata_ttl=0.05)
+        query = "select count(*) from 'memory://part*.csv'"
+        assert duckdb_cursor.sql(query).fetchone() == (3,)
+        parts.pipe("part3.csv", b"a\n3\n")
+        time.sleep(0.1)
+        assert duckdb_cursor.sql(query).fetchone() == (4,)
+
+    def test_invalid_options(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        with pytest.raises(InvalidInputException, match="'metadata_ttl' has to be a non-negative number of seconds"):
+            duckdb_cursor.register_filesystem(memory, metadata_ttl=-1)
+        with pytest.raises(InvalidInputException, match="No Python filesystem named 'memory' is registered"):
+            duckdb_cursor.invalidate_filesystem_cache("memory")
+
+
+class TestFilesystemWriteBuffer:
+    QUERY = "copy (select i, 'value_' || i as s from range(100000) t(i)) to 'memory://out.csv'"
+
+    def test_combined_writes(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(memory, write_buffer_size=0)
+        duckdb_cursor.execute(self.QUERY)
+        unbuffered = duckdb_cursor.filesystem_stats("memory")
+        expected = memory.cat("out.csv")
+        duckdb_cursor.unregister_filesystem("memory")
+
+        duckdb_cursor.register_filesystem(memory, write_buffer_size=1 << 20)
+        duckdb_cursor.execute(self.QUERY)
+        buffered = duckdb_cursor.filesystem_stats("memory")
+        assert memory.cat("out.csv") == expected
+        assert buffered["bytes_written"] == unbuffered["bytes_written"] == len(expected)
+        # DuckDB writes CSV files in 32KB chunks, they are handed to Python in 1MB blocks
+        assert buffered["writes"] < unbuffered["writes"] // 10
+        assert duckdb_cursor.sql("select count(*) from 'memory://out.csv'").fetchone() == (100000,)
+
+    def test_write_error_on_close(self, duckdb_cursor: DuckDBPyConnection):
+        from fsspec.implementations.memory import MemoryFile, MemoryFileSystem
+
+        closed = []
+
+        class FailingFile(MemoryFile):
+            def write(self, data):
+                msg = "disk full"
+                raise OSError(msg)
+
+            def close(self):
+                closed.append(self.path)
+                super().close()
+
+        class FailingFileSystem(MemoryFileSystem):
+            protocol = "failing"
+
+            def _open(self, path, mode="rb", **kwargs):
+                if "w" in mode:
+                    return FailingFile(self, path)
+                return super()._open(path, mode, **kwargs)
+
+        fs = FailingFileSystem(skip_instance_cache=True)
+        fs.store = {}
+        duckdb_cursor.register_filesystem(fs, write_buffer_size=1 << 20)
+        # the rows fit in the write buffer, so they are only handed to Python when the file is closed
+        with pytest.raises((OSError, duckdb.Error), match="disk full"):
+            duckdb_cursor.execute("copy (select 1 as a) to 'failing://out.csv'")
+        assert len(closed) == 1
+
+    def test_parquet(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        duckdb_cursor.register_filesystem(memory, write_buffer_size=4096)
+        duckdb_cursor.execute("copy (select i from range(100000) t(i)) to 'memory://out.parquet'")
+        assert duckdb_cursor.sql("select sum(i) from 'memory://out.parquet'").fetchone() == (sum(range(100000)),)
+
+    def test_upload_block_size(self, duckdb_cursor: DuckDBPyConnection):
+        from fsspec.implementations.memory import MemoryFileSystem
+
+        block_sizes = []
+
+        class UploadFileSystem(MemoryFileSystem):
+            protocol = "upload"
+
+            def _open(self, path, mode="rb", block_size=None, **kwargs):
+                if "w" in mode:
+                    block_sizes.append(block_size)
+                return super()._open(path, mode, block_size=block_size, **kwargs)
+
+        fs = UploadFileSystem(skip_instance_cache=True)
+        fs.store = {}
+        duckdb_cursor.register_filesystem(fs, upload_block_size=5 << 20)
+        duckdb_cursor.execute("copy (select 1 as a) to 'upload://out.csv'")
+        assert block_sizes == [5 << 20]
+
+    def test_invalid_options(self, duckdb_cursor: DuckDBPyConnection, memory: fsspec.AbstractFileSystem):
+        with pytest.raises(InvalidInputException, match="'upload_block_size' has to be a positive integer"):
+            duckdb_cursor.register_filesystem(memory, upload_block_size=0)
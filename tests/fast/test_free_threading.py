@@ -0,0 +1,123 @@
+"""Tests that use the client from several threads at once.
+
+They run on every build, but are what the free-threaded (cp314t) wheels are tested with: without the GIL the
+threads really run at the same time.
+"""
+
+import platform
+import subprocess
+import sys
+import sysconfig
+import threading
+
+import pytest
+
+import duckdb
+
+pytestmark = pytest.mark.xfail(
+    condition=platform.system() == "Emscripten",
+    reason="Emscripten builds cannot use threads",
+)
+
+THREAD_COUNT = 8
+
+# Runs in a new interpreter, so the import cache is still empty when the threads first use its items
+FIRST_USE_SCRIPT = """
+import datetime
+import decimal
+import importlib.util
+import threading
+import uuid
+
+import duckdb
+
+barrier = threading.Barrier({thread_count})
+errors = []
+
+
+def first_use():
+    try:
+        con = duckdb.connect()
+        barrier.wait()
+        row = con.execute(
+            "select ?, ?, ?", [decimal.Decimal("1.5"), datetime.date(2024, 1, 2), uuid.UUID(int=1)]
+        ).fetchone()
+        assert row == (1.5, datetime.date(2024, 1, 2), uuid.UUID(int=1)), row
+        if importlib.util.find_spec("pandas"):
+            assert con.sql("select 42 i").df()["i"][0] == 42
+    except Exception as e:
+        errors.append(e)
+
+
+threads = [threading.Thread(target=first_use) for _ in range({thread_count})]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert not errors, errors
+print("ok")
+"""
+
+
+def run_threads(target):
+    """Runs target(index) on THREAD_COUNT threads and re-raises the first error."""
+    errors = []
+
+    def run(index):
+        try:
+            target(index)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(THREAD_COUNT)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+class TestFreeThreading:
+    @pytest.mark.skipif(not sysconfig.get_config_var("Py_GIL_DISABLED"), reason="not a free-threaded build")
+    def test_gil_stays_disabled(self):
+        # importing an extension that isn't declared free-threading safe enables the GIL again
+        assert not sys._is_gil_enabled()
+
+    def test_first_use_of_import_cache(self):
+        result = subprocess.run(
+            [sys.executable, "-c", FIRST_USE_SCRIPT.format(thread_count=THREAD_COUNT)],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "ok"
+
+    def test_concurrent_fetch_on_one_relation(self):
+        con = duckdb.connect()
+        rel = con.sql("select i, i::varchar s from range(10000) t(i)")
+        expected = [(i, str(i)) for i in range(10000)]
+        barrier = threading.Barrier(THREAD_COUNT)
+        results = [None] * THREAD_COUNT
+
+        def fetch(index):
+            barrier.wait()
+            results[index] = rel.fetchall()
+
+        run_threads(fetch)
+        assert all(result == expected for result in results)
+
+    def test_concurrent_cursors(self):
+        con = duckdb.connect()
+        con.execute("create table tbl as select i from range(10000) t(i)")
+        barrier = threading.Barrier(THREAD_COUNT)
+
+        def insert_and_count(index):
+            cursor = con.cursor()
+            barrier.wait()
+            cursor.executemany("insert into tbl values (?)", [[index]] * 100)
+            assert cursor.execute("select count(*) from tbl where i = ?", [index]).fetchone()[0] >= 100
+
+        run_threads(insert_and_count)
+        assert con.execute("select count(*) from tbl").fetchone() == (10000 + 100 * THREAD_COUNT,)
@@ -1,4 +1,6 @@
 import re
+import threading
+import time
 from datetime import date, timedelta
 from typing import NoReturn
 
@@ -263,3 +265,116 @@ class TestMap:
         con = duckdb.connect()
         with pytest.raises(duckdb.InvalidInputException):
             con.sql("select 42").map(basic_function)
+
+
+class TestArrowMap:
+    def test_arrow_format(self):
+        pa = pytest.importorskip("pyarrow")
+        pc = pytest.importorskip("pyarrow.compute")
+
+        def plus_one(table):
+            assert isinstance(table, pa.Table)
+            return table.set_column(0, "i", pc.add(table["i"], 1))
+
+        con = duckdb.connect()
+        rel = con.sql("select i, i::varchar s from range(5000) tbl(i)").map(plus_one, format="arrow")
+        assert rel.columns == ["i", "s"]
+        assert rel.types == [duckdb.sqltypes.BIGINT, duckdb.sqltypes.VARCHAR]
+        assert sorted(rel.fetchall()) == [(i + 1, str(i)) for i in range(5000)]
+
+    def test_polars_format(self):
+        pytest.importorskip("pyarrow")
+        pl = pytest.importorskip("polars")
+
+        def double(df):
+            assert isinstance(df, pl.DataFrame)
+            return df.select(pl.col("i") * 2)
+
+        con = duckdb.connect()
+        rel = con.sql("select i from range(10) tbl(i)").map(double, format="polars", parallel=False)
+        assert rel.fetchall() == [(i * 2,) for i in range(10)]
+
+    def test_batch_rows(self):
+        pytest.importorskip("pyarrow")
+        sizes = []
+
+        def record_size(table):
+            sizes.append(table.num_rows)
+            return table
+
+        con = duckdb.connect()
+        rel = con.sql("select i from range(25000) tbl(i)").map(
+            record_size, format="arrow", batch_rows=10000, parallel=False
+        )
+        assert rel.fetchall() == [(i,) for i in range(25000)]
+        # Binding infers the schema from a call with an empty table
+        batches = [size for size in sizes if size]
+        assert sum(batches) == 25000
+        assert all(size >= 10000 for size in batches[:-1])
+
+    @pytest.mark.parametrize("format", ["pandas", "arrow"])
+    def test_not_parallel(self, format):
+        if format == "arrow":
+            pytest.importorskip("pyarrow")
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+        thread_ids = set()
+
+        def serial(table):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+                thread_ids.add(threading.get_ident())
+            # releases the GIL, another thread could call the function in the meantime
+            time.sleep(0.001)
+            with lock:
+                running -= 1
+            return table
+
+        con = duckdb.connect(config={"threads": 4})
+        # several row groups, so the input of the function is produced on several threads
+        con.execute("create table tbl as select i from range(1000000) t(i)")
+        rel = con.table("tbl").map(serial, format=format, parallel=False)
+        assert rel.aggregate("count(*), sum(i)").fetchone() == (1000000, sum(range(1000000)))
+        assert len(thread_ids) > 1
+        assert max_running == 1
+
+    def test_more_output_rows_than_a_vector(self):
+        pa = pytest.importorskip("pyarrow")
+
+        def repeat(table):
+            return pa.concat_tables([table] * 10)
+
+        con = duckdb.connect()
+        rel = con.sql("select i from range(3000) tbl(i)").map(repeat, format="arrow")
+        assert rel.aggregate("count(*), sum(i)").fetchall() == [(30000, 10 * sum(range(3000)))]
+
+    def test_explicit_schema_is_cast(self):
+        pa = pytest.importorskip("pyarrow")
+
+        def to_int32(table):
+            return table.cast(pa.schema([("i", pa.int32())]))
+
+        con = duckdb.connect()
+        rel = con.sql("select i from range(3) tbl(i)").map(to_int32, format="arrow", schema={"i": "DOUBLE"})
+        assert rel.types == [duckdb.sqltypes.DOUBLE]
+        assert rel.fetchall() == [(0.0,), (1.0,), (2.0,)]
+
+    def test_errors(self):
+        pytest.importorskip("pyarrow")
+        con = duckdb.connect()
+        rel = con.sql("select i from range(3) tbl(i)")
+        with pytest.raises(duckdb.InvalidInputException, match="'format' has to be one of"):
+            rel.map(lambda t: t, format="numpy")
+        with pytest.raises(duckdb.InvalidInputException, match="'batch_rows' is only supported"):
+            rel.map(lambda df: df, batch_rows=100)
+        with pytest.raises(duckdb.InvalidInputException, match="'batch_rows' has to be a positive integer"):
+            rel.map(lambda t: t, format="arrow", batch_rows=0)
+        with pytest.raises(duckdb.InvalidInputException, match="No return value from Python function"):
+            rel.map(lambda t: None, format="arrow")
+        with pytest.raises(duckdb.InvalidInputException, match="UDF column name mismatch"):
+            rel.map(lambda t: t.rename_columns(["j"]) if t.num_rows else t, format="arrow").fetchall()
+        with pytest.raises(duckdb.InvalidInputException, match="Expected 1 columns from UDF, got 2"):
+            rel.map(lambda t: t.append_column("j", t["i"]) if t.num_rows else t, format="arrow").fetchall()
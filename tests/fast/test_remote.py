@@ -0,0 +1,117 @@
+import socket
+import threading
+from pathlib import Path
+
+import pytest
+
+import duckdb
+
+pa = pytest.importorskip("pyarrow")
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets are not available")
+
+
+@pytest.fixture
+def server(tmp_path):
+    con = duckdb.connect()
+    con.execute("create table t as select i, i::varchar as s from range(10000) t(i)")
+    with duckdb.serve(con, str(tmp_path / "duckdb.sock")) as server:
+        yield server
+    con.close()
+
+
+class TestRemote:
+    def test_query(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            assert con.execute("select count(*), sum(i) from t").fetchall() == [(10000, sum(range(10000)))]
+            table = con.execute("select * from t where i < ?", [3]).to_arrow_table()
+            assert table.to_pydict() == {"i": [0, 1, 2], "s": ["0", "1", "2"]}
+
+    def test_statement_without_result(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            con.execute("create table u (a integer)")
+            con.execute("insert into u values (?), (?)", [1, 2])
+            assert con.execute("select sum(a) from u").fetchall() == [(3,)]
+
+    def test_streaming(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            reader = con.execute("select * from range(1000000) t(i)", batch_size=100000).to_arrow_reader()
+            assert sum(batch.num_rows for batch in reader) == 1000000
+
+    def test_errors(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            with pytest.raises(duckdb.CatalogException):
+                con.execute("select * from does_not_exist")
+            with pytest.raises(duckdb.ConversionException):
+                con.execute("select 'a'::integer from range(10)").fetchall()
+            # the session is still usable
+            assert con.execute("select 42").fetchall() == [(42,)]
+
+    def test_error_after_first_batch(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            # one thread, so the failing rows are reached after the first batches were sent
+            con.execute("set threads = 1")
+            query = (
+                "select case when i < 100000 then i else error('boom ' || i)::bigint end as i from range(1000000) t(i)"
+            )
+            reader = con.execute(query, batch_size=2048).to_arrow_reader()
+            assert reader.read_next_batch().num_rows > 0
+            with pytest.raises(duckdb.Error, match="boom"):
+                for _ in reader:
+                    pass
+            assert con.execute("select 42").fetchall() == [(42,)]
+
+    def test_interrupt(self, server):
+        errors = []
+        with duckdb.connect_remote(server.socket_path) as con:
+
+            def run():
+                try:
+                    con.execute("select sum(i) from range(1000000000000) t(i)").fetchall()
+                except duckdb.Error as error:
+                    errors.append(error)
+
+            thread = threading.Thread(target=run)
+            thread.start()
+            # an interrupt that arrives before the query started is lost, so repeat it until the query stops
+            for _ in range(600):
+                con.interrupt()
+                thread.join(0.1)
+                if not thread.is_alive():
+                    break
+            assert not thread.is_alive()
+            assert len(errors) == 1
+            assert isinstance(errors[0], duckdb.InterruptException)
+            assert con.execute("select 42").fetchall() == [(42,)]
+
+    def test_socket_permissions(self, server):
+        assert Path(server.socket_path).stat().st_mode & 0o777 == 0o600
+
+    def test_unread_result_is_discarded(self, server):
+        with duckdb.connect_remote(server.socket_path) as con:
+            reader = con.execute("select * from range(10000000) t(i)", batch_size=2048).to_arrow_reader()
+            reader.read_next_batch()
+            assert con.execute("select 1").fetchall() == [(1,)]
+
+    def test_concurrent_cursors(self, server):
+        results = []
+
+        def run(n):
+            with duckdb.connect_remote(server.socket_path) as con:
+                results.append(con.execute("select count(*) from t where i < ?", [n]).fetchall()[0][0])
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(results) == list(range(8))
+
+    def test_writes_are_shared(self, server):
+        with duckdb.connect_remote(server.socket_path) as writer, writer.cursor() as reader:
+            writer.execute("create table shared as select 1 as a")
+            assert reader.execute("select a from shared").fetchall() == [(1,)]
+
+    def test_server_in_use(self, server):
+        with pytest.raises(FileExistsError):
+            duckdb.serve(duckdb.connect(), server.socket_path)
@@ -0,0 +1,122 @@
+import pytest
+
+import duckdb
+from duckdb.sqltypes import BIGINT, DOUBLE, VARCHAR
+
+pa = pytest.importorskip("pyarrow")
+pc = pytest.importorskip("pyarrow.compute")
+np = pytest.importorskip("numpy")
+
+
+def arrow_sum(con, name="py_sum"):
+    con.create_aggregate_function(
+        name,
+        init=lambda: 0,
+        update=lambda state, x: state + pc.sum(x).as_py(),
+        combine=lambda state, other: state + other,
+        finalize=lambda state: state,
+        parameters=[BIGINT],
+        return_type=BIGINT,
+    )
+
+
+class TestAggregateUDF:
+    def test_ungrouped(self):
+        con = duckdb.connect()
+        arrow_sum(con)
+        assert con.sql("select py_sum(i) from range(100000) tbl(i)").fetchall() == [(sum(range(100000)),)]
+
+    def test_grouped(self):
+        con = duckdb.connect()
+        arrow_sum(con)
+        res = con.sql("select i % 7 g, py_sum(i) from range(100000) tbl(i) group by g order by g").fetchall()
+        expected = [(g, sum(i for i in range(100000) if i % 7 == g)) for g in range(7)]
+        assert res == expected
+
+    def test_parallel_combine(self):
+        con = duckdb.connect()
+        con.execute("set threads=4")
+        arrow_sum(con)
+        con.execute("create table t as select i, i % 1000 g from range(1000000) tbl(i)")
+        res = con.sql("select g, py_sum(i) from t group by g order by g").fetchall()
+        expected = con.sql("select g, sum(i)::BIGINT from t group by g order by g").fetchall()
+        assert res == expected
+
+    def test_numpy_format(self):
+        con = duckdb.connect()
+
+        def update(state, values, weights):
+            assert isinstance(values, np.ndarray)
+            state[0] += float(np.dot(values, weights))
+            state[1] += float(weights.sum())
+
+        con.create_aggregate_function(
+            "weighted_avg",
+            init=lambda: [0.0, 0.0],
+            update=update,
+            combine=lambda state, other: [state[0] + other[0], state[1] + other[1]],
+            finalize=lambda state: state[0] / state[1] if state[1] else None,
+            parameters=[DOUBLE, DOUBLE],
+            return_type=DOUBLE,
+            format="numpy",
+        )
+        res = con.sql("select weighted_avg(v, w) from (values (1.0, 1.0), (3.0, 3.0)) t(v, w)").fetchone()
+        assert res[0] == pytest.approx(2.5)
+
+    def test_null_handling(self):
+        con = duckdb.connect()
+        con.create_aggregate_function(
+            "count_rows",
+            init=lambda: 0,
+            update=lambda state, x: state + len(x),
+            combine=lambda state, other: state + other,
+            finalize=lambda state: state,
+            parameters=[VARCHAR],
+            return_type=BIGINT,
+        )
+        con.create_aggregate_function(
+            "count_rows_special",
+            init=lambda: 0,
+            update=lambda state, x: state + len(x),
+            combine=lambda state, other: state + other,
+            finalize=lambda state: state,
+            parameters=[VARCHAR],
+            return_type=BIGINT,
+            null_handling="special",
+        )
+        res = con.sql("select count_rows(x), count_rows_special(x) from (values ('a'), (NULL), ('b')) t(x)").fetchall()
+        assert res == [(2, 3)]
+
+    def test_empty_input(self):
+        con = duckdb.connect()
+        arrow_sum(con)
+        assert con.sql("select py_sum(i) from range(0) tbl(i)").fetchall() == [(0,)]
+
+    def test_exception(self):
+        con = duckdb.connect()
+
+        def update(state, x):
+            msg = "broken"
+            raise ValueError(msg)
+
+        con.create_aggregate_function(
+            "broken", lambda: 0, update, lambda a, b: a + b, lambda s: s, parameters=[BIGINT], return_type=BIGINT
+        )
+        with pytest.raises(duckdb.InvalidInputException, match="ValueError: broken"):
+            con.sql("select broken(i) from range(10) tbl(i)").fetchall()
+
+    def test_remove_function(self):
+        con = duckdb.connect()
+        arrow_sum(con)
+        con.remove_function("py_sum")
+        with pytest.raises(duckdb.CatalogException):
+            con.sql("select py_sum(i) from range(10) tbl(i)").fetchall()
+        arrow_sum(con)
+        assert con.sql("select py_sum(i) from range(10) tbl(i)").fetchall() == [(45,)]
+
+    def test_invalid_format(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match="'format' has to be either 'arrow' or 'numpy'"):
+            con.create_aggregate_function(
+                "f", lambda: 0, lambda s, x: s, lambda a, b: a, lambda s: s, [BIGINT], BIGINT, format="pandas"
+            )
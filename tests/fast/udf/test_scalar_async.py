@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+import duckdb
+from duckdb.sqltypes import BIGINT, VARCHAR
+
+
+class InFlightCounter:
+    def __init__(self) -> None:
+        self.current = 0
+        self.peak = 0
+
+    async def track(self, coro):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            return await coro
+        finally:
+            self.current -= 1
+
+
+class TestAsyncUDF:
+    def test_basic(self):
+        async def plus_one(x):
+            await asyncio.sleep(0)
+            return x + 1
+
+        con = duckdb.connect()
+        con.create_function("plus_one", plus_one, [BIGINT], BIGINT)
+        res = con.sql("select plus_one(i) from range(5000) tbl(i)").fetchall()
+        assert res == [(i + 1,) for i in range(5000)]
+
+    def test_calls_run_concurrently(self):
+        counter = InFlightCounter()
+
+        async def lookup(x):
+            return await counter.track(asyncio.sleep(0.01, result=x))
+
+        con = duckdb.connect()
+        con.create_function("lookup", lookup, [BIGINT], BIGINT)
+        res = con.sql("select lookup(i) from range(100) tbl(i)").fetchall()
+        assert res == [(i,) for i in range(100)]
+        assert counter.peak > 1
+
+    def test_concurrency_limit(self):
+        counter = InFlightCounter()
+
+        async def lookup(x):
+            return await counter.track(asyncio.sleep(0.001, result=x))
+
+        con = duckdb.connect()
+        con.create_function("lookup", lookup, [BIGINT], BIGINT, concurrency=3)
+        res = con.sql("select lookup(i) from range(100) tbl(i)").fetchall()
+        assert res == [(i,) for i in range(100)]
+        assert 1 < counter.peak <= 3
+
+    def test_timeout(self):
+        async def slow(x):
+            await asyncio.sleep(10)
+            return x
+
+        con = duckdb.connect()
+        con.create_function("slow", slow, [BIGINT], BIGINT, timeout=0.01)
+        with pytest.raises(duckdb.InvalidInputException, match="TimeoutError"):
+            con.sql("select slow(i) from range(10) tbl(i)").fetchall()
+
+        con.create_function("slow_or_null", slow, [BIGINT], BIGINT, timeout=0.01, exception_handling="return_null")
+        res = con.sql("select slow_or_null(i) from range(10) tbl(i)").fetchall()
+        assert res == [(None,)] * 10
+
+    def test_exception(self):
+        async def fails(x):
+            if x % 2 == 0:
+                msg = "even"
+                raise ValueError(msg)
+            return x
+
+        con = duckdb.connect()
+        con.create_function("fails", fails, [BIGINT], BIGINT)
+        with pytest.raises(duckdb.InvalidInputException, match="ValueError: even"):
+            con.sql("select fails(i) from range(10) tbl(i)").fetchall()
+
+        con.create_function("fails_or_null", fails, [BIGINT], BIGINT, exception_handling="return_null")
+        res = con.sql("select fails_or_null(i) from range(4) tbl(i)").fetchall()
+        assert res == [(None,), (1,), (None,), (3,)]
+
+    def test_exception_cancels_pending_calls(self):
+        started = []
+        cancelled = []
+
+        async def fails_first(x):
+            if x == 0:
+                msg = "first"
+                raise ValueError(msg)
+            started.append(x)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(x)
+                raise
+            return x
+
+        con = duckdb.connect()
+        con.create_function("fails_first", fails_first, [BIGINT], BIGINT)
+        with pytest.raises(duckdb.InvalidInputException, match="ValueError: first"):
+            con.sql("select fails_first(i) from range(10) tbl(i)").fetchall()
+        # the other calls were cancelled and awaited before the query failed, none of them keeps running
+        assert sorted(cancelled) == sorted(started)
+
+    def test_nulls(self):
+        calls = []
+
+        async def echo(x):
+            calls.append(x)
+            return x
+
+        con = duckdb.connect()
+        con.create_function("echo", echo, [VARCHAR], VARCHAR)
+        res = con.sql("select echo(x) from (values ('a'), (NULL), ('b')) t(x)").fetchall()
+        assert res == [("a",), (None,), ("b",)]
+        assert sorted(calls) == ["a", "b"]
+
+        con.create_function("echo_special", echo, [VARCHAR], VARCHAR, null_handling="special")
+        res = con.sql("select echo_special(x) from (values ('a'), (NULL)) t(x)").fetchall()
+        assert res == [("a",), (None,)]
+
+    def test_from_running_event_loop(self):
+        async def plus_one(x):
+            await asyncio.sleep(0)
+            return x + 1
+
+        con = duckdb.connect()
+        con.create_function("plus_one", plus_one, [BIGINT], BIGINT)
+
+        async def main():
+            return con.sql("select plus_one(i) from range(3) tbl(i)").fetchall()
+
+        assert asyncio.run(main()) == [(1,), (2,), (3,)]
+
+    def test_from_running_event_loop_reuses_loop(self):
+        loops = set()
+
+        async def plus_one(x):
+            loops.add(asyncio.get_running_loop())
+            return x + 1
+
+        con = duckdb.connect(config={"threads": 1})
+        con.create_function("plus_one", plus_one, [BIGINT], BIGINT)
+
+        async def main():
+            return con.sql("select sum(plus_one(i)) from range(10000) tbl(i)").fetchall()
+
+        assert asyncio.run(main()) == [(sum(range(1, 10001)),)]
+        # several chunks, all awaited on the same helper loop
+        assert len(loops) == 1
+
+    def test_invalid_options(self):
+        con = duckdb.connect()
+
+        def sync_function(x):
+            return x
+
+        async def async_function(x):
+            return x
+
+        with pytest.raises(duckdb.InvalidInputException, match="can only be provided for functions defined with"):
+            con.create_function("sync_function", sync_function, [BIGINT], BIGINT, concurrency=4)
+        with pytest.raises(duckdb.InvalidInputException, match="'concurrency' has to be a positive integer"):
+            con.create_function("async_function", async_function, [BIGINT], BIGINT, concurrency=0)
+        with pytest.raises(duckdb.InvalidInputException, match="'timeout' has to be a positive number"):
+            con.create_function("async_function", async_function, [BIGINT], BIGINT, timeout=-1)
+        with pytest.raises(duckdb.InvalidInputException, match="not supported for type='arrow'"):
+            con.create_function("async_function", async_function, [BIGINT], BIGINT, type="arrow")
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+import duckdb
+from duckdb.sqltypes import BIGINT, VARCHAR
+from duckdb.udf import FunctionCache
+
+
+class CountingFunction:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, x: int) -> int:
+        self.calls += 1
+        return x * 2
+
+
+class TestCachedUDF:
+    def test_repeated_values(self):
+        func = CountingFunction()
+        cache = FunctionCache()
+        con = duckdb.connect()
+        con.create_function("double", func, [BIGINT], BIGINT, cache=cache)
+        res = con.sql("select double(i % 10) from range(10000) tbl(i)").fetchall()
+        assert res == [((i % 10) * 2,) for i in range(10000)]
+        assert func.calls == 10
+
+        info = cache.cache_info()
+        assert info.misses == 10
+        assert info.hits == 10000 - 10
+        assert info.currsize == 10
+
+        # The cache outlives the query
+        con.sql("select double(i % 10) from range(100) tbl(i)").fetchall()
+        assert func.calls == 10
+        assert cache.cache_info().hits == 10000 - 10 + 100
+
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, 4096, 0, None, 0)
+
+    def test_dictionary_vectors(self):
+        pa = pytest.importorskip("pyarrow")
+
+        class CountingCache(FunctionCache):
+            def __init__(self) -> None:
+                super().__init__()
+                self.lookups = 0
+
+            def _lookup(self, key):
+                self.lookups += 1
+                return super()._lookup(key)
+
+        func = CountingFunction()
+        cache = CountingCache()
+        con = duckdb.connect(config={"threads": 1})
+        # the arrow scan turns a dictionary array into DICTIONARY vectors
+        flavours = pa.table({"f": pa.array(["sweet", "sour", "bitter"] * 2000).dictionary_encode()})  # noqa: F841
+        con.create_function("double", func, [VARCHAR], VARCHAR, cache=cache)
+        res = con.sql("select double(f) from flavours").fetchall()
+        assert res == [(f * 2,) for f in ["sweet", "sour", "bitter"] * 2000]
+        assert func.calls == 3
+        info = cache.cache_info()
+        assert info.hits + info.misses == 6000
+        # rows of a chunk sharing a dictionary entry are resolved once, the cache is only asked per distinct entry
+        # and chunk, not per row
+        assert cache.lookups <= 3 * 6000 // 2048 + 3
+
+    def test_maxsize(self):
+        func = CountingFunction()
+        con = duckdb.connect()
+        con.create_function("double", func, [BIGINT], BIGINT, cache=FunctionCache(maxsize=2))
+        con.sql("select double(i) from range(5) tbl(i)").fetchall()
+        con.sql("select double(i) from range(5) tbl(i)").fetchall()
+        assert func.calls == 10
+
+    def test_max_bytes(self):
+        cache = FunctionCache(maxsize=None, max_bytes=1000)
+        con = duckdb.connect()
+        con.create_function("pad", lambda x: x * 100, [VARCHAR], VARCHAR, cache=cache)
+        con.sql("select pad(i::varchar) from range(100) tbl(i)").fetchall()
+        info = cache.cache_info()
+        assert 0 < info.currsize < 100
+        assert info.currbytes <= 1000
+
+    def test_cache_true_and_int(self):
+        func = CountingFunction()
+        con = duckdb.connect()
+        con.create_function("double", func, [BIGINT], BIGINT, cache=True)
+        con.create_function("double_small", func, [BIGINT], BIGINT, cache=8)
+        res = con.sql("select double(i % 4), double_small(i % 4) from range(1000) tbl(i)").fetchall()
+        assert res == [((i % 4) * 2, (i % 4) * 2) for i in range(1000)]
+        assert func.calls == 8
+
+    def test_nulls_and_exceptions(self):
+        calls = []
+
+        def fails_on_odd(x):
+            calls.append(x)
+            if x % 2:
+                msg = "odd"
+                raise ValueError(msg)
+            return x
+
+        con = duckdb.connect()
+        con.create_function(
+            "fails_on_odd", fails_on_odd, [BIGINT], BIGINT, cache=True, exception_handling="return_null"
+        )
+        res = con.sql("select fails_on_odd(x) from (values (1), (2), (NULL), (1), (2)) t(x)").fetchall()
+        assert res == [(None,), (2,), (None,), (None,), (2,)]
+        # Exceptions aren't cached
+        assert sorted(calls) == [1, 1, 2]
+
+        con.create_function("fails_on_odd_forward", fails_on_odd, [BIGINT], BIGINT, cache=True)
+        with pytest.raises(duckdb.InvalidInputException, match="ValueError: odd"):
+            con.sql("select fails_on_odd_forward(x) from (values (1), (2)) t(x)").fetchall()
+
+    def test_unhashable_arguments(self):
+        cache = FunctionCache()
+        con = duckdb.connect()
+        con.create_function("total", lambda x: sum(x), ["BIGINT[]"], BIGINT, cache=cache)
+        res = con.sql("select total([i, i]) from range(3) tbl(i)").fetchall()
+        assert res == [(0,), (2,), (4,)]
+        assert cache.cache_info().currsize == 0
+
+    def test_async(self):
+        calls = []
+
+        async def double(x):
+            calls.append(x)
+            await asyncio.sleep(0)
+            return x * 2
+
+        con = duckdb.connect()
+        con.create_function("double", double, [BIGINT], BIGINT, cache=True, concurrency=4)
+        res = con.sql("select double(i % 5) from range(1000) tbl(i)").fetchall()
+        assert res == [((i % 5) * 2,) for i in range(1000)]
+        assert sorted(calls) == [0, 1, 2, 3, 4]
+
+    def test_invalid_options(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match="'cache' has to be a positive integer"):
+            con.create_function("f", lambda x: x, [BIGINT], BIGINT, cache=0)
+        with pytest.raises(duckdb.InvalidInputException, match="'cache' has to be a bool"):
+            con.create_function("f", lambda x: x, [BIGINT], BIGINT, cache="yes")
+        with pytest.raises(duckdb.InvalidInputException, match="can not be cached"):
+            con.create_function("f", lambda x: x, [BIGINT], BIGINT, cache=True, side_effects=True)
+        with pytest.raises(duckdb.InvalidInputException, match="not supported for type='arrow'"):
+            con.create_function("f", lambda x: x, [BIGINT], BIGINT, cache=True, type="arrow")
+        with pytest.raises(ValueError, match="'maxsize' has to be a positive integer"):
+            FunctionCache(maxsize=0)
@@ -0,0 +1,114 @@
+import pytest
+
+import duckdb
+from duckdb.sqltypes import BIGINT, DOUBLE, VARCHAR
+
+pa = pytest.importorskip("pyarrow")
+np = pytest.importorskip("numpy")
+
+
+def numbers(n):
+    for start in range(0, n, 1000):
+        yield pa.record_batch({"i": pa.array(range(start, min(start + 1000, n)), pa.int64())})
+
+
+class TestTableFunction:
+    def test_record_batches(self):
+        con = duckdb.connect()
+        con.create_table_function("numbers", numbers, {"i": BIGINT}, [BIGINT])
+        assert con.sql("select count(*), sum(i) from numbers(10500)").fetchall() == [(10500, sum(range(10500)))]
+        # The generator is called again for every scan
+        assert con.sql("select max(i) from numbers(10)").fetchall() == [(9,)]
+
+    def test_numpy_dicts_and_casting(self):
+        def squares(n):
+            values = np.arange(n, dtype=np.int32)
+            yield {"x": values, "square": values * values, "ignored": values}
+
+        con = duckdb.connect()
+        con.create_table_function("squares", squares, {"x": BIGINT, "square": DOUBLE}, [BIGINT])
+        rel = con.sql("select * from squares(4)")
+        assert rel.columns == ["x", "square"]
+        assert rel.types == [BIGINT, DOUBLE]
+        assert rel.fetchall() == [(0, 0.0), (1, 1.0), (2, 4.0), (3, 9.0)]
+
+    def test_dataframes(self):
+        pd = pytest.importorskip("pandas")
+
+        def frames():
+            yield pd.DataFrame({"name": ["a", "b"]})
+            yield pd.DataFrame({"name": ["c"]}, index=[10])
+
+        con = duckdb.connect()
+        con.create_table_function("frames", frames, {"name": VARCHAR})
+        assert con.sql("select * from frames()").fetchall() == [("a",), ("b",), ("c",)]
+
+    def test_single_table(self):
+        con = duckdb.connect()
+        con.create_table_function("single", lambda: pa.table({"i": [1, 2, 3]}), {"i": BIGINT})
+        assert con.sql("select sum(i) from single()").fetchall() == [(6,)]
+
+    def test_projection_pushdown(self):
+        requested = []
+
+        def wide(columns):
+            requested.append(columns)
+            yield {name: [1, 2] for name in columns}
+
+        con = duckdb.connect()
+        con.create_table_function("wide", wide, {"a": BIGINT, "b": BIGINT, "c": BIGINT}, projection_pushdown=True)
+        assert con.sql("select c, a from wide()").fetchall() == [(1, 1), (2, 2)]
+        assert set(requested[-1]) == {"a", "c"}
+
+    def test_lazy(self):
+        produced = []
+
+        def endless():
+            i = 0
+            while True:
+                produced.append(i)
+                yield pa.record_batch({"i": pa.array([i], pa.int64())})
+                i += 1
+
+        con = duckdb.connect()
+        con.create_table_function("endless", endless, {"i": BIGINT})
+        assert con.sql("select i from endless() limit 3").fetchall() == [(0,), (1,), (2,)]
+        assert len(produced) < 10000
+
+    def test_cardinality(self):
+        con = duckdb.connect()
+        con.create_table_function("fixed", numbers, {"i": BIGINT}, [BIGINT], cardinality=123456)
+        con.create_table_function("estimated", numbers, {"i": BIGINT}, [BIGINT], cardinality=lambda n: n)
+        plan = con.sql("explain select * from fixed(10)").fetchall()[0][1]
+        assert "123456" in plan
+        plan = con.sql("explain select * from estimated(654321)").fetchall()[0][1]
+        assert "654321" in plan
+
+    def test_exception(self):
+        def broken():
+            yield pa.record_batch({"i": pa.array([1], pa.int64())})
+            msg = "broken"
+            raise ValueError(msg)
+
+        con = duckdb.connect()
+        con.create_table_function("broken", broken, {"i": BIGINT})
+        with pytest.raises(duckdb.Error, match="broken"):
+            con.sql("select * from broken()").fetchall()
+
+    def test_remove_function(self):
+        con = duckdb.connect()
+        con.create_table_function("numbers", numbers, {"i": BIGINT}, [BIGINT])
+        con.remove_function("numbers")
+        with pytest.raises(duckdb.CatalogException):
+            con.sql("select * from numbers(10)").fetchall()
+        con.create_table_function("numbers", numbers, {"i": BIGINT}, [BIGINT])
+        assert con.sql("select count(*) from numbers(10)").fetchall() == [(10,)]
+
+    def test_invalid_options(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match="'schema' has to be a non-empty dict"):
+            con.create_table_function("f", numbers, [BIGINT])
+        with pytest.raises(duckdb.InvalidInputException, match="'cardinality' has to be a non-negative integer"):
+            con.create_table_function("f", numbers, {"i": BIGINT}, cardinality=-1)
+        with pytest.raises(duckdb.InvalidInputException, match="'cardinality' has to be an integer"):
+            con.create_table_function("f", numbers, {"i": BIGINT}, cardinality="many")